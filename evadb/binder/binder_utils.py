@@ -37,6 +37,7 @@ if TYPE_CHECKING:
 
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.aggregation_expression import AggregationExpression
 from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.alias import Alias
@@ -183,6 +184,35 @@ def create_row_num_tv_expr(table_alias):
     return tv_expr
 
 
+def check_groupby_list(
+    target_list: List[AbstractExpression], groupby_list: List[AbstractExpression]
+) -> None:
+    """Checks that the targets of a query grouping the rows by the columns of
+    the groupby_list are either aggregates or expressions of these columns"""
+    for expr in groupby_list:
+        if not isinstance(expr, TupleValueExpression):
+            err_msg = "GROUP BY only supports columns, got {}".format(expr)
+            raise BinderError(err_msg)
+    groupby_columns = [expr.col_alias for expr in groupby_list]
+
+    for expr in target_list or []:
+        if isinstance(expr, AggregationExpression):
+            if not expr.mergeable:
+                err_msg = (
+                    f"{expr.get_symbol()} is only supported when grouping by "
+                    "segments (e.g., GROUP BY '8 frames')"
+                )
+                raise BinderError(err_msg)
+            continue
+        if any(True for _ in expr.find_all(AggregationExpression)):
+            err_msg = f"Aggregate functions must not be nested in {expr}"
+            raise BinderError(err_msg)
+        for tv_expr in expr.find_all(TupleValueExpression):
+            if tv_expr.col_alias not in groupby_columns:
+                err_msg = f"Column {tv_expr.col_alias} must be grouped or aggregated"
+                raise BinderError(err_msg)
+
+
 def check_groupby_pattern(table_ref: TableRef, groupby_string: str) -> None:
     # match the pattern of group by clause (e.g., 16 frames or 8 samples)
     pattern = re.search(r"^\d+\s*(?:frames|samples|paragraphs)$", groupby_string)
@@ -41,6 +41,20 @@ def bind_create_index(binder: StatementBinder, node: CreateIndexStatement):
         node.table_ref.is_table_atom()
     ), "Index can only be created on an existing table"
 
+    # Only FAISS indexes accept index parameters.
+    if node.index_params:
+        if node.vector_store_type != VectorStoreType.FAISS:
+            raise BinderError(
+                f"{node.vector_store_type} index does not accept index parameters."
+            )
+        from evadb.third_party.vector_stores.faiss import index_params
+
+        unknown_params = [key for key in node.index_params if key not in index_params]
+        if unknown_params:
+            raise BinderError(
+                f"Unknown FAISS index parameters {unknown_params}, expected {index_params}."
+            )
+
     # Vector type specific check.
     catalog = binder._catalog()
     if node.vector_store_type == VectorStoreType.PGVECTOR:
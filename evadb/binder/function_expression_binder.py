@@ -12,7 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
 from pathlib import Path
+from typing import Dict, Hashable
 
 from evadb.binder.binder_utils import (
     BinderError,
@@ -28,6 +30,7 @@ from evadb.configuration.constants import EvaDB_INSTALLATION_DIR
 from evadb.executor.execution_context import Context
 from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.functions.function_pool import get_function_pool
 from evadb.parser.types import FunctionType
 from evadb.third_party.huggingface.binder import assign_hf_function
 from evadb.utils.generic_utils import (
@@ -36,6 +39,41 @@ from evadb.utils.generic_utils import (
 )
 from evadb.utils.logging_manager import logger
 
+# the function classes are imported once per registered function, since a
+# function registered again gets a new row_id or checksum
+_function_classes: Dict[Hashable, type] = {}
+_function_classes_lock = threading.Lock()
+
+
+def load_function_class(function_obj, class_name: str) -> type:
+    key = (function_obj.row_id, function_obj.checksum, class_name)
+    with _function_classes_lock:
+        function_class = _function_classes.get(key)
+    if function_class is None:
+        function_class = load_function_class_from_file(
+            function_obj.impl_file_path, class_name
+        )
+        with _function_classes_lock:
+            _function_classes[key] = function_class
+    return function_class
+
+
+class FunctionFactory:
+    """Creates instances of a function class loaded from its implementation file
+
+    Unlike a closure over the class, the factory can be pickled (e.g., into the
+    worker processes of a local Exchange), which load the class on first use.
+    """
+
+    def __init__(self, function_obj, class_name: str, **kwargs):
+        self.function_obj = function_obj
+        self.class_name = class_name
+        self.kwargs = kwargs
+
+    def __call__(self):
+        function_class = load_function_class(self.function_obj, self.class_name)
+        return function_class(**self.kwargs)
+
 
 def bind_func_expr(binder: StatementBinder, node: FunctionExpression):
     # setup the context
@@ -68,18 +106,20 @@ def bind_func_expr(binder: StatementBinder, node: FunctionExpression):
         logger.error(err_msg)
         raise BinderError(err_msg)
 
+    properties = get_metadata_properties(function_obj)
+    stateless = False
     if string_comparison_case_insensitive(function_obj.type, "HuggingFace"):
         node.function = assign_hf_function(function_obj)
 
     elif string_comparison_case_insensitive(function_obj.type, "Ludwig"):
-        function_class = load_function_class_from_file(
-            function_obj.impl_file_path,
-            "GenericLudwigModel",
-        )
+        # the class is loaded while binding, so that errors surface early
+        load_function_class(function_obj, "GenericLudwigModel")
         function_metadata = get_metadata_properties(function_obj)
         assert "model_path" in function_metadata, "Ludwig models expect 'model_path'."
-        node.function = lambda: function_class(
-            model_path=function_metadata["model_path"]
+        node.function = FunctionFactory(
+            function_obj,
+            "GenericLudwigModel",
+            model_path=function_metadata["model_path"],
         )
 
     else:
@@ -100,15 +140,12 @@ def bind_func_expr(binder: StatementBinder, node: FunctionExpression):
         #     registration. Please use DROP FUNCTION to drop it and re-create it # using CREATE FUNCTION."""
 
         try:
-            function_class = load_function_class_from_file(
-                function_obj.impl_file_path,
-                function_obj.name,
-            )
+            function_class = load_function_class(function_obj, function_obj.name)
+            stateless = getattr(function_class, "stateless", False)
             # certain functions take additional inputs like yolo needs the model_name
             # these arguments are passed by the user as part of metadata
             # we also handle the special case of ChatGPT where we need to send the
             # OpenAPI key as part of the parameter if not provided by the user
-            properties = get_metadata_properties(function_obj)
             if string_comparison_case_insensitive(node.name, "CHATGPT"):
                 # if the user didn't provide any API_KEY, check if we have one in the catalog
                 if "OPENAI_API_KEY" not in properties.keys():
@@ -117,7 +154,9 @@ def bind_func_expr(binder: StatementBinder, node: FunctionExpression):
                     )
                     properties["openai_api_key"] = openai_key
 
-            node.function = lambda: function_class(**properties)
+            node.function = FunctionFactory(
+                function_obj, function_obj.name, **properties
+            )
         except Exception as e:
             err_msg = (
                 f"{str(e)}. Please verify that the function class name in the "
@@ -127,6 +166,22 @@ def bind_func_expr(binder: StatementBinder, node: FunctionExpression):
             raise BinderError(err_msg)
 
     node.function_obj = function_obj
+    pool_memory_size = binder._catalog().get_configuration_catalog_value(
+        "function_pool_memory_size", 0
+    )
+    function_pool = get_function_pool()
+    if function_pool.max_memory_size != pool_memory_size:
+        function_pool.resize(pool_memory_size)
+    # the instances of stateless functions are kept warm across queries in the
+    # function pool, the key identifies the function and the arguments of its
+    # constructor
+    if stateless and pool_memory_size > 0:
+        node._pool_key = (
+            function_obj.row_id,
+            function_obj.name,
+            function_obj.checksum,
+            tuple(sorted((key, str(value)) for key, value in properties.items())),
+        )
     output_objs = binder._catalog().get_function_io_catalog_output_entries(function_obj)
     if node.output:
         for obj in output_objs:
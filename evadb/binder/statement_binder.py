@@ -19,6 +19,7 @@ from evadb.binder.binder_utils import (
     BinderError,
     bind_table_info,
     check_column_name_is_string,
+    check_groupby_list,
     check_groupby_pattern,
     check_table_object_is_groupable,
     drop_row_id_from_target_list,
@@ -178,6 +179,10 @@ class StatementBinder:
             self.bind(node.groupby_clause)
             check_table_object_is_groupable(node.from_table)
             check_groupby_pattern(node.from_table, node.groupby_clause.value)
+        if node.groupby_list:
+            for expr in node.groupby_list:
+                self.bind(expr)
+            check_groupby_list(node.target_list, node.groupby_list)
         if node.orderby_list:
             for expr in node.orderby_list:
                 self.bind(expr[0])
@@ -236,9 +241,10 @@ class StatementBinder:
     @bind.register(RenameTableStatement)
     def _bind_rename_table_statement(self, node: RenameTableStatement):
         self.bind(node.old_table_ref)
-        assert (
-            node.old_table_ref.table.table_obj.table_type != TableType.STRUCTURED_DATA
-        ), "Rename not yet supported on structured data"
+        assert node.old_table_ref.table.table_obj.table_type not in [
+            TableType.STRUCTURED_DATA,
+            TableType.COLUMNAR_DATA,
+        ], "Rename not yet supported on structured data"
 
     @bind.register(TableRef)
     def _bind_tableref(self, node: TableRef):
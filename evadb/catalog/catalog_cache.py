@@ -0,0 +1,79 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class CatalogCache:
+    """Read-through cache of catalog entries
+
+    Planning a query looks up the same table, column, function, index and
+    configuration entries many times. The cache keeps the entries, including the
+    misses, in memory so that only the first lookup reaches the catalog database.
+    Any catalog write drops all the cached entries, since a single statement can
+    affect entries of several kinds (e.g., dropping a table removes its columns and
+    indexes).
+
+    The cache is local to the process; DDL issued by another process against the
+    same catalog database is not observed.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Any] = {}
+        # bumped on every invalidation so that a lookup racing with a DDL does
+        # not store the entry it read before the DDL
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                value = self._entries[key]
+                return list(value) if isinstance(value, list) else value
+            generation = self._generation
+
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = value
+        # callers are free to modify the returned lists
+        return list(value) if isinstance(value, list) else value
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+def invalidate_catalog_cache(func):
+    """Invalidates the catalog cache after the decorated catalog write"""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._cache.invalidate()
+
+    return wrapper
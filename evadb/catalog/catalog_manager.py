@@ -17,6 +17,7 @@ import shutil
 from pathlib import Path
 from typing import Any, List
 
+from evadb.catalog.catalog_cache import CatalogCache, invalidate_catalog_cache
 from evadb.catalog.catalog_type import (
     ColumnType,
     TableType,
@@ -85,6 +86,7 @@ class CatalogManager(object):
     def __init__(self, db_uri: str):
         self._db_uri = db_uri
         self._sql_config = SQLConfig(db_uri)
+        self._cache = CatalogCache()
         self._bootstrap_catalog()
         self._db_catalog_service = DatabaseCatalogService(self._sql_config.session)
         self._config_catalog_service = ConfigurationCatalogService(
@@ -113,6 +115,13 @@ class CatalogManager(object):
     def sql_config(self):
         return self._sql_config
 
+    @property
+    def version(self) -> int:
+        """Version of the catalog, which changes on every catalog write. It is used
+        to invalidate the state derived from the catalog, e.g., cached plans."""
+        return self._cache.version
+
+    @invalidate_catalog_cache
     def reset(self):
         """
         This method resets the state of the singleton instance.
@@ -126,6 +135,7 @@ class CatalogManager(object):
         This method closes all the connections
         """
         if self.sql_config is not None:
+            self.sql_config.session.remove()
             sqlalchemy_engine = self.sql_config.engine
             sqlalchemy_engine.dispose()
 
@@ -157,6 +167,7 @@ class CatalogManager(object):
 
     "Database catalog services"
 
+    @invalidate_catalog_cache
     def insert_database_catalog_entry(self, name: str, engine: str, params: dict):
         """A new entry is persisted in the database catalog."
 
@@ -184,6 +195,7 @@ class CatalogManager(object):
     def get_all_database_catalog_entries(self):
         return self._db_catalog_service.get_all_entries()
 
+    @invalidate_catalog_cache
     def drop_database_catalog_entry(self, database_entry: DatabaseCatalogEntry) -> bool:
         """
         This method deletes the database from  catalog.
@@ -357,6 +369,7 @@ class CatalogManager(object):
 
     "Table catalog services"
 
+    @invalidate_catalog_cache
     def insert_table_catalog_entry(
         self,
         name: str,
@@ -405,12 +418,14 @@ class CatalogManager(object):
             TableCatalogEntry
         """
 
-        table_entry = self._table_catalog_service.get_entry_by_name(
-            database_name, table_name
+        return self._cache.get(
+            ("table", database_name, table_name),
+            lambda: self._table_catalog_service.get_entry_by_name(
+                database_name, table_name
+            ),
         )
 
-        return table_entry
-
+    @invalidate_catalog_cache
     def delete_table_catalog_entry(self, table_entry: TableCatalogEntry) -> bool:
         """
         This method deletes the table along with its columns from table catalog
@@ -424,6 +439,7 @@ class CatalogManager(object):
         """
         return self._table_catalog_service.delete_entry(table_entry)
 
+    @invalidate_catalog_cache
     def rename_table_catalog_entry(
         self, curr_table: TableCatalogEntry, new_name: TableInfo
     ):
@@ -435,10 +451,7 @@ class CatalogManager(object):
         if is_native_table:
             return self.check_native_table_exists(table_name, database_name)
         else:
-            table_entry = self._table_catalog_service.get_entry_by_name(
-                database_name, table_name
-            )
-            return table_entry is not None
+            return self.get_table_catalog_entry(table_name) is not None
 
     def get_all_table_catalog_entries(self):
         return self._table_catalog_service.get_all_entries()
@@ -448,8 +461,11 @@ class CatalogManager(object):
     def get_column_catalog_entry(
         self, table_obj: TableCatalogEntry, col_name: str
     ) -> ColumnCatalogEntry:
-        col_obj = self._column_service.filter_entry_by_table_id_and_name(
-            table_obj.row_id, col_name
+        col_obj = self._cache.get(
+            ("column", table_obj.row_id, col_name),
+            lambda: self._column_service.filter_entry_by_table_id_and_name(
+                table_obj.row_id, col_name
+            ),
         )
         if col_obj:
             return col_obj
@@ -465,11 +481,14 @@ class CatalogManager(object):
             return None
 
     def get_column_catalog_entries_by_table(self, table_obj: TableCatalogEntry):
-        col_entries = self._column_service.filter_entries_by_table(table_obj)
-        return col_entries
+        return self._cache.get(
+            ("columns", table_obj.row_id),
+            lambda: self._column_service.filter_entries_by_table(table_obj),
+        )
 
     "function catalog services"
 
+    @invalidate_catalog_cache
     def insert_function_catalog_entry(
         self,
         name: str,
@@ -513,8 +532,12 @@ class CatalogManager(object):
         Returns:
             FunctionCatalogEntry object
         """
-        return self._function_service.get_entry_by_name(name)
+        return self._cache.get(
+            ("function", name),
+            lambda: self._function_service.get_entry_by_name(name),
+        )
 
+    @invalidate_catalog_cache
     def delete_function_catalog_entry_by_name(self, function_name: str) -> bool:
         return self._function_service.delete_entry_by_name(function_name)
 
@@ -524,7 +547,7 @@ class CatalogManager(object):
     "function cost catalog services"
 
     def upsert_function_cost_catalog_entry(
-        self, function_id: int, name: str, cost: int
+        self, function_id: int, name: str, cost: int, cache_hit_rate: float = None
     ) -> FunctionCostCatalogEntry:
         """Upserts function cost catalog entry.
 
@@ -532,12 +555,15 @@ class CatalogManager(object):
             function_id(int): unique function id
             name(str): the name of the function
             cost(int): cost of this function
+            cache_hit_rate(float): fraction of the calls served by the cache
 
         Returns:
             The persisted FunctionCostCatalogEntry object.
         """
 
-        self._function_cost_catalog_service.upsert_entry(function_id, name, cost)
+        self._function_cost_catalog_service.upsert_entry(
+            function_id, name, cost, cache_hit_rate
+        )
 
     def get_function_cost_catalog_entry(self, name: str):
         return self._function_cost_catalog_service.get_entry_by_name(name)
@@ -547,19 +573,26 @@ class CatalogManager(object):
     def get_function_io_catalog_input_entries(
         self, function_obj: FunctionCatalogEntry
     ) -> List[FunctionIOCatalogEntry]:
-        return self._function_io_service.get_input_entries_by_function_id(
-            function_obj.row_id
+        return self._cache.get(
+            ("function_inputs", function_obj.row_id),
+            lambda: self._function_io_service.get_input_entries_by_function_id(
+                function_obj.row_id
+            ),
         )
 
     def get_function_io_catalog_output_entries(
         self, function_obj: FunctionCatalogEntry
     ) -> List[FunctionIOCatalogEntry]:
-        return self._function_io_service.get_output_entries_by_function_id(
-            function_obj.row_id
+        return self._cache.get(
+            ("function_outputs", function_obj.row_id),
+            lambda: self._function_io_service.get_output_entries_by_function_id(
+                function_obj.row_id
+            ),
         )
 
     """ Index related services. """
 
+    @invalidate_catalog_cache
     def insert_index_catalog_entry(
         self,
         name: str,
@@ -580,15 +613,21 @@ class CatalogManager(object):
         return index_catalog_entry
 
     def get_index_catalog_entry_by_name(self, name: str) -> IndexCatalogEntry:
-        return self._index_service.get_entry_by_name(name)
+        return self._cache.get(
+            ("index", name), lambda: self._index_service.get_entry_by_name(name)
+        )
 
     def get_index_catalog_entry_by_column_and_function_signature(
         self, column: ColumnCatalogEntry, function_signature: str
     ):
-        return self._index_service.get_entry_by_column_and_function_signature(
-            column, function_signature
+        return self._cache.get(
+            ("index", column.row_id, function_signature),
+            lambda: self._index_service.get_entry_by_column_and_function_signature(
+                column, function_signature
+            ),
         )
 
+    @invalidate_catalog_cache
     def drop_index_catalog_entry(self, index_name: str) -> bool:
         return self._index_service.delete_entry_by_name(index_name)
 
@@ -597,6 +636,7 @@ class CatalogManager(object):
 
     """ Function Cache related"""
 
+    @invalidate_catalog_cache
     def insert_function_cache_catalog_entry(self, func_expr: FunctionExpression):
         cache_dir = self.get_configuration_catalog_value("cache_dir")
         entry = construct_function_cache_catalog_entry(func_expr, cache_dir=cache_dir)
@@ -607,6 +647,7 @@ class CatalogManager(object):
     ) -> FunctionCacheCatalogEntry:
         return self._function_cache_service.get_entry_by_name(name)
 
+    @invalidate_catalog_cache
     def drop_function_cache_catalog_entry(
         self, entry: FunctionCacheCatalogEntry
     ) -> bool:
@@ -631,10 +672,12 @@ class CatalogManager(object):
         """
         function_entry = self.get_function_catalog_entry_by_name(function_name)
         if function_entry:
-            entries = self._function_metadata_service.get_entries_by_function_id(
-                function_entry.row_id
+            return self._cache.get(
+                ("function_metadata", function_entry.row_id),
+                lambda: self._function_metadata_service.get_entries_by_function_id(
+                    function_entry.row_id
+                ),
             )
-            return entries
         else:
             return []
 
@@ -763,6 +806,7 @@ class CatalogManager(object):
 
     "Configuration catalog services"
 
+    @invalidate_catalog_cache
     def upsert_configuration_catalog_entry(self, key: str, value: any):
         """Upserts configuration catalog entry"
 
@@ -782,7 +826,10 @@ class CatalogManager(object):
             ConfigurationCatalogEntry
         """
 
-        table_entry = self._config_catalog_service.get_entry_by_name(key)
+        table_entry = self._cache.get(
+            ("configuration", key),
+            lambda: self._config_catalog_service.get_entry_by_name(key),
+        )
         if table_entry:
             return table_entry.value
         return default
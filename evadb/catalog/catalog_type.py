@@ -35,6 +35,10 @@ class TableType(EvaDBEnum):
     # database backend.
     NATIVE_DATA  # noqa: F821
 
+    # Structured tables whose fixed-shape ndarray columns are stored as
+    # contiguous column files instead of pickled blobs.
+    COLUMNAR_DATA  # noqa: F821
+
 
 class ColumnType(EvaDBEnum):
     BOOLEAN  # noqa: F821
@@ -12,9 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import threading
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from evadb.catalog.catalog_type import (
     ColumnType,
@@ -54,6 +56,27 @@ def is_string_col(col: ColumnCatalogEntry):
     return col.type == ColumnType.TEXT or col.array_type == NdArrayType.STR
 
 
+def is_fixed_shape_ndarray_col(col: ColumnCatalogEntry):
+    """Check if the column is an ndarray column with a known numeric dtype and
+    a fully specified shape, i.e., every row occupies the same number of bytes.
+    """
+    if col.type != ColumnType.NDARRAY or not col.array_dimensions:
+        return False
+    if col.array_type in [
+        None,
+        NdArrayType.ANYTYPE,
+        NdArrayType.STR,
+        NdArrayType.UNICODE,
+        NdArrayType.DECIMAL,
+        NdArrayType.DATETIME,
+    ]:
+        return False
+    return all(
+        isinstance(dim, int) and not isinstance(dim, bool) and dim > 0
+        for dim in col.array_dimensions
+    )
+
+
 def get_video_table_column_definitions() -> List[ColumnDefinition]:
     """
     name: video path
@@ -307,14 +330,32 @@ def get_configuration_value(key: str):
 
 
 #### get catalog instance
-# This function plays a crucial role in ensuring that different threads do
-# not share the same catalog object, as it can result in serialization issues and
-# incorrect behavior with SQLAlchemy. Therefore, whenever a catalog instance is
-# required, we create a new one. One possible optimization is to share the catalog
-# instance across all objects within the same thread. It is worth investigating whether
-# SQLAlchemy already handles this optimization for us, which will be explored at a
-# later time.
+# The catalog instance is shared by all the queries of a process, so that the
+# catalog tables are bootstrapped once and the metadata cache of the catalog
+# survives across queries. Sharing it across threads is safe since the SQLAlchemy
+# session is thread-local (scoped_session). The instances are keyed by the process
+# id so that a forked process (e.g., the job scheduler) does not reuse the
+# connections of its parent.
+_catalog_instances: Dict[Tuple[int, str], Any] = {}
+_catalog_instances_lock = threading.Lock()
+
+
 def get_catalog_instance(db_uri: str):
     from evadb.catalog.catalog_manager import CatalogManager
 
-    return CatalogManager(db_uri)
+    key = (os.getpid(), str(db_uri))
+    with _catalog_instances_lock:
+        if key not in _catalog_instances:
+            _catalog_instances[key] = CatalogManager(db_uri)
+        return _catalog_instances[key]
+
+
+def release_catalog_instance(db_uri: str):
+    """Closes the shared catalog instance of the db_uri, if any. The next
+    get_catalog_instance() creates a new instance, which bootstraps the catalog
+    tables again, e.g., after the database directory is removed."""
+    key = (os.getpid(), str(db_uri))
+    with _catalog_instances_lock:
+        catalog = _catalog_instances.pop(key, None)
+    if catalog is not None:
+        catalog.close()
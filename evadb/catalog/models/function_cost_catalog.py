@@ -25,6 +25,7 @@ class FunctionCostCatalog(BaseModel):
     `_name:` name of the Function
     `_function_id`: the row_id of the Function
     `_cost:` cost of this Function
+    `_cache_hit_rate:` fraction of the calls of this Function served by its cache
     """
 
     __tablename__ = "function_cost_catalog"
@@ -38,16 +39,21 @@ class FunctionCostCatalog(BaseModel):
         "name", String(128), ForeignKey("function_catalog.name", ondelete="CASCADE")
     )
     _cost = Column("cost", Float)
+    _cache_hit_rate = Column("cache_hit_rate", Float, default=0.0)
 
-    def __init__(self, function_id: int, name: str, cost: float):
+    def __init__(
+        self, function_id: int, name: str, cost: float, cache_hit_rate: float = 0.0
+    ):
         self._function_id = function_id
         self._function_name = name
         self._cost = cost
+        self._cache_hit_rate = cache_hit_rate
 
     def as_dataclass(self) -> "FunctionCostCatalogEntry":
         return FunctionCostCatalogEntry(
             function_id=self._function_id,
             name=self._function_name,
             cost=self._cost,
+            cache_hit_rate=self._cache_hit_rate,
             row_id=self._row_id,
         )
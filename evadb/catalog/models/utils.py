@@ -90,6 +90,8 @@ def drop_all_tables_except_catalog(engine: Engine):
                 if table.name not in CATALOG_TABLES:
                     if insp.has_table(table.name):
                         table.drop(con)
+                    # keep the in-memory metadata in sync with the database
+                    BaseModel.metadata.remove(table)
             trans.commit()
 
 
@@ -186,11 +188,17 @@ class FunctionCostCatalogEntry:
 
     name: str
     cost: float = None
+    cache_hit_rate: float = None
     function_id: int = None
     row_id: int = None
 
     def display_format(self):
-        return {"function_id": self.function_id, "name": self.name, "cost": self.cost}
+        return {
+            "function_id": self.function_id,
+            "name": self.name,
+            "cost": self.cost,
+            "cache_hit_rate": self.cache_hit_rate,
+        }
 
 
 @dataclass(unsafe_hash=True)
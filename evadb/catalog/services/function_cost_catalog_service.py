@@ -29,7 +29,7 @@ class FunctionCostCatalogService(BaseService):
         super().__init__(FunctionCostCatalog, db_session)
 
     def insert_entry(
-        self, function_id: int, name: str, cost: int
+        self, function_id: int, name: str, cost: int, cache_hit_rate: float = None
     ) -> FunctionCostCatalogEntry:
         """Insert a new function cost entry
 
@@ -37,34 +37,46 @@ class FunctionCostCatalogService(BaseService):
             function_id(int): id of the function
             name (str) : name of the function
             cost(int)  : cost of the function
+            cache_hit_rate(float): fraction of the calls served by the cache
 
         Returns:
             FunctionCostCatalogEntry: Returns the new entry created
         """
         try:
-            function_obj = self.model(function_id, name, cost)
+            function_obj = self.model(function_id, name, cost, cache_hit_rate or 0.0)
             function_obj.save(self.session)
         except Exception as e:
             raise CatalogError(
                 f"Error while inserting entry to FunctionCostCatalog: {str(e)}"
             )
 
-    def upsert_entry(self, function_id: int, name: str, new_cost: int):
+    def upsert_entry(
+        self,
+        function_id: int,
+        name: str,
+        new_cost: int,
+        cache_hit_rate: float = None,
+    ):
         """Upserts a new function cost entry
 
         Arguments:
             function_id(int): id of the function
             name (str) : name of the function
             cost(int)  : cost of the function
+            cache_hit_rate(float): fraction of the calls served by the cache. The
+                persisted value is kept if it is None.
         """
         try:
             function_obj = self.session.execute(
                 select(self.model).filter(self.model._function_id == function_id)
             ).scalar_one_or_none()
             if function_obj:
-                function_obj.update(self.session, _cost=new_cost)
+                updates = {"_cost": new_cost}
+                if cache_hit_rate is not None:
+                    updates["_cache_hit_rate"] = cache_hit_rate
+                function_obj.update(self.session, **updates)
             else:
-                self.insert_entry(function_id, name, new_cost)
+                self.insert_entry(function_id, name, new_cost, cache_hit_rate)
         except Exception as e:
             raise CatalogError(
                 f"Error while upserting entry to FunctionCostCatalog: {str(e)}"
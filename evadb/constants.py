@@ -21,3 +21,5 @@ CACHEABLE_FUNCTIONS = ["Yolo", "FaceDetector", "OCRExtractor", "HFObjectDetector
 IFRAMES = "IFRAMES"
 AUDIORATE = "AUDIORATE"
 DEFAULT_FUNCTION_EXPRESSION_COST = 100
+# seconds per row of the functions worth evaluating in several processes
+MIN_PARALLEL_FUNCTION_COST = 0.001
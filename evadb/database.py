@@ -16,7 +16,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
-from evadb.catalog.catalog_utils import bootstrap_configs, get_catalog_instance
+from evadb.catalog.catalog_utils import (
+    bootstrap_configs,
+    get_catalog_instance,
+    release_catalog_instance,
+)
 from evadb.configuration.bootstrap_environment import bootstrap_environment
 from evadb.configuration.constants import (
     DB_DEFAULT_NAME,
@@ -36,7 +40,7 @@ class EvaDBDatabase:
 
     def catalog(self) -> "CatalogManager":
         """
-        Note: Generating an object on demand plays a crucial role in ensuring that different threads do not share the same catalog object, as it can result in serialization issues and incorrect behavior with SQLAlchemy. Refer to get_catalog_instance()
+        Note: The catalog object is fetched on demand instead of being stored, so that the database object can be serialized. The catalog object is shared within a process. Refer to get_catalog_instance()
         """
         return self.catalog_func(self.catalog_uri)
 
@@ -59,7 +63,19 @@ def init_evadb_instance(
 
     catalog_uri = custom_db_uri or get_default_db_uri(Path(db_dir))
 
+    # start from a fresh catalog instance, as the catalog database might have been
+    # removed since the last connection
+    release_catalog_instance(catalog_uri)
+
     # load all the config into the configuration_catalog table
-    bootstrap_configs(get_catalog_instance(catalog_uri), config_obj)
+    catalog = get_catalog_instance(catalog_uri)
+    bootstrap_configs(catalog, config_obj)
+
+    # start the worker processes of the local Exchange with the database rather
+    # than on the first parallel query
+    if catalog.get_configuration_catalog_value("local_exchange", False):
+        from evadb.executor.process_utils import start_worker_pool
+
+        start_worker_pool()
 
     return EvaDBDatabase(db_dir, catalog_uri, get_catalog_instance)
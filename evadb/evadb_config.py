@@ -38,7 +38,24 @@ BASE_EVADB_CONFIG = {
     "host": "0.0.0.0",
     "port": 8803,
     "socket_timeout": 60,
+    "server_workers": 4,  # number of queries the server runs concurrently
+    "server_max_queued_requests": 64,  # queued requests beyond which new ones fail
+    "server_query_timeout": 0,  # seconds a server query may run, 0 disables it
     "ray": False,
+    "local_exchange": False,  # evaluate functions in worker processes without Ray
+    "columnar_storage": False,  # store fixed-shape ndarray columns as column files
+    "decode_parallelism": 1,  # number of video files decoded concurrently
+    "frame_cache_size": 0,  # bytes of decoded video frames cached on disk, 0 disables it
+    "frame_cache_memory_size": 0,  # bytes of decoded video frames cached in memory
+    "function_cache_memory_size": 2**27,  # bytes of function results cached in memory
+    "function_cache_eviction_policy": "least-recently-used",
+    "function_pool_memory_size": 2**31,  # bytes of warm stateless functions
+    "plan_cache_size": 128,  # number of query plans cached, 0 disables it
+    "index_build_in_background": True,  # overlap feature extraction and index inserts
+    "hash_join_memory_size": 2**28,  # bytes of a hash join build side kept in memory
+    "nested_loop_join_memory_size": 2**28,  # bytes of the inner side kept in memory
+    "sort_memory_size": 2**28,  # bytes of rows an ORDER BY sorts in memory
+    "groupby_memory_size": 2**28,  # bytes of GROUP BY groups kept in memory
     "OPENAI_API_KEY": "",
     "PINECONE_API_KEY": "",
     "PINECONE_ENV": "",
@@ -39,7 +39,7 @@ class AbstractExecutor(ABC):
 
     # @lru_cache(maxsize=None)
     def catalog(self) -> "CatalogManager":
-        """The object is intentionally generated on demand to prevent serialization issues. Having a SQLAlchemy object as a member variable can cause problems with multiprocessing. See get_catalog_instance()"""
+        """The object is intentionally fetched on demand rather than stored to prevent serialization issues. Having a SQLAlchemy object as a member variable can cause problems with multiprocessing. See get_catalog_instance()"""
         return self._db.catalog() if self._db else None
 
     def append_child(self, child: AbstractExecutor):
@@ -16,6 +16,11 @@ import contextlib
 
 import pandas as pd
 
+from evadb.catalog.catalog_type import TableType
+from evadb.catalog.catalog_utils import (
+    is_fixed_shape_ndarray_col,
+    xform_column_definitions_to_catalog_entries,
+)
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import (
@@ -33,6 +38,15 @@ class CreateExecutor(AbstractExecutor):
     def __init__(self, db: EvaDBDatabase, node: CreatePlan):
         super().__init__(db, node)
 
+    def _get_table_type(self) -> TableType:
+        # tables with fixed-shape ndarray columns can be routed to the columnar
+        # storage engine, which memory-maps those columns instead of pickling them
+        if self.catalog().get_configuration_catalog_value("columnar_storage", False):
+            columns = xform_column_definitions_to_catalog_entries(self.node.column_list)
+            if any(is_fixed_shape_ndarray_col(col) for col in columns):
+                return TableType.COLUMNAR_DATA
+        return TableType.STRUCTURED_DATA
+
     def exec(self, *args, **kwargs):
         # create a table in the active database if set
         is_native_table = self.node.table_info.database_name is not None
@@ -50,7 +64,9 @@ class CreateExecutor(AbstractExecutor):
 
         if not is_native_table:
             catalog_entry = self.catalog().create_and_insert_table_catalog_entry(
-                self.node.table_info, self.node.column_list
+                self.node.table_info,
+                self.node.column_list,
+                table_type=self._get_table_type(),
             )
         else:
             catalog_entry = create_table_catalog_entry_for_native_table(
@@ -20,12 +20,16 @@ from evadb.catalog.catalog_type import VectorStoreType
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
-from evadb.executor.executor_utils import ExecutorError, handle_vector_store_params
+from evadb.executor.executor_utils import (
+    ExecutorError,
+    add_in_background,
+    handle_vector_store_params,
+    stack_features,
+)
 from evadb.expression.function_expression import FunctionExpression
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.create_index_plan import CreateIndexPlan
 from evadb.third_party.databases.interface import get_database_handler
-from evadb.third_party.vector_stores.types import FeaturePayload
 from evadb.third_party.vector_stores.utils import VectorStoreFactory
 from evadb.utils.logging_manager import logger
 
@@ -41,6 +45,7 @@ class CreateIndexExecutor(AbstractExecutor):
         self.vector_store_type = self.node.vector_store_type
         self.project_expr_list = self.node.project_expr_list
         self.index_def = self.node.index_def
+        self.index_params = self.node.index_params
 
     def exec(self, *args, **kwargs):
         # Vector type specific creation.
@@ -135,29 +140,43 @@ class CreateIndexExecutor(AbstractExecutor):
             index = None
 
         try:
-            # Add features to index.
-            for input_batch in self.children[0].exec():
-                input_batch.drop_column_alias()
-                feat = input_batch.column_as_numpy_array(feat_col_name)
-                row_num = input_batch.column_as_numpy_array(ROW_NUM_COLUMN)
-
-                for i in range(len(input_batch)):
-                    row_feat = feat[i].reshape(1, -1)
+            # Stack the features and row ids of every input batch, so that they
+            # are added to the index in bulk.
+            def feature_batches():
+                nonlocal index
+                for input_batch in self.children[0].exec():
+                    if len(input_batch) == 0:
+                        continue
+                    input_batch.drop_column_alias()
+                    feat = stack_features(
+                        input_batch.column_as_numpy_array(feat_col_name)
+                    )
+                    row_num = input_batch.column_as_numpy_array(ROW_NUM_COLUMN)
 
                     # Create new index if not exists.
                     if index is None:
-                        input_dim = row_feat.shape[1]
                         index = VectorStoreFactory.init_vector_store(
                             self.vector_store_type,
                             self.name,
                             **handle_vector_store_params(
                                 self.vector_store_type, index_path, self.catalog
                             ),
+                            **self.index_params,
                         )
-                        index.create(input_dim)
+                        index.create(feat.shape[1])
 
                     # Row ID for mapping back to the row.
-                    index.add([FeaturePayload(row_num[i], row_feat)])
+                    yield row_num, feat
+
+            if self.catalog().get_configuration_catalog_value(
+                "index_build_in_background", True
+            ):
+                add_in_background(
+                    lambda *batch: index.add_batch(*batch), feature_batches()
+                )
+            else:
+                for row_num, feat in feature_batches():
+                    index.add_batch(row_num, feat)
 
             # Persist index.
             index.persist()
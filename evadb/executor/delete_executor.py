@@ -21,6 +21,7 @@ from evadb.catalog.catalog_type import TableType
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.executor_utils import remove_rows_from_vector_indexes
 from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
@@ -94,9 +95,10 @@ class DeleteExecutor(AbstractExecutor):
         table_catalog = self.node.table_ref.table.table_obj
         storage_engine = StorageEngine.factory(self.db, table_catalog)
 
-        assert (
-            table_catalog.table_type == TableType.STRUCTURED_DATA
-        ), "DELETE only implemented for structured data"
+        assert table_catalog.table_type in [
+            TableType.STRUCTURED_DATA,
+            TableType.COLUMNAR_DATA,
+        ], "DELETE only implemented for structured data"
 
         table_to_delete_from = storage_engine._try_loading_table_via_reflection(
             table_catalog.name
@@ -108,5 +110,6 @@ class DeleteExecutor(AbstractExecutor):
         # verify where clause and convert to sqlalchemy supported filter
         # https://stackoverflow.com/questions/34026210/where-filter-from-table-object-using-a-dictionary-or-kwargs
 
-        storage_engine.delete(table_catalog, sqlalchemy_filter_clause)
+        deleted_row_ids = storage_engine.delete(table_catalog, sqlalchemy_filter_clause)
+        remove_rows_from_vector_indexes(self.db, table_catalog, deleted_row_ids)
         yield Batch(pd.DataFrame(["Deleted rows"]))
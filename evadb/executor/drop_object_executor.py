@@ -19,9 +19,11 @@ import pandas as pd
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import ExecutorError, handle_vector_store_params
+from evadb.functions.function_pool import get_function_pool
 from evadb.models.storage.batch import Batch
 from evadb.parser.types import ObjectType
 from evadb.plan_nodes.drop_object_plan import DropObjectPlan
+from evadb.storage.native_storage_engine import NativeStorageEngine
 from evadb.storage.storage_engine import StorageEngine
 from evadb.third_party.vector_stores.utils import VectorStoreFactory
 from evadb.utils.logging_manager import logger
@@ -100,6 +102,8 @@ class DropObjectExecutor(AbstractExecutor):
             # todo also delete the indexes associated with the table
 
             self.catalog().delete_function_catalog_entry_by_name(function_name)
+            # CREATE OR REPLACE FUNCTION also drops the function through here
+            get_function_pool().invalidate(function_name)
 
             return Batch(
                 pd.DataFrame(
@@ -156,6 +160,7 @@ class DropObjectExecutor(AbstractExecutor):
         logger.debug(f"Dropping database {database_name}")
 
         self.catalog().drop_database_catalog_entry(db_catalog_entry)
+        NativeStorageEngine.dispose_sqlalchemy_engines(database_name)
 
         return Batch(
             pd.DataFrame(
@@ -12,11 +12,26 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator
+import pickle
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Iterator, Tuple
 
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import ExecutorError
+from evadb.executor.process_utils import (
+    SharedBatch,
+    read_shared_batch,
+    release_shared_batch,
+    run_inner_executor,
+    run_worker,
+    shutdown_worker_pool,
+    start_worker_pool,
+    write_shared_batch,
+)
 from evadb.executor.ray_utils import (
     StageCompleteSignal,
     ray_parallel,
@@ -25,6 +40,7 @@ from evadb.executor.ray_utils import (
 )
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.exchange_plan import ExchangePlan
+from evadb.utils.logging_manager import logger
 
 
 class QueueReaderExecutor(AbstractExecutor):
@@ -56,22 +72,91 @@ class ExchangeExecutor(AbstractExecutor):
         self.parallelism = node.parallelism
         self.ray_pull_env_conf_dict = node.ray_pull_env_conf_dict
         self.ray_parallel_env_conf_dict = node.ray_parallel_env_conf_dict
+        self.use_ray = node.use_ray
         super().__init__(db, node)
 
     def build_inner_executor(self, inner_executor):
         self.inner_executor = inner_executor
         self.inner_executor.children = [QueueReaderExecutor()]
 
-    def exec(self) -> Iterator[Batch]:
+    def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        # Pull data from child executor
+        assert (
+            len(self.children) == 1
+        ), "Exchange currently only supports parallelization of node with only one child"
+        if self.use_ray:
+            yield from self._exec_ray()
+        else:
+            yield from self._exec_local(**kwargs)
+
+    def _exec_local(self, **kwargs) -> Iterator[Batch]:
+        """Runs the inner executor over the batches of the child in the worker
+        processes of the Exchange, and yields the outputs in the order of the
+        batches
+
+        At most parallelism batches are in flight, so that the query uses as
+        many workers of the shared pool and the child is not read far ahead.
+        """
+        batches = self.children[0].exec(**kwargs)
+        try:
+            inner_executor = pickle.dumps(self.inner_executor)
+        except Exception as e:
+            logger.warning(
+                "Evaluating the functions in the query's process, since they "
+                f"cannot be sent to the worker processes: {str(e)}"
+            )
+            for batch in batches:
+                yield from run_inner_executor(self.inner_executor, batch)
+            return
+
+        pool = start_worker_pool()
+        executor_id = uuid.uuid4().hex
+        pending: Deque[Tuple[SharedBatch, Future]] = deque()
+        try:
+            for batch in batches:
+                shared_batch = write_shared_batch(batch)
+                future = pool.submit(
+                    run_worker, executor_id, inner_executor, shared_batch
+                )
+                pending.append((shared_batch, future))
+                if len(pending) >= self.parallelism:
+                    yield from self._read_outputs(pending.popleft()[1])
+            while pending:
+                yield from self._read_outputs(pending.popleft()[1])
+        finally:
+            # release the batches of the queries stopped early (e.g., LIMIT)
+            for shared_batch, future in pending:
+                if future.cancel():
+                    release_shared_batch(shared_batch)
+                elif future.exception() is None:
+                    for output in future.result():
+                        release_shared_batch(output)
+
+    def _read_outputs(self, future: Future) -> Iterator[Batch]:
+        try:
+            outputs = future.result()
+        except ExecutorError:
+            raise
+        except BrokenProcessPool as e:
+            # a worker died, the next query starts new workers
+            shutdown_worker_pool()
+            raise ExecutorError(e)
+        except Exception as e:
+            raise ExecutorError(e)
+        try:
+            batches = [read_shared_batch(output) for output in outputs]
+        finally:
+            # the blocks of the outputs that are read are already released
+            for output in outputs:
+                release_shared_batch(output)
+        yield from batches
+
+    def _exec_ray(self) -> Iterator[Batch]:
         from ray.util.queue import Queue
 
         input_queue = Queue(maxsize=100)
         output_queue = Queue(maxsize=100)
 
-        # Pull data from child executor
-        assert (
-            len(self.children) == 1
-        ), "Exchange currently only supports parallelization of node with only one child"
         ray_pull_task = ray_pull().remote(
             self.ray_pull_env_conf_dict,
             self.children[0],
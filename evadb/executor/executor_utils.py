@@ -14,17 +14,23 @@
 # limitations under the License.
 import glob
 import os
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator, List, Union
+from queue import Queue
+from typing import TYPE_CHECKING, Callable, Generator, Iterator, List, Optional, Union
+
+import numpy as np
 
 from evadb.catalog.catalog_utils import xform_column_definitions_to_catalog_entries
-from evadb.catalog.models.utils import TableCatalogEntry
+from evadb.catalog.models.utils import IndexCatalogEntry, TableCatalogEntry
 from evadb.parser.create_statement import ColumnDefinition
 
 if TYPE_CHECKING:
     from evadb.catalog.catalog_manager import CatalogManager
+    from evadb.database import EvaDBDatabase
 
 from evadb.catalog.catalog_type import TableType, VectorStoreType
+from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.function_expression import FunctionExpression
 from evadb.models.storage.batch import Batch
@@ -61,6 +67,7 @@ def instrument_function_expression_cost(
                     function_id,
                     func_expr.function_obj.name,
                     func_expr._stats.prev_cost,
+                    func_expr._stats.cache_hit_rate,
                 )
 
 
@@ -212,6 +219,137 @@ def handle_vector_store_params(
         raise ValueError("Unsupported vector store type: {}".format(vector_store_type))
 
 
+def stack_features(features: np.ndarray) -> np.ndarray:
+    """Stacks the features of a batch into a float32 matrix of shape (n, dim)
+
+    Args:
+        features (np.ndarray): feature column of the batch, whose rows are
+            ndarrays (e.g., of shape (1, dim))
+    """
+    if features.dtype == object:
+        features = np.stack([feature.reshape(-1) for feature in features])
+    return np.ascontiguousarray(features.reshape(len(features), -1), dtype="float32")
+
+
+def add_in_background(add: Callable, batches: Iterator[tuple], max_pending: int = 2):
+    """Calls `add` with every batch on a background thread
+
+    The next batch (e.g., running the feature extractor) is produced while the
+    previous one is added (e.g., inserted into a vector index, which releases the
+    GIL). At most `max_pending` batches wait for the background thread.
+    """
+    pending = Queue(maxsize=max_pending)
+    errors = []
+
+    def consume():
+        while True:
+            batch = pending.get()
+            if batch is None:
+                return
+            if not errors:
+                try:
+                    add(*batch)
+                except Exception as e:
+                    errors.append(e)
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    try:
+        for batch in batches:
+            if errors:
+                break
+            pending.put(batch)
+    finally:
+        pending.put(None)
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def get_vector_indexes_on_table(
+    catalog: "CatalogManager", table: TableCatalogEntry
+) -> List[IndexCatalogEntry]:
+    """Returns the EvaDB vector indexes built on a column of the table"""
+    return [
+        index
+        for index in catalog.get_all_index_catalog_entries()
+        if index.type != VectorStoreType.PGVECTOR and index.feat_column in table.columns
+    ]
+
+
+def _open_vector_index(db: "EvaDBDatabase", index: IndexCatalogEntry):
+    from evadb.third_party.vector_stores.utils import VectorStoreFactory
+
+    return VectorStoreFactory.init_vector_store(
+        index.type,
+        index.name,
+        **handle_vector_store_params(index.type, index.save_file_path, db.catalog),
+    )
+
+
+def add_rows_to_vector_indexes(
+    db: "EvaDBDatabase", table: TableCatalogEntry, after_row_id: Optional[int]
+):
+    """Adds the rows of the table with a row id larger than after_row_id (all the
+    rows if None) to the vector indexes on the table
+
+    Only these rows are read and go through the feature function of the index,
+    instead of running the CREATE INDEX statement over the whole table again.
+    """
+    from evadb.binder.statement_binder import StatementBinder
+    from evadb.binder.statement_binder_context import StatementBinderContext
+    from evadb.parser.parser import Parser
+    from evadb.storage.storage_engine import StorageEngine
+
+    indexes = get_vector_indexes_on_table(db.catalog(), table)
+    if not indexes:
+        return
+
+    storage_engine = StorageEngine.factory(db, table)
+    for index_catalog_entry in indexes:
+        # The stored definition gives the projection computing the feature.
+        stmt = Parser().parse(index_catalog_entry.index_def)[0]
+        StatementBinder(StatementBinderContext(db.catalog)).bind(stmt)
+        feat_col_name = index_catalog_entry.feat_column.name
+        for project_expr in stmt.project_expr_list:
+            if isinstance(project_expr, FunctionExpression):
+                feat_col_name = project_expr.output_objs[0].name
+
+        index = None
+        for batch in storage_engine.read(table, after_row_id=after_row_id):
+            batch.modify_column_alias(stmt.table_ref.alias)
+            batch = apply_project(batch, stmt.project_expr_list)
+            if batch.empty():
+                continue
+            batch.drop_column_alias()
+            if index is None:
+                index = _open_vector_index(db, index_catalog_entry)
+            index.add_batch(
+                batch.column_as_numpy_array(ROW_NUM_COLUMN),
+                stack_features(batch.column_as_numpy_array(feat_col_name)),
+            )
+        if index is not None:
+            index.persist()
+
+
+def remove_rows_from_vector_indexes(
+    db: "EvaDBDatabase", table: TableCatalogEntry, row_ids: List[int]
+):
+    """Removes the deleted rows of the table from the vector indexes on the table"""
+    if len(row_ids) == 0:
+        return
+    for index_catalog_entry in get_vector_indexes_on_table(db.catalog(), table):
+        index = _open_vector_index(db, index_catalog_entry)
+        try:
+            index.remove_ids(np.asarray(row_ids, dtype=np.int64))
+        except NotImplementedError as e:
+            # the scan over the index joins the results with the table, which
+            # drops the deleted rows
+            logger.warn(f"Index {index_catalog_entry.name} keeps deleted rows: {e}")
+            continue
+        index.persist()
+
+
 def create_table_catalog_entry_for_native_table(
     table_info: TableInfo, column_list: List[ColumnDefinition]
 ):
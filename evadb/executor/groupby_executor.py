@@ -13,21 +13,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
-from typing import Iterator
+import shutil
+import tempfile
+from typing import Iterator, List
 
+import numpy as np
 import pandas as pd
 
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.spill_utils import (
+    MAX_PARTITION_LEVEL,
+    NUM_SPILL_PARTITIONS,
+    SpillPartitions,
+    frame_memory_size,
+)
+from evadb.expression.abstract_expression import ExpressionType
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.groupby_plan import GroupByPlan
 
+# key of the single group of an aggregation without GROUP BY list
+_GROUP_COLUMN = "__group"
+
+# aggregate -> [(aggregate of the rows of a batch, merge of these aggregates)]
+_PARTIAL_AGGREGATES = {
+    ExpressionType.AGGREGATION_SUM: [("sum", "sum")],
+    ExpressionType.AGGREGATION_COUNT: [("count", "sum")],
+    ExpressionType.AGGREGATION_AVG: [("sum", "sum"), ("count", "sum")],
+    ExpressionType.AGGREGATION_MIN: [("min", "min")],
+    ExpressionType.AGGREGATION_MAX: [("max", "max")],
+}
+
 
 class GroupByExecutor(AbstractExecutor):
     """
     Group inputs into 4d segments of length provided in the query
     E.g., "GROUP BY '8 frames'" groups every 8 frames into one segment
 
+    Otherwise, aggregates the rows grouped by the values of the columns in the
+    GROUP BY list (hash aggregation). The rows of every batch are aggregated
+    into partial aggregates (e.g., the sum and the count of AVG), which are
+    merged into the table of the groups. Once the table exceeds the
+    `groupby_memory_size` configuration, it is hash partitioned to spill files
+    along with the partial aggregates of the remaining batches, and every
+    partition is aggregated on its own.
+
     Arguments:
         node (AbstractPlan): The GroupBy Plan
 
@@ -35,18 +65,189 @@ class GroupByExecutor(AbstractExecutor):
 
     def __init__(self, db: EvaDBDatabase, node: GroupByPlan):
         super().__init__(db, node)
-        numbers_only = re.sub(r"\D", "", node.groupby_clause.value)
-        self._segment_length = int(numbers_only)
+        self._segment_length = None
+        if node.groupby_clause is not None:
+            numbers_only = re.sub(r"\D", "", node.groupby_clause.value)
+            self._segment_length = int(numbers_only)
+        self._groupby_list = node.groupby_list or []
+        self._aggregates = node.aggregates or []
 
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        if self._segment_length is not None:
+            yield from self._exec_segments(**kwargs)
+        else:
+            yield from self._exec_aggregation(**kwargs)
+
+    def _exec_segments(self, **kwargs) -> Iterator[Batch]:
         child_executor = self.children[0]
 
-        buffer = Batch(pd.DataFrame())
+        # The batches are concatenated once they hold a segment
+        buffer = []
+        num_rows = 0
         for batch in child_executor.exec(**kwargs):
-            new_batch = buffer + batch
+            if batch.empty():
+                continue
+            buffer.append(batch)
+            num_rows += len(batch)
+            if num_rows < self._segment_length:
+                continue
+            new_batch = Batch.concat(buffer, copy=False)
+            num_segments = num_rows // self._segment_length
+            for idx in range(num_segments):
+                start = idx * self._segment_length
+                yield new_batch[start : start + self._segment_length]
             # We assume that all the segments exactly of segment_length size
             # and discard any dangling frames in the end.
-            while len(new_batch) >= self._segment_length:
-                yield new_batch[: self._segment_length]
-                new_batch = new_batch[self._segment_length :]
-            buffer = new_batch
+            num_rows -= num_segments * self._segment_length
+            buffer = [new_batch[len(new_batch) - num_rows :]] if num_rows else []
+
+    def _exec_aggregation(self, **kwargs) -> Iterator[Batch]:
+        child_executor = self.children[0]
+        keys = [expr.col_alias for expr in self._groupby_list] or [_GROUP_COLUMN]
+        catalog = self.catalog()
+        memory_size = catalog.get_configuration_catalog_value(
+            "groupby_memory_size", 2**28
+        )
+        spill_dir = tempfile.mkdtemp(
+            dir=catalog.get_configuration_catalog_value("tmp_dir") or None
+        )
+        try:
+            partials = (
+                self._partial_aggregate(batch, keys)
+                for batch in child_executor.exec(**kwargs)
+                if not batch.empty()
+            )
+            for table in self._aggregate(partials, keys, memory_size, spill_dir, 0):
+                yield Batch(self._finalize(table, keys))
+        finally:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+    def _state_columns(self) -> List[List[str]]:
+        """Returns the columns of the partial aggregates of every aggregate"""
+        return [
+            [
+                "__{}_{}".format(idx, partial)
+                for partial, _ in _PARTIAL_AGGREGATES[expr.etype]
+            ]
+            for idx, (_, expr) in enumerate(self._aggregates)
+        ]
+
+    def _partial_aggregate(self, batch: Batch, keys: List[str]) -> pd.DataFrame:
+        """Aggregates the rows of the batch into partial aggregates per group"""
+        if self._groupby_list:
+            frame = batch.frames[keys].reset_index(drop=True)
+        else:
+            frame = pd.DataFrame({_GROUP_COLUMN: np.zeros(len(batch), dtype=np.int8)})
+
+        partial_aggregates = {}
+        for idx, ((_, expr), columns) in enumerate(
+            zip(self._aggregates, self._state_columns())
+        ):
+            values = expr.get_child(0).evaluate(batch).frames
+            frame["__{}".format(idx)] = values.iloc[:, 0].to_numpy()
+            for column, (partial, _) in zip(columns, _PARTIAL_AGGREGATES[expr.etype]):
+                partial_aggregates[column] = ("__{}".format(idx), partial)
+        # the groups of a GROUP BY without aggregates are its distinct keys
+        if not partial_aggregates:
+            return frame.drop_duplicates(ignore_index=True)
+        return (
+            frame.groupby(keys, sort=False, dropna=False)
+            .agg(**partial_aggregates)
+            .reset_index()
+        )
+
+    def _merge(self, tables: List[pd.DataFrame], keys: List[str]) -> pd.DataFrame:
+        """Merges the partial aggregates of the same groups"""
+        if len(tables) == 1:
+            return tables[0]
+        merges = {}
+        for expr_columns, (_, expr) in zip(self._state_columns(), self._aggregates):
+            for column, (_, merge) in zip(
+                expr_columns, _PARTIAL_AGGREGATES[expr.etype]
+            ):
+                merges[column] = (column, merge)
+        if not merges:
+            return pd.concat(tables, ignore_index=True, copy=False).drop_duplicates(
+                ignore_index=True
+            )
+        return (
+            pd.concat(tables, ignore_index=True, copy=False)
+            .groupby(keys, sort=False, dropna=False)
+            .agg(**merges)
+            .reset_index()
+        )
+
+    def _aggregate(
+        self,
+        partials: Iterator[pd.DataFrame],
+        keys: List[str],
+        memory_size: int,
+        spill_dir: str,
+        level: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Merges the partial aggregates into tables of the groups, one table per
+        spilled partition"""
+        table = None
+        table_size = 0
+        buffer = []
+        buffer_size = 0
+        partitions = None
+        for partial in partials:
+            if partitions is not None:
+                partitions.write(Batch(partial))
+                continue
+            buffer.append(partial)
+            buffer_size += frame_memory_size(partial)
+            # merge once the buffer is as large as the table, so that the
+            # table is copied a logarithmic number of times
+            if buffer_size < table_size:
+                continue
+            table = self._merge(buffer if table is None else [table, *buffer], keys)
+            table_size = frame_memory_size(table)
+            buffer = []
+            buffer_size = 0
+            # a single group is not split by partitioning
+            if (
+                table_size > memory_size
+                and len(table) > 1
+                and level <= MAX_PARTITION_LEVEL
+            ):
+                partitions = SpillPartitions(
+                    spill_dir, keys, NUM_SPILL_PARTITIONS, level
+                )
+                partitions.write(Batch(table))
+                table = None
+
+        if partitions is None:
+            if table is not None:
+                buffer.insert(0, table)
+            if buffer:
+                yield self._merge(buffer, keys)
+            return
+
+        try:
+            for spill_file in partitions.files:
+                if spill_file.num_rows > 0:
+                    yield from self._aggregate(
+                        (batch.frames for batch in spill_file.read()),
+                        keys,
+                        memory_size,
+                        spill_dir,
+                        level + 1,
+                    )
+                spill_file.close()
+        finally:
+            partitions.close()
+
+    def _finalize(self, table: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        """Computes the aggregates of the groups from their partial aggregates"""
+        output = {}
+        if self._groupby_list:
+            for key in keys:
+                output[key] = table[key]
+        for columns, (name, expr) in zip(self._state_columns(), self._aggregates):
+            if expr.etype == ExpressionType.AGGREGATION_AVG:
+                output[name] = table[columns[0]] / table[columns[1]]
+            else:
+                output[name] = table[columns[0]]
+        return pd.DataFrame(output).reset_index(drop=True)
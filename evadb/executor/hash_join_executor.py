@@ -12,7 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator
+import shutil
+import tempfile
+from typing import Iterator, List
 
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
@@ -21,11 +23,28 @@ from evadb.executor.executor_utils import (
     apply_project,
     instrument_function_expression_cost,
 )
+from evadb.executor.join_build_executor import JoinHashTable
+from evadb.executor.spill_utils import (
+    MAX_PARTITION_LEVEL,
+    NUM_SPILL_PARTITIONS,
+    SpillFile,
+    SpillPartitions,
+)
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.hash_join_probe_plan import HashJoinProbePlan
 
 
 class HashJoinExecutor(AbstractExecutor):
+    """
+    Joins the probe side with the hash table of the build side
+
+    The probe side is read once. If the build side exceeds the
+    `hash_join_memory_size` configuration, the probe rows are hash partitioned
+    to spill files like the build rows, and every build partition is joined
+    with the probe rows of the same partition. A build partition exceeding the
+    memory budget is partitioned again.
+    """
+
     def __init__(self, db: EvaDBDatabase, node: HashJoinProbePlan):
         super().__init__(db, node)
         self.predicate = node.join_predicate
@@ -37,17 +56,104 @@ class HashJoinExecutor(AbstractExecutor):
         build_table = self.children[0]
         probe_table = self.children[1]
         hash_keys = [key.col_alias for key in self.probe_keys]
-        for build_batch in build_table.exec():
-            for probe_batch in probe_table.exec():
-                probe_batch.reassign_indices_to_hash(hash_keys)
-                join_batch = Batch.join(probe_batch, build_batch)
-                join_batch.reset_index()
-                join_batch = apply_predicate(join_batch, self.predicate)
-                join_batch = apply_project(join_batch, self.join_project)
-                yield join_batch
+        catalog = self.catalog()
+        memory_size = catalog.get_configuration_catalog_value(
+            "hash_join_memory_size", 2**28
+        )
+        spill_dir = tempfile.mkdtemp(
+            dir=catalog.get_configuration_catalog_value("tmp_dir") or None
+        )
+        try:
+            hash_table = build_table.build(memory_size, spill_dir, **kwargs)
+            if hash_table is None and build_table.partitions is None:
+                # no row of the probe side matches an empty build side
+                return
+            if hash_table is not None:
+                for probe_batch in probe_table.exec(**kwargs):
+                    yield from self._join(hash_table, probe_batch, hash_keys)
+            else:
+                build_partitions = build_table.partitions
+                probe_partitions = SpillPartitions(
+                    spill_dir, hash_keys, NUM_SPILL_PARTITIONS
+                )
+                for probe_batch in probe_table.exec(**kwargs):
+                    probe_partitions.write(probe_batch)
+                yield from self._join_partitions(
+                    build_partitions, probe_partitions, memory_size, spill_dir
+                )
+        finally:
+            shutil.rmtree(spill_dir, ignore_errors=True)
 
         # instrument required stats
         if self.predicate or self.join_project:
-            catalog = self.catalog()
             instrument_function_expression_cost(self.predicate, catalog)
             instrument_function_expression_cost(self.join_project, catalog)
+
+    def _join(
+        self, hash_table: JoinHashTable, probe_batch: Batch, hash_keys: List[str]
+    ) -> Iterator[Batch]:
+        join_batch = hash_table.probe(probe_batch, hash_keys)
+        join_batch = apply_predicate(join_batch, self.predicate)
+        join_batch = apply_project(join_batch, self.join_project)
+        if not join_batch.empty():
+            yield join_batch
+
+    def _join_partitions(
+        self,
+        build_partitions: SpillPartitions,
+        probe_partitions: SpillPartitions,
+        memory_size: int,
+        spill_dir: str,
+    ) -> Iterator[Batch]:
+        for build_file, probe_file in zip(
+            build_partitions.files, probe_partitions.files
+        ):
+            if build_file.num_rows > 0 and probe_file.num_rows > 0:
+                yield from self._join_partition(
+                    build_file,
+                    probe_file,
+                    build_partitions,
+                    probe_partitions,
+                    memory_size,
+                    spill_dir,
+                )
+            build_file.close()
+            probe_file.close()
+
+    def _join_partition(
+        self,
+        build_file: SpillFile,
+        probe_file: SpillFile,
+        build_partitions: SpillPartitions,
+        probe_partitions: SpillPartitions,
+        memory_size: int,
+        spill_dir: str,
+    ) -> Iterator[Batch]:
+        level = build_partitions.level + 1
+        if build_file.memory_size > memory_size and level <= MAX_PARTITION_LEVEL:
+            # Partition both sides of the partition again.
+            build_subpartitions = SpillPartitions(
+                spill_dir, build_partitions.keys, NUM_SPILL_PARTITIONS, level
+            )
+            for batch in build_file.read():
+                build_subpartitions.write(batch)
+            # all the rows have the same key if they are in a single partition
+            if max(f.num_rows for f in build_subpartitions.files) < build_file.num_rows:
+                build_file.close()
+                probe_subpartitions = SpillPartitions(
+                    spill_dir, probe_partitions.keys, NUM_SPILL_PARTITIONS, level
+                )
+                for batch in probe_file.read():
+                    probe_subpartitions.write(batch)
+                probe_file.close()
+                yield from self._join_partitions(
+                    build_subpartitions, probe_subpartitions, memory_size, spill_dir
+                )
+                return
+            build_subpartitions.close()
+
+        hash_table = JoinHashTable(
+            Batch.concat(build_file.read(), copy=False), build_partitions.keys
+        )
+        for probe_batch in probe_file.read():
+            yield from self._join(hash_table, probe_batch, probe_partitions.keys)
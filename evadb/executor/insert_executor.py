@@ -17,6 +17,7 @@ import pandas as pd
 from evadb.catalog.catalog_type import TableType
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.executor_utils import add_rows_to_vector_indexes
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.insert_plan import InsertPlan
 from evadb.storage.storage_engine import StorageEngine
@@ -38,9 +39,10 @@ class InsertExecutor(AbstractExecutor):
         )
 
         # Implemented only for STRUCTURED_DATA
-        assert (
-            table_catalog_entry.table_type == TableType.STRUCTURED_DATA
-        ), "INSERT only implemented for structured data"
+        assert table_catalog_entry.table_type in [
+            TableType.STRUCTURED_DATA,
+            TableType.COLUMNAR_DATA,
+        ], "INSERT only implemented for structured data"
 
         tuples_to_insert = [
             tuple(i.value for i in val_node) for val_node in self.node.value_list
@@ -52,28 +54,11 @@ class InsertExecutor(AbstractExecutor):
         batch = Batch(dataframe)
 
         storage_engine = StorageEngine.factory(self.db, table_catalog_entry)
+        last_row_id = storage_engine.last_row_id(table_catalog_entry)
         storage_engine.write(table_catalog_entry, batch)
 
-        # Index update if there is an index built on the table.
-        for index in self.db.catalog().get_all_index_catalog_entries():
-            is_index_on_current_table = False
-            for column in table_catalog_entry.columns:
-                if column == index.feat_column:
-                    is_index_on_current_table = True
-                    break
-            if is_index_on_current_table:
-                create_index_query = index.index_def
-                create_index_query_list = create_index_query.split(" ")
-                if_not_exists = " ".join(create_index_query_list[2:5]).lower()
-                if if_not_exists != "if not exists":
-                    create_index_query = (
-                        " ".join(create_index_query_list[:2])
-                        + " IF NOT EXISTS "
-                        + " ".join(create_index_query_list[2:])
-                    )
-                from evadb.server.command_handler import execute_query_fetch_all
-
-                execute_query_fetch_all(self.db, create_index_query)
+        # Add the inserted rows to the indexes built on the table.
+        add_rows_to_vector_indexes(self.db, table_catalog_entry, last_row_id)
 
         yield Batch(
             pd.DataFrame([f"Number of rows loaded: {str(len(tuples_to_insert))}"])
@@ -12,28 +12,121 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
 
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.spill_utils import (
+    NUM_SPILL_PARTITIONS,
+    SpillPartitions,
+    frame_memory_size,
+)
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.hash_join_build_plan import HashJoinBuildPlan
 
 
+def _key_index(frame: pd.DataFrame, keys: List[str]) -> pd.Index:
+    if len(keys) == 1:
+        return pd.Index(frame[keys[0]])
+    return pd.MultiIndex.from_frame(frame[keys])
+
+
+class JoinHashTable:
+    """Hash table of the rows of the build side on the join keys
+
+    The keys are factorized once, and the rows are grouped by key, so that a
+    probe batch is matched with a single vectorized lookup of its keys. Rows
+    with a null key do not match any row.
+    """
+
+    def __init__(self, batch: Batch, keys: List[str]):
+        frame = batch.frames
+        self._keys = keys
+        if not keys:
+            self._rows = frame.reset_index(drop=True)
+            return
+        codes, self._uniques = pd.factorize(_key_index(frame, keys))
+        order = np.argsort(codes, kind="stable")
+        # rows with a null key are factorized to -1, and sorted first
+        order = order[np.count_nonzero(codes < 0) :]
+        self._rows = frame.iloc[order].reset_index(drop=True)
+        self._counts = np.bincount(codes[order], minlength=len(self._uniques))
+        self._starts = np.cumsum(self._counts) - self._counts
+
+    def probe(self, batch: Batch, keys: List[str]) -> Batch:
+        """Returns the probe rows joined with their matching build rows"""
+        probe_frame = batch.frames.reset_index(drop=True)
+        if not self._keys:
+            return Batch(probe_frame.merge(self._rows, how="cross"))
+        codes = self._uniques.get_indexer(_key_index(probe_frame, keys))
+        matched = np.flatnonzero(codes >= 0)
+        counts = self._counts[codes[matched]]
+        probe_rows = np.repeat(matched, counts)
+        # the build rows of a key are contiguous, starting at self._starts
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        build_rows = np.repeat(self._starts[codes[matched]], counts) + offsets
+        return Batch(
+            pd.concat(
+                [
+                    probe_frame.iloc[probe_rows].reset_index(drop=True),
+                    self._rows.iloc[build_rows].reset_index(drop=True),
+                ],
+                axis=1,
+            )
+        )
+
+
 class BuildJoinExecutor(AbstractExecutor):
+    """
+    Builds the hash table of the build side of the hash join
+
+    The build side is kept in memory as long as it fits in `memory_size` bytes.
+    Beyond it, all the rows of the build side are hash partitioned to spill files
+    instead, so that the join runs partition by partition (grace hash join).
+    """
+
     def __init__(self, db: EvaDBDatabase, node: HashJoinBuildPlan):
         super().__init__(db, node)
         self.predicate = None  # node.join_predicate
         self.join_type = node.join_type
         self.build_keys = node.build_keys
+        self.hash_keys = [key.col_alias for key in self.build_keys]
+        self.partitions: Optional[SpillPartitions] = None
 
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
         child_executor = self.children[0]
-        # build in memory hash table and pass to the probe phase
-        # Assumption the hash table fits in memory
-        # Todo: Implement a partition based hash join (grace hash join)
-        cumm_batches = [batch for batch in child_executor.exec() if not batch.empty()]
-        cumm_batches = Batch.concat(cumm_batches)
-        hash_keys = [key.col_alias for key in self.build_keys]
-        cumm_batches.reassign_indices_to_hash(hash_keys)
-        yield cumm_batches
+        for batch in child_executor.exec(**kwargs):
+            if not batch.empty():
+                yield batch
+
+    def build(
+        self, memory_size: int, spill_dir: str, **kwargs
+    ) -> Optional[JoinHashTable]:
+        """Returns the hash table of the build side, or None if the build side is
+        empty or partitioned to self.partitions"""
+        self.partitions = None
+        batches = []
+        batches_size = 0
+        for batch in self.exec(**kwargs):
+            if self.partitions is not None:
+                self.partitions.write(batch)
+                continue
+            batches.append(batch)
+            batches_size += frame_memory_size(batch.frames)
+            # a cartesian product (no keys) cannot be partitioned
+            if batches_size > memory_size and self.hash_keys:
+                self.partitions = SpillPartitions(
+                    spill_dir, self.hash_keys, NUM_SPILL_PARTITIONS
+                )
+                for spilled_batch in batches:
+                    self.partitions.write(spilled_batch)
+                batches = []
+
+        if self.partitions is not None or not batches:
+            return None
+        return JoinHashTable(Batch.concat(batches, copy=False), self.hash_keys)
@@ -20,11 +20,27 @@ from evadb.executor.executor_utils import (
     apply_predicate,
     instrument_function_expression_cost,
 )
+from evadb.executor.spill_utils import BatchBuffer, frame_memory_size
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.nested_loop_join_plan import NestedLoopJoinPlan
 
+# rows of the cross product the join predicate is evaluated on at once
+MAX_CROSS_PRODUCT_ROWS = 2**20
+
 
 class NestedLoopJoinExecutor(AbstractExecutor):
+    """
+    Block nested loop join
+
+    The inner side is read once, and buffered in memory up to the
+    `nested_loop_join_memory_size` configuration, or spilled to a file beyond
+    it. The outer side is read in blocks of up to the same size, and every block
+    is joined with the buffered inner batches, so that both sides are read once
+    from their children (e.g., videos are decoded and functions are evaluated
+    once). The join predicate is evaluated on the cross product of an outer
+    block and an inner batch.
+    """
+
     def __init__(self, db: EvaDBDatabase, node: NestedLoopJoinPlan):
         super().__init__(db, node)
         self.predicate = node.join_predicate
@@ -32,14 +48,48 @@ class NestedLoopJoinExecutor(AbstractExecutor):
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
         outer = self.children[0]
         inner = self.children[1]
-        for row1 in outer.exec(**kwargs):
-            for row2 in inner.exec(**kwargs):
-                result_batch = Batch.join(row1, row2)
-                result_batch.reset_index()
-                result_batch = apply_predicate(result_batch, self.predicate)
-                if not result_batch.empty():
-                    yield result_batch
+        catalog = self.catalog()
+        memory_size = catalog.get_configuration_catalog_value(
+            "nested_loop_join_memory_size", 2**28
+        )
+        inner_batches = BatchBuffer(
+            memory_size, catalog.get_configuration_catalog_value("tmp_dir") or None
+        )
+        try:
+            for inner_batch in inner.exec(**kwargs):
+                inner_batches.write(inner_batch)
+            # Nothing to join with, the outer side is not read.
+            if inner_batches.num_rows > 0:
+                for outer_block in self._outer_blocks(memory_size, **kwargs):
+                    for inner_batch in inner_batches.read():
+                        yield from self._join(outer_block, inner_batch)
+        finally:
+            inner_batches.close()
 
         # instrument required stats
         if self.predicate:
-            instrument_function_expression_cost(self.predicate, self.catalog())
+            instrument_function_expression_cost(self.predicate, catalog)
+
+    def _outer_blocks(self, memory_size: int, **kwargs) -> Iterator[Batch]:
+        block = []
+        block_size = 0
+        for outer_batch in self.children[0].exec(**kwargs):
+            if outer_batch.empty():
+                continue
+            block.append(outer_batch)
+            block_size += frame_memory_size(outer_batch.frames)
+            if block_size >= memory_size:
+                yield Batch.concat(block, copy=False)
+                block = []
+                block_size = 0
+        if block:
+            yield Batch.concat(block, copy=False)
+
+    def _join(self, outer_block: Batch, inner_batch: Batch) -> Iterator[Batch]:
+        rows_per_chunk = max(1, MAX_CROSS_PRODUCT_ROWS // len(inner_batch))
+        for start in range(0, len(outer_block), rows_per_chunk):
+            outer_rows = outer_block.frames.iloc[start : start + rows_per_chunk]
+            result_batch = Batch(outer_rows.merge(inner_batch.frames, how="cross"))
+            result_batch = apply_predicate(result_batch, self.predicate)
+            if not result_batch.empty():
+                yield result_batch
@@ -12,17 +12,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
 
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.executor.executor_utils import ExecutorError
+from evadb.executor.spill_utils import SpillFile, frame_memory_size
 from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.models.storage.batch import Batch
 from evadb.parser.types import ParserOrderBySortType
 from evadb.plan_nodes.orderby_plan import OrderByPlan
 
+# maximum number of runs merged at once, the runs are merged in several passes
+# beyond it. The runs are written in chunks of memory_size / MERGE_FAN_IN bytes,
+# and the merge reads a chunk of every run at a time.
+MERGE_FAN_IN = 16
+# run of the bound rows while merging the runs
+_RUN_COLUMN = "__run"
+
 
 class OrderByExecutor(AbstractExecutor):
     """
@@ -71,47 +82,173 @@ class OrderByExecutor(AbstractExecutor):
                 sort_type_bools.append(False)
         return sort_type_bools
 
-    def exec(self, *args, **kwargs) -> Iterator[Batch]:
-        child_executor = self.children[0]
-        aggregated_batch_list = []
-
-        # aggregates the batches into one large batch
-        for batch in child_executor.exec(**kwargs):
-            self.batch_sizes.append(len(batch))
-            aggregated_batch_list.append(batch)
-        aggregated_batch = Batch.concat(aggregated_batch_list, copy=False)
-
-        # nothing to order by
-        if not len(aggregated_batch):
-            return
-
+    def _append_sort_columns(self, batch: Batch) -> Batch:
+        """Appends the sort columns missing from the batch"""
         # Column can be a functional expression, so if it
         # is not in columns, it needs to be re-evaluated.
-        merge_batch_list = [aggregated_batch]
+        merge_batch_list = [batch]
         for col in self._columns:
             col_name_list = self._extract_column_name(col)
             for col_name in col_name_list:
-                if col_name not in aggregated_batch.columns:
-                    batch = col.evaluate(aggregated_batch)
-                    merge_batch_list.append(batch)
+                if col_name not in batch.columns:
+                    merge_batch_list.append(col.evaluate(batch))
         if len(merge_batch_list) > 1:
-            aggregated_batch = Batch.merge_column_wise(merge_batch_list)
+            batch = Batch.merge_column_wise(merge_batch_list)
+        return batch
 
-        # sorts the batch
+    def _sort(self, frame: pd.DataFrame) -> pd.DataFrame:
         try:
-            aggregated_batch.sort_orderby(
-                by=self.extract_column_names(),
-                sort_type=self.extract_sort_types(),
+            return frame.sort_values(
+                self.extract_column_names(),
+                ascending=self.extract_sort_types(),
+                kind="stable",
+                ignore_index=True,
             )
         except KeyError:
             # raise ExecutorError(str(e))
-            pass
+            return frame.reset_index(drop=True)
+
+    def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        child_executor = self.children[0]
+        catalog = self.catalog()
+        memory_size = catalog.get_configuration_catalog_value(
+            "sort_memory_size", 2**28
+        )
+        spill_dir = catalog.get_configuration_catalog_value("tmp_dir") or None
+
+        # The batches are sorted in memory as long as they fit in memory_size
+        # bytes. Beyond it, they are sorted into runs spilled to disk, which are
+        # merged (external merge sort).
+        chunk_size = max(memory_size // MERGE_FAN_IN, 1)
+        batches = []
+        batches_size = 0
+        runs = []
+        # every run written, the merged runs are closed as soon as possible
+        spilled_runs = []
+        try:
+            for batch in child_executor.exec(**kwargs):
+                if batch.empty():
+                    continue
+                batch = self._append_sort_columns(batch)
+                self.batch_sizes.append(len(batch))
+                batches.append(batch)
+                batches_size += frame_memory_size(batch.frames)
+                if batches_size > memory_size:
+                    runs.append(self._spill_run(batches, spill_dir, chunk_size))
+                    spilled_runs.append(runs[-1])
+                    batches = []
+                    batches_size = 0
+
+            if not runs:
+                yield from self._sort_in_memory(batches)
+            else:
+                if batches:
+                    runs.append(self._spill_run(batches, spill_dir, chunk_size))
+                    spilled_runs.append(runs[-1])
+                while len(runs) > MERGE_FAN_IN:
+                    runs = [
+                        self._merge_to_run(
+                            runs[start : start + MERGE_FAN_IN],
+                            spill_dir,
+                            chunk_size,
+                            spilled_runs,
+                        )
+                        for start in range(0, len(runs), MERGE_FAN_IN)
+                    ]
+                yield from self._merge_runs(runs)
+        finally:
+            for run in spilled_runs:
+                run.close()
+
+    def _sort_in_memory(self, batches: List[Batch]) -> Iterator[Batch]:
+        # nothing to order by
+        if not batches:
+            return
+        sorted_frame = self._sort(Batch.concat(batches, copy=False).frames)
 
-        # split the aggregated batch into smaller ones based
+        # split the sorted frame into smaller batches based
         #  on self.batch_sizes which holds the input batches sizes
         index = 0
         for i in self.batch_sizes:
-            batch = aggregated_batch[index : index + i]
-            batch.reset_index()
+            yield Batch(sorted_frame.iloc[index : index + i].reset_index(drop=True))
             index += i
-            yield batch
+
+    def _spill_run(
+        self, batches: List[Batch], spill_dir: str, chunk_size: int
+    ) -> SpillFile:
+        """Writes the sorted rows of the batches to a run"""
+        sorted_frame = self._sort(Batch.concat(batches, copy=False).frames)
+        run = SpillFile(spill_dir)
+        self._write_chunks(run, sorted_frame, chunk_size)
+        return run
+
+    def _write_chunks(self, run: SpillFile, frame: pd.DataFrame, chunk_size: int):
+        """Appends the rows to the run in chunks of about chunk_size bytes"""
+        if len(frame) == 0:
+            return
+        row_size = max(frame_memory_size(frame) // len(frame), 1)
+        chunk_rows = max(chunk_size // row_size, 1)
+        for start in range(0, len(frame), chunk_rows):
+            run.write(Batch(frame.iloc[start : start + chunk_rows]))
+
+    def _merge_to_run(
+        self,
+        runs: List[SpillFile],
+        spill_dir: str,
+        chunk_size: int,
+        spilled_runs: List[SpillFile],
+    ) -> SpillFile:
+        """Merges the runs into a new run, and removes them"""
+        merged_run = SpillFile(spill_dir)
+        spilled_runs.append(merged_run)
+        for batch in self._merge_runs(runs):
+            self._write_chunks(merged_run, batch.frames, chunk_size)
+        for run in runs:
+            run.close()
+        return merged_run
+
+    def _merge_runs(self, runs: List[SpillFile]) -> Iterator[Batch]:
+        """Merges the sorted runs, reading a chunk of a run at a time
+
+        The last row read from a run bounds its unread rows. The pending rows
+        sorted before the lowest bound are yielded, and the run of the lowest
+        bound is read next. At most a chunk of every run is pending, so the
+        merge holds up to len(runs) chunks in memory.
+        """
+        chunks = {idx: run.read() for idx, run in enumerate(runs)}
+        bounds = {}
+        pending = []
+        for idx in chunks:
+            self._read_chunk(idx, chunks, bounds, pending)
+
+        while bounds:
+            bound_frame = pd.concat(bounds.values(), ignore_index=True)
+            bound_frame[_RUN_COLUMN] = list(bounds.keys())
+            sorted_frame = self._sort(pd.concat([*pending, bound_frame]))
+            # the bound rows are the only rows with a run
+            first_bound = int(np.flatnonzero(sorted_frame[_RUN_COLUMN].notna())[0])
+            run_idx = int(sorted_frame[_RUN_COLUMN].iloc[first_bound])
+            if first_bound > 0:
+                yield Batch(
+                    sorted_frame.iloc[:first_bound]
+                    .drop(columns=[_RUN_COLUMN])
+                    .reset_index(drop=True)
+                )
+            rest = sorted_frame.iloc[first_bound:]
+            pending = [rest[rest[_RUN_COLUMN].isna()]]
+            self._read_chunk(run_idx, chunks, bounds, pending)
+
+        if pending:
+            rest = self._sort(pd.concat(pending)).drop(
+                columns=[_RUN_COLUMN], errors="ignore"
+            )
+            if len(rest) > 0:
+                yield Batch(rest)
+
+    def _read_chunk(self, run_idx, chunks, bounds, pending):
+        bounds.pop(run_idx, None)
+        chunk = next(chunks[run_idx], None)
+        if chunk is None:
+            return
+        pending.append(chunk.frames)
+        bounds[run_idx] = chunk.frames.iloc[-1:]
@@ -45,6 +45,7 @@ from evadb.executor.seq_scan_executor import SequentialScanExecutor
 from evadb.executor.set_executor import SetExecutor
 from evadb.executor.show_info_executor import ShowInfoExecutor
 from evadb.executor.storage_executor import StorageExecutor
+from evadb.executor.top_k_executor import TopKExecutor
 from evadb.executor.union_executor import UnionExecutor
 from evadb.executor.use_executor import UseExecutor
 from evadb.executor.vector_index_scan_executor import VectorIndexScanExecutor
@@ -126,6 +127,8 @@ class PlanExecutor:
             executor_node = OrderByExecutor(db=self._db, node=plan)
         elif plan_opr_type == PlanOprType.LIMIT:
             executor_node = LimitExecutor(db=self._db, node=plan)
+        elif plan_opr_type == PlanOprType.TOP_K:
+            executor_node = TopKExecutor(db=self._db, node=plan)
         elif plan_opr_type == PlanOprType.SAMPLE:
             executor_node = SampleExecutor(db=self._db, node=plan)
         elif plan_opr_type == PlanOprType.NESTED_LOOP_JOIN:
@@ -0,0 +1,158 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Helpers of the Exchange operator that runs its inner executor in local worker
+processes instead of Ray actors
+
+The batches are passed between the processes in shared memory blocks, laid out
+in the columnar wire format of the server, so that the ndarray columns (e.g.,
+frames) are copied once into the block instead of being pickled through a pipe.
+Only the (name, size) handle of a block is sent to the other process, which
+reads the batch and releases the block. The inner executor is pickled and sent
+to the workers along with the batches, like to the Ray actors.
+"""
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import forkserver
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator, List, Tuple
+
+from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.ray_utils import StageCompleteSignal
+from evadb.models.server.wire_format import decode_frame, encode_frame, pack, unpack
+from evadb.models.storage.batch import Batch
+
+# name and size of the shared memory block holding a batch
+SharedBatch = Tuple[str, int]
+
+# pool of worker processes shared by the Exchanges of all the queries
+_worker_pool: ProcessPoolExecutor = None
+_worker_pool_lock = threading.Lock()
+
+# inner executors of the last queries run by the worker process, by query
+MAX_WORKER_EXECUTORS = 4
+_inner_executors: "OrderedDict[str, AbstractExecutor]" = OrderedDict()
+
+
+def write_shared_batch(batch: Batch) -> SharedBatch:
+    """Writes the batch into a new shared memory block"""
+    header, buffers = encode_frame(batch.frames)
+    blocks = []
+
+    def allocate(size: int) -> memoryview:
+        # a block cannot be empty
+        blocks.append(SharedMemory(create=True, size=max(size, 1)))
+        return blocks[0].buf[:size]
+
+    message = pack(header, buffers, allocate)
+    size = len(message)
+    message.release()
+    blocks[0].close()
+    return blocks[0].name, size
+
+
+def read_shared_batch(shared_batch: SharedBatch) -> Batch:
+    """Reads the batch and releases its shared memory block"""
+    name, size = shared_batch
+    block = SharedMemory(name=name)
+    try:
+        with block.buf[:size] as message:
+            data = bytearray(message)
+    finally:
+        block.close()
+        block.unlink()
+    return Batch(decode_frame(*unpack(data)))
+
+
+def release_shared_batch(shared_batch: SharedBatch):
+    """Releases the shared memory block of a batch that is not read"""
+    try:
+        block = SharedMemory(name=shared_batch[0])
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def run_inner_executor(
+    inner_executor: AbstractExecutor, batch: Batch
+) -> Iterator[Batch]:
+    """Runs the inner executor of an Exchange over a single batch"""
+    input_queue = queue.Queue()
+    input_queue.put(batch)
+    input_queue.put(StageCompleteSignal)
+    yield from inner_executor.exec(input_queue=input_queue)
+
+
+def start_worker_pool() -> ProcessPoolExecutor:
+    """Starts the worker processes of the Exchange, unless they are running
+
+    The workers are forked by a fork server (or spawned, where there is none),
+    which is a fresh process without the threads of the caller. So the workers
+    do not inherit the locks of the server threads, the catalog connections or
+    the decode threads of a query. The pool is started with the database when
+    local_exchange is set, and the workers on the first parallel query.
+    """
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                # the workers are forked with the modules of the exchange loaded
+                context.set_forkserver_preload([__name__])
+                forkserver.ensure_running()
+            else:
+                context = multiprocessing.get_context("spawn")
+            _worker_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=context
+            )
+        return _worker_pool
+
+
+def shutdown_worker_pool():
+    """Stops the worker processes, e.g., after one of them died"""
+    global _worker_pool
+    with _worker_pool_lock:
+        worker_pool, _worker_pool = _worker_pool, None
+    if worker_pool is not None:
+        worker_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_worker(
+    executor_id: str, inner_executor: bytes, shared_batch: SharedBatch
+) -> List[SharedBatch]:
+    """Runs the inner executor of a query over a batch in a worker process
+
+    The pickled inner executor is loaded once per query, so that its functions
+    are loaded once and not for every batch. The workers are shared by the
+    queries, so the executors of a few recent queries are kept.
+    """
+    executor = _inner_executors.pop(executor_id, None)
+    if executor is None:
+        executor = pickle.loads(inner_executor)
+    _inner_executors[executor_id] = executor
+    while len(_inner_executors) > MAX_WORKER_EXECUTORS:
+        _inner_executors.popitem(last=False)
+    batch = read_shared_batch(shared_batch)
+    return [
+        write_shared_batch(output)
+        for output in run_inner_executor(executor, batch)
+        if not output.empty()
+    ]
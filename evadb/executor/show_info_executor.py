@@ -17,6 +17,7 @@ import pandas as pd
 from evadb.catalog.catalog_type import TableType
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.functions.function_pool import get_function_pool
 from evadb.models.storage.batch import Batch
 from evadb.parser.types import ShowType
 from evadb.plan_nodes.show_info_plan import ShowInfoPlan
@@ -34,6 +35,7 @@ class ShowInfoExecutor(AbstractExecutor):
             or ShowType.TABLES
             or ShowType.DATABASES
             or ShowType.CONFIGS
+            or ShowType.FUNCTION_POOL
         ), f"Show command does not support type {self.node.show_type}"
 
         if self.node.show_type is ShowType.FUNCTIONS:
@@ -50,6 +52,18 @@ class ShowInfoExecutor(AbstractExecutor):
             databases = self.catalog().get_all_database_catalog_entries()
             for db in databases:
                 show_entries.append(db.display_format())
+        elif self.node.show_type is ShowType.FUNCTION_POOL:
+            show_entries = pd.DataFrame(
+                get_function_pool().display_format(),
+                columns=[
+                    "name",
+                    "warm_instances",
+                    "memory_size",
+                    "loads",
+                    "hits",
+                    "evictions",
+                ],
+            )
         elif self.node.show_type is ShowType.CONFIGS:
             show_entries = {}
             # CONFIGS is a special word, which is used to display all the configurations
@@ -0,0 +1,154 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Helpers of the operators that spill their state to disk once it exceeds their
+memory budget (e.g., the hash join)
+"""
+import os
+import pickle
+import tempfile
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
+
+from evadb.models.storage.batch import Batch
+
+# number of partitions the rows are hash partitioned into once they exceed the
+# memory budget of the operator
+NUM_SPILL_PARTITIONS = 32
+# The partitions are split with the next 5 bits of the 64-bit hash of the keys
+# while they exceed the memory budget.
+MAX_PARTITION_LEVEL = 11
+
+
+def frame_memory_size(frame: pd.DataFrame) -> int:
+    """Returns the bytes held by the frame, including the ndarray cells"""
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+def hash_keys(frame: pd.DataFrame, keys: List[str]) -> np.ndarray:
+    """Returns the uint64 hash of the keys of every row
+
+    The numeric keys are hashed as float64, so that equal keys of different
+    dtypes (e.g., 1 and 1.0) get the same hash.
+    """
+    key_frame = frame[keys]
+    numeric_keys = [key for key in keys if key_frame[key].dtype.kind in "biuf"]
+    if numeric_keys:
+        key_frame = key_frame.astype({key: "float64" for key in numeric_keys})
+    return pd.util.hash_pandas_object(key_frame, index=False).to_numpy()
+
+
+class SpillFile:
+    """Batches appended to a file on disk, and read back in the same order"""
+
+    def __init__(self, directory: str):
+        fd, self._path = tempfile.mkstemp(suffix=".spill", dir=directory)
+        self._file = os.fdopen(fd, "wb")
+        self.num_rows = 0
+        self.memory_size = 0
+
+    def write(self, batch: Batch):
+        if batch.empty():
+            return
+        pickle.dump(batch.frames, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.num_rows += len(batch)
+        self.memory_size += frame_memory_size(batch.frames)
+
+    def read(self) -> Iterator[Batch]:
+        self._file.flush()
+        with open(self._path, "rb") as spill_file:
+            while True:
+                try:
+                    yield Batch(pickle.load(spill_file))
+                except EOFError:
+                    return
+
+    def close(self):
+        self._file.close()
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
+class SpillPartitions:
+    """Batches hash partitioned on their keys into spill files
+
+    Arguments:
+        directory (str): directory of the spill files
+        keys (List[str]): columns the batches are partitioned on
+        num_partitions (int): number of partitions
+        level (int): partitions of the rows of a partition use the next bits of
+            the hash of the keys
+    """
+
+    def __init__(
+        self, directory: str, keys: List[str], num_partitions: int, level: int = 0
+    ):
+        self.keys = keys
+        self.level = level
+        self._num_partitions = num_partitions
+        self.files = [SpillFile(directory) for _ in range(num_partitions)]
+
+    def write(self, batch: Batch):
+        if batch.empty():
+            return
+        hashes = hash_keys(batch.frames, self.keys)
+        partitions = (
+            hashes // np.uint64(self._num_partitions**self.level)
+        ) % np.uint64(self._num_partitions)
+        for partition, spill_file in enumerate(self.files):
+            rows = np.flatnonzero(partitions == partition)
+            if len(rows) > 0:
+                spill_file.write(Batch(batch.frames.iloc[rows]))
+
+    def close(self):
+        for spill_file in self.files:
+            spill_file.close()
+
+
+class BatchBuffer:
+    """Batches kept in memory up to `memory_size` bytes, and spilled to a file
+    beyond it. The batches can be read any number of times, in order."""
+
+    def __init__(self, memory_size: int, directory: str = None):
+        self._memory_size = memory_size
+        self._directory = directory
+        self._batches = []
+        self._batches_size = 0
+        self._spill_file = None
+        self.num_rows = 0
+
+    def write(self, batch: Batch):
+        if batch.empty():
+            return
+        self.num_rows += len(batch)
+        if self._spill_file is None:
+            self._batches_size += frame_memory_size(batch.frames)
+            if self._batches_size <= self._memory_size:
+                self._batches.append(batch)
+                return
+            self._spill_file = SpillFile(self._directory)
+        self._spill_file.write(batch)
+
+    def read(self) -> Iterator[Batch]:
+        yield from self._batches
+        if self._spill_file is not None:
+            yield from self._spill_file.read()
+
+    def close(self):
+        self._batches = []
+        if self._spill_file is not None:
+            self._spill_file.close()
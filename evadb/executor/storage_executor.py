@@ -32,6 +32,18 @@ class StorageExecutor(AbstractExecutor):
         try:
             storage_engine = StorageEngine.factory(self.db, self.node.table)
 
+            # slice and shard of the table to read
+            scan_params = dict(
+                offset=self.node.offset,
+                limit=self.node.limit,
+                total_shards=self.node.total_shards,
+                curr_shard=self.node.curr_shard,
+            )
+            # rows looked up by their row id (e.g., by the vector index scan)
+            lookup_params = {}
+            if kwargs.get("row_ids") is not None:
+                lookup_params["row_ids"] = kwargs["row_ids"]
+
             if self.node.table.table_type == TableType.VIDEO_DATA:
                 return storage_engine.read(
                     self.node.table,
@@ -41,17 +53,37 @@ class StorageExecutor(AbstractExecutor):
                     sampling_type=self.node.sampling_type,
                     read_audio=self.node.table_ref.get_audio,
                     read_video=self.node.table_ref.get_video,
+                    **scan_params,
                 )
             elif self.node.table.table_type == TableType.IMAGE_DATA:
-                return storage_engine.read(self.node.table)
+                return storage_engine.read(
+                    self.node.table, **scan_params, **lookup_params
+                )
             elif self.node.table.table_type == TableType.DOCUMENT_DATA:
-                return storage_engine.read(self.node.table, self.node.chunk_params)
-            elif self.node.table.table_type == TableType.STRUCTURED_DATA:
-                return storage_engine.read(self.node.table, self.node.batch_mem_size)
+                return storage_engine.read(
+                    self.node.table, self.node.chunk_params, **scan_params
+                )
+            elif self.node.table.table_type in [
+                TableType.STRUCTURED_DATA,
+                TableType.COLUMNAR_DATA,
+            ]:
+                return storage_engine.read(
+                    self.node.table,
+                    self.node.batch_mem_size,
+                    columns=self.node.column_list,
+                    **scan_params,
+                    **lookup_params,
+                )
             elif self.node.table.table_type == TableType.NATIVE_DATA:
-                return storage_engine.read(self.node.table)
+                return storage_engine.read(
+                    self.node.table,
+                    self.node.batch_mem_size,
+                    predicate=self.node.predicate,
+                    columns=self.node.column_list,
+                    **scan_params,
+                )
             elif self.node.table.table_type == TableType.PDF_DATA:
-                return storage_engine.read(self.node.table)
+                return storage_engine.read(self.node.table, **scan_params)
             else:
                 raise ExecutorError(
                     f"Unsupported TableType {self.node.table.table_type} encountered"
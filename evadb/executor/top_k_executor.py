@@ -0,0 +1,54 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Iterator
+
+from evadb.database import EvaDBDatabase
+from evadb.executor.orderby_executor import OrderByExecutor
+from evadb.models.storage.batch import Batch
+from evadb.plan_nodes.top_k_plan import TopKPlan
+
+
+class TopKExecutor(OrderByExecutor):
+    """
+    Returns the first rows in the order of the Order By, keeping only
+    `limit_count` rows in memory while reading the input
+
+    Every batch is sorted together with the current top rows, and the first
+    `limit_count` rows are kept as the new top rows.
+
+    Arguments:
+        node (AbstractPlan): The Top-K Plan
+
+    """
+
+    def __init__(self, db: EvaDBDatabase, node: TopKPlan):
+        super().__init__(db, node)
+        self._limit_count = node.limit_value
+
+    def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        child_executor = self.children[0]
+        if self._limit_count <= 0:
+            return
+        top_rows = None
+        for batch in child_executor.exec(**kwargs):
+            if batch.empty():
+                continue
+            batch = self._append_sort_columns(batch)
+            if top_rows is not None:
+                batch = Batch.concat([top_rows, batch], copy=False)
+            top_rows = Batch(self._sort(batch.frames).iloc[: self._limit_count])
+
+        if top_rows is not None:
+            yield top_rows
@@ -12,20 +12,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator
+from typing import Iterator, List
 
+import numpy as np
 import pandas as pd
 
 from evadb.catalog.models.utils import VectorStoreType
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
-from evadb.executor.executor_utils import ExecutorError, handle_vector_store_params
+from evadb.executor.executor_utils import (
+    ExecutorError,
+    handle_vector_store_params,
+    stack_features,
+)
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.storage_plan import StoragePlan
 from evadb.plan_nodes.vector_index_scan_plan import VectorIndexScanPlan
 from evadb.third_party.databases.interface import get_database_handler
-from evadb.third_party.vector_stores.types import VectorIndexQuery
+from evadb.third_party.vector_stores.types import (
+    VectorIndexQuery,
+    VectorIndexQueryResult,
+)
 from evadb.third_party.vector_stores.utils import VectorStoreFactory
 from evadb.utils.logging_manager import logger
 
@@ -38,7 +46,29 @@ def get_row_num_column_alias(column_list):
             return alias
 
 
+# The index is queried for OVERFETCH_FACTOR times more neighbors when the
+# predicate of the scan rejects some of them.
+OVERFETCH_FACTOR = 4
+# rounds of over-fetching before the index searches only the rows satisfying the
+# predicate, if it supports filtering
+MAX_OVERFETCH_ROUNDS = 3
+# The rows are looked up by their row ids if there are fewer ids than this,
+# which is below the bound parameters limit of SQLite, otherwise the table is
+# scanned.
+MAX_LOOKUP_ROW_IDS = 999
+
+
 class VectorIndexScanExecutor(AbstractExecutor):
+    """
+    Returns the rows of the LIMIT nearest neighbors of every query vector
+
+    The index is queried with all the query vectors at once, and the rows of the
+    neighbors are looked up by their row ids. The neighbors rejected by the
+    predicate of the child scan are replaced by querying the index for more
+    neighbors, or, after a few rounds, by searching only the embeddings of the
+    rows satisfying the predicate.
+    """
+
     def __init__(self, db: EvaDBDatabase, node: VectorIndexScanPlan):
         super().__init__(db, node)
 
@@ -67,13 +97,11 @@ class VectorIndexScanExecutor(AbstractExecutor):
         # Scan index. The search batch comes from the Open call.
         feature_col_name = self.search_query_expr.output_objs[0].name
         search_batch.drop_column_alias()
-        search_feat = search_batch.column_as_numpy_array(feature_col_name)[0]
-        search_feat = search_feat.reshape(1, -1)
-        return search_feat
+        return stack_features(search_batch.column_as_numpy_array(feature_col_name))
 
     def _native_vector_index_scan(self):
-        search_feat = self._get_search_query_results()
-        search_feat = search_feat.reshape(-1).tolist()
+        search_feat = self._get_search_query_results()[0]
+        search_feat = search_feat.tolist()
 
         tb_catalog_entry = list(self.node.find_all(StoragePlan))[0].table
         db_catalog_entry = self.db.catalog().get_database_catalog_entry(
@@ -107,50 +135,99 @@ class VectorIndexScanExecutor(AbstractExecutor):
             ),
         )
 
-        search_feat = self._get_search_query_results()
-        index_result = self.index.query(
-            VectorIndexQuery(search_feat, self.limit_count.value)
-        )
-        # todo support queries over distance as well
-        # distance_list = index_result.similarities
-        row_num_np = index_result.ids
-        # Load projected columns from disk and join with search results.
-        row_num_col_name = None
-
-        # handle the case where the index_results are less than self.limit_count.value
-        num_required_results = self.limit_count.value
-        if len(index_result.ids) < self.limit_count.value:
-            num_required_results = len(index_result.ids)
+        search_feats = self._get_search_query_results()
+        top_k = self.limit_count.value
+
+        fetch_k = top_k
+        num_rounds = 0
+        while True:
+            index_results = self.index.query_batch(
+                [VectorIndexQuery(search_feat, fetch_k) for search_feat in search_feats]
+            )
+            row_ids = np.unique(
+                np.concatenate(
+                    [np.asarray(r.ids, dtype=np.int64) for r in index_results]
+                )
+            )
+            rows = self._lookup_rows(row_ids, **kwargs)
+            matches = self._match_rows(index_results, rows, top_k)
+
+            exhausted = all(len(r.ids) < fetch_k for r in index_results)
+            if exhausted or all(len(match) == top_k for match in matches):
+                break
+
+            num_rounds += 1
+            if self.index.supports_filtering and num_rounds >= MAX_OVERFETCH_ROUNDS:
+                # Few rows satisfy the predicate, search only their embeddings.
+                filter_ids = self._lookup_row_ids(**kwargs)
+                index_results = self.index.query_batch(
+                    [
+                        VectorIndexQuery(search_feat, top_k, filter_ids=filter_ids)
+                        for search_feat in search_feats
+                    ]
+                )
+                row_ids = np.unique(
+                    np.concatenate(
+                        [np.asarray(r.ids, dtype=np.int64) for r in index_results]
+                    )
+                )
+                rows = self._lookup_rows(row_ids, **kwargs)
+                matches = self._match_rows(index_results, rows, top_k)
+                break
+            fetch_k *= OVERFETCH_FACTOR
+
+        num_results = sum(len(match) for match in matches)
+        if num_results < top_k * len(matches):
             logger.warning(
-                f"The index {self.index_name} returned only {num_required_results} results, which is fewer than the required {self.limit_count.value}."
+                f"The index {self.index_name} returned only {num_results} results, which is fewer than the required {top_k * len(matches)}."
             )
 
-        final_df = pd.DataFrame()
-        res_data_list = []
-        row_num_df = pd.DataFrame({"row_num_np": row_num_np})
+        # The rows of every query vector, ordered by their distance.
+        row_order = [row_id for match in matches for row_id in match]
+        yield Batch(rows.loc[row_order].reset_index(drop=True))
+
+    def _lookup_row_ids(self, **kwargs) -> np.ndarray:
+        """Returns the row ids of all the rows of the child, without holding the
+        rows themselves"""
+        row_ids = [np.empty(0, dtype=np.int64)]
         for batch in self.children[0].exec(**kwargs):
-            if not row_num_col_name:
-                column_list = batch.columns
-                row_num_alias = get_row_num_column_alias(column_list)
-                row_num_col_name = "{}.{}".format(row_num_alias, ROW_NUM_COLUMN)
-
-            if not batch.frames[row_num_col_name].isin(row_num_df["row_num_np"]).any():
-                continue
-
-            for index, row in batch.frames.iterrows():
-                row_dict = row.to_dict()
-                res_data_list.append(row_dict)
-
-        result_df = pd.DataFrame(res_data_list)
-
-        final_df = pd.merge(
-            row_num_df,
-            result_df,
-            left_on="row_num_np",
-            right_on=row_num_col_name,
-            how="inner",
-        )
+            row_ids.append(
+                batch.frames[self._row_num_column(batch)].to_numpy(dtype=np.int64)
+            )
+        return np.unique(np.concatenate(row_ids))
+
+    def _lookup_rows(self, row_ids: np.ndarray, **kwargs) -> pd.DataFrame:
+        """Returns the rows of the child with the given row ids, indexed by their
+        row id"""
+        if len(row_ids) <= MAX_LOOKUP_ROW_IDS:
+            kwargs = dict(kwargs, row_ids=row_ids.tolist())
 
-        if "row_num_np" in final_df:
-            del final_df["row_num_np"]
-        yield Batch(final_df)
+        frames = []
+        for batch in self.children[0].exec(**kwargs):
+            row_num_col_name = self._row_num_column(batch)
+            frame = batch.frames
+            frame = frame[frame[row_num_col_name].isin(row_ids)]
+            frames.append(frame.set_axis(frame[row_num_col_name].to_numpy()))
+
+        if not frames:
+            return pd.DataFrame()
+        rows = pd.concat(frames)
+        return rows[~rows.index.duplicated()]
+
+    def _row_num_column(self, batch: Batch) -> str:
+        row_num_alias = get_row_num_column_alias(batch.columns)
+        return "{}.{}".format(row_num_alias, ROW_NUM_COLUMN)
+
+    def _match_rows(
+        self,
+        index_results: List[VectorIndexQueryResult],
+        rows: pd.DataFrame,
+        top_k: int,
+    ) -> List[List[int]]:
+        """Returns the row ids of the top_k neighbors of every query vector that
+        are among the rows"""
+        matches = []
+        for index_result in index_results:
+            ids = np.asarray(index_result.ids, dtype=np.int64)
+            matches.append(list(ids[np.isin(ids, rows.index)][:top_k]))
+        return matches
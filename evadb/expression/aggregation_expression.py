@@ -65,6 +65,19 @@ class AggregationExpression(AbstractExpression):
         # TODO: Raise exception if data type doesn't match
         return batch
 
+    @property
+    def mergeable(self) -> bool:
+        """True if the aggregate is computed by merging the partial aggregates of
+        the batches (e.g., SUM), unlike FIRST, LAST and SEGMENT that aggregate
+        the rows of a segment"""
+        return self.etype in [
+            ExpressionType.AGGREGATION_SUM,
+            ExpressionType.AGGREGATION_COUNT,
+            ExpressionType.AGGREGATION_AVG,
+            ExpressionType.AGGREGATION_MIN,
+            ExpressionType.AGGREGATION_MAX,
+        ]
+
     def get_symbol(self) -> str:
         if self.etype == ExpressionType.AGGREGATION_FIRST:
             return "FIRST"
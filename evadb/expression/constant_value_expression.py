@@ -33,7 +33,7 @@ class ConstantValueExpression(AbstractExpression):
         self._v_type = v_type
 
     def evaluate(self, batch: Batch, **kwargs):
-        batch = Batch(pd.DataFrame({0: [self._value] * len(batch)}))
+        batch = Batch(pd.DataFrame({0: [self.value] * len(batch)}))
         return batch
 
     def signature(self) -> str:
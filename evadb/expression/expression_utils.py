@@ -13,12 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import operator
 from typing import List, Set
 
+import numpy as np
+from sqlalchemy import Table, and_, or_
+
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
 from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.parameter_expression import ParameterExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 
 
@@ -296,3 +301,66 @@ def is_simple_predicate(predicate: AbstractExpression) -> bool:
     ]
 
     return _has_simple_expressions(predicate) and contains_single_column(predicate)
+
+
+# comparison and logical operators that have the same semantics in sql
+SQL_COMPATIBLE_EXPRESSION_TYPES = {
+    ExpressionType.COMPARE_EQUAL: operator.eq,
+    ExpressionType.COMPARE_GREATER: operator.gt,
+    ExpressionType.COMPARE_LESSER: operator.lt,
+    ExpressionType.COMPARE_GEQ: operator.ge,
+    ExpressionType.COMPARE_LEQ: operator.le,
+    ExpressionType.COMPARE_NEQ: operator.ne,
+    ExpressionType.LOGICAL_AND: and_,
+    ExpressionType.LOGICAL_OR: or_,
+}
+
+
+def is_sql_compatible_predicate(predicate: AbstractExpression) -> bool:
+    """Checks if the predicate can be translated into a sql where clause. It
+        should only contain comparison and logical expressions over columns and
+        scalar constants
+
+    Args:
+        predicate (AbstractExpression): predicate expression to check
+
+    Returns:
+        bool: True, if the predicate can be evaluated by a sql database
+    """
+    if isinstance(predicate, TupleValueExpression):
+        return True
+    if isinstance(predicate, ParameterExpression):
+        # the value of the parameter is only bound at execution time
+        return False
+    if isinstance(predicate, ConstantValueExpression):
+        return isinstance(predicate.value, (str, int, float, bool, np.generic))
+    if isinstance(predicate, (ComparisonExpression, LogicalExpression)):
+        return predicate.etype in SQL_COMPATIBLE_EXPRESSION_TYPES and all(
+            is_sql_compatible_predicate(child) for child in predicate.children
+        )
+    return False
+
+
+def to_sqlalchemy_filter_clause(predicate: AbstractExpression, table: Table):
+    """Translates a sql compatible predicate into a sqlalchemy filter clause
+        over the columns of the table. Column names are matched ignoring case.
+
+    Args:
+        predicate (AbstractExpression): predicate to translate, it must satisfy
+            `is_sql_compatible_predicate`
+        table (Table): sqlalchemy table the predicate is evaluated on
+
+    Returns:
+        sqlalchemy filter clause
+    """
+    if isinstance(predicate, TupleValueExpression):
+        columns = {column.name.lower(): column for column in table.columns}
+        return columns[predicate.name.lower()]
+    if isinstance(predicate, ConstantValueExpression):
+        value = predicate.value
+        # sqlalchemy does not consume numpy generic data types
+        return value.tolist() if isinstance(value, np.generic) else value
+
+    left = to_sqlalchemy_filter_clause(predicate.children[0], table)
+    right = to_sqlalchemy_filter_clause(predicate.children[1], table)
+    return SQL_COMPATIBLE_EXPRESSION_TYPES[predicate.etype](left, right)
@@ -12,8 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from copy import deepcopy
 from dataclasses import dataclass
-from typing import Callable, List, Tuple
+from typing import Callable, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -23,10 +24,11 @@ from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.constants import NO_GPU
 from evadb.executor.execution_context import Context
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.functions.function_pool import get_function_pool
 from evadb.functions.gpu_compatible import GPUCompatible
 from evadb.models.storage.batch import Batch
 from evadb.parser.alias import Alias
-from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.kv_cache import DiskKVCache, TieredKVCache, hash_keys
 from evadb.utils.logging_manager import logger
 from evadb.utils.stats import FunctionStats
 
@@ -71,6 +73,8 @@ class FunctionExpression(AbstractExpression):
         self.projection_columns: List[str] = []
         self._cache: FunctionExpressionCache = None
         self._stats = FunctionStats()
+        # key of the warm instances in the function pool, set by the binder
+        self._pool_key: tuple = None
 
     @property
     def name(self):
@@ -163,21 +167,31 @@ class FunctionExpression(AbstractExpression):
 
     def _gpu_enabled_function(self):
         if self._function_instance is None:
-            self._function_instance = self.function()
-            if isinstance(self._function_instance, GPUCompatible):
-                device = self._context.gpu_device()
-                if device != NO_GPU:
-                    self._function_instance = self._function_instance.to_device(device)
+            device = self._context.gpu_device()
+            if self._pool_key is None:
+                self._function_instance = self._create_function_instance(device)
+            else:
+                self._function_instance = get_function_pool().get(
+                    (*self._pool_key, device),
+                    self.name,
+                    device,
+                    lambda: self._create_function_instance(device),
+                )
         return self._function_instance
 
+    def _create_function_instance(self, device: str):
+        function_instance = self.function()
+        if isinstance(function_instance, GPUCompatible) and device != NO_GPU:
+            function_instance = function_instance.to_device(device)
+        return function_instance
+
     def _apply_function_expression(self, func: Callable, batch: Batch, **kwargs):
         """
         If cache is not enabled, call the func on the batch and return.
         If cache is enabled:
-        (1) iterate over the input batch rows and check if we have the value in the
-        cache;
+        (1) hash the cache keys of the input batch and look them up in the cache;
         (2) for all cache miss rows, call the func;
-        (3) iterate over each cache miss row and store the results in the cache;
+        (3) store the results of the cache miss rows in the cache;
         (4) stitch back the partial cache results with the new func calls.
         """
         func_args = Batch.merge_column_wise(
@@ -190,11 +204,8 @@ class FunctionExpression(AbstractExpression):
         output_cols = [obj.name for obj in self.function_obj.outputs]
 
         # 1. check cache
-        # We are required to iterate over the batch row by row and check the cache.
-        # This can hurt performance, as we have to stitch together columns to generate
-        # row tuples. Is there an alternative approach we can take?
-
-        results = np.full([len(batch), len(output_cols)], None)
+        # The rows of the cache key columns are hashed vectorially, and the hashed
+        # keys are looked up in a single transaction.
         cache_keys = func_args
         # cache keys can be different from func_args
         # see optimize_cache_key
@@ -204,13 +215,18 @@ class FunctionExpression(AbstractExpression):
             )
             assert len(cache_keys) == len(batch), "Not all rows have the cache key"
 
-        cache_miss = np.full(len(batch), True)
-        for idx, (_, key) in enumerate(cache_keys.iterrows()):
-            val = self._cache.store.get(key.to_numpy())
-            results[idx] = val
-            cache_miss[idx] = val is None
+        hashed_keys = hash_keys(cache_keys.frames)
+        cached_values = self._cache.store.get_many(hashed_keys)
+        cache_miss = np.fromiter(
+            (val is None for val in cached_values), dtype=bool, count=len(batch)
+        )
+        results = np.full([len(batch), len(output_cols)], None)
+        cache_hits = np.flatnonzero(~cache_miss)
+        if len(cache_hits):
+            results[cache_hits] = np.stack([cached_values[idx] for idx in cache_hits])
 
-        # log the cache misses
+        # log the cache hits and misses
+        self._stats.cache_hits += len(cache_hits)
         self._stats.cache_misses += sum(cache_miss)
 
         # 2. call func for cache miss rows
@@ -219,18 +235,45 @@ class FunctionExpression(AbstractExpression):
             cache_miss_results = func_args.apply_function_expression(func)
 
             # 3. set the cache results
-            missing_keys = cache_keys[list(cache_miss)]
-            for key, value in zip(
-                missing_keys.iterrows(), cache_miss_results.iterrows()
-            ):
-                self._cache.store.set(key[1].to_numpy(), value[1].to_numpy())
+            cache_miss_values = cache_miss_results.to_numpy()
+            missing_keys = [hashed_keys[idx] for idx in np.flatnonzero(cache_miss)]
+            self._cache.store.set_many(missing_keys, list(cache_miss_values))
 
             # 4. merge the cache results
-            results[cache_miss] = cache_miss_results.to_numpy()
+            results[cache_miss] = cache_miss_values
+
+        if isinstance(self._cache.store, TieredKVCache):
+            self._stats.cache_memory_hits = self._cache.store.memory_hits
+            self._stats.cache_evictions = self._cache.store.evictions
 
         # 5. return the correct batch
         return Batch(pd.DataFrame(results, columns=output_cols))
 
+    def __getstate__(self):
+        # a pickled expression (e.g., in a worker process) loads its own
+        # function instance
+        state = self.__dict__.copy()
+        state["_function_instance"] = None
+        return state
+
+    def __deepcopy__(self, memo):
+        # the copy shares the function, its catalog entries and the cache store,
+        # but loads its own function instance and collects its own stats, so
+        # that copies of a cached plan can be executed concurrently
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.__dict__.update(self.__dict__)
+        result._children = deepcopy(self._children, memo)
+        result.projection_columns = list(self.projection_columns)
+        if self._cache is not None:
+            result._cache = FunctionExpressionCache(
+                deepcopy(self._cache.key, memo), self._cache.store
+            )
+        result._function_instance = None
+        result._stats = FunctionStats()
+        return result
+
     def __str__(self) -> str:
         args = [str(child) for child in self.children]
         expr_str = f"{self.name}({','.join(args)})"
@@ -270,8 +313,8 @@ class FunctionExpressionCache:
 
     Args:
         key (`AbstractExpression`): the list of abstract expression to evaluate to get the key. If `None`, use the function arguments as the key. This is useful when the system wants to use logically equivalent columns as the key (e.g., frame number instead of frame data).
-        store (`DiskKVCache`): the cache object to get/set key-value pairs
+        store (`DiskKVCache` or `TieredKVCache`): the cache object to get/set key-value pairs
     """
 
     key: Tuple[AbstractExpression]
-    store: DiskKVCache = None
+    store: Union[DiskKVCache, TieredKVCache] = None
@@ -0,0 +1,88 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from typing import Any, List
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.expression.constant_value_expression import ConstantValueExpression
+
+
+class QueryParameters:
+    """Values of the parameter placeholders ($1, $2, ...) of a prepared statement
+
+    The values are local to the executing thread, so that concurrent executions of
+    the same cached plan do not observe each other's values. All the copies of a
+    statement share the same parameters.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self.num_parameters = 0
+
+    def set(self, values: List[Any]):
+        self._local.values = list(values)
+
+    def clear(self):
+        self._local.values = None
+
+    def get(self, index: int) -> Any:
+        values = getattr(self._local, "values", None)
+        if values is None or index > len(values):
+            raise ValueError(
+                f"No value is bound to parameter ${index}; use PREPARE and EXECUTE"
+                " to run parameterized queries"
+            )
+        return values[index - 1]
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class ParameterExpression(ConstantValueExpression):
+    """Placeholder of a prepared statement, e.g., $1
+
+    It behaves as a constant whose value is bound on every EXECUTE of the
+    statement. The value is unknown while the statement is optimized, so the
+    plan-time rewrites that inspect constants (e.g., pushing predicates into sql
+    data sources) are skipped for the predicates using it.
+    """
+
+    def __init__(self, index: int, parameters: QueryParameters):
+        super().__init__(None, ColumnType.ANY)
+        self._index = index
+        self._parameters = parameters
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def value(self):
+        return self._parameters.get(self._index)
+
+    @property
+    def v_type(self):
+        return ColumnType.ANY
+
+    def __eq__(self, other):
+        if not isinstance(other, ParameterExpression):
+            return False
+        return self.index == other.index and self._parameters is other._parameters
+
+    def __str__(self) -> str:
+        return f"${self._index}"
+
+    def __hash__(self) -> int:
+        return hash((self.etype, self._index, id(self._parameters)))
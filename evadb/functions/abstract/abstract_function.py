@@ -27,8 +27,14 @@ class AbstractFunction(metaclass=ABCMeta):
 
     Load and initialize the machine learning model in the __init__.
 
+    Functions that keep no state across calls (e.g., model inference) can set
+    `stateless` so that a warm instance is kept in the function pool and shared
+    by the queries, possibly concurrently.
+
     """
 
+    stateless: bool = False
+
     def __init__(self, *args, **kwargs):
         self.setup(*args, **kwargs)
 
@@ -28,6 +28,9 @@ class EvaDBTrackerAbstractFunction(AbstractFunction):
     An abstract class for all EvaDB object trackers.
     """
 
+    # trackers carry the tracks across frames, an instance is never shared
+    stateless = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -26,6 +26,8 @@ from evadb.utils.generic_utils import try_to_import_torch, try_to_import_torchvi
 
 
 class ASLActionRecognition(PytorchAbstractClassifierFunction):
+    stateless = True
+
     @property
     def name(self) -> str:
         return "ASLActionRecognition"
@@ -62,6 +62,8 @@ class EmotionDetector(PytorchAbstractClassifierFunction):
         threshold (float): Threshold for classifier confidence score
     """
 
+    stateless = True
+
     @property
     def name(self) -> str:
         return "EmotionDetector"
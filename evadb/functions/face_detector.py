@@ -34,6 +34,8 @@ class FaceDetector(AbstractClassifierFunction, GPUCompatible):
         threshold (float): Threshold for classifier confidence score
     """
 
+    stateless = True
+
     def setup(self, threshold=0.85):
         self.threshold = threshold
         try_to_import_torch()
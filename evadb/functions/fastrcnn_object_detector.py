@@ -36,6 +36,8 @@ class FastRCNNObjectDetector(PytorchAbstractClassifierFunction):
 
     """
 
+    stateless = True
+
     @property
     def name(self) -> str:
         return "fastrcnn"
@@ -28,6 +28,8 @@ from evadb.functions.abstract.pytorch_abstract_function import (
 class FeatureExtractor(PytorchAbstractClassifierFunction):
     """ """
 
+    stateless = True
+
     def setup(self):
         self.model = models.resnet50(weights="IMAGENET1K_V2", progress=False)
         for param in self.model.parameters():
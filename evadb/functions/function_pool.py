@@ -0,0 +1,175 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List
+
+import psutil
+
+from evadb.utils.logging_manager import logger
+
+
+@dataclass
+class FunctionPoolEntry:
+    name: str
+    device: str
+    instance: Any
+    memory_size: int
+    hits: int = 0
+
+
+@dataclass
+class FunctionPoolStats:
+    loads: int = 0
+    hits: int = 0
+    evictions: int = 0
+
+
+_function_pool_instance = None
+_function_pool_lock = threading.Lock()
+
+
+def _get_process_memory() -> int:
+    return psutil.Process().memory_info().rss
+
+
+class FunctionPool:
+    """Process-wide pool of warm function instances
+
+    Loading a model (e.g., YOLO weights) dominates the latency of short queries.
+    The pool keeps the instances of stateless functions across queries, keyed by
+    the function catalog row_id, the metadata properties and the device. The
+    instances are shared by concurrent queries. The memory size of an instance is
+    approximated by the growth of the process memory while it is created, and the
+    least recently used instances are evicted once the pool exceeds its memory
+    budget.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[Hashable, FunctionPoolEntry] = OrderedDict()
+        self._stats: Dict[str, FunctionPoolStats] = defaultdict(FunctionPoolStats)
+        self._max_memory_size = 0
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+
+    @property
+    def max_memory_size(self) -> int:
+        return self._max_memory_size
+
+    def resize(self, max_memory_size: int):
+        with self._lock:
+            self._max_memory_size = max_memory_size
+            self._evict()
+
+    def get(
+        self, key: Hashable, name: str, device: str, factory: Callable[[], Any]
+    ) -> Any:
+        """Returns the warm instance of the key, or creates it with the factory"""
+        with self._lock:
+            instance = self._get_warm(key, name)
+            if instance is not None:
+                return instance
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # only the loads of the same key wait for each other, so that a model is
+        # not loaded twice while the other functions are served from the pool
+        with load_lock:
+            with self._lock:
+                instance = self._get_warm(key, name)
+                if instance is not None:
+                    return instance
+
+            # the memory growth of concurrent loads of other keys is attributed
+            # to this instance as well, which overestimates its size
+            memory_before = _get_process_memory()
+            instance = factory()
+            memory_size = max(0, _get_process_memory() - memory_before)
+
+            with self._lock:
+                self._load_locks.pop(key, None)
+                self._stats[name].loads += 1
+                if self._max_memory_size <= 0:
+                    return instance
+                self._entries[key] = FunctionPoolEntry(
+                    name, device, instance, memory_size
+                )
+                self._memory_size += memory_size
+                self._evict()
+            return instance
+
+    def _get_warm(self, key: Hashable, name: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        self._stats[name].hits += 1
+        return entry.instance
+
+    def _evict(self):
+        # the pool is disabled without a budget, otherwise the most recently used
+        # instance is kept even if it alone exceeds the budget
+        min_entries = 1 if self._max_memory_size > 0 else 0
+        while len(self._entries) > min_entries and (
+            self._memory_size > self._max_memory_size or min_entries == 0
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._memory_size -= entry.memory_size
+            self._stats[entry.name].evictions += 1
+            logger.debug(f"Evicted function {entry.name} from the function pool")
+
+    def invalidate(self, name: str):
+        """Drops the warm instances of the function, e.g., on DROP FUNCTION"""
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if entry.name.lower() == name.lower()
+            ]:
+                self._memory_size -= self._entries.pop(key).memory_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+            self._memory_size = 0
+
+    def display_format(self) -> List[dict]:
+        with self._lock:
+            warm = defaultdict(lambda: [0, 0])
+            for entry in self._entries.values():
+                warm[entry.name][0] += 1
+                warm[entry.name][1] += entry.memory_size
+            return [
+                {
+                    "name": name,
+                    "warm_instances": warm[name][0],
+                    "memory_size": warm[name][1],
+                    "loads": stats.loads,
+                    "hits": stats.hits,
+                    "evictions": stats.evictions,
+                }
+                for name, stats in self._stats.items()
+            ]
+
+
+def get_function_pool() -> FunctionPool:
+    global _function_pool_instance
+    with _function_pool_lock:
+        if _function_pool_instance is None:
+            _function_pool_instance = FunctionPool()
+    return _function_pool_instance
@@ -23,6 +23,8 @@ from evadb.utils.generic_utils import try_to_import_torch, try_to_import_torchvi
 
 
 class MVITActionRecognition(PytorchAbstractClassifierFunction):
+    stateless = True
+
     @property
     def name(self) -> str:
         return "MVITActionRecognition"
@@ -37,6 +37,8 @@ from sentence_transformers import SentenceTransformer  # noqa: E402
 
 
 class SentenceTransformerFeatureExtractor(AbstractFunction, GPUCompatible):
+    stateless = True
+
     @setup(cacheable=False, function_type="FeatureExtraction", batchable=False)
     def setup(self):
         self.model = SentenceTransformer("all-MiniLM-L6-v2")
@@ -29,6 +29,8 @@ class Yolo(AbstractFunction, GPUCompatible):
         threshold (float): Threshold for classifier confidence score
     """
 
+    stateless = True
+
     @property
     def name(self) -> str:
         return "yolo"
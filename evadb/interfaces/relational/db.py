@@ -23,7 +23,7 @@ from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.functions.function_bootstrap_queries import init_builtin_functions
 from evadb.interfaces.relational.relation import EvaDBQuery
 from evadb.interfaces.relational.utils import try_binding
-from evadb.models.server.response import Response
+from evadb.models.server.response import Response, ResponseStatus
 from evadb.models.storage.batch import Batch
 from evadb.parser.alias import Alias
 from evadb.parser.select_statement import SelectStatement
@@ -106,6 +106,8 @@ class EvaDBCursor(object):
         self._connection = connection
         self._evadb = connection._evadb
         self._pending_query = False
+        # responses of the last query that are not read yet
+        self._unread_responses = False
         self._result = None
 
     async def execute_async(self, query: str):
@@ -117,30 +119,57 @@ class EvaDBCursor(object):
                 "EvaDB does not support concurrent queries. \
                     Call fetch_all() to complete the pending query"
             )
+        # skip the rest of the results of a stopped query
+        while self._unread_responses:
+            await self._read_response()
         query = self._multiline_query_transformation(query)
         self._connection._writer.write((query + "\n").encode())
         await self._connection._writer.drain()
         self._pending_query = True
+        self._unread_responses = True
         return self
 
-    async def fetch_one_async(self) -> Response:
-        """
-        fetch_one returns one batch instead of one row for now.
-        """
+    async def _read_response(self) -> Response:
         response = Response()
         prefix = await self._connection._reader.readline()
         if prefix != b"":
             message_length = int(prefix)
             message = await self._connection._reader.readexactly(message_length)
             response = Response.deserialize(message)
-        self._pending_query = False
+        self._unread_responses = response.has_more
         return response
 
-    async def fetch_all_async(self) -> Response:
+    async def fetch_one_async(self) -> Response:
         """
-        fetch_all is the same as fetch_one for now.
+        fetch_one returns the next batch of the results instead of one row for now.
+
+        The server streams the results batch by batch as they are produced, so the
+        first batch is available before the query completes. `has_more` is set on
+        the response if more batches follow.
+        """
+        response = await self._read_response()
+        self._pending_query = response.has_more
+        return response
+
+    async def fetch_all_async(self) -> Response:
         """
-        return await self.fetch_one_async()
+        fetch_all reads the remaining batches of the results into one response.
+        """
+        batches = []
+        while True:
+            response = await self.fetch_one_async()
+            if not response.has_more:
+                break
+            batches.append(response.batch)
+
+        if not batches or response.status != ResponseStatus.SUCCESS:
+            return response
+        batches.append(response.batch)
+        return Response(
+            status=response.status,
+            batch=Batch.concat(batches, copy=False),
+            query_time=response.query_time,
+        )
 
     def _multiline_query_transformation(self, query: str) -> str:
         query = query.replace("\n", " ")
@@ -151,6 +180,7 @@ class EvaDBCursor(object):
         return query
 
     def stop_query(self):
+        # the unread results are skipped by the next query
         self._pending_query = False
 
     def __getattr__(self, name):
@@ -17,8 +17,8 @@ from enum import Enum
 from typing import Optional
 
 from evadb.executor.executor_utils import ExecutorError
+from evadb.models.server.wire_format import decode_frame, encode_frame, pack, unpack
 from evadb.models.storage.batch import Batch
-from evadb.utils.generic_utils import PickleSerializer
 
 
 class ResponseStatus(str, Enum):
@@ -30,20 +30,47 @@ class ResponseStatus(str, Enum):
 class Response:
     """
     Data model for EvaDB server response
+
+    The results of a query are streamed as a sequence of responses with one batch
+    each; `has_more` is set on all but the last response of the sequence.
     """
 
     status: ResponseStatus = ResponseStatus.FAIL
     batch: Batch = None
     error: Optional[str] = None
     query_time: Optional[float] = None
+    has_more: bool = False
 
-    def serialize(self):
-        return PickleSerializer.serialize(self)
+    def serialize(self) -> bytes:
+        """Encodes the response in the columnar wire format, with the columns of
+        the batch in contiguous buffers"""
+        header = {
+            "status": self.status.value,
+            "error": self.error,
+            "query_time": self.query_time,
+            "has_more": self.has_more,
+            "batch": None,
+        }
+        buffers = []
+        if self.batch is not None:
+            header["batch"], buffers = encode_frame(self.batch.frames)
+        return pack(header, buffers)
 
     @classmethod
-    def deserialize(cls, data):
-        obj = PickleSerializer.deserialize(data)
-        return obj
+    def deserialize(cls, data) -> "Response":
+        """Decodes the response; the ndarrays in the batch are views into `data`,
+        or into a copy of it if it is immutable"""
+        header, buffers = unpack(data)
+        batch = None
+        if header["batch"] is not None:
+            batch = Batch(decode_frame(header["batch"], buffers))
+        return cls(
+            status=ResponseStatus(header["status"]),
+            batch=batch,
+            error=header["error"],
+            query_time=header["query_time"],
+            has_more=header["has_more"],
+        )
 
     def as_df(self):
         if self.error is not None:
@@ -0,0 +1,254 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Columnar wire format of the server responses
+
+A message is laid out as
+
+    MAGIC | header length (uint32) | header (JSON) | padding | column buffers
+
+The header describes every column of the batch and where its buffers start in
+the message. The buffers are aligned to ALIGNMENT bytes, so that the decoder
+wraps them into numpy arrays without copying:
+
+- numpy: numeric, boolean and datetime columns, one buffer with the values.
+- tensor: object columns holding ndarrays of the same shape and dtype (e.g.,
+  frames, embeddings), one contiguous buffer with all the ndarrays stacked. The
+  decoded cells are views into the buffer.
+- string: object columns holding str values, one buffer with the int64
+  character offsets and one with the utf-8 encoded characters. Lone surrogates
+  are encoded with surrogatepass, so that any str round-trips.
+- pickle: any other column (e.g., nested lists, None values, extension dtypes).
+
+The decoded arrays are views into the message. An immutable message (e.g.,
+bytes read from a stream) is copied once when it is unpacked, so that the
+decoded frames can be modified in place.
+"""
+import json
+import pickle
+import struct
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b"EVA1"
+ALIGNMENT = 64
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def _is_default_index(index: pd.Index) -> bool:
+    return isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+
+
+def _tensor_layout(values: np.ndarray) -> Optional[Tuple[np.dtype, tuple]]:
+    """Returns the dtype and shape shared by all the cells, if they are ndarrays"""
+    if len(values) == 0 or not isinstance(values[0], np.ndarray):
+        return None
+    dtype, shape = values[0].dtype, values[0].shape
+    if dtype.kind not in "biufc" or len(shape) == 0:
+        return None
+    for value in values:
+        if (
+            not isinstance(value, np.ndarray)
+            or value.dtype != dtype
+            or value.shape != shape
+        ):
+            return None
+    return dtype, shape
+
+
+class _StackedCells:
+    """Buffer of the ndarray cells of a tensor column, which are stacked straight
+    into the message"""
+
+    def __init__(self, cells: np.ndarray, dtype: np.dtype, shape: tuple):
+        self.cells = cells
+        self.shape = (len(cells), *shape)
+        self.dtype = dtype
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+
+def _encode_column(values: Any) -> Tuple[Dict, List[Any]]:
+    """Returns the header entry and the buffers of a column"""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biufcmM":
+        return {"kind": "numpy", "dtype": values.dtype.str}, [
+            np.ascontiguousarray(values)
+        ]
+
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        layout = _tensor_layout(values)
+        if layout is not None:
+            dtype, shape = layout
+            return {"kind": "tensor", "dtype": dtype.str, "shape": list(shape)}, [
+                _StackedCells(values, dtype, shape)
+            ]
+
+        if len(values) > 0 and all(isinstance(value, str) for value in values):
+            offsets = np.zeros(len(values) + 1, dtype=np.int64)
+            np.cumsum([len(value) for value in values], out=offsets[1:])
+            return {"kind": "string"}, [
+                offsets,
+                "".join(values).encode("utf-8", errors="surrogatepass"),
+            ]
+
+    return {"kind": "pickle"}, [pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)]
+
+
+def _decode_column(entry: Dict, buffers: List[memoryview], num_rows: int) -> Any:
+    kind = entry["kind"]
+    if kind == "numpy":
+        return np.frombuffer(buffers[0], dtype=np.dtype(entry["dtype"]))
+
+    if kind == "tensor":
+        shape = (num_rows, *entry["shape"])
+        tensor = np.frombuffer(buffers[0], dtype=np.dtype(entry["dtype"]))
+        values = np.empty(num_rows, dtype=object)
+        for idx, cell in enumerate(tensor.reshape(shape)):
+            values[idx] = cell
+        return values
+
+    if kind == "string":
+        offsets = np.frombuffer(buffers[0], dtype=np.int64)
+        text = str(buffers[1], "utf-8", errors="surrogatepass")
+        values = np.empty(num_rows, dtype=object)
+        values[:] = [text[offsets[idx] : offsets[idx + 1]] for idx in range(num_rows)]
+        return values
+
+    return pickle.loads(buffers[0])
+
+
+def encode_frame(frame: pd.DataFrame) -> Tuple[Dict, List[Any]]:
+    """Returns the header and the buffers of the frame"""
+    columns = [frame.iloc[:, idx] for idx in range(len(frame.columns))]
+    if not _is_default_index(frame.index):
+        columns.append(frame.index.to_series())
+
+    entries = []
+    buffers = []
+    for name, series in zip([*frame.columns, None], columns):
+        # extension dtypes (e.g., categorical) fall back to pickle
+        if isinstance(series.dtype, np.dtype):
+            values = series.to_numpy()
+        else:
+            values = series.array
+        entry, column_buffers = _encode_column(values)
+        entry["name"] = name
+        entry["num_buffers"] = len(column_buffers)
+        entries.append(entry)
+        buffers.extend(column_buffers)
+
+    header = {
+        "num_rows": len(frame),
+        "columns": entries[: len(frame.columns)],
+        "index": entries[-1] if len(entries) > len(frame.columns) else None,
+    }
+    return header, buffers
+
+
+def decode_frame(header: Dict, buffers: List[memoryview]) -> pd.DataFrame:
+    num_rows = header["num_rows"]
+    entries = list(header["columns"])
+    if header["index"] is not None:
+        entries.append(header["index"])
+
+    values = []
+    position = 0
+    for entry in entries:
+        num_buffers = entry["num_buffers"]
+        values.append(
+            _decode_column(entry, buffers[position : position + num_buffers], num_rows)
+        )
+        position += num_buffers
+
+    index = pd.RangeIndex(num_rows)
+    if header["index"] is not None:
+        index = pd.Index(values.pop())
+    frame = pd.DataFrame(dict(enumerate(values)), index=index, copy=False)
+    frame.columns = [entry["name"] for entry in header["columns"]]
+    return frame
+
+
+def _padding(length: int) -> int:
+    return -length % ALIGNMENT
+
+
+def _nbytes(buffer: Any) -> int:
+    if isinstance(buffer, (np.ndarray, _StackedCells)):
+        return buffer.nbytes
+    return len(buffer)
+
+
+def pack(header: Dict, buffers: List[Any], allocate: Callable[[int], Any] = bytearray):
+    """Lays out the header and the buffers in one message, copying every buffer
+    once
+
+    The message is written into `allocate(length)`, a writable buffer of the
+    message's length (e.g., a view of a shared memory block).
+    """
+    locations = []
+    offset = 0
+    for buffer in buffers:
+        locations.append([offset, _nbytes(buffer)])
+        offset += _nbytes(buffer) + _padding(_nbytes(buffer))
+    header_data = json.dumps(dict(header, buffers=locations)).encode("utf-8")
+
+    prefix_length = len(MAGIC) + _HEADER_LENGTH.size + len(header_data)
+    prefix_length += _padding(prefix_length)
+    message = allocate(prefix_length + offset)
+    message[: len(MAGIC)] = MAGIC
+    _HEADER_LENGTH.pack_into(message, len(MAGIC), len(header_data))
+    start = len(MAGIC) + _HEADER_LENGTH.size
+    message[start : start + len(header_data)] = header_data
+
+    for buffer, (start, length) in zip(buffers, locations):
+        start += prefix_length
+        if isinstance(buffer, _StackedCells):
+            tensor = np.frombuffer(
+                message,
+                dtype=buffer.dtype,
+                count=length // buffer.dtype.itemsize,
+                offset=start,
+            )
+            np.stack(buffer.cells, out=tensor.reshape(buffer.shape))
+        elif isinstance(buffer, np.ndarray):
+            target = np.frombuffer(message, dtype=np.uint8, count=length, offset=start)
+            target[:] = buffer.reshape(-1).view(np.uint8)
+        else:
+            message[start : start + length] = buffer
+    return message
+
+
+def unpack(data) -> Tuple[Dict, List[memoryview]]:
+    """Returns the header and views of the buffers of the message"""
+    data = memoryview(data)
+    if data.readonly:
+        data = memoryview(bytearray(data))
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ValueError("Invalid message, expected the EvaDB wire format")
+    offset = len(MAGIC)
+    (header_length,) = _HEADER_LENGTH.unpack_from(data, offset)
+    offset += _HEADER_LENGTH.size
+    header = json.loads(bytes(data[offset : offset + header_length]))
+    offset += header_length
+    offset += _padding(offset)
+    buffers = [
+        data[offset + start : offset + start + length]
+        for start, length in header.pop("buffers")
+    ]
+    return header, buffers
@@ -15,7 +15,7 @@
 from collections import deque
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from evadb.catalog.catalog_type import VectorStoreType
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
@@ -26,6 +26,7 @@ from evadb.catalog.models.utils import IndexCatalogEntry
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.alias import Alias
 from evadb.parser.create_statement import ColumnDefinition
 from evadb.parser.table_ref import TableInfo, TableRef
@@ -64,6 +65,7 @@ class OperatorType(IntEnum):
     LOGICAL_EXTRACT_OBJECT = auto()
     LOGICAL_VECTOR_INDEX_SCAN = auto()
     LOGICAL_USE = auto()
+    LOGICAL_TOP_K = auto()
     LOGICALDELIMITER = auto()
 
 
@@ -182,6 +184,8 @@ class LogicalGet(Operator):
         sampling_rate: int = None,
         sampling_type: str = None,
         chunk_params: dict = {},
+        column_list: List[ColumnCatalogEntry] = None,
+        limit: int = None,
         children=None,
     ):
         self._video = video
@@ -192,6 +196,8 @@ class LogicalGet(Operator):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        self._column_list = column_list
+        self._limit = limit
         super().__init__(OperatorType.LOGICALGET, children)
 
     @property
@@ -222,6 +228,14 @@ class LogicalGet(Operator):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def column_list(self):
+        return self._column_list
+
+    @property
+    def limit(self):
+        return self._limit
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalGet):
@@ -236,6 +250,8 @@ class LogicalGet(Operator):
             and self.sampling_rate == other.sampling_rate
             and self.sampling_type == other.sampling_type
             and self.chunk_params == other.chunk_params
+            and self.column_list == other.column_list
+            and self.limit == other.limit
         )
 
     def __hash__(self) -> int:
@@ -250,6 +266,8 @@ class LogicalGet(Operator):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.column_list or []),
+                self.limit,
             )
         )
 
@@ -332,22 +350,58 @@ class LogicalProject(Operator):
 
 
 class LogicalGroupBy(Operator):
-    def __init__(self, groupby_clause: ConstantValueExpression, children: List = None):
+    """Groups the rows into segments of the groupby_clause (e.g., '8 frames'),
+    or by the values of the columns of the groupby_list
+
+    The rows grouped by the groupby_list are aggregated by the aggregates, a
+    list of (output column name, AggregationExpression). An empty groupby_list
+    aggregates all the rows in one group.
+    """
+
+    def __init__(
+        self,
+        groupby_clause: ConstantValueExpression,
+        children: List = None,
+        groupby_list: List[TupleValueExpression] = None,
+        aggregates: List[Tuple[str, AbstractExpression]] = None,
+    ):
         super().__init__(OperatorType.LOGICALGROUPBY, children)
         self._groupby_clause = groupby_clause
+        self._groupby_list = groupby_list
+        self._aggregates = aggregates
 
     @property
     def groupby_clause(self):
         return self._groupby_clause
 
+    @property
+    def groupby_list(self):
+        return self._groupby_list
+
+    @property
+    def aggregates(self):
+        return self._aggregates
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalGroupBy):
             return False
-        return is_subtree_equal and self.groupby_clause == other.groupby_clause
+        return (
+            is_subtree_equal
+            and self.groupby_clause == other.groupby_clause
+            and self.groupby_list == other.groupby_list
+            and self.aggregates == other.aggregates
+        )
 
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self.groupby_clause))
+        return hash(
+            (
+                super().__hash__(),
+                self.groupby_clause,
+                tuple(self.groupby_list or []),
+                tuple(self.aggregates or []),
+            )
+        )
 
 
 class LogicalOrderBy(Operator):
@@ -388,6 +442,41 @@ class LogicalLimit(Operator):
         return hash((super().__hash__(), self.limit_count))
 
 
+class LogicalTopK(Operator):
+    """The rows of the first limit_count rows in the order of orderby_list"""
+
+    def __init__(
+        self,
+        orderby_list: List,
+        limit_count: ConstantValueExpression,
+        children: List = None,
+    ):
+        super().__init__(OperatorType.LOGICAL_TOP_K, children)
+        self._orderby_list = orderby_list
+        self._limit_count = limit_count
+
+    @property
+    def orderby_list(self):
+        return self._orderby_list
+
+    @property
+    def limit_count(self):
+        return self._limit_count
+
+    def __eq__(self, other):
+        is_subtree_equal = super().__eq__(other)
+        if not isinstance(other, LogicalTopK):
+            return False
+        return (
+            is_subtree_equal
+            and self.orderby_list == other.orderby_list
+            and self.limit_count == other.limit_count
+        )
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), tuple(self.orderby_list), self.limit_count))
+
+
 class LogicalSample(Operator):
     def __init__(
         self,
@@ -1097,6 +1186,7 @@ class LogicalCreateIndex(Operator):
         vector_store_type: VectorStoreType,
         project_expr_list: List[AbstractExpression],
         index_def: str,
+        index_params: Dict[str, Any] = None,
         children: List = None,
     ):
         super().__init__(OperatorType.LOGICALCREATEINDEX, children)
@@ -1107,6 +1197,7 @@ class LogicalCreateIndex(Operator):
         self._vector_store_type = vector_store_type
         self._project_expr_list = project_expr_list
         self._index_def = index_def
+        self._index_params = index_params or {}
 
     @property
     def name(self):
@@ -1136,6 +1227,10 @@ class LogicalCreateIndex(Operator):
     def index_def(self):
         return self._index_def
 
+    @property
+    def index_params(self):
+        return self._index_params
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalCreateIndex):
@@ -1149,6 +1244,7 @@ class LogicalCreateIndex(Operator):
             and self.vector_store_type == other.vector_store_type
             and self.project_expr_list == other.project_expr_list
             and self.index_def == other.index_def
+            and self.index_params == other.index_params
         )
 
     def __hash__(self) -> int:
@@ -1162,6 +1258,7 @@ class LogicalCreateIndex(Operator):
                 self.vector_store_type,
                 tuple(self.project_expr_list),
                 self.index_def,
+                tuple(self.index_params.items()),
             )
         )
 
@@ -43,9 +43,16 @@ class OptimizerContext:
         self._task_stack = OptimizerTaskStack()
         self._memo = Memo()
         self._cost_model = cost_model
-        # check if ray is enabled
-        is_ray_enabled = self.db.catalog().get_configuration_catalog_value("ray")
-        self._rules_manager = rules_manager or RulesManager({"ray": is_ray_enabled})
+        # check if ray or the local worker processes are enabled
+        catalog = self.db.catalog()
+        self._rules_manager = rules_manager or RulesManager(
+            {
+                "ray": catalog.get_configuration_catalog_value("ray"),
+                "local_exchange": catalog.get_configuration_catalog_value(
+                    "local_exchange"
+                ),
+            }
+        )
 
     @property
     def db(self):
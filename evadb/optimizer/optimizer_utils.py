@@ -12,17 +12,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import math
+import os
 import typing
 from typing import List, Tuple
 
 if typing.TYPE_CHECKING:
     from evadb.optimizer.optimizer_context import OptimizerContext
 
+from evadb.catalog.catalog_type import TableType
 from evadb.catalog.catalog_utils import get_table_primary_columns
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
-from evadb.constants import CACHEABLE_FUNCTIONS, DEFAULT_FUNCTION_EXPRESSION_COST
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.constants import (
+    CACHEABLE_FUNCTIONS,
+    DEFAULT_FUNCTION_EXPRESSION_COST,
+    MIN_PARALLEL_FUNCTION_COST,
+)
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.expression_utils import (
@@ -30,6 +38,7 @@ from evadb.expression.expression_utils import (
     contains_single_column,
     get_columns_in_predicate,
     is_simple_predicate,
+    is_sql_compatible_predicate,
     to_conjunction_list,
 )
 from evadb.expression.function_expression import (
@@ -39,7 +48,12 @@ from evadb.expression.function_expression import (
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.alias import Alias
 from evadb.parser.create_statement import ColumnDefinition
-from evadb.utils.kv_cache import DiskKVCache
+from evadb.third_party.databases.interface import is_sqlalchemy_compatible_database
+from evadb.utils.kv_cache import (
+    DiskKVCache,
+    TieredKVCache,
+    get_shared_memory_cache,
+)
 
 
 def column_definition_to_function_io(col_list: List[ColumnDefinition], is_input: bool):
@@ -159,6 +173,57 @@ def extract_pushdown_predicate(
     )
 
 
+def extract_sql_pushdown_predicate(
+    predicate: AbstractExpression,
+) -> Tuple[AbstractExpression, AbstractExpression]:
+    """Decompose the predicate into the conjuncts that can be evaluated by a sql
+    data source and the remaining predicate
+
+    Args:
+        predicate (AbstractExpression): predicate that needs to be decomposed
+    Returns:
+        Tuple[AbstractExpression, AbstractExpression]: (pushdown predicate,
+        remaining predicate)
+    """
+    if predicate is None:
+        return None, None
+
+    pushdown_preds = []
+    rem_pred = []
+    for pred in to_conjunction_list(predicate):
+        if is_sql_compatible_predicate(pred):
+            pushdown_preds.append(pred)
+        else:
+            rem_pred.append(pred)
+
+    return (
+        conjunction_list_to_expression_tree(pushdown_preds),
+        conjunction_list_to_expression_tree(rem_pred),
+    )
+
+
+def is_sql_pushdown_supported(
+    context: "OptimizerContext", table_obj: TableCatalogEntry
+) -> bool:
+    """Checks if predicates, projections and limits can be pushed into the
+    queries issued to the data source of the native table
+
+    Args:
+        context (OptimizerContext): associated optimizer context
+        table_obj (TableCatalogEntry): table to check
+    """
+    if table_obj.table_type != TableType.NATIVE_DATA:
+        return False
+    db_catalog_entry = context.db.catalog().get_database_catalog_entry(
+        table_obj.database_name
+    )
+    if db_catalog_entry is None:
+        return False
+    return is_sqlalchemy_compatible_database(
+        db_catalog_entry.engine, **db_catalog_entry.params
+    )
+
+
 def extract_pushdown_predicate_for_alias(
     predicate: AbstractExpression, aliases: List[Alias]
 ):
@@ -269,9 +334,19 @@ def enable_cache_init(
     if not cache_entry:
         cache_entry = catalog.insert_function_cache_catalog_entry(func_expr)
 
-    cache = FunctionExpressionCache(
-        key=tuple(optimized_key), store=DiskKVCache(cache_entry.cache_path)
+    store = DiskKVCache(cache_entry.cache_path)
+    memory_cache_size = catalog.get_configuration_catalog_value(
+        "function_cache_memory_size", 0
     )
+    if memory_cache_size:
+        eviction_policy = catalog.get_configuration_catalog_value(
+            "function_cache_eviction_policy", "least-recently-used"
+        )
+        store = TieredKVCache(
+            store, get_shared_memory_cache(memory_cache_size, eviction_policy)
+        )
+
+    cache = FunctionExpressionCache(key=tuple(optimized_key), store=store)
     return cache
 
 
@@ -327,7 +402,8 @@ def get_expression_execution_cost(
     based on the statistics in the catalog. The function assumes that all the
     expression, except for the FunctionExpression, have a cost of zero.
     For FunctionExpression, it checks the catalog for relevant statistics; if none are
-    available, it uses a default cost of DEFAULT_FUNCTION_EXPRESSION_COST.
+    available, it uses a default cost of DEFAULT_FUNCTION_EXPRESSION_COST. The cost
+    of a cached FunctionExpression is scaled by the observed cache miss rate.
 
     Args:
         context (OptimizerContext): the associated optimizer context
@@ -344,7 +420,42 @@ def get_expression_execution_cost(
             child_expr.name
         )
         if cost_entry:
-            total_cost += cost_entry.cost
+            cost = cost_entry.cost
+            if child_expr.has_cache() and cost_entry.cache_hit_rate:
+                cost *= 1 - cost_entry.cache_hit_rate
+            total_cost += cost
         else:
             total_cost += DEFAULT_FUNCTION_EXPRESSION_COST
     return total_cost
+
+
+def get_exchange_parallelism(
+    context: "OptimizerContext",
+    exprs: List[AbstractExpression],
+    default_parallelism: int = 1,
+) -> int:
+    """
+    Returns the number of workers of an Exchange evaluating the expressions. The
+    expressions cheaper than MIN_PARALLEL_FUNCTION_COST per row are evaluated by
+    a single worker, since shipping the batches to other workers costs more than
+    it saves. Otherwise, a worker is added per MIN_PARALLEL_FUNCTION_COST of the
+    estimated cost, up to the number of CPUs. If a function has no statistics in
+    the catalog yet, its cost is unknown and default_parallelism is used.
+
+    Args:
+        context (OptimizerContext): the associated optimizer context
+        exprs (List[AbstractExpression]): expressions evaluated by the workers
+        default_parallelism (int): number of workers of unknown cost expressions
+
+    Returns:
+        int: The number of workers.
+    """
+    catalog = context.db.catalog()
+    for expr in exprs:
+        for func_expr in expr.find_all(FunctionExpression):
+            if not catalog.get_function_cost_catalog_entry(func_expr.name):
+                return default_parallelism
+    cost = sum(get_expression_execution_cost(context, expr) for expr in exprs)
+    if cost < MIN_PARALLEL_FUNCTION_COST:
+        return 1
+    return min(os.cpu_count() or 1, math.ceil(cost / MIN_PARALLEL_FUNCTION_COST))
@@ -0,0 +1,155 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import re
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from evadb.expression.parameter_expression import QueryParameters
+from evadb.parser.statement import AbstractStatement
+from evadb.plan_nodes.abstract_plan import AbstractPlan
+
+_QUOTED_PATTERN = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)""")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapses the whitespace outside of the quoted literals and identifiers and
+    strips the trailing semicolon, so that the same query typed differently maps to
+    the same plan"""
+    parts = _QUOTED_PATTERN.split(query)
+    # the quoted parts are at the odd positions
+    for idx in range(0, len(parts), 2):
+        parts[idx] = _WHITESPACE_PATTERN.sub(" ", parts[idx])
+    return "".join(parts).strip().rstrip(";").rstrip()
+
+
+def copy_plan(plan: AbstractPlan) -> AbstractPlan:
+    """Returns a copy of the plan for a single execution
+
+    Executing a plan modifies the state of its expressions, e.g., the function
+    instances and stats of the function expressions. A cached plan is shared by
+    concurrent executions, so each execution runs its own copy.
+    """
+    return deepcopy(plan)
+
+
+@dataclass
+class PreparedStatement:
+    """Statement registered with PREPARE
+
+    `statement` is the unbound statement, which is copied and optimized again
+    whenever the catalog changes. `plan` is the physical plan optimized for the
+    catalog `version`, which is copied for every execution.
+    """
+
+    name: str
+    statement: AbstractStatement
+    parameters: QueryParameters
+    plan: Optional[AbstractPlan] = None
+    version: Optional[int] = None
+
+
+class PlanCache:
+    """Cache of the physical plans of the recently executed queries
+
+    Plans are keyed by the normalized query text, and are only served for the
+    catalog version they were optimized for, so any DDL (e.g., dropping a table,
+    function or index referenced by the query) invalidates them. The least recently
+    used plans are evicted once the cache holds `max_size` plans.
+
+    The cache also holds the prepared statements.
+    """
+
+    def __init__(self, max_size: int = 0):
+        self._plans: OrderedDict[str, Tuple[int, AbstractPlan]] = OrderedDict()
+        self._prepared: Dict[str, PreparedStatement] = {}
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def resize(self, max_size: int):
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def get(self, query: str, version: int) -> Optional[AbstractPlan]:
+        """Returns a copy of the cached plan to execute, or None"""
+        with self._lock:
+            entry = self._plans.get(query)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._plans.move_to_end(query)
+            self.hits += 1
+        return copy_plan(entry[1])
+
+    def put(self, query: str, version: int, plan: AbstractPlan):
+        if self._max_size <= 0:
+            return
+        # the cache keeps a template that is never executed itself
+        plan = copy_plan(plan)
+        with self._lock:
+            if self._max_size <= 0:
+                return
+            self._plans[query] = (version, plan)
+            self._plans.move_to_end(query)
+            self._evict()
+
+    def _evict(self):
+        while len(self._plans) > max(self._max_size, 0):
+            self._plans.popitem(last=False)
+
+    def prepare(self, prepared: PreparedStatement):
+        with self._lock:
+            self._prepared[prepared.name.lower()] = prepared
+
+    def get_prepared(self, name: str) -> Optional[PreparedStatement]:
+        with self._lock:
+            return self._prepared.get(name.lower())
+
+    def deallocate(self, name: str) -> bool:
+        with self._lock:
+            return self._prepared.pop(name.lower(), None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+            self._prepared.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._plans)
+
+
+_plan_caches: Dict[str, PlanCache] = {}
+_plan_caches_lock = threading.Lock()
+
+
+def get_plan_cache(catalog_uri: str) -> PlanCache:
+    """Returns the plan cache shared by the connections to the catalog"""
+    with _plan_caches_lock:
+        if catalog_uri not in _plan_caches:
+            _plan_caches[catalog_uri] = PlanCache()
+        return _plan_caches[catalog_uri]
@@ -39,9 +39,16 @@ class PlanGenerator:
         cost_model: CostModel = None,
     ) -> None:
         self.db = db
-        # check if ray is enabled
-        is_ray_enabled = self.db.catalog().get_configuration_catalog_value("ray")
-        self.rules_manager = rules_manager or RulesManager({"ray": is_ray_enabled})
+        # check if ray or the local worker processes are enabled
+        catalog = self.db.catalog()
+        self.rules_manager = rules_manager or RulesManager(
+            {
+                "ray": catalog.get_configuration_catalog_value("ray"),
+                "local_exchange": catalog.get_configuration_catalog_value(
+                    "local_exchange"
+                ),
+            }
+        )
         self.cost_model = cost_model or CostModel()
 
     def execute_task_stack(self, task_stack: OptimizerTaskStack):
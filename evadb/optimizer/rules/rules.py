@@ -14,13 +14,14 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from evadb.catalog.catalog_type import TableType, VectorStoreType
 from evadb.catalog.catalog_utils import is_video_table
 from evadb.catalog.models.utils import IndexCatalogEntry
 from evadb.constants import CACHEABLE_FUNCTIONS
 from evadb.executor.execution_context import Context
+from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.expression_utils import (
     conjunction_list_to_expression_tree,
     to_conjunction_list,
@@ -34,11 +35,15 @@ from evadb.optimizer.optimizer_utils import (
     extract_equi_join_keys,
     extract_pushdown_predicate,
     extract_pushdown_predicate_for_alias,
+    extract_sql_pushdown_predicate,
+    get_exchange_parallelism,
     get_expression_execution_cost,
+    is_sql_pushdown_supported,
 )
 from evadb.optimizer.rules.pattern import Pattern
 from evadb.optimizer.rules.rules_base import Promise, Rule, RuleType
 from evadb.parser.types import JoinType, ParserOrderBySortType
+from evadb.plan_nodes.abstract_plan import AbstractPlan
 from evadb.plan_nodes.apply_and_merge_plan import ApplyAndMergePlan
 from evadb.plan_nodes.create_from_select_plan import CreateFromSelectPlan
 from evadb.plan_nodes.exchange_plan import ExchangePlan
@@ -77,6 +82,7 @@ from evadb.optimizer.operators import (
     LogicalRename,
     LogicalSample,
     LogicalShow,
+    LogicalTopK,
     LogicalUnion,
     LogicalVectorIndexScan,
     Operator,
@@ -98,6 +104,7 @@ from evadb.plan_nodes.orderby_plan import OrderByPlan
 from evadb.plan_nodes.rename_plan import RenamePlan
 from evadb.plan_nodes.seq_scan_plan import SeqScanPlan
 from evadb.plan_nodes.storage_plan import StoragePlan
+from evadb.plan_nodes.top_k_plan import TopKPlan
 from evadb.plan_nodes.union_plan import UnionPlan
 from evadb.plan_nodes.vector_index_scan_plan import VectorIndexScanPlan
 
@@ -115,7 +122,8 @@ class EmbedFilterIntoGet(Rule):
         return Promise.EMBED_FILTER_INTO_GET
 
     def check(self, before: LogicalFilter, context: OptimizerContext):
-        # System supports predicate pushdown only while reading video data
+        # System supports predicate pushdown only while reading video data or
+        # native tables of sql data sources
         predicate = before.predicate
         lget: LogicalGet = before.children[0]
         if predicate and is_video_table(lget.table_obj):
@@ -125,17 +133,25 @@ class EmbedFilterIntoGet(Rule):
             pushdown_pred, _ = extract_pushdown_predicate(predicate, col_alias)
             if pushdown_pred:
                 return True
+        elif predicate and lget.predicate is None and lget.limit is None:
+            pushdown_pred, _ = extract_sql_pushdown_predicate(predicate)
+            if pushdown_pred and is_sql_pushdown_supported(context, lget.table_obj):
+                return True
         return False
 
     def apply(self, before: LogicalFilter, context: OptimizerContext):
         predicate = before.predicate
         lget = before.children[0]
-        # System only supports pushing basic range predicates on id
-        video_alias = lget.video.alias
-        col_alias = f"{video_alias}.id"
-        pushdown_pred, unsupported_pred = extract_pushdown_predicate(
-            predicate, col_alias
-        )
+        if lget.table_obj.table_type == TableType.NATIVE_DATA:
+            # comparison and logical predicates are evaluated by the data source
+            pushdown_pred, unsupported_pred = extract_sql_pushdown_predicate(predicate)
+        else:
+            # System only supports pushing basic range predicates on id
+            video_alias = lget.video.alias
+            col_alias = f"{video_alias}.id"
+            pushdown_pred, unsupported_pred = extract_pushdown_predicate(
+                predicate, col_alias
+            )
         if pushdown_pred:
             new_get_opr = LogicalGet(
                 lget.video,
@@ -145,6 +161,8 @@ class EmbedFilterIntoGet(Rule):
                 target_list=lget.target_list,
                 sampling_rate=lget.sampling_rate,
                 sampling_type=lget.sampling_type,
+                column_list=lget.column_list,
+                limit=lget.limit,
                 children=lget.children,
             )
             if unsupported_pred:
@@ -184,11 +202,47 @@ class EmbedSampleIntoGet(Rule):
             target_list=lget.target_list,
             sampling_rate=sample_freq,
             sampling_type=sample_type,
+            column_list=lget.column_list,
+            limit=lget.limit,
             children=lget.children,
         )
         yield new_get_opr
 
 
+class EmbedLimitIntoGet(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALLIMIT)
+        pattern.append_child(Pattern(OperatorType.LOGICALGET))
+        super().__init__(RuleType.EMBED_LIMIT_INTO_GET, pattern)
+
+    def promise(self):
+        return Promise.EMBED_LIMIT_INTO_GET
+
+    def check(self, before: LogicalLimit, context: OptimizerContext):
+        # Every storage engine stops reading once the limit is reached
+        lget: LogicalGet = before.children[0]
+        return lget.limit is None
+
+    def apply(self, before: LogicalLimit, context: OptimizerContext):
+        lget: LogicalGet = before.children[0]
+        new_get_opr = LogicalGet(
+            lget.video,
+            lget.table_obj,
+            alias=lget.alias,
+            predicate=lget.predicate,
+            target_list=lget.target_list,
+            sampling_rate=lget.sampling_rate,
+            sampling_type=lget.sampling_type,
+            column_list=lget.column_list,
+            limit=before.limit_count.value,
+            children=lget.children,
+        )
+        # the limit operator is retained, the storage only stops reading early
+        new_limit_opr = LogicalLimit(before.limit_count)
+        new_limit_opr.append_child(new_get_opr)
+        yield new_limit_opr
+
+
 class CacheFunctionExpressionInProject(Rule):
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALPROJECT)
@@ -493,8 +547,8 @@ class CombineSimilarityOrderByAndLimitToVectorIndexScan(Rule):
     Because vector index only works for similarity search, the rule will
     only be applied when the Order By is on Similarity expression. For
     simplicity, we also only enable this rule when the Similarity expression
-    applies to the full table. Predicated query will yield incorrect results
-    if we use an index scan.
+    applies to a table scan. The predicate on the table is kept below the index
+    scan, which skips the neighbors rejected by the predicate.
 
     Limit(10)
         |
@@ -530,15 +584,17 @@ class CombineSimilarityOrderByAndLimitToVectorIndexScan(Rule):
         orderby_node = before.children[0]
         sub_tree_root = orderby_node.children[0]
 
-        # Check if predicate exists on table.
-        def _exists_predicate(opr):
-            if isinstance(opr, LogicalGet):
-                return opr.predicate is not None
-            # LogicalFilter
-            return True
-
-        if _exists_predicate(sub_tree_root.opr):
+        # Only a table scan, possibly below a predicate, is supported.
+        scan_opr = sub_tree_root.opr
+        if isinstance(scan_opr, LogicalFilter):
+            filter_expr = context.memo.groups[sub_tree_root.group_id].logical_exprs[0]
+            scan_opr = context.memo.groups[filter_expr.children[0]].logical_exprs[0].opr
+        if not isinstance(scan_opr, LogicalGet):
             return
+        has_predicate = (
+            isinstance(sub_tree_root.opr, LogicalFilter)
+            or scan_opr.predicate is not None
+        )
 
         # Check if orderby runs on similarity expression.
         # Current optimization will only accept Similarity expression.
@@ -553,13 +609,16 @@ class CombineSimilarityOrderByAndLimitToVectorIndexScan(Rule):
             return
 
         # Traverse to the LogicalGet operator.
-        tb_catalog_entry = list(sub_tree_root.opr.find_all(LogicalGet))[0].table_obj
+        tb_catalog_entry = scan_opr.table_obj
         db_catalog_entry = catalog_manager().get_database_catalog_entry(
             tb_catalog_entry.database_name
         )
         is_postgres_data_source = (
             db_catalog_entry is not None and db_catalog_entry.engine == "postgres"
         )
+        # The native index scan of postgres does not apply the predicate.
+        if is_postgres_data_source and has_predicate:
+            return
 
         # Check if there exists an index on table and column.
         query_func_expr, base_func_expr = func_orderby_expr.children
@@ -607,6 +666,40 @@ class CombineSimilarityOrderByAndLimitToVectorIndexScan(Rule):
         yield vector_index_scan_node
 
 
+class CombineOrderByAndLimitToTopK(Rule):
+    """
+    This rule rewrites Order By + Limit to a Top-K, which keeps only the first
+    rows of the order while reading its input instead of sorting all of it. It
+    applies after the rewrite to a vector index scan is ruled out.
+
+    Limit(10)
+        |
+    OrderBy(col)        ->        TopK(col, 10)
+        |                               |
+        A                               A
+    """
+
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALLIMIT)
+        orderby_pattern = Pattern(OperatorType.LOGICALORDERBY)
+        orderby_pattern.append_child(Pattern(OperatorType.DUMMY))
+        pattern.append_child(orderby_pattern)
+        super().__init__(RuleType.COMBINE_ORDERBY_AND_LIMIT_TO_TOP_K, pattern)
+
+    def promise(self):
+        return Promise.COMBINE_ORDERBY_AND_LIMIT_TO_TOP_K
+
+    def check(self, before: LogicalLimit, context: OptimizerContext):
+        return True
+
+    def apply(self, before: LogicalLimit, context: OptimizerContext):
+        orderby_node = before.children[0]
+        top_k_node = LogicalTopK(orderby_node.orderby_list, before.limit_count)
+        for child in orderby_node.children:
+            top_k_node.append_child(child)
+        yield top_k_node
+
+
 # REWRITE RULES END
 ##############################################
 
@@ -834,6 +927,7 @@ class LogicalCreateIndexToVectorIndex(Rule):
             before.vector_store_type,
             before.project_expr_list,
             before.index_def,
+            before.index_params,
         )
         child = SeqScanPlan(None, before.project_expr_list, before.table_ref.alias)
 
@@ -948,6 +1042,8 @@ class LogicalGetToSeqScan(Rule):
                 sampling_type=before.sampling_type,
                 chunk_params=before.chunk_params,
                 batch_mem_size=batch_mem_size,
+                column_list=before.column_list,
+                limit=before.limit,
             )
         )
         yield after
@@ -1005,7 +1101,9 @@ class LogicalGroupByToPhysical(Rule):
         return True
 
     def apply(self, before: LogicalGroupBy, context: OptimizerContext):
-        after = GroupByPlan(before.groupby_clause)
+        after = GroupByPlan(
+            before.groupby_clause, before.groupby_list, before.aggregates
+        )
         for child in before.children:
             after.append_child(child)
         yield after
@@ -1049,6 +1147,25 @@ class LogicalLimitToPhysical(Rule):
         yield after
 
 
+class LogicalTopKToPhysical(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICAL_TOP_K)
+        pattern.append_child(Pattern(OperatorType.DUMMY))
+        super().__init__(RuleType.LOGICAL_TOP_K_TO_PHYSICAL, pattern)
+
+    def promise(self):
+        return Promise.LOGICAL_TOP_K_TO_PHYSICAL
+
+    def check(self, before: Operator, context: OptimizerContext):
+        return True
+
+    def apply(self, before: LogicalTopK, context: OptimizerContext):
+        after = TopKPlan(before.orderby_list, before.limit_count)
+        for child in before.children:
+            after.append_child(child)
+        yield after
+
+
 class LogicalFunctionScanToPhysical(Rule):
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALFUNCTIONSCAN)
@@ -1355,7 +1472,9 @@ class LogicalApplyAndMergeToRayPhysical(Rule):
     def apply(self, before: LogicalApplyAndMerge, context: OptimizerContext):
         apply_plan = ApplyAndMergePlan(before.func_expr, before.alias, before.do_unnest)
 
-        parallelism = 2
+        parallelism = get_exchange_parallelism(
+            context, [before.func_expr], default_parallelism=2
+        )
 
         ray_process_env_dict = get_ray_env_dict()
         ray_parallel_env_conf_dict = [ray_process_env_dict for _ in range(parallelism)]
@@ -1394,7 +1513,9 @@ class LogicalProjectToRayPhysical(Rule):
                 project_plan.append_child(child)
             yield project_plan
         else:
-            parallelism = 2
+            parallelism = get_exchange_parallelism(
+                context, before.target_list, default_parallelism=2
+            )
 
             ray_process_env_dict = get_ray_env_dict()
             ray_parallel_env_conf_dict = [
@@ -1412,5 +1533,73 @@ class LogicalProjectToRayPhysical(Rule):
             yield exchange_plan
 
 
+"""
+Rules to evaluate the functions in local worker processes, without Ray.
+"""
+
+
+def get_local_exchange_parallelism(
+    context: OptimizerContext, exprs: List[AbstractExpression]
+) -> int:
+    # the workers would each load their own copy of the models onto the GPUs
+    if len(Context().gpus) > 0:
+        return 1
+    return get_exchange_parallelism(context, exprs)
+
+
+def get_local_exchange_plan(
+    inner_plan: AbstractPlan, parallelism: int, children: List[Operator]
+) -> AbstractPlan:
+    plan = inner_plan
+    if parallelism > 1:
+        plan = ExchangePlan(
+            inner_plan=inner_plan, parallelism=parallelism, use_ray=False
+        )
+    for child in children:
+        plan.append_child(child)
+    return plan
+
+
+class LogicalApplyAndMergeToLocalPhysical(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICAL_APPLY_AND_MERGE)
+        pattern.append_child(Pattern(OperatorType.DUMMY))
+        super().__init__(RuleType.LOGICAL_APPLY_AND_MERGE_TO_PHYSICAL, pattern)
+
+    def promise(self):
+        return Promise.LOGICAL_APPLY_AND_MERGE_TO_PHYSICAL
+
+    def check(self, grp_id: int, context: OptimizerContext):
+        return True
+
+    def apply(self, before: LogicalApplyAndMerge, context: OptimizerContext):
+        apply_plan = ApplyAndMergePlan(before.func_expr, before.alias, before.do_unnest)
+        parallelism = get_local_exchange_parallelism(context, [before.func_expr])
+        yield get_local_exchange_plan(apply_plan, parallelism, before.children)
+
+
+class LogicalProjectToLocalPhysical(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALPROJECT)
+        pattern.append_child(Pattern(OperatorType.DUMMY))
+        super().__init__(RuleType.LOGICAL_PROJECT_TO_PHYSICAL, pattern)
+
+    def promise(self):
+        return Promise.LOGICAL_PROJECT_TO_PHYSICAL
+
+    def check(self, before: LogicalProject, context: OptimizerContext):
+        return True
+
+    def apply(self, before: LogicalProject, context: OptimizerContext):
+        project_plan = ProjectPlan(before.target_list)
+        parallelism = 1
+        # Check whether the projection contains a Function
+        if before.target_list is not None and any(
+            [isinstance(expr, FunctionExpression) for expr in before.target_list]
+        ):
+            parallelism = get_local_exchange_parallelism(context, before.target_list)
+        yield get_local_exchange_plan(project_plan, parallelism, before.children)
+
+
 # IMPLEMENTATION RULES END
 ##############################################
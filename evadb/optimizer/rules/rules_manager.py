@@ -21,9 +21,12 @@ from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInApply,
     CacheFunctionExpressionInFilter,
     CacheFunctionExpressionInProject,
+    CombineOrderByAndLimitToTopK,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedLimitIntoGet,
     EmbedSampleIntoGet,
+    LogicalApplyAndMergeToLocalPhysical,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
     LogicalCreateFromSelectToPhysical,
@@ -49,10 +52,12 @@ from evadb.optimizer.rules.rules import (
     LogicalLoadToPhysical,
     LogicalOrderByToPhysical,
     LogicalProjectNoTableToPhysical,
+    LogicalProjectToLocalPhysical,
     LogicalProjectToPhysical,
     LogicalProjectToRayPhysical,
     LogicalRenameToPhysical,
     LogicalShowToPhysical,
+    LogicalTopKToPhysical,
     LogicalUnionToPhysical,
     LogicalVectorIndexScanToPhysical,
     PushDownFilterThroughApplyAndMerge,
@@ -83,9 +88,12 @@ class RulesManager:
             EmbedFilterIntoGet(),
             # EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedLimitIntoGet(),
             PushDownFilterThroughJoin(),
             PushDownFilterThroughApplyAndMerge(),
             CombineSimilarityOrderByAndLimitToVectorIndexScan(),
+            # after the vector index scan, which also replaces Order By + Limit
+            CombineOrderByAndLimitToTopK(),
             ReorderPredicates(),
         ]
 
@@ -105,6 +113,7 @@ class RulesManager:
             LogicalGroupByToPhysical(),
             LogicalOrderByToPhysical(),
             LogicalLimitToPhysical(),
+            LogicalTopKToPhysical(),
             LogicalJoinToPhysicalNestedLoopJoin(),
             LogicalLateralJoinToPhysical(),
             LogicalJoinToPhysicalHashJoin(),
@@ -131,6 +140,12 @@ class RulesManager:
                     LogicalProjectToRayPhysical(),
                 ]
             )
+        # Otherwise, the functions are evaluated in local worker processes if
+        # enabled using the SET command
+        elif configs.get("local_exchange", False):
+            self._implementation_rules.extend(
+                [LogicalApplyAndMergeToLocalPhysical(), LogicalProjectToLocalPhysical()]
+            )
         else:
             self._implementation_rules.extend(
                 [LogicalApplyAndMergeToPhysical(), LogicalProjectToPhysical()]
@@ -14,7 +14,9 @@
 # limitations under the License.
 from evadb.binder.binder_utils import get_bound_func_expr_outputs_as_tuple_value_expr
 from evadb.expression.abstract_expression import AbstractExpression
+from evadb.expression.aggregation_expression import AggregationExpression
 from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
     LogicalCreate,
     LogicalCreateFunction,
@@ -63,6 +65,43 @@ from evadb.utils.logging_manager import logger
 class StatementToPlanConverter:
     def __init__(self):
         self._plan = None
+        # columns referenced by the select statement being converted, used to
+        # restrict the columns read by the table scans
+        self._referenced_columns = None
+
+    def _get_referenced_columns(self, statement: SelectStatement):
+        """Collect the columns referenced anywhere in the select statement,
+        excluding the nested queries. Returns None if all the columns are needed.
+        """
+        if statement.target_list is None:
+            return None
+
+        exprs = list(statement.target_list)
+        if statement.where_clause is not None:
+            exprs.append(statement.where_clause)
+        if statement.groupby_clause is not None:
+            exprs.append(statement.groupby_clause)
+        exprs.extend(statement.groupby_list or [])
+        for orderby_expr, _ in statement.orderby_list or []:
+            exprs.append(orderby_expr)
+
+        table_refs = [statement.from_table]
+        while table_refs:
+            table_ref = table_refs.pop()
+            if not isinstance(table_ref, TableRef):
+                continue
+            if table_ref.is_join():
+                table_refs.extend([table_ref.join_node.left, table_ref.join_node.right])
+                if table_ref.join_node.predicate is not None:
+                    exprs.append(table_ref.join_node.predicate)
+            elif table_ref.is_table_valued_expr():
+                exprs.append(table_ref.table_valued_expr.func_expr)
+
+        columns = []
+        for expr in exprs:
+            for tv_expr in expr.find_all(TupleValueExpression):
+                columns.append(tv_expr.col_object)
+        return columns
 
     def visit_table_ref(self, table_ref: TableRef):
         """Bind table ref object and convert to LogicalGet, LogicalJoin,
@@ -74,11 +113,19 @@ class StatementToPlanConverter:
         if table_ref.is_table_atom():
             # Table
             catalog_entry = table_ref.table.table_obj
+            column_list = None
+            if self._referenced_columns is not None:
+                column_list = [
+                    col
+                    for col in catalog_entry.columns
+                    if col in self._referenced_columns
+                ]
             self._plan = LogicalGet(
                 table_ref,
                 catalog_entry,
                 table_ref.alias,
                 chunk_params=table_ref.chunk_params,
+                column_list=column_list,
             )
 
         elif table_ref.is_table_valued_expr():
@@ -137,7 +184,11 @@ class StatementToPlanConverter:
 
         col_with_func_exprs = []
 
-        if statement.orderby_list and statement.groupby_clause is None:
+        if (
+            statement.orderby_list
+            and statement.groupby_clause is None
+            and statement.groupby_list is None
+        ):
             projection_cols = []
             for col in statement.target_list:
                 if isinstance(col, FunctionExpression):
@@ -152,6 +203,9 @@ class StatementToPlanConverter:
             # update target list with projection cols
             statement.target_list = projection_cols
 
+        target_list = statement.target_list
+        orderby_list = statement.orderby_list
+
         table_ref = statement.from_table
         if not table_ref and col_with_func_exprs:
             # if there is no table source, we add a projection node with all the
@@ -173,26 +227,33 @@ class StatementToPlanConverter:
             statement.from_table = table_ref
 
         if table_ref is not None:
+            outer_referenced_columns = self._referenced_columns
+            self._referenced_columns = self._get_referenced_columns(statement)
             self.visit_table_ref(table_ref)
+            self._referenced_columns = outer_referenced_columns
 
             # Filter Operator
             predicate = statement.where_clause
             if predicate is not None:
                 self._visit_select_predicate(predicate)
 
-            # TODO ACTION: Group By
-
             if statement.groupby_clause is not None:
                 self._visit_groupby(statement.groupby_clause)
+            elif statement.groupby_list is not None or self._is_aggregation(
+                target_list
+            ):
+                target_list, orderby_list = self._visit_aggregation(
+                    statement.groupby_list or [], target_list, orderby_list
+                )
 
-        if statement.orderby_list is not None:
-            self._visit_orderby(statement.orderby_list)
+        if orderby_list is not None:
+            self._visit_orderby(orderby_list)
 
         if statement.limit_count is not None:
             self._visit_limit(statement.limit_count)
 
-        if statement.target_list is not None:
-            self._visit_projection(statement.target_list)
+        if target_list is not None:
+            self._visit_projection(target_list)
 
         # union
         if statement.union_link is not None:
@@ -208,6 +269,56 @@ class StatementToPlanConverter:
         groupby_opr.append_child(self._plan)
         self._plan = groupby_opr
 
+    def _is_aggregation(self, target_list) -> bool:
+        """Checks if the target list only has aggregates merged across the
+        batches (e.g., SELECT COUNT(*), AVG(id) FROM MyVideo)"""
+        return bool(target_list) and all(
+            isinstance(expr, AggregationExpression) and expr.mergeable
+            for expr in target_list
+        )
+
+    def _visit_aggregation(self, groupby_list, target_list, orderby_list):
+        """Adds a GroupBy aggregating the rows grouped by the columns of the
+        groupby_list. Returns the target list and the order by list, with their
+        aggregates replaced by the output columns of the GroupBy."""
+        aggregates = []
+
+        def _aggregate_column(expr):
+            if not isinstance(expr, AggregationExpression):
+                return expr
+            for name, aggregate in aggregates:
+                if aggregate == expr:
+                    break
+            else:
+                # AVG(myvideo.id) -> AVG.id, as the aggregates of a batch
+                child = expr.get_child(0)
+                col_name = str(len(aggregates))
+                if isinstance(child, TupleValueExpression):
+                    col_name = child.col_alias.split(".")[-1]
+                name = "{}.{}".format(expr.get_symbol(), col_name)
+                if any(name == other for other, _ in aggregates):
+                    name = "{}_{}".format(name, len(aggregates))
+                aggregates.append((name, expr))
+            return TupleValueExpression(
+                name=name.split(".", 1)[1],
+                table_alias=expr.get_symbol(),
+                col_alias=name,
+            )
+
+        if target_list is not None:
+            target_list = [_aggregate_column(expr) for expr in target_list]
+        if orderby_list is not None:
+            orderby_list = [
+                (_aggregate_column(expr), sort_type) for expr, sort_type in orderby_list
+            ]
+
+        groupby_opr = LogicalGroupBy(
+            None, groupby_list=groupby_list, aggregates=aggregates
+        )
+        groupby_opr.append_child(self._plan)
+        self._plan = groupby_opr
+        return target_list, orderby_list
+
     def _visit_orderby(self, orderby_list):
         # orderby_list structure: List[(TupleValueExpression, EnumInt), ...]
         orderby_opr = LogicalOrderBy(orderby_list)
@@ -366,6 +477,7 @@ class StatementToPlanConverter:
             statement.vector_store_type,
             statement.project_expr_list,
             statement.index_def,
+            statement.index_params,
         )
         self._plan = create_index_opr
 
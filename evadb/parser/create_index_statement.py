@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List
+from typing import Any, Dict, List
 
 from evadb.catalog.catalog_type import VectorStoreType
 from evadb.expression.abstract_expression import AbstractExpression
@@ -33,6 +33,7 @@ class CreateIndexStatement(AbstractStatement):
         col_list: List[ColumnDefinition],
         vector_store_type: VectorStoreType,
         project_expr_list: List[AbstractStatement],
+        index_params: Dict[str, Any] = None,
     ):
         super().__init__(StatementType.CREATE_INDEX)
         self._name = name
@@ -41,6 +42,8 @@ class CreateIndexStatement(AbstractStatement):
         self._col_list = col_list
         self._vector_store_type = vector_store_type
         self._project_expr_list = project_expr_list
+        # Vector store specific options, e.g., {"index_factory": "IVF256,PQ16"}
+        self._index_params = index_params or {}
 
         # Definition of CREATE INDEX.
         self._index_def = self.__str__()
@@ -67,7 +70,11 @@ class CreateIndexStatement(AbstractStatement):
                 return f"{expr.name}({traverse_create_function_expression_str(expr.children[0])})"
 
             print_str += f" ({traverse_create_function_expression_str(function_expr)})"
-        print_str += f" USING {self._vector_store_type};"
+        print_str += f" USING {self._vector_store_type}"
+        for key, value in self._index_params.items():
+            value = f"'{value}'" if isinstance(value, str) else value
+            print_str += f" {key.upper()} {value}"
+        print_str += ";"
         return print_str
 
     @property
@@ -98,6 +105,10 @@ class CreateIndexStatement(AbstractStatement):
     def project_expr_list(self, project_expr_list: List[AbstractExpression]):
         self._project_expr_list = project_expr_list
 
+    @property
+    def index_params(self):
+        return self._index_params
+
     @property
     def index_def(self):
         return self._index_def
@@ -112,6 +123,7 @@ class CreateIndexStatement(AbstractStatement):
             and self.col_list == other.col_list
             and self._vector_store_type == other.vector_store_type
             and self._project_expr_list == other.project_expr_list
+            and self._index_params == other.index_params
             and self._index_def == other.index_def
         )
 
@@ -125,6 +137,7 @@ class CreateIndexStatement(AbstractStatement):
                 tuple(self.col_list),
                 self._vector_store_type,
                 tuple(self._project_expr_list),
+                tuple(self._index_params.items()),
                 self._index_def,
             )
         )
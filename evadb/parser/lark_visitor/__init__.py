@@ -30,6 +30,7 @@ from evadb.parser.lark_visitor._expressions import Expressions
 from evadb.parser.lark_visitor._functions import Functions
 from evadb.parser.lark_visitor._insert_statements import Insert
 from evadb.parser.lark_visitor._load_statement import Load
+from evadb.parser.lark_visitor._prepare_statement import Prepare
 from evadb.parser.lark_visitor._rename_statement import RenameTable
 from evadb.parser.lark_visitor._select_statement import Select
 from evadb.parser.lark_visitor._set_statement import Set
@@ -78,6 +79,7 @@ class LarkInterpreter(
     DropObject,
     Show,
     Explain,
+    Prepare,
     Delete,
     Use,
     Set,
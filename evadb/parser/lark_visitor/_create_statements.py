@@ -16,6 +16,7 @@
 from lark import Tree
 
 from evadb.catalog.catalog_type import ColumnType, NdArrayType, VectorStoreType
+from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.create_index_statement import CreateIndexStatement
 from evadb.parser.create_statement import (
@@ -243,6 +244,7 @@ class CreateIndex:
         table_name = None
         vector_store_type = None
         index_elem = None
+        index_params = {}
 
         for child in tree.children:
             if isinstance(child, Tree):
@@ -257,6 +259,12 @@ class CreateIndex:
                     vector_store_type = self.visit(child)
                 elif child.data == "index_elem":
                     index_elem = self.visit(child)
+                elif child.data == "index_parameter":
+                    # Each index parameter is a key value pair, e.g., NPROBE 8
+                    key, value = self.visit(child)
+                    if isinstance(value, ConstantValueExpression):
+                        value = value.value
+                    index_params[key.lower()] = value
 
         # Projection list of child of index creation.
         project_expr_list = []
@@ -284,6 +292,7 @@ class CreateIndex:
             col_list,
             vector_store_type,
             project_expr_list,
+            index_params,
         )
 
     def vector_store_type(self, tree):
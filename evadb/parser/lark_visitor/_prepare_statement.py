@@ -0,0 +1,70 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from lark import Tree
+
+from evadb.expression.parameter_expression import ParameterExpression, QueryParameters
+from evadb.parser.prepare_statement import (
+    DeallocateStatement,
+    ExecuteStatement,
+    PrepareStatement,
+)
+
+
+##################################################################
+# PREPARED STATEMENTS
+##################################################################
+class Prepare:
+    def _get_query_parameters(self) -> QueryParameters:
+        # all the parameters of the parsed statement share the bound values. The
+        # interpreter resolves unknown attributes to visitors, so use its __dict__
+        if "_query_parameters" not in self.__dict__:
+            self.__dict__["_query_parameters"] = QueryParameters()
+        return self.__dict__["_query_parameters"]
+
+    def parameter_expression_atom(self, tree):
+        index = int(str(tree.children[0])[1:])
+        parameters = self._get_query_parameters()
+        parameters.num_parameters = max(parameters.num_parameters, index)
+        return ParameterExpression(index, parameters)
+
+    def prepare_statement(self, tree):
+        name = None
+        statement = None
+        for child in tree.children:
+            if isinstance(child, Tree):
+                if child.data == "uid":
+                    name = self.visit(child)
+                else:
+                    statement = self.visit(child)
+        return PrepareStatement(name, statement, self._get_query_parameters())
+
+    def execute_statement(self, tree):
+        name = None
+        values = []
+        for child in tree.children:
+            if isinstance(child, Tree):
+                if child.data == "uid":
+                    name = self.visit(child)
+                elif child.data == "constant":
+                    values.append(self.visit(child).value)
+        return ExecuteStatement(name, values)
+
+    def deallocate_statement(self, tree):
+        name = None
+        for child in tree.children:
+            if isinstance(child, Tree):
+                if child.data == "uid":
+                    name = self.visit(child)
+        return DeallocateStatement(name)
@@ -30,4 +30,9 @@ class Show:
         elif isinstance(token, str) and str.upper(token) == "DATABASES":
             return ShowStatement(show_type=ShowType.DATABASES)
         elif token is not None:
-            return ShowStatement(show_type=ShowType.CONFIGS, show_val=self.visit(token))
+            show_val = self.visit(token)
+            # FUNCTION_POOL is a special word, which is used to display the warm
+            # function instances
+            if str.upper(show_val) == ShowType.FUNCTION_POOL.name:
+                return ShowStatement(show_type=ShowType.FUNCTION_POOL)
+            return ShowStatement(show_type=ShowType.CONFIGS, show_val=show_val)
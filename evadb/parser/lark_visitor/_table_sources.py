@@ -15,6 +15,7 @@
 
 from lark import Token, Tree
 
+from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.select_statement import SelectStatement
 from evadb.parser.table_ref import Alias, JoinNode, TableRef, TableValuedExpression
@@ -101,6 +102,7 @@ class TableSources:
         from_clause = None
         where_clause = None
         groupby_clause = None
+        groupby_list = None
         orderby_clause = None
         limit_count = None
 
@@ -114,6 +116,7 @@ class TableSources:
                     from_clause = clause.get("from", None)
                     where_clause = clause.get("where", None)
                     groupby_clause = clause.get("groupby", None)
+                    groupby_list = clause.get("groupby_list", None)
                 elif child.data == "order_by_clause":
                     orderby_clause = self.visit(child)
                 elif child.data == "limit_clause":
@@ -132,6 +135,7 @@ class TableSources:
             from_clause,
             where_clause,
             groupby_clause=groupby_clause,
+            groupby_list=groupby_list,
             orderby_list=orderby_clause,
             limit_count=limit_count,
         )
@@ -142,8 +146,7 @@ class TableSources:
     def from_clause(self, tree):
         from_table = None
         where_clause = None
-        groupby_clause = None
-        # TODO ACTION Group By
+        groupby_items = []
 
         for child in tree.children:
             if isinstance(child, Tree):
@@ -152,11 +155,25 @@ class TableSources:
                 elif child.data == "where_expr":
                     where_clause = self.visit(child)
                 elif child.data == "group_by_item":
-                    groupby_item = self.visit(child)
-                    # TODO: Support multiple group by columns
-                    groupby_clause = groupby_item
+                    groupby_items.append(self.visit(child))
 
-        return {"from": from_table, "where": where_clause, "groupby": groupby_clause}
+        # GROUP BY '8 frames' groups segments of rows, and GROUP BY a, b groups
+        # the rows by the values of the columns
+        groupby_clause = None
+        groupby_list = None
+        if len(groupby_items) == 1 and isinstance(
+            groupby_items[0], ConstantValueExpression
+        ):
+            groupby_clause = groupby_items[0]
+        elif groupby_items:
+            groupby_list = groupby_items
+
+        return {
+            "from": from_table,
+            "where": where_clause,
+            "groupby": groupby_clause,
+            "groupby_list": groupby_list,
+        }
 
     # Join
     def inner_join(self, tree):
@@ -0,0 +1,112 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import Any, List
+
+from evadb.expression.parameter_expression import QueryParameters
+from evadb.parser.statement import AbstractStatement
+from evadb.parser.types import StatementType
+
+
+class PrepareStatement(AbstractStatement):
+    """PREPARE name AS statement
+
+    The statement can refer to parameters ($1, $2, ...), which are bound by
+    EXECUTE name (value1, value2, ...).
+    """
+
+    def __init__(
+        self, name: str, statement: AbstractStatement, parameters: QueryParameters
+    ):
+        super().__init__(StatementType.PREPARE)
+        self._name = name
+        self._statement = statement
+        self._parameters = parameters
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def statement(self) -> AbstractStatement:
+        return self._statement
+
+    @property
+    def parameters(self) -> QueryParameters:
+        return self._parameters
+
+    def __str__(self):
+        return f"PREPARE {self._name} AS {str(self._statement)}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PrepareStatement):
+            return False
+        return self.name == other.name and self.statement == other.statement
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.name, self.statement))
+
+
+class ExecuteStatement(AbstractStatement):
+    """EXECUTE name (value1, value2, ...)"""
+
+    def __init__(self, name: str, values: List[Any]):
+        super().__init__(StatementType.EXECUTE)
+        self._name = name
+        self._values = values
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def values(self) -> List[Any]:
+        return self._values
+
+    def __str__(self):
+        values = ", ".join(str(value) for value in self._values)
+        return f"EXECUTE {self._name} ({values})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExecuteStatement):
+            return False
+        return self.name == other.name and self.values == other.values
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.name, tuple(map(str, self.values))))
+
+
+class DeallocateStatement(AbstractStatement):
+    """DEALLOCATE name"""
+
+    def __init__(self, name: str):
+        super().__init__(StatementType.DEALLOCATE)
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __str__(self):
+        return f"DEALLOCATE {self._name}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DeallocateStatement):
+            return False
+        return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.name))
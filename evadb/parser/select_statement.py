@@ -40,6 +40,8 @@ class SelectStatement(AbstractStatement):
     _where_clause : AbstractExpression
         predicate of the select query, represented as a expression tree.
     **kwargs : to support other functionality, Orderby, Distinct, Groupby.
+        The groupby_clause is a segment of rows (e.g., '8 frames'), and the
+        groupby_list is a list of columns grouping the rows by their values.
     """
 
     def __init__(
@@ -56,6 +58,7 @@ class SelectStatement(AbstractStatement):
         self._union_link = None
         self._union_all = False
         self._groupby_clause = kwargs.get("groupby_clause", None)
+        self._groupby_list = kwargs.get("groupby_list", None)
         self._orderby_list = kwargs.get("orderby_list", None)
         self._limit_count = kwargs.get("limit_count", None)
 
@@ -107,6 +110,14 @@ class SelectStatement(AbstractStatement):
     def groupby_clause(self, groupby_clause):
         self._groupby_clause = groupby_clause
 
+    @property
+    def groupby_list(self):
+        return self._groupby_list
+
+    @groupby_list.setter
+    def groupby_list(self, groupby_list):
+        self._groupby_list = groupby_list
+
     @property
     def orderby_list(self):
         return self._orderby_list
@@ -158,6 +169,11 @@ class SelectStatement(AbstractStatement):
         if self._groupby_clause is not None:
             select_str += " GROUP BY " + str(self._groupby_clause)
 
+        if self._groupby_list is not None:
+            select_str += " GROUP BY " + ", ".join(
+                str(expr) for expr in self._groupby_list
+            )
+
         if self._orderby_list is not None:
             select_str += " ORDER BY " + orderby_list_str
 
@@ -178,6 +194,7 @@ class SelectStatement(AbstractStatement):
             and self.union_link == other.union_link
             and self.union_all == other.union_all
             and self._groupby_clause == other.groupby_clause
+            and self.groupby_list == other.groupby_list
             and self.orderby_list == other.orderby_list
             and self.limit_count == other.limit_count
         )
@@ -192,6 +209,7 @@ class SelectStatement(AbstractStatement):
                 self.union_link,
                 self.union_all,
                 self.groupby_clause,
+                tuple(self.groupby_list or []),
                 tuple(self.orderby_list or []),
                 self.limit_count,
             )
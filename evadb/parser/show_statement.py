@@ -44,6 +44,8 @@ class ShowStatement(AbstractStatement):
             show_str = self.show_val
         elif self.show_type == ShowType.DATABASES:
             show_str = "DATABASES"
+        elif self.show_type == ShowType.FUNCTION_POOL:
+            show_str = "FUNCTION_POOL"
         return f"SHOW {show_str}"
 
     def __eq__(self, other: object) -> bool:
@@ -43,6 +43,9 @@ class StatementType(EvaDBEnum):
     USE  # noqa: F821
     SET  # noqa: F821
     CREATE_JOB  # noqa: F821
+    PREPARE  # noqa: F821
+    EXECUTE  # noqa: F821
+    DEALLOCATE  # noqa: F821
     # add other types
 
 
@@ -73,6 +76,7 @@ class ShowType(EvaDBEnum):
     TABLES  # noqa: F821
     CONFIGS  # noqa: F821
     DATABASES  # noqa: F821
+    FUNCTION_POOL  # noqa: F821
 
 
 class FunctionType(EvaDBEnum):
@@ -23,6 +23,11 @@ from evadb.parser.explain_statement import ExplainStatement
 from evadb.parser.insert_statement import InsertTableStatement
 from evadb.parser.load_statement import LoadDataStatement
 from evadb.parser.parser import Parser
+from evadb.parser.prepare_statement import (
+    DeallocateStatement,
+    ExecuteStatement,
+    PrepareStatement,
+)
 from evadb.parser.rename_statement import RenameTableStatement
 from evadb.parser.select_statement import SelectStatement
 from evadb.parser.set_statement import SetStatement
@@ -39,6 +44,13 @@ SKIP_BINDER_AND_OPTIMIZER_STATEMENTS = (
     SetStatement,
 )
 
+# Statements that manage the prepared statements, they are handled by the command
+# handler.
+PREPARED_STATEMENTS = (PrepareStatement, ExecuteStatement, DeallocateStatement)
+
+# List of statements whose physical plans are cached by the command handler.
+CACHEABLE_STATEMENTS = (SelectStatement,)
+
 
 def parse_expression(expr: str):
     mock_query = f"SELECT {expr} FROM DUMMY;"
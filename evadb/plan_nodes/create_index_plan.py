@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List
+from typing import Any, Dict, List
 
 from evadb.catalog.catalog_type import VectorStoreType
 from evadb.expression.abstract_expression import AbstractExpression
@@ -33,6 +33,7 @@ class CreateIndexPlan(AbstractPlan):
         vector_store_type: VectorStoreType,
         project_expr_list: List[AbstractExpression],
         index_def: str,
+        index_params: Dict[str, Any] = None,
     ):
         super().__init__(PlanOprType.CREATE_INDEX)
         self._name = name
@@ -42,6 +43,7 @@ class CreateIndexPlan(AbstractPlan):
         self._vector_store_type = vector_store_type
         self._project_expr_list = project_expr_list
         self._index_def = index_def
+        self._index_params = index_params or {}
 
     @property
     def name(self):
@@ -71,6 +73,10 @@ class CreateIndexPlan(AbstractPlan):
     def index_def(self):
         return self._index_def
 
+    @property
+    def index_params(self):
+        return self._index_params
+
     def __str__(self):
         function_expr = None
         for project_expr in self._project_expr_list:
@@ -100,5 +106,6 @@ class CreateIndexPlan(AbstractPlan):
                 self.vector_store_type,
                 tuple(self.project_expr_list),
                 self.index_def,
+                tuple(self.index_params.items()),
             )
         )
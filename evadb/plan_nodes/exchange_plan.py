@@ -34,9 +34,12 @@ class ExchangePlan(AbstractPlan):
         parallelism: int = 1,
         ray_pull_env_conf_dict: Dict[str, Any] = {},
         ray_parallel_env_conf_dict: List[Dict[str, Any]] = [{}],
+        use_ray: bool = True,
     ):
         self.inner_plan = inner_plan
         self.parallelism = parallelism
+        # Ray actors or, otherwise, local worker processes run the inner plan
+        self.use_ray = use_ray
         # Environment variables to configure in the remote process. The problem of Ray remote function
         # is that we cannot control which GPU to spawn the job. Second, Ray does not offer anything
         # extra when specify GPU job. Just by giving environment variables like CUDA_VISIBLE_DEVICES,
@@ -54,5 +57,6 @@ class ExchangePlan(AbstractPlan):
                 super().__hash__(),
                 self.inner_plan,
                 self.parallelism,
+                self.use_ray,
             )
         )
@@ -12,7 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List, Tuple
+
+from evadb.expression.aggregation_expression import AggregationExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.plan_nodes.abstract_plan import AbstractPlan
 from evadb.plan_nodes.types import PlanOprType
 
@@ -26,18 +30,50 @@ class GroupByPlan(AbstractPlan):
         groupby_clause: ConstantValueExpression
             A ConstantValueExpression which is the number of elements to
             group together.
+        groupby_list: List[TupleValueExpression]
+            The columns whose values group the rows, if there is no
+            groupby_clause. An empty list groups all the rows together.
+        aggregates: List[(str, AggregationExpression)]
+            The aggregates of the rows of every group grouped by the
+            groupby_list, and the name of their output column.
     """
 
-    def __init__(self, groupby_clause: ConstantValueExpression):
+    def __init__(
+        self,
+        groupby_clause: ConstantValueExpression,
+        groupby_list: List[TupleValueExpression] = None,
+        aggregates: List[Tuple[str, AggregationExpression]] = None,
+    ):
         self._groupby_clause = groupby_clause
+        self._groupby_list = groupby_list
+        self._aggregates = aggregates
         super().__init__(PlanOprType.GROUP_BY)
 
     @property
     def groupby_clause(self):
         return self._groupby_clause
 
+    @property
+    def groupby_list(self):
+        return self._groupby_list
+
+    @property
+    def aggregates(self):
+        return self._aggregates
+
     def __str__(self):
+        if self._groupby_clause is None:
+            return "GroupByPlan(groupby_list={}, aggregates={})".format(
+                self._groupby_list, self._aggregates
+            )
         return "GroupByPlan(groupby_clause={})".format(self._groupby_clause)
 
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self.groupby_clause))
+        return hash(
+            (
+                super().__hash__(),
+                self.groupby_clause,
+                tuple(self.groupby_list or []),
+                tuple(self.aggregates or []),
+            )
+        )
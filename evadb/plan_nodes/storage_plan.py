@@ -12,6 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List
+
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.parser.table_ref import TableRef
@@ -34,6 +37,8 @@ class StoragePlan(AbstractPlan):
         curr_shard (int): current curr_shard if data is sharded
         sampling_rate (int): uniform sampling rate
         sampling_type (str): special sampling type like IFRAMES
+        column_list (List[ColumnCatalogEntry]): columns to read from the table,
+            all the columns are read if None
     """
 
     def __init__(
@@ -50,6 +55,7 @@ class StoragePlan(AbstractPlan):
         batch_mem_size: int = 30000000,
         sampling_type: str = None,
         chunk_params: dict = {},
+        column_list: List[ColumnCatalogEntry] = None,
     ):
         super().__init__(PlanOprType.STORAGE_PLAN)
         self._table = table
@@ -64,6 +70,7 @@ class StoragePlan(AbstractPlan):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        self._column_list = column_list
 
     @property
     def table(self):
@@ -109,6 +116,10 @@ class StoragePlan(AbstractPlan):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def column_list(self):
+        return self._column_list
+
     def __str__(self):
         return "StoragePlan(video={}, \
             table_ref={},\
@@ -150,5 +161,6 @@ class StoragePlan(AbstractPlan):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.column_list or []),
             )
         )
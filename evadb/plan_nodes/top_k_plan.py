@@ -0,0 +1,60 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.plan_nodes.abstract_plan import AbstractPlan
+from evadb.plan_nodes.types import PlanOprType
+
+
+class TopKPlan(AbstractPlan):
+    """
+    This plan is used for storing information required for the fused order by
+    and limit operations, which keeps only the first rows of the order.
+
+    Arguments:
+        orderby_list: List[(TupleValueExpression, EnumInt), ...]
+            A tuple of the column names string and the type of sort in the plan
+        limit_count: ConstantValueExpression
+            A ConstantValueExpression which is the count of the
+            number of rows returned
+    """
+
+    def __init__(self, orderby_list, limit_count: ConstantValueExpression):
+        self._orderby_list = orderby_list
+        self._limit_count = limit_count
+        super().__init__(PlanOprType.TOP_K)
+
+    @property
+    def columns(self):
+        return [_[0] for _ in self._orderby_list]
+
+    @property
+    def sort_types(self):
+        return [_[1] for _ in self._orderby_list]
+
+    @property
+    def orderby_list(self):
+        return self._orderby_list
+
+    @property
+    def limit_value(self):
+        return self._limit_count.value
+
+    def __str__(self):
+        return "TopKPlan(orderby_list={}, limit_count={})".format(
+            self._orderby_list, self._limit_count
+        )
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), tuple(self._orderby_list), self._limit_count))
@@ -32,6 +32,7 @@ class PlanOprType(Enum):
     GROUP_BY = auto()
     ORDER_BY = auto()
     LIMIT = auto()
+    TOP_K = auto()
     SAMPLE = auto()
     FUNCTION_SCAN = auto()
     NESTED_LOOP_JOIN = auto()
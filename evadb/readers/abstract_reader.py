@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Iterator
 
@@ -31,9 +32,12 @@ class AbstractReader(metaclass=ABCMeta):
 
     Attributes:
         file_url (str): path to read data from
+        limit (int): maximum number of rows to read, all the rows are read if None
     """
 
-    def __init__(self, file_url: str, batch_mem_size: int = 30000000):
+    def __init__(
+        self, file_url: str, batch_mem_size: int = 30000000, limit: int = None
+    ):
         # Check if the file still exists, if not raise an exception
         if not Path(file_url).exists():
             raise DatasetFileNotFoundError()
@@ -42,6 +46,7 @@ class AbstractReader(metaclass=ABCMeta):
             file_url = str(file_url)
         self.file_url = file_url
         self.batch_mem_size = batch_mem_size
+        self.limit = limit
 
     def read(self) -> Iterator[Batch]:
         """
@@ -51,7 +56,8 @@ class AbstractReader(metaclass=ABCMeta):
 
         data_batch = []
         row_size = None
-        for data in self._read():
+        # stop pulling rows from the sub class once the limit is reached
+        for data in islice(self._read(), self.limit):
             if row_size is None:
                 row_size = 0
                 row_size = get_size(data)
@@ -12,17 +12,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+import math
+from itertools import islice
+from typing import Dict, Iterator, Tuple
 
 import numpy as np
+import pandas as pd
 
 from evadb.catalog.catalog_type import VideoColumnName
 from evadb.catalog.sql_config import ROW_NUM_COLUMN
 from evadb.constants import AUDIORATE, IFRAMES
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.expression.expression_utils import extract_range_list_from_predicate
+from evadb.models.storage.batch import Batch
 from evadb.readers.abstract_reader import AbstractReader
-from evadb.utils.generic_utils import try_to_import_decord
+from evadb.utils.frame_cache import FrameCache
+from evadb.utils.generic_utils import get_size, try_to_import_decord
 from evadb.utils.logging_manager import logger
 
 
@@ -35,6 +40,8 @@ class DecordReader(AbstractReader):
         sampling_type: str = None,
         read_audio: bool = False,
         read_video: bool = True,
+        frame_cache: FrameCache = None,
+        frame_range: Tuple[int, int] = None,
         **kwargs,
     ):
         """Read frames from the disk
@@ -48,18 +55,64 @@ class DecordReader(AbstractReader):
             sampling_type (str, optional): Set as IFRAMES if caller want to sample on top on iframes only. e.g if the IFRAME frame numbers are [10,20,30,40,50] then 'SAMPLE IFRAMES 2' will return [10,30,50]
             read_audio (bool, optional): Whether to read audio stream from the video. Defaults to False
             read_video (bool, optional): Whether to read video stream from the video. Defaults to True
+            frame_cache (FrameCache, optional): Cache of decoded video frames. Frames are decoded from the video file if it is None
+            frame_range (Tuple[int, int], optional): Only the frames between the two (inclusive) frame ids are read. The sampling is aligned with the whole video, so that the frames of consecutive ranges are the frames of the whole video. Defaults to None.
         """
         self._predicate = predicate
         self._sampling_rate = sampling_rate or 1
         self._sampling_type = sampling_type
         self._read_audio = read_audio
         self._read_video = read_video
+        self._frame_cache = frame_cache
+        self._frame_range = frame_range
         self._reader = None
         self._get_frame = None
         super().__init__(*args, **kwargs)
         self.initialize_reader()
 
+    def read(self) -> Iterator[Batch]:
+        """
+        Decodes the video frames in batches using `VideoReader.get_batch` and
+        builds each Batch directly from the stacked frames. Audio streams are
+        still read frame by frame.
+        """
+        if self._read_audio:
+            yield from super().read()
+            return
+
+        logger.debug("Reading frames")
+        frame_ids = islice(self._get_frame_ids(), self.limit)
+        first_frame_id = next(frame_ids, None)
+        if first_frame_id is None:
+            return
+        # same batching as AbstractReader.read, which yields a batch once its
+        # size reaches batch_mem_size
+        first_row = self._get_frame(first_frame_id)
+        rows_per_batch = max(1, math.ceil(self.batch_mem_size / get_size(first_row)))
+
+        # the first frame is decoded once, the rest of its batch is decoded after
+        batches = [Batch(pd.DataFrame([first_row]))]
+        batch_frame_ids = np.fromiter(
+            islice(frame_ids, rows_per_batch - 1), dtype=np.int64
+        )
+        if len(batch_frame_ids) > 0:
+            batches.append(self._get_video_batch(batch_frame_ids))
+        yield Batch.concat(batches, copy=False)
+
+        while True:
+            batch_frame_ids = np.fromiter(
+                islice(frame_ids, rows_per_batch), dtype=np.int64
+            )
+            if len(batch_frame_ids) == 0:
+                break
+            yield self._get_video_batch(batch_frame_ids)
+
     def _read(self) -> Iterator[Dict]:
+        logger.debug("Reading frames")
+        for frame_id in self._get_frame_ids():
+            yield self._get_frame(frame_id)
+
+    def _get_frame_ids(self) -> Iterator[int]:
         num_frames = int(len(self._reader))
         if self._predicate:
             range_list = extract_range_list_from_predicate(
@@ -67,7 +120,13 @@ class DecordReader(AbstractReader):
             )
         else:
             range_list = [(0, num_frames - 1)]
-        logger.debug("Reading frames")
+        if self._frame_range is not None:
+            first, last = self._frame_range
+            range_list = [
+                (max(begin, first), min(end, last))
+                for begin, end in range_list
+                if begin <= last and end >= first
+            ]
 
         if self._sampling_type == IFRAMES:
             iframes = self._reader.get_key_indices()
@@ -79,13 +138,13 @@ class DecordReader(AbstractReader):
                 while idx < len(iframes) and iframes[idx] <= end:
                     frame_id = iframes[idx]
                     idx += self._sampling_rate
-                    yield self._get_frame(frame_id)
+                    yield frame_id
 
         elif self._sampling_rate == 1 or self._read_audio:
             for begin, end in range_list:
                 frame_id = begin
                 while frame_id <= end:
-                    yield self._get_frame(frame_id)
+                    yield frame_id
                     frame_id += 1
         else:
             for begin, end in range_list:
@@ -93,7 +152,10 @@ class DecordReader(AbstractReader):
                 if begin % self._sampling_rate:
                     begin += self._sampling_rate - (begin % self._sampling_rate)
                 for frame_id in range(begin, end + 1, self._sampling_rate):
-                    yield self._get_frame(frame_id)
+                    yield frame_id
+
+    def num_frames(self) -> int:
+        return int(len(self._reader))
 
     def initialize_reader(self):
         try_to_import_decord()
@@ -121,17 +183,56 @@ class DecordReader(AbstractReader):
             self._get_frame = self.__get_video_frame
 
     def __get_video_frame(self, frame_id):
-        frame_video = self._reader[frame_id]
-        frame_video = frame_video.asnumpy()
-        timestamp = self._reader.get_frame_timestamp(frame_id)[0]
+        frames, timestamps = self._get_video_frames(np.array([frame_id]))
 
         return {
             VideoColumnName.id.name: frame_id,
             ROW_NUM_COLUMN: frame_id,
-            VideoColumnName.data.name: frame_video,
-            VideoColumnName.seconds.name: round(timestamp, 2),
+            # copy the frame so that it owns its data, get_size ignores the
+            # buffer of array views
+            VideoColumnName.data.name: frames[0].copy(),
+            VideoColumnName.seconds.name: round(timestamps[0], 2),
         }
 
+    def _get_video_batch(self, frame_ids: np.ndarray) -> Batch:
+        frames, timestamps = self._get_video_frames(frame_ids)
+        return Batch(
+            pd.DataFrame(
+                {
+                    VideoColumnName.id.name: frame_ids,
+                    ROW_NUM_COLUMN: frame_ids,
+                    VideoColumnName.data.name: list(frames),
+                    VideoColumnName.seconds.name: np.round(timestamps, 2),
+                }
+            )
+        )
+
+    def _get_video_frames(self, frame_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the stacked frames and the timestamps of the frame ids. Only the
+        frames missing from the frame cache are decoded.
+        """
+        if self._frame_cache is None:
+            return self._decode_video_frames(frame_ids)
+
+        entries = self._frame_cache.get_many(self.file_url, frame_ids)
+        misses = [idx for idx, entry in enumerate(entries) if entry is None]
+        if misses:
+            frames, timestamps = self._decode_video_frames(frame_ids[misses])
+            decoded = list(zip(frames, timestamps))
+            self._frame_cache.set_many(self.file_url, frame_ids[misses], decoded)
+            for idx, entry in zip(misses, decoded):
+                entries[idx] = entry
+        frames, timestamps = zip(*entries)
+        return np.stack(frames), np.array(timestamps, dtype=np.float32)
+
+    def _decode_video_frames(
+        self, frame_ids: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        frames = self._reader.get_batch(frame_ids).asnumpy()
+        timestamps = self._reader.get_frame_timestamp(frame_ids)[:, 0]
+        return frames, timestamps
+
     def __get_audio_frame(self, frame_id):
         frame_audio, _ = self._reader[frame_id]
         frame_audio = frame_audio.asnumpy()[0]
@@ -12,46 +12,197 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+from concurrent.futures import Executor
 from typing import Iterator, Optional
 
+import pandas as pd
+
 from evadb.binder.statement_binder import StatementBinder
 from evadb.binder.statement_binder_context import StatementBinderContext
 from evadb.database import EvaDBDatabase
+from evadb.executor.executor_utils import ExecutorError
 from evadb.executor.plan_executor import PlanExecutor
 from evadb.models.server.response import Response, ResponseStatus
 from evadb.models.storage.batch import Batch
+from evadb.optimizer.plan_cache import (
+    PlanCache,
+    PreparedStatement,
+    copy_plan,
+    get_plan_cache,
+    normalize_query,
+)
 from evadb.optimizer.plan_generator import PlanGenerator
 from evadb.optimizer.statement_to_opr_converter import StatementToPlanConverter
 from evadb.parser.parser import Parser
+from evadb.parser.prepare_statement import DeallocateStatement, PrepareStatement
 from evadb.parser.statement import AbstractStatement
-from evadb.parser.utils import SKIP_BINDER_AND_OPTIMIZER_STATEMENTS
+from evadb.parser.utils import (
+    CACHEABLE_STATEMENTS,
+    PREPARED_STATEMENTS,
+    SKIP_BINDER_AND_OPTIMIZER_STATEMENTS,
+)
 from evadb.utils.logging_manager import logger
 from evadb.utils.stats import Timer
 
 
-def execute_statement(
+def _build_physical_plan(
+    evadb: EvaDBDatabase, stmt: AbstractStatement, plan_generator: PlanGenerator
+):
+    StatementBinder(StatementBinderContext(evadb.catalog)).bind(stmt)
+    logical_plan = StatementToPlanConverter().visit(stmt)
+    return plan_generator.build(logical_plan)
+
+
+def _execute_plan(
+    evadb: EvaDBDatabase,
+    physical_plan,
+    do_not_raise_exceptions: bool = False,
+    do_not_print_exceptions: bool = False,
+) -> Iterator[Batch]:
+    return PlanExecutor(evadb, physical_plan).execute_plan(
+        do_not_raise_exceptions, do_not_print_exceptions
+    )
+
+
+def _execute_prepared_statement(
+    evadb: EvaDBDatabase,
+    stmt: AbstractStatement,
+    do_not_raise_exceptions: bool = False,
+    do_not_print_exceptions: bool = False,
+    **kwargs,
+) -> Iterator[Batch]:
+    plan_cache = get_plan_cache(evadb.catalog_uri)
+    if isinstance(stmt, PrepareStatement):
+        # keep the unbound statement, the binder modifies the statement in place
+        plan_cache.prepare(
+            PreparedStatement(stmt.name, stmt.statement.copy(), stmt.parameters)
+        )
+        yield Batch(pd.DataFrame([f"Statement {stmt.name} prepared"]))
+        return
+
+    if isinstance(stmt, DeallocateStatement):
+        if not plan_cache.deallocate(stmt.name):
+            raise ExecutorError(f"Prepared statement {stmt.name} does not exist")
+        yield Batch(pd.DataFrame([f"Statement {stmt.name} deallocated"]))
+        return
+
+    prepared = plan_cache.get_prepared(stmt.name)
+    if prepared is None:
+        raise ExecutorError(f"Prepared statement {stmt.name} does not exist")
+    num_parameters = prepared.parameters.num_parameters
+    if len(stmt.values) != num_parameters:
+        raise ExecutorError(
+            f"Prepared statement {stmt.name} expects {num_parameters} parameters,"
+            f" got {len(stmt.values)}"
+        )
+
+    version = evadb.catalog().version
+    if prepared.plan is not None and prepared.version == version:
+        physical_plan = copy_plan(prepared.plan)
+    else:
+        plan_generator = kwargs.get("plan_generator", PlanGenerator(evadb))
+        physical_plan = _build_physical_plan(
+            evadb, prepared.statement.copy(), plan_generator
+        )
+        if evadb.catalog().version == version:
+            prepared.plan, prepared.version = copy_plan(physical_plan), version
+
+    prepared.parameters.set(stmt.values)
+    try:
+        yield from _execute_plan(
+            evadb, physical_plan, do_not_raise_exceptions, do_not_print_exceptions
+        )
+    finally:
+        prepared.parameters.clear()
+
+
+def _stream_statement(
     evadb: EvaDBDatabase,
     stmt: AbstractStatement,
     do_not_raise_exceptions: bool = False,
     do_not_print_exceptions: bool = False,
-    **kwargs
+    **kwargs,
 ) -> Iterator[Batch]:
+    if isinstance(stmt, PREPARED_STATEMENTS):
+        return _execute_prepared_statement(
+            evadb, stmt, do_not_raise_exceptions, do_not_print_exceptions, **kwargs
+        )
+
     # For certain statements, we plan to omit binder and optimizer to keep the code
     # clean. So, we handle such cases here and pass the statement directly to the
     # executor.
-    plan_generator = kwargs.get("plan_generator", PlanGenerator(evadb))
     if not isinstance(stmt, SKIP_BINDER_AND_OPTIMIZER_STATEMENTS):
-        StatementBinder(StatementBinderContext(evadb.catalog)).bind(stmt)
-        logical_plan = StatementToPlanConverter().visit(stmt)
-        physical_plan = plan_generator.build(logical_plan)
+        plan_generator = kwargs.get("plan_generator", PlanGenerator(evadb))
+        physical_plan = _build_physical_plan(evadb, stmt, plan_generator)
     else:
         physical_plan = stmt
-    output = PlanExecutor(evadb, physical_plan).execute_plan(
-        do_not_raise_exceptions, do_not_print_exceptions
+    return _execute_plan(
+        evadb, physical_plan, do_not_raise_exceptions, do_not_print_exceptions
+    )
+
+
+def execute_statement(
+    evadb: EvaDBDatabase,
+    stmt: AbstractStatement,
+    do_not_raise_exceptions: bool = False,
+    do_not_print_exceptions: bool = False,
+    **kwargs,
+) -> Optional[Batch]:
+    output = _stream_statement(
+        evadb, stmt, do_not_raise_exceptions, do_not_print_exceptions, **kwargs
+    )
+    return Batch.concat(output, copy=False)
+
+
+def _get_plan_cache(evadb: EvaDBDatabase, **kwargs) -> Optional[PlanCache]:
+    # a custom plan generator (e.g., with a different set of rules) bypasses the
+    # plan cache
+    if "plan_generator" in kwargs:
+        return None
+    plan_cache = get_plan_cache(evadb.catalog_uri)
+    plan_cache.resize(
+        evadb.catalog().get_configuration_catalog_value("plan_cache_size", 0)
     )
-    if output:
-        batch_list = list(output)
-        return Batch.concat(batch_list, copy=False)
+    return plan_cache if plan_cache.max_size > 0 else None
+
+
+def execute_query_stream(
+    evadb: EvaDBDatabase,
+    query,
+    do_not_raise_exceptions: bool = False,
+    do_not_print_exceptions: bool = False,
+    **kwargs,
+) -> Iterator[Batch]:
+    """
+    Execute the query and yield the result batches as they are produced.
+
+    The plans of SELECT queries are cached by the normalized query text and the
+    catalog version, so repeating a query skips parsing, binding and optimization.
+    """
+    plan_cache = _get_plan_cache(evadb, **kwargs)
+    physical_plan = None
+    if plan_cache is not None:
+        query_key = normalize_query(query)
+        version = evadb.catalog().version
+        physical_plan = plan_cache.get(query_key, version)
+
+    if physical_plan is None:
+        stmt = Parser().parse(query)[0]
+        if plan_cache is not None and isinstance(stmt, CACHEABLE_STATEMENTS):
+            physical_plan = _build_physical_plan(evadb, stmt, PlanGenerator(evadb))
+            # skip caching if the catalog changed while optimizing the query
+            if evadb.catalog().version == version:
+                plan_cache.put(query_key, version, physical_plan)
+
+    if physical_plan is not None:
+        yield from _execute_plan(
+            evadb, physical_plan, do_not_raise_exceptions, do_not_print_exceptions
+        )
+    else:
+        yield from _stream_statement(
+            evadb, stmt, do_not_raise_exceptions, do_not_print_exceptions, **kwargs
+        )
 
 
 def execute_query(
@@ -60,18 +211,18 @@ def execute_query(
     report_time: bool = False,
     do_not_raise_exceptions: bool = False,
     do_not_print_exceptions: bool = False,
-    **kwargs
-) -> Iterator[Batch]:
+    **kwargs,
+) -> Optional[Batch]:
     """
-    Execute the query and return a result generator.
+    Execute the query and return the results in one Batch object.
     """
     query_compile_time = Timer()
 
     with query_compile_time:
-        stmt = Parser().parse(query)[0]
-        res_batch = execute_statement(
-            evadb, stmt, do_not_raise_exceptions, do_not_print_exceptions, **kwargs
+        output = execute_query_stream(
+            evadb, query, do_not_raise_exceptions, do_not_print_exceptions, **kwargs
         )
+        res_batch = Batch.concat(output, copy=False)
 
     if report_time is True:
         query_compile_time.log_elapsed_time("Query Compile Time")
@@ -85,7 +236,7 @@ def execute_query_fetch_all(
     report_time: bool = False,
     do_not_raise_exceptions: bool = False,
     do_not_print_exceptions: bool = False,
-    **kwargs
+    **kwargs,
 ) -> Optional[Batch]:
     """
     Execute the query and fetch all results into one Batch object.
@@ -96,51 +247,115 @@ def execute_query_fetch_all(
         report_time,
         do_not_raise_exceptions,
         do_not_print_exceptions,
-        **kwargs
+        **kwargs,
     )
     return res_batch
 
 
-async def handle_request(evadb: EvaDBDatabase, client_writer, request_message):
+def write_response(client_writer, response: Response):
+    """Sends the response to the client, prefixed with its length"""
+    response_data = Response.serialize(response)
+    client_writer.write(b"%d\n" % len(response_data))
+    client_writer.write(response_data)
+
+
+async def handle_request(
+    evadb: EvaDBDatabase,
+    client_writer,
+    request_message,
+    worker: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+):
     """
-    Reads a request from a client and processes it
+    Reads a request from a client, processes it and streams the results back
+
+    Every result batch is sent in its own Response as soon as it is produced, and
+    all but the last Response are marked with `has_more`. The next batch is only
+    produced after the previous one is flushed to the client, so a slow client
+    throttles the query and the server holds at most a couple of batches.
 
-    If user inputs 'quit' stops the event loop
-    otherwise just echoes user input
+    Given a `worker`, the batches are produced on the worker, so that the event
+    loop keeps serving the other clients meanwhile. The worker must run the calls
+    in order on a single thread, since the state of a running query (e.g., the
+    catalog session) is local to the thread. The query fails once it runs for
+    longer than `timeout` seconds, and stops when the request is cancelled.
     """
     logger.debug("Receive request: --|" + str(request_message) + "|--")
 
-    error = False
-    error_msg = None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout else None
+    output = execute_query_stream(evadb, request_message)
+
+    async def next_batch() -> Optional[Batch]:
+        if deadline is not None and loop.time() >= deadline:
+            raise ExecutorError(f"Query exceeded the timeout of {timeout} seconds")
+        if worker is None:
+            return next(output, None)
+        step = loop.run_in_executor(worker, next, output, None)
+        remaining = None if deadline is None else deadline - loop.time()
+        try:
+            # the worker thread cannot be interrupted, so only stop waiting for it
+            return await asyncio.wait_for(asyncio.shield(step), remaining)
+        except asyncio.TimeoutError:
+            if step.done():
+                raise
+            raise ExecutorError(f"Query exceeded the timeout of {timeout} seconds")
+
     query_runtime = Timer()
-    with query_runtime:
+    # the last batch is held back, so that it goes out with the final status
+    pending_batch = None
+    try:
         try:
-            output_batch = execute_query_fetch_all(evadb, request_message)
+            while True:
+                with query_runtime:
+                    batch = await next_batch()
+                if batch is None:
+                    break
+                if pending_batch is not None:
+                    write_response(
+                        client_writer,
+                        Response(
+                            status=ResponseStatus.SUCCESS,
+                            batch=pending_batch,
+                            has_more=True,
+                        ),
+                    )
+                    await client_writer.drain()
+                pending_batch = batch
         except Exception as e:
             error_msg = str(e)
             logger.exception(error_msg)
-            error = True
+            response = Response(
+                status=ResponseStatus.FAIL,
+                batch=None,
+                error=error_msg,
+            )
+        else:
+            response = Response(
+                status=ResponseStatus.SUCCESS,
+                batch=pending_batch if pending_batch is not None else Batch(),
+                query_time=query_runtime.total_elapsed_time,
+            )
 
-    if not error:
-        response = Response(
-            status=ResponseStatus.SUCCESS,
-            batch=output_batch,
-            query_time=query_runtime.total_elapsed_time,
-        )
-    else:
-        response = Response(
-            status=ResponseStatus.FAIL,
-            batch=None,
-            error=error_msg,
-        )
-
-    query_runtime.log_elapsed_time("Query Response Time")
+        query_runtime.log_elapsed_time("Query Response Time")
 
-    logger.debug(response)
+        logger.debug(response)
 
-    response_data = Response.serialize(response)
-
-    client_writer.write(b"%d\n" % len(response_data))
-    client_writer.write(response_data)
+        try:
+            write_response(client_writer, response)
+        except Exception as e:
+            # e.g., the last batch cannot be serialized, the client is still
+            # answered so that it does not wait for the response forever
+            error_msg = str(e)
+            logger.exception(error_msg)
+            response = Response(status=ResponseStatus.FAIL, batch=None, error=error_msg)
+            write_response(client_writer, response)
+    finally:
+        # stop the query if it did not complete, e.g., on a timeout, once the
+        # worker is done with the batch in flight
+        if worker is None:
+            output.close()
+        else:
+            await asyncio.shield(loop.run_in_executor(worker, output.close))
 
     return response
@@ -0,0 +1,128 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+from evadb.database import EvaDBDatabase
+from evadb.models.server.response import Response, ResponseStatus
+from evadb.server.command_handler import handle_request, write_response
+from evadb.utils.logging_manager import logger
+
+
+class RequestScheduler:
+    """Runs the requests of the server's clients on a bounded pool of workers
+
+    Every worker is a single-thread executor, so that all the batches of a query
+    are produced on the same thread. At most `num_workers` queries run at a time;
+    the queries of different clients run in parallel (e.g., function calls into
+    PyTorch release the GIL) while the event loop keeps accepting connections.
+
+    The requests of a client are queued and run one after the other, since the
+    responses on a connection are matched to the requests by their order. Once
+    `max_queued_requests` requests are waiting across all the clients, the new
+    ones are rejected with a failed response (admission control). The requests of
+    a client are cancelled when it disconnects, and a query fails once it runs
+    longer than the `server_query_timeout` configuration.
+    """
+
+    def __init__(
+        self, evadb: EvaDBDatabase, num_workers: int, max_queued_requests: int
+    ):
+        self._evadb = evadb
+        self._workers = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"evadb-worker-{idx}")
+            for idx in range(max(num_workers, 1))
+        ]
+        self._idle_workers = asyncio.Queue()
+        for worker in self._workers:
+            self._idle_workers.put_nowait(worker)
+        self._max_queued_requests = max_queued_requests
+        self._num_queued_requests = 0
+        # client writer -> (request queue, task serving the queue)
+        self._clients: Dict[object, Tuple[asyncio.Queue, asyncio.Task]] = {}
+
+    @property
+    def num_queued_requests(self) -> int:
+        return self._num_queued_requests
+
+    def submit(self, client_writer, request_message: str):
+        """Queues the request of the client"""
+        if client_writer not in self._clients:
+            requests = asyncio.Queue()
+            task = asyncio.create_task(self._serve_client(client_writer, requests))
+            self._clients[client_writer] = (requests, task)
+        requests, _ = self._clients[client_writer]
+
+        admitted = self._num_queued_requests < self._max_queued_requests
+        if admitted:
+            self._num_queued_requests += 1
+        else:
+            logger.warn(f"Rejected request --|{request_message}|--, server is busy")
+        requests.put_nowait((request_message, admitted))
+
+    async def remove_client(self, client_writer):
+        """Cancels the queued and running requests of the client"""
+        if client_writer not in self._clients:
+            return
+        requests, task = self._clients.pop(client_writer)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        while not requests.empty():
+            _, admitted = requests.get_nowait()
+            if admitted:
+                self._num_queued_requests -= 1
+
+    async def stop(self):
+        for client_writer in list(self._clients):
+            await self.remove_client(client_writer)
+        for worker in self._workers:
+            worker.shutdown(wait=False)
+
+    async def _serve_client(self, client_writer, requests: asyncio.Queue):
+        while True:
+            request_message, admitted = await requests.get()
+            if not admitted:
+                write_response(
+                    client_writer,
+                    Response(
+                        status=ResponseStatus.FAIL,
+                        error="Server is busy, too many requests are queued",
+                    ),
+                )
+                continue
+
+            self._num_queued_requests -= 1
+            timeout = self._evadb.catalog().get_configuration_catalog_value(
+                "server_query_timeout", 0
+            )
+            worker = await self._idle_workers.get()
+            try:
+                await handle_request(
+                    self._evadb, client_writer, request_message, worker, timeout
+                )
+            except Exception as e:
+                # the failure of a request must not stop serving the client,
+                # otherwise its next requests would never be answered
+                logger.exception(f"Failed to serve request --|{request_message}|--")
+                try:
+                    write_response(
+                        client_writer,
+                        Response(status=ResponseStatus.FAIL, error=str(e)),
+                    )
+                except Exception:
+                    logger.exception("Failed to send the failed response")
+            finally:
+                self._idle_workers.put_nowait(worker)
@@ -18,18 +18,21 @@ from asyncio import StreamReader, StreamWriter
 
 from evadb.database import init_evadb_instance
 from evadb.functions.function_bootstrap_queries import init_builtin_functions
+from evadb.server.request_scheduler import RequestScheduler
 from evadb.utils.logging_manager import logger
 
 
 class EvaServer:
     """
-    Receives messages and offloads them to another task for processing them.
+    Receives messages and offloads them to the request scheduler, which processes
+    them on a pool of workers.
     """
 
     def __init__(self):
         self._server = None
         self._clients = {}  # client -> (reader, writer)
         self._evadb = None
+        self._scheduler = None
 
     async def start_evadb_server(
         self, db_dir: str, host: string, port: int, custom_db_uri: str = None
@@ -46,6 +49,15 @@ class EvaServer:
         pprint(f"EvaDB server started at host {host} and port {port}")
         self._evadb = init_evadb_instance(db_dir, host, port, custom_db_uri)
 
+        catalog = self._evadb.catalog()
+        self._scheduler = RequestScheduler(
+            self._evadb,
+            num_workers=catalog.get_configuration_catalog_value("server_workers", 4),
+            max_queued_requests=catalog.get_configuration_catalog_value(
+                "server_max_queued_requests", 64
+            ),
+        )
+
         self._server = await asyncio.start_server(self.accept_client, host, port)
 
         # load built-in functions
@@ -59,6 +71,8 @@ class EvaServer:
 
     async def stop_evadb_server(self):
         logger.warn("EvaDB server stopped")
+        if self._scheduler is not None:
+            await self._scheduler.stop()
         if self._server is not None:
             await self._server.close()
 
@@ -93,9 +107,10 @@ class EvaServer:
                     return
 
                 logger.debug("Handle request")
-                from evadb.server.command_handler import handle_request
-
-                asyncio.create_task(handle_request(self._evadb, client_writer, message))
+                self._scheduler.submit(client_writer, message)
 
         except Exception as e:
             logger.critical("Error reading from client.", exc_info=e)
+        finally:
+            # cancel the pending requests of the client
+            await self._scheduler.remove_client(client_writer)
@@ -16,6 +16,7 @@ import os
 import re
 import shutil
 from pathlib import Path
+from typing import Iterator, List, Tuple
 
 import pandas as pd
 
@@ -23,7 +24,7 @@ from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
-from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.abstract_storage_engine import AbstractStorageEngine, is_in_shard
 from evadb.storage.sqlite_storage_engine import SQLStorageEngine
 from evadb.utils.logging_manager import logger
 
@@ -58,6 +59,26 @@ class AbstractMediaStorageEngine(AbstractStorageEngine):
         file_path = re.sub(r"[^a-zA-Z0-9 \.\n]", "_", file_path_str)
         return file_path
 
+    def _get_media_files(
+        self,
+        table: TableCatalogEntry,
+        total_shards: int = 0,
+        curr_shard: int = 0,
+        row_ids: List[int] = None,
+    ) -> Iterator[Tuple[int, str, Path]]:
+        """
+        Yields the row id, the file name and the stored path of the media files
+        that belong to the current shard of the table, restricted to the given
+        row ids if any
+        """
+        metadata_table = self._get_metadata_table(table)
+        for media_files in self._rdb_handler.read(metadata_table, row_ids=row_ids):
+            for _, (row_id, file_name, _) in media_files.iterrows():
+                if not is_in_shard(row_id, total_shards, curr_shard):
+                    continue
+                system_file_name = self._xform_file_url_to_file_name(file_name)
+                yield row_id, file_name, Path(table.file_url) / system_file_name
+
     def create(self, table: TableCatalogEntry, if_not_exists=True):
         """
         Create the directory to store the images.
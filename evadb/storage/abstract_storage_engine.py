@@ -68,6 +68,60 @@ class AbstractStorageEngine(metaclass=ABCMeta):
             table: storage unit to be read
             pos: row position to be returned
 
+        Engines also accept the `offset`, `limit`, `total_shards` and
+        `curr_shard` of the StoragePlan to read a slice or a shard of the table.
+        Structured tables also accept `after_row_id` to read only the rows
+        appended after the given row id. Structured and image tables accept
+        `row_ids` to read only the rows with the given row ids.
+
         Returns:
             Batch: an iterator of the batch read
         """
+
+
+def is_in_shard(row_id: int, total_shards: int = 0, curr_shard: int = 0) -> bool:
+    """Checks if the row belongs to the current shard. Rows are assigned to the
+    shards in a round robin manner using their row id.
+
+    Arguments:
+        row_id (int): row id of the row
+        total_shards (int): number of shards, the data is not sharded if it is
+            less than 2
+        curr_shard (int): index of the current shard
+    """
+    if total_shards is None or total_shards <= 1:
+        return True
+    return row_id % total_shards == curr_shard
+
+
+def apply_offset_and_limit(
+    batches: Iterator[Batch], offset: int = None, limit: int = None
+) -> Iterator[Batch]:
+    """Skips the first `offset` rows of the batches and stops consuming the
+    batches once `limit` rows are returned.
+
+    Arguments:
+        batches (Iterator[Batch]): batches read from the storage
+        offset (int): number of rows to skip
+        limit (int): maximum number of rows to return
+    """
+    to_skip = offset or 0
+    remaining = limit
+    if remaining is not None and remaining <= 0:
+        return
+    for batch in batches:
+        if to_skip:
+            if len(batch) <= to_skip:
+                to_skip -= len(batch)
+                continue
+            batch = batch[to_skip:]
+            batch.reset_index()
+            to_skip = 0
+        if remaining is not None:
+            if len(batch) >= remaining:
+                batch = batch[:remaining]
+                batch.reset_index()
+                yield batch
+                return
+            remaining -= len(batch)
+        yield batch
@@ -0,0 +1,220 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import dataclasses
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType
+from evadb.catalog.catalog_utils import is_fixed_shape_ndarray_col
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.database import EvaDBDatabase
+from evadb.models.storage.batch import Batch
+from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+from evadb.utils.logging_manager import logger
+
+# hidden column that maps every sql row to its position in the column files
+SLOT_COLUMN = "_slot"
+
+
+class ColumnarStorageEngine(SQLStorageEngine):
+    """
+    Storage engine for structured tables with fixed-shape ndarray columns.
+
+    Scalar columns (and ndarray columns without a fixed shape) are persisted in
+    the sql table, exactly like SQLStorageEngine. Every fixed-shape ndarray
+    column is persisted as a contiguous, append-only binary column file under
+    `table.file_url` and is read back as zero-copy `np.memmap` slices. The hidden
+    `_slot` column stores the position of each row in the column files. Deleted
+    rows only disappear from the sql table; their slots are never reused.
+    """
+
+    def __init__(self, db: EvaDBDatabase):
+        super().__init__(db)
+
+    def _get_array_columns(self, table: TableCatalogEntry) -> List[ColumnCatalogEntry]:
+        return [col for col in table.columns if is_fixed_shape_ndarray_col(col)]
+
+    def _get_sql_table(self, table: TableCatalogEntry) -> TableCatalogEntry:
+        # catalog entry describing the part of the table persisted in sql
+        columns = [col for col in table.columns if not is_fixed_shape_ndarray_col(col)]
+        columns.append(ColumnCatalogEntry(SLOT_COLUMN, ColumnType.INTEGER))
+        return dataclasses.replace(table, columns=columns)
+
+    def _column_file_path(self, table: TableCatalogEntry, col: ColumnCatalogEntry):
+        return Path(table.file_url) / f"{col.name}.col"
+
+    def _column_dtype(self, col: ColumnCatalogEntry) -> np.dtype:
+        return np.dtype(NdArrayType.to_numpy_type(col.array_type))
+
+    def _row_nbytes(self, col: ColumnCatalogEntry) -> int:
+        return self._column_dtype(col).itemsize * int(np.prod(col.array_dimensions))
+
+    def _num_slots(self, table: TableCatalogEntry, col: ColumnCatalogEntry) -> int:
+        path = self._column_file_path(table, col)
+        if not path.exists():
+            return 0
+        return path.stat().st_size // self._row_nbytes(col)
+
+    def _open_column_file(
+        self, table: TableCatalogEntry, col: ColumnCatalogEntry
+    ) -> np.ndarray:
+        num_slots = self._num_slots(table, col)
+        shape = (num_slots, *col.array_dimensions)
+        if num_slots == 0:
+            return np.empty(shape, dtype=self._column_dtype(col))
+        return np.memmap(
+            self._column_file_path(table, col),
+            dtype=self._column_dtype(col),
+            mode="r",
+            shape=shape,
+        )
+
+    def _to_contiguous_array(self, values, col: ColumnCatalogEntry) -> np.ndarray:
+        shape = tuple(col.array_dimensions)
+        try:
+            data = np.stack([np.asarray(value).reshape(shape) for value in values])
+        except ValueError as e:
+            raise ValueError(
+                f"Column {col.name} expects arrays of shape {shape}, got {e}"
+            )
+        return np.ascontiguousarray(data, dtype=self._column_dtype(col))
+
+    def _gather(self, column_file: np.ndarray, slots: np.ndarray) -> np.ndarray:
+        # rows inserted together are stored next to each other, so most batches
+        # map to a contiguous range that we can slice without copying
+        if len(slots) == 0:
+            return np.asarray(column_file[:0])
+        start = slots[0]
+        if np.array_equal(slots, np.arange(start, start + len(slots))):
+            return np.asarray(column_file[start : start + len(slots)])
+        return np.asarray(column_file[slots])
+
+    def create(self, table: TableCatalogEntry, **kwargs):
+        """
+        Create the directory for the column files and the sql table for the
+        scalar columns.
+        """
+        Path(table.file_url).mkdir(parents=True, exist_ok=True)
+        return super().create(self._get_sql_table(table), **kwargs)
+
+    def drop(self, table: TableCatalogEntry):
+        super().drop(self._get_sql_table(table))
+        shutil.rmtree(table.file_url, ignore_errors=True)
+
+    def write(self, table: TableCatalogEntry, rows: Batch):
+        """
+        Append the fixed-shape ndarray columns to their column files and write
+        the remaining columns along with the slot of each row into sql.
+
+        Arguments:
+            table: table metadata object to write into
+            rows : batch to be persisted in the storage.
+        """
+        array_columns = self._get_array_columns(table)
+        file_sizes: Dict[Path, int] = {}
+        try:
+            num_rows = len(rows)
+            start_slot = (
+                self._num_slots(table, array_columns[0]) if array_columns else 0
+            )
+            for col in array_columns:
+                data = self._to_contiguous_array(rows.frames[col.name], col)
+                path = self._column_file_path(table, col)
+                file_sizes[path] = path.stat().st_size if path.exists() else 0
+                with open(path, "ab") as f:
+                    data.tofile(f)
+
+            array_column_names = [col.name for col in array_columns]
+            sql_frames = rows.frames.drop(columns=array_column_names)
+            sql_frames[SLOT_COLUMN] = np.arange(start_slot, start_slot + num_rows)
+            super().write(self._get_sql_table(table), Batch(sql_frames))
+        except Exception as e:
+            # rollback the partially appended column files
+            for path, size in file_sizes.items():
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+            err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def read(
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        columns: List[ColumnCatalogEntry] = None,
+        offset: int = None,
+        limit: int = None,
+        total_shards: int = 0,
+        curr_shard: int = 0,
+        after_row_id: int = None,
+        row_ids: List[int] = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the sql columns and attaches the memory-mapped ndarray columns.
+
+        Argument:
+            table: table metadata object of the table to read
+            batch_mem_size (int): memory size of the batch read from storage
+            columns (List[ColumnCatalogEntry]): columns to read from the table.
+                All the columns are read if it is None.
+            offset, limit, total_shards, curr_shard, after_row_id, row_ids:
+                see SQLStorageEngine.read
+        Return:
+            Iterator of Batch read.
+        """
+        columns = self._get_columns_to_read(table, columns)
+        array_columns = [col for col in columns if is_fixed_shape_ndarray_col(col)]
+        column_files = {
+            col.name: self._open_column_file(table, col) for col in array_columns
+        }
+        row_nbytes = sum(self._row_nbytes(col) for col in array_columns)
+        rows_per_batch = max(1, batch_mem_size // max(1, row_nbytes))
+        column_order = [col.name for col in columns]
+
+        sql_table = self._get_sql_table(table)
+        sql_columns = [
+            col
+            for col in sql_table.columns
+            if col.name in column_order or col.name == SLOT_COLUMN
+        ]
+        sql_batches = super().read(
+            sql_table,
+            batch_mem_size,
+            sql_columns,
+            offset=offset,
+            limit=limit,
+            total_shards=total_shards,
+            curr_shard=curr_shard,
+            after_row_id=after_row_id,
+            row_ids=row_ids,
+        )
+        for sql_batch in sql_batches:
+            frames = sql_batch.frames
+            for begin in range(0, len(frames), rows_per_batch):
+                df = frames.iloc[begin : begin + rows_per_batch].reset_index(drop=True)
+                slots = df.pop(SLOT_COLUMN).to_numpy(dtype=np.int64)
+                for col in array_columns:
+                    data = self._gather(column_files[col.name], slots)
+                    df[col.name] = list(data)
+                yield Batch(
+                    df[column_order + [c for c in df.columns if c not in column_order]]
+                )
+
+    def rename(self, old_table: TableCatalogEntry, new_name):
+        raise Exception("Rename not supported for columnar data table")
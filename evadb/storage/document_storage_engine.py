@@ -12,7 +12,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from pathlib import Path
 from typing import Iterator
 
 from evadb.catalog.models.table_catalog import TableCatalogEntry
@@ -21,25 +20,44 @@ from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
 from evadb.readers.document.document_reader import DocumentReader
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.storage.abstract_storage_engine import apply_offset_and_limit
 
 
 class DocumentStorageEngine(AbstractMediaStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
 
-    def read(self, table: TableCatalogEntry, chunk_params: dict) -> Iterator[Batch]:
-        for doc_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
-            for _, (row_id, file_name, _) in doc_files.iterrows():
-                system_file_name = self._xform_file_url_to_file_name(file_name)
-                doc_file = Path(table.file_url) / system_file_name
-                # setting batch_mem_size = 1, we need fix it
-                reader = DocumentReader(
-                    str(doc_file), batch_mem_size=1, chunk_params=chunk_params
+    def read(
+        self,
+        table: TableCatalogEntry,
+        chunk_params: dict,
+        offset: int = None,
+        limit: int = None,
+        total_shards: int = 0,
+        curr_shard: int = 0,
+    ) -> Iterator[Batch]:
+        yield from apply_offset_and_limit(
+            self._read(table, chunk_params, total_shards, curr_shard), offset, limit
+        )
+
+    def _read(
+        self,
+        table: TableCatalogEntry,
+        chunk_params: dict,
+        total_shards: int,
+        curr_shard: int,
+    ) -> Iterator[Batch]:
+        for row_id, file_name, doc_file in self._get_media_files(
+            table, total_shards, curr_shard
+        ):
+            # setting batch_mem_size = 1, we need fix it
+            reader = DocumentReader(
+                str(doc_file), batch_mem_size=1, chunk_params=chunk_params
+            )
+            for batch in reader.read():
+                batch.frames[table.columns[0].name] = row_id
+                batch.frames[table.columns[1].name] = str(file_name)
+                batch.frames[ROW_NUM_COLUMN] = (
+                    row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
                 )
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(file_name)
-                    batch.frames[ROW_NUM_COLUMN] = (
-                        row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
-                    )
-                    yield batch
+                yield batch
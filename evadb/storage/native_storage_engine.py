@@ -12,11 +12,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator, List
+from typing import Dict, Iterator, List, Tuple
 
 import numpy as np
 import pandas as pd
 from sqlalchemy import Column, MetaData, Table, create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -25,8 +26,13 @@ from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.catalog.models.utils import ColumnCatalogEntry
 from evadb.catalog.schema_utils import SchemaUtils
 from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression
 from evadb.models.storage.batch import Batch
-from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.storage.abstract_storage_engine import (
+    AbstractStorageEngine,
+    apply_offset_and_limit,
+)
+from evadb.storage.sqlite_storage_engine import insert_sql_rows
 from evadb.third_party.databases.interface import get_database_handler
 from evadb.utils.generic_utils import PickleSerializer, rebatch
 from evadb.utils.logging_manager import logger
@@ -72,20 +78,6 @@ def create_table(uri: str, table_name: str, columns: dict):
     session.close()
 
 
-def _dict_to_sql_row(dict_row: dict, columns: List[ColumnCatalogEntry]):
-    # Serialize numpy data
-    for col in columns:
-        if col.type == ColumnType.NDARRAY:
-            dict_row[col.name] = PickleSerializer.serialize(dict_row[col.name])
-        elif isinstance(dict_row[col.name], (np.generic,)):
-            # Sqlalchemy does not consume numpy generic data types
-            # convert numpy datatype to python generic datatype using tolist()
-            # eg. np.int64 -> int
-            # https://stackoverflow.com/a/53067954
-            dict_row[col.name] = dict_row[col.name].tolist()
-    return dict_row
-
-
 def _deserialize_sql_row(sql_row: tuple, columns: List[ColumnCatalogEntry]):
     # Deserialize numpy data
 
@@ -99,7 +91,34 @@ def _deserialize_sql_row(sql_row: tuple, columns: List[ColumnCatalogEntry]):
     return dict_row
 
 
+def _read_shard(
+    batches: Iterator[Batch],
+    columns: List[ColumnCatalogEntry],
+    total_shards: int,
+    curr_shard: int,
+) -> Iterator[Batch]:
+    # the ndarray cells are not hashable, the rows are hashed on the other columns
+    scalar_columns = set(col.name for col in columns if col.type != ColumnType.NDARRAY)
+    num_rows = 0
+    for batch in batches:
+        names = [name for name in batch.frames.columns if name in scalar_columns]
+        if names:
+            hashes = pd.util.hash_pandas_object(batch.frames[names], index=False)
+            shards = hashes.to_numpy() % np.uint64(total_shards)
+        else:
+            # tables of ndarray columns only fall back to the position of the rows
+            shards = np.arange(num_rows, num_rows + len(batch)) % total_shards
+        num_rows += len(batch)
+        rows = np.flatnonzero(shards == curr_shard)
+        if len(rows) > 0:
+            yield Batch(batch.frames.iloc[rows].reset_index(drop=True))
+
+
 class NativeStorageEngine(AbstractStorageEngine):
+    # sqlalchemy engine and metadata of the reflected tables, cached per database
+    # connection across the storage engine instances
+    _sqlalchemy_engines: Dict[tuple, Tuple[Engine, MetaData]] = {}
+
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
 
@@ -111,16 +130,45 @@ class NativeStorageEngine(AbstractStorageEngine):
             )
         return db_catalog_entry
 
-    def create(self, table: TableCatalogEntry):
-        try:
-            db_catalog_entry = self._get_database_catalog_entry(table.database_name)
-            uri = None
+    def _get_sqlalchemy_engine(self, db_catalog_entry) -> Tuple[Engine, MetaData]:
+        key = (
+            db_catalog_entry.name,
+            db_catalog_entry.engine,
+            tuple(sorted((k, str(v)) for k, v in db_catalog_entry.params.items())),
+        )
+        if key not in self._sqlalchemy_engines:
             with get_database_handler(
                 db_catalog_entry.engine, **db_catalog_entry.params
             ) as handler:
                 uri = handler.get_sqlalchmey_uri()
+            self._sqlalchemy_engines[key] = (create_engine(uri), MetaData())
+        return self._sqlalchemy_engines[key]
+
+    @classmethod
+    def dispose_sqlalchemy_engines(cls, database_name: str):
+        """Closes the pooled connections of the engines of the database, e.g.,
+        once it is dropped"""
+        for key in [key for key in cls._sqlalchemy_engines if key[0] == database_name]:
+            engine, _ = cls._sqlalchemy_engines.pop(key)
+            engine.dispose()
+
+    def _get_sqlalchemy_table(
+        self, engine: Engine, metadata: MetaData, table_name: str
+    ) -> Table:
+        if table_name in metadata.tables:
+            return metadata.tables[table_name]
+        # Retrieve the SQLAlchemy table object for the existing table
+        return Table(table_name, metadata, autoload_with=engine)
+
+    def create(self, table: TableCatalogEntry):
+        try:
+            db_catalog_entry = self._get_database_catalog_entry(table.database_name)
+            engine, metadata = self._get_sqlalchemy_engine(db_catalog_entry)
             sqlalchemy_schema = SchemaUtils.xform_to_sqlalchemy_schema(table.columns)
-            create_table(uri, table.name, sqlalchemy_schema)
+            create_table(engine.url, table.name, sqlalchemy_schema)
+            # the table might have been reflected before it was re-created
+            if table.name in metadata.tables:
+                metadata.remove(metadata.tables[table.name])
         except Exception as e:
             err_msg = f"Failed to create the table {table.name} in data source {table.database_name} with exception {str(e)}"
             logger.exception(err_msg)
@@ -129,29 +177,12 @@ class NativeStorageEngine(AbstractStorageEngine):
     def write(self, table: TableCatalogEntry, rows: Batch):
         try:
             db_catalog_entry = self._get_database_catalog_entry(table.database_name)
-            with get_database_handler(
-                db_catalog_entry.engine, **db_catalog_entry.params
-            ) as handler:
-                uri = handler.get_sqlalchmey_uri()
+            engine, metadata = self._get_sqlalchemy_engine(db_catalog_entry)
+            table_to_update = self._get_sqlalchemy_table(engine, metadata, table.name)
 
-            # Create a metadata object
-            engine = create_engine(uri)
-            metadata = MetaData()
-
-            # Retrieve the SQLAlchemy table object for the existing table
-            table_to_update = Table(table.name, metadata, autoload_with=engine)
-            columns = rows.frames.keys()
-            data = []
             # Todo: validate the data type before inserting into the table
-            for record in rows.frames.values:
-                row_data = {col: record[idx] for idx, col in enumerate(columns)}
-                data.append(_dict_to_sql_row(row_data, table.columns))
-
-            Session = sessionmaker(bind=engine)
-            session = Session()
-            session.execute(table_to_update.insert(), data)
-            session.commit()
-            session.close()
+            with engine.begin() as connection:
+                insert_sql_rows(connection, table_to_update, rows.frames, table.columns)
 
         except Exception as e:
             err_msg = f"Failed to write to the table {table.name} in data source {table.database_name} with exception {str(e)}"
@@ -159,14 +190,65 @@ class NativeStorageEngine(AbstractStorageEngine):
             raise Exception(err_msg)
 
     def read(
-        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        predicate: AbstractExpression = None,
+        columns: List[ColumnCatalogEntry] = None,
+        limit: int = None,
+        offset: int = None,
+        total_shards: int = 0,
+        curr_shard: int = 0,
     ) -> Iterator[Batch]:
+        """
+        Reads the table from the data source. For sqlalchemy compatible data
+        sources, the predicate, the columns and the limit are pushed into the
+        query issued to the data source. Native tables have no row id, so the
+        rows are assigned to the shards by the hash of their values, which does
+        not depend on the order the data source returns them in.
+
+        Argument:
+            table: table metadata object of the table to read
+            batch_mem_size (int): memory size of the batch read from storage
+            predicate (AbstractExpression): sql compatible predicate to filter
+                the rows with
+            columns (List[ColumnCatalogEntry]): columns to read from the table.
+                All the columns are read if it is None.
+            limit (int): maximum number of rows to read
+            offset (int): number of rows to skip
+            total_shards (int): number of shards
+            curr_shard (int): shard to read
+        Return:
+            Iterator of Batch read.
+        """
         try:
             db_catalog_entry = self._get_database_catalog_entry(table.database_name)
             with get_database_handler(
                 db_catalog_entry.engine, **db_catalog_entry.params
             ) as handler:
-                handler_response = handler.select(table.name)
+                table_columns = table.columns
+                if handler.is_sqlalchmey_compatible():
+                    if columns:
+                        names = set(col.name for col in columns)
+                        table_columns = [
+                            col for col in table.columns if col.name in names
+                        ]
+                    # the rows of the other shards and the offset are
+                    # skipped after reading them from the data source
+                    num_rows = None
+                    if limit is not None and not (total_shards and total_shards > 1):
+                        num_rows = (offset or 0) + limit
+                    handler_response = handler.select(
+                        table.name,
+                        columns=[col.name for col in table_columns],
+                        predicate=predicate,
+                        limit=num_rows,
+                    )
+                else:
+                    handler_response = handler.select(table.name)
+                if handler_response.error is not None:
+                    raise Exception(handler_response.error)
+
                 # we prefer the generator/iterator when available
                 result = []
                 if handler_response.data_generator:
@@ -174,7 +256,7 @@ class NativeStorageEngine(AbstractStorageEngine):
                 elif handler_response.data:
                     result = handler_response.data
 
-                if handler.is_sqlalchmey_compatible():
+                if handler.is_sqlalchmey_compatible() and result:
                     # For sql data source, we can deserialize sql rows into numpy array
                     cols = result[0]._fields
                     index_dict = {
@@ -182,7 +264,7 @@ class NativeStorageEngine(AbstractStorageEngine):
                     }
                     try:
                         ordered_columns = sorted(
-                            table.columns, key=lambda x: index_dict[x.name.lower()]
+                            table_columns, key=lambda x: index_dict[x.name.lower()]
                         )
                     except KeyError as e:
                         raise Exception(f"Column mismatch with error {e}")
@@ -190,8 +272,14 @@ class NativeStorageEngine(AbstractStorageEngine):
                         _deserialize_sql_row(row, ordered_columns) for row in result
                     )
 
-                for df in rebatch(result, batch_mem_size):
-                    yield Batch(pd.DataFrame(df))
+                batches = (
+                    Batch(pd.DataFrame(df)) for df in rebatch(result, batch_mem_size)
+                )
+                if total_shards and total_shards > 1:
+                    batches = _read_shard(
+                        batches, table_columns, total_shards, curr_shard
+                    )
+                yield from apply_offset_and_limit(batches, offset, limit)
 
         except Exception as e:
             err_msg = f"Failed to read the table {table.name} in data source {table.database_name} with exception {str(e)}"
@@ -201,22 +289,10 @@ class NativeStorageEngine(AbstractStorageEngine):
     def drop(self, table: TableCatalogEntry):
         try:
             db_catalog_entry = self._get_database_catalog_entry(table.database_name)
-            with get_database_handler(
-                db_catalog_entry.engine, **db_catalog_entry.params
-            ) as handler:
-                uri = handler.get_sqlalchmey_uri()
-
-            # Create a metadata object
-            engine = create_engine(uri)
-            metadata = MetaData()
-            Session = sessionmaker(bind=engine)
-            session = Session()
-            # Retrieve the SQLAlchemy table object for the existing table
-            table_to_remove = Table(table.name, metadata, autoload_with=engine)
-
+            engine, metadata = self._get_sqlalchemy_engine(db_catalog_entry)
+            table_to_remove = self._get_sqlalchemy_table(engine, metadata, table.name)
             table_to_remove.drop(engine)
-            session.commit()
-            session.close()
+            metadata.remove(table_to_remove)
         except Exception as e:
             err_msg = f"Failed to drop the table {table.name} in data source {table.database_name} with exception {str(e)}"
             logger.error(err_msg)
@@ -12,11 +12,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator, List
+import math
+from typing import Dict, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import Table, inspect
+from sqlalchemy import Table, func, inspect, select
+from sqlalchemy.engine import Connection
 from sqlalchemy.sql.expression import ColumnElement
 
 from evadb.catalog.catalog_type import ColumnType
@@ -29,13 +31,77 @@ from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
-from evadb.utils.generic_utils import PickleSerializer, rebatch
+from evadb.utils.generic_utils import PickleSerializer, get_size
 from evadb.utils.logging_manager import logger
 
 # Leveraging Dynamic schema in SQLAlchemy
 # https://sparrigan.github.io/sql/sqla/2016/01/03/dynamic-tables.html
 
 
+def _to_python_list(column: pd.Series) -> list:
+    # Sqlalchemy does not consume numpy generic data types. tolist() converts
+    # the numpy values of a typed column into python values in a single pass,
+    # whereas object columns may still hold numpy values, eg. np.int64 -> int
+    # https://stackoverflow.com/a/53067954
+    values = column.tolist()
+    if column.dtype == object:
+        values = [
+            val.tolist() if isinstance(val, (np.generic,)) else val for val in values
+        ]
+    return values
+
+
+def batch_to_sql_columns(
+    frames: pd.DataFrame, columns: List[ColumnCatalogEntry]
+) -> Dict[str, list]:
+    # Serialize the data column by column instead of row by row
+    missing_columns = [col.name for col in columns if col.name not in frames]
+    if missing_columns:
+        raise KeyError(f"Missing columns {missing_columns}")
+    ndarray_columns = set(col.name for col in columns if col.type == ColumnType.NDARRAY)
+    values = {}
+    for name in frames.columns:
+        if name in ndarray_columns:
+            values[name] = [PickleSerializer.serialize(val) for val in frames[name]]
+        else:
+            values[name] = _to_python_list(frames[name])
+    return values
+
+
+def insert_sql_rows(
+    connection: Connection,
+    table: Table,
+    frames: pd.DataFrame,
+    columns: List[ColumnCatalogEntry],
+):
+    """
+    Inserts the rows of the frames into the table with a single executemany.
+    If the driver takes positional parameters (e.g., sqlite), the rows are
+    passed as tuples zipped from the serialized columns, rather than as a
+    dict per row.
+    """
+    if len(frames) == 0:
+        return
+    values = batch_to_sql_columns(frames, columns)
+    compiled = table.insert().compile(
+        dialect=connection.dialect, column_keys=list(values)
+    )
+    if not compiled.positional:
+        names = list(values)
+        rows = [dict(zip(names, row)) for row in zip(*values.values())]
+        connection.execute(table.insert(), rows)
+        return
+
+    # the insert lists the columns in the order of the table
+    names = [col.key for col in table.columns if col.key in values]
+    for name in names:
+        processor = table.columns[name].type.bind_processor(connection.dialect)
+        if processor is not None:
+            values[name] = [processor(val) for val in values[name]]
+    rows = list(zip(*[values[name] for name in names]))
+    connection.exec_driver_sql(str(compiled), rows)
+
+
 class SQLStorageEngine(AbstractStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         """
@@ -46,19 +112,6 @@ class SQLStorageEngine(AbstractStorageEngine):
         self._sql_engine = db.catalog().sql_config.engine
         self._serializer = PickleSerializer
 
-    def _dict_to_sql_row(self, dict_row: dict, columns: List[ColumnCatalogEntry]):
-        # Serialize numpy data
-        for col in columns:
-            if col.type == ColumnType.NDARRAY:
-                dict_row[col.name] = self._serializer.serialize(dict_row[col.name])
-            elif isinstance(dict_row[col.name], (np.generic,)):
-                # Sqlalchemy does not consume numpy generic data types
-                # convert numpy datatype to python generic datatype using tolist()
-                # eg. np.int64 -> int
-                # https://stackoverflow.com/a/53067954
-                dict_row[col.name] = dict_row[col.name].tolist()
-        return dict_row
-
     def _deserialize_sql_row(self, sql_row: dict, columns: List[ColumnCatalogEntry]):
         # Deserialize numpy data
         dict_row = {}
@@ -146,8 +199,6 @@ class SQLStorageEngine(AbstractStorageEngine):
         """
         try:
             table_to_update = self._try_loading_table_via_reflection(table.name)
-            columns = rows.frames.keys()
-            data = []
 
             # During table writes, assume row_id is automatically handled by
             # the sqlalchemy engine. Another assumption we make here is the
@@ -159,62 +210,146 @@ class SQLStorageEngine(AbstractStorageEngine):
             ]
 
             # Todo: validate the data type before inserting into the table
-            for record in rows.frames.values:
-                row_data = {
-                    col: record[idx]
-                    for idx, col in enumerate(columns)
-                    if col != ROW_NUM_COLUMN
-                }
-                data.append(self._dict_to_sql_row(row_data, table_columns))
-            self._sql_session.execute(table_to_update.insert(), data)
+            frames = rows.frames.drop(columns=[ROW_NUM_COLUMN], errors="ignore")
+            insert_sql_rows(
+                self._sql_session.connection(), table_to_update, frames, table_columns
+            )
             self._sql_session.commit()
         except Exception as e:
             err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def _get_columns_to_read(
+        self, table: TableCatalogEntry, columns: List[ColumnCatalogEntry] = None
+    ) -> List[ColumnCatalogEntry]:
+        # the row id is always read as it is used to generate the row number
+        if columns is None:
+            return table.columns
+        names = set(col.name for col in columns)
+        return [
+            col
+            for col in table.columns
+            if col.name == IDENTIFIER_COLUMN or col.name in names
+        ]
+
     def read(
-        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        columns: List[ColumnCatalogEntry] = None,
+        offset: int = None,
+        limit: int = None,
+        total_shards: int = 0,
+        curr_shard: int = 0,
+        after_row_id: int = None,
+        row_ids: List[int] = None,
     ) -> Iterator[Batch]:
         """
         Reads the table and return a batch iterator for the
-        tuples.
+        tuples. The table is scanned in chunks ordered by the row id, and each
+        chunk is fetched by a separate query. Hence, only a single batch is held
+        in memory and no cursor is kept open across the batches.
 
         Argument:
             table: table metadata object of the table to read
             batch_mem_size (int): memory size of the batch read from storage
+            columns (List[ColumnCatalogEntry]): columns to read from the table.
+                All the columns are read if it is None.
+            offset (int): number of rows to skip
+            limit (int): maximum number of rows to read
+            total_shards (int): number of shards, rows are assigned to the
+                shards by their row id
+            curr_shard (int): shard to read
+            after_row_id (int): only the rows with a larger row id are read
+            row_ids (List[int]): only the rows with these row ids are read
         Return:
             Iterator of Batch read.
         """
         try:
             table_to_read = self._try_loading_table_via_reflection(table.name)
-            result = self._sql_session.execute(table_to_read.select()).fetchall()
-            result_iter = (
-                self._deserialize_sql_row(row._asdict(), table.columns)
-                for row in result
-            )
-            for df in rebatch(result_iter, batch_mem_size):
-                yield Batch(pd.DataFrame(df))
+            columns = self._get_columns_to_read(table, columns)
+            row_id = table_to_read.columns[IDENTIFIER_COLUMN]
+            query = select(
+                *[table_to_read.columns[col.name] for col in columns]
+            ).order_by(row_id)
+            if total_shards and total_shards > 1:
+                query = query.where(row_id % total_shards == curr_shard)
+            if after_row_id is not None:
+                query = query.where(row_id > after_row_id)
+            if row_ids is not None:
+                query = query.where(row_id.in_(row_ids))
+
+            data = []
+            rows_per_batch = None
+            last_row_id = None
+            remaining = limit
+            while True:
+                # the first row is fetched alone to estimate the row size
+                chunk_size = 1 if rows_per_batch is None else rows_per_batch - len(data)
+                if remaining is not None:
+                    chunk_size = min(chunk_size, remaining)
+                if last_row_id is None:
+                    chunk_query = query.offset(offset) if offset else query
+                else:
+                    chunk_query = query.where(row_id > last_row_id)
+                result = self._sql_session.execute(
+                    chunk_query.limit(chunk_size)
+                ).fetchall()
+                for row in result:
+                    data.append(self._deserialize_sql_row(row._asdict(), columns))
+                if result:
+                    last_row_id = result[-1]._mapping[IDENTIFIER_COLUMN]
+                if rows_per_batch is None and data:
+                    rows_per_batch = math.ceil(batch_mem_size / get_size(data))
+                if remaining is not None:
+                    remaining -= len(result)
+
+                is_exhausted = len(result) < chunk_size or remaining == 0
+                if data and (is_exhausted or len(data) >= rows_per_batch):
+                    yield Batch(pd.DataFrame(data))
+                    data = []
+                if is_exhausted:
+                    break
         except Exception as e:
             err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def last_row_id(self, table: TableCatalogEntry) -> Optional[int]:
+        """Returns the largest row id of the table, None if the table is empty"""
+        table_to_read = self._try_loading_table_via_reflection(table.name)
+        row_id = table_to_read.columns[IDENTIFIER_COLUMN]
+        return self._sql_session.execute(select(func.max(row_id))).scalar()
+
     def delete(
         self, table: TableCatalogEntry, sqlalchemy_filter_clause: "ColumnElement[bool]"
-    ):
+    ) -> List[int]:
         """Delete tuples from the table where rows satisfy the where_clause.
         The current implementation only handles equality predicates.
 
         Argument:
             table: table metadata object of the table
             where_clause: clause used to find the tuples to remove.
+        Return:
+            row ids of the deleted tuples
         """
         try:
             table_to_delete_from = self._try_loading_table_via_reflection(table.name)
+            row_id = table_to_delete_from.columns[IDENTIFIER_COLUMN]
+            # the row ids are read in the same transaction as the delete, so
+            # that the vector indexes on the table drop the same rows
+            deleted_row_ids = (
+                self._sql_session.execute(
+                    select(row_id).where(sqlalchemy_filter_clause)
+                )
+                .scalars()
+                .all()
+            )
             d = table_to_delete_from.delete().where(sqlalchemy_filter_clause)
             self._sql_session.execute(d)
             self._sql_session.commit()
+            return deleted_row_ids
         except Exception as e:
             err_msg = (
                 f"Failed to delete from the table {table.name} with exception {str(e)}"
@@ -12,9 +12,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import math
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator
+from queue import Full, Queue
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.catalog.sql_config import ROW_NUM_COLUMN, ROW_NUM_MAGIC
@@ -23,12 +27,46 @@ from evadb.expression.abstract_expression import AbstractExpression
 from evadb.models.storage.batch import Batch
 from evadb.readers.decord_reader import DecordReader
 from evadb.storage.abstract_media_storage_engine import AbstractMediaStorageEngine
+from evadb.storage.abstract_storage_engine import apply_offset_and_limit
+from evadb.utils.frame_cache import FrameCache
+
+# number of decoded batches buffered per frame range in the parallel read
+DECODE_PREFETCH_BATCHES = 2
+# the videos are split into frame ranges of at least this many frames, so that
+# the frames of a single video are also decoded in parallel
+MIN_DECODE_RANGE_FRAMES = 256
+_END_OF_FILE = object()
 
 
 class DecordStorageEngine(AbstractMediaStorageEngine):
+    # the engine is instantiated for every query, so the frame caches are shared
+    # across instances to keep the in-memory tier warm
+    _frame_caches: Dict[tuple, FrameCache] = {}
+    _frame_caches_lock = threading.Lock()
+
     def __init__(self, db: EvaDBDatabase):
         super().__init__(db)
 
+    def _get_frame_cache(self) -> Optional[FrameCache]:
+        catalog = self.db.catalog()
+        max_cache_size = catalog.get_configuration_catalog_value("frame_cache_size", 0)
+        if not max_cache_size:
+            return None
+        max_memory_size = catalog.get_configuration_catalog_value(
+            "frame_cache_memory_size", 0
+        )
+        path = str(
+            Path(catalog.get_configuration_catalog_value("cache_dir")) / "frames"
+        )
+        key = (path, max_cache_size, max_memory_size)
+        with self._frame_caches_lock:
+            frame_cache = self._frame_caches.get(key)
+            # the cache directory is wiped when the catalog is reset
+            if frame_cache is None or not Path(path).exists():
+                frame_cache = FrameCache(path, max_cache_size, max_memory_size)
+                self._frame_caches[key] = frame_cache
+        return frame_cache
+
     def read(
         self,
         table: TableCatalogEntry,
@@ -38,28 +76,187 @@ class DecordStorageEngine(AbstractMediaStorageEngine):
         sampling_type: str = None,
         read_audio: bool = False,
         read_video: bool = True,
+        offset: int = None,
+        limit: int = None,
+        total_shards: int = 0,
+        curr_shard: int = 0,
+    ) -> Iterator[Batch]:
+        batches = self._read(
+            table,
+            batch_mem_size,
+            predicate=predicate,
+            sampling_rate=sampling_rate,
+            sampling_type=sampling_type,
+            read_audio=read_audio,
+            read_video=read_video,
+            num_rows=None if limit is None else (offset or 0) + limit,
+            total_shards=total_shards,
+            curr_shard=curr_shard,
+        )
+        yield from apply_offset_and_limit(batches, offset, limit)
+
+    def _read(
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int,
+        predicate: AbstractExpression,
+        sampling_rate: int,
+        sampling_type: str,
+        read_audio: bool,
+        read_video: bool,
+        num_rows: int,
+        total_shards: int,
+        curr_shard: int,
     ) -> Iterator[Batch]:
-        for video_files in self._rdb_handler.read(self._get_metadata_table(table), 12):
-            for _, (row_id, video_file_name, _) in video_files.iterrows():
-                system_file_name = self._xform_file_url_to_file_name(video_file_name)
-                video_file = Path(table.file_url) / system_file_name
-                # increase batch size when reading audio so that
-                # the audio for the file is returned in one single batch
-                if read_audio:
-                    batch_mem_size = sys.maxsize
-                reader = DecordReader(
-                    str(video_file),
-                    batch_mem_size=batch_mem_size,
-                    predicate=predicate,
-                    sampling_rate=sampling_rate,
-                    sampling_type=sampling_type,
-                    read_audio=read_audio,
-                    read_video=read_video,
-                )
-                for batch in reader.read():
-                    batch.frames[table.columns[0].name] = row_id
-                    batch.frames[table.columns[1].name] = str(video_file_name)
-                    batch.frames[ROW_NUM_COLUMN] = (
-                        row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
-                    )
-                    yield batch
+        # num_rows is the number of frames to decode across the video files,
+        # every frame is decoded if it is None
+        # increase batch size when reading audio so that
+        # the audio for the file is returned in one single batch
+        if read_audio:
+            batch_mem_size = sys.maxsize
+        reader_kwargs = dict(
+            batch_mem_size=batch_mem_size,
+            frame_cache=None if read_audio else self._get_frame_cache(),
+            predicate=predicate,
+            sampling_rate=sampling_rate,
+            sampling_type=sampling_type,
+            read_audio=read_audio,
+            read_video=read_video,
+        )
+        video_files = self._get_media_files(table, total_shards, curr_shard)
+
+        parallelism = self.db.catalog().get_configuration_catalog_value(
+            "decode_parallelism", 1
+        )
+        # with a limit only the first few files are decoded, so it is not
+        # worth decoding the following files ahead of time
+        if parallelism > 1 and num_rows is None:
+            yield from self._parallel_read(
+                table, video_files, reader_kwargs, parallelism
+            )
+            return
+
+        for row_id, video_file_name, video_file in video_files:
+            if num_rows is not None and num_rows <= 0:
+                return
+            for batch in self._read_file(
+                table, row_id, video_file_name, video_file, num_rows, reader_kwargs
+            ):
+                if num_rows is not None:
+                    num_rows -= len(batch)
+                yield batch
+
+    def _read_file(
+        self,
+        table: TableCatalogEntry,
+        row_id: int,
+        video_file_name: str,
+        video_file: Path,
+        num_rows: int,
+        reader_kwargs: dict,
+        frame_range: Tuple[int, int] = None,
+    ) -> Iterator[Batch]:
+        # the ranges of a video are validated once before they are read
+        frame_cache = reader_kwargs["frame_cache"]
+        if frame_cache is not None and frame_range is None:
+            frame_cache.validate(video_file)
+        reader = DecordReader(
+            str(video_file), limit=num_rows, frame_range=frame_range, **reader_kwargs
+        )
+        for batch in reader.read():
+            batch.frames[table.columns[0].name] = row_id
+            batch.frames[table.columns[1].name] = str(video_file_name)
+            batch.frames[ROW_NUM_COLUMN] = (
+                row_id * ROW_NUM_MAGIC + batch.frames[ROW_NUM_COLUMN]
+            )
+            yield batch
+
+    def _parallel_read(
+        self,
+        table: TableCatalogEntry,
+        video_files: Iterator[Tuple[int, str, Path]],
+        reader_kwargs: dict,
+        parallelism: int,
+    ) -> Iterator[Batch]:
+        """
+        Decodes up to `parallelism` frame ranges concurrently. decord releases
+        the GIL while decoding, so a thread pool is enough to keep the cores
+        busy. Large video files are split into frame ranges, so that a single
+        video is also decoded in parallel. Every range owns a bounded queue of
+        decoded batches, and the queues are drained in order so that the output
+        (and hence the ROW_NUM_COLUMN order) is the same as the sequential read.
+        """
+        stop = threading.Event()
+
+        def put(queue: Queue, item) -> bool:
+            # returns False once the consumer is gone
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def decode(queue: Queue, file_info, frame_range):
+            # the end of the range is always queued, otherwise the consumer
+            # would wait for it forever
+            try:
+                if stop.is_set():
+                    return
+                for batch in self._read_file(
+                    table, *file_info, None, reader_kwargs, frame_range
+                ):
+                    if not put(queue, batch):
+                        return
+            except BaseException as e:
+                put(queue, e)
+            finally:
+                put(queue, _END_OF_FILE)
+
+        # the pool picks up the ranges in submission order, so the range being
+        # drained always has a worker and the bounded queues cannot deadlock
+        with ThreadPoolExecutor(max_workers=parallelism) as pool:
+            try:
+                queues = []
+                for file_info in video_files:
+                    for frame_range in self._split_frame_ranges(
+                        file_info[2], reader_kwargs, parallelism
+                    ):
+                        queue = Queue(maxsize=DECODE_PREFETCH_BATCHES)
+                        pool.submit(decode, queue, file_info, frame_range)
+                        queues.append(queue)
+
+                for queue in queues:
+                    batch = queue.get()
+                    while batch is not _END_OF_FILE:
+                        if isinstance(batch, BaseException):
+                            raise batch
+                        yield batch
+                        batch = queue.get()
+            finally:
+                # stop the workers if the consumer exits early
+                stop.set()
+
+    def _split_frame_ranges(
+        self, video_file: Path, reader_kwargs: dict, parallelism: int
+    ) -> List[Optional[Tuple[int, int]]]:
+        """
+        Splits the video into up to `parallelism` frame ranges of at least
+        MIN_DECODE_RANGE_FRAMES frames. The audio of a video is not split, since
+        it is returned in a single batch.
+        """
+        frame_cache = reader_kwargs["frame_cache"]
+        if frame_cache is not None:
+            frame_cache.validate(video_file)
+        if reader_kwargs["read_audio"]:
+            return [None]
+        num_frames = DecordReader(str(video_file), **reader_kwargs).num_frames()
+        if num_frames == 0:
+            return [None]
+        num_ranges = max(1, min(parallelism, num_frames // MIN_DECODE_RANGE_FRAMES))
+        range_size = math.ceil(num_frames / num_ranges)
+        return [
+            (begin, min(begin + range_size, num_frames) - 1)
+            for begin in range(0, num_frames, range_size)
+        ]
@@ -68,6 +68,18 @@ def get_database_handler(engine: str, **kwargs):
         handler.disconnect()
 
 
+def is_sqlalchemy_compatible_database(engine: str, **kwargs) -> bool:
+    """
+    Return whether the data source can be queried using sqlalchemy. It does not
+    establish a connection to the data source.
+    """
+    try:
+        handler = _get_database_handler(engine, **kwargs)
+    except Exception:
+        return False
+    return handler.is_sqlalchmey_compatible()
+
+
 def dynamic_import(handler_dir):
     import_path = f"evadb.third_party.databases.{handler_dir}.{handler_dir}_handler"
     return importlib.import_module(import_path)
@@ -13,12 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from dataclasses import dataclass
-from typing import Generator
+from typing import Generator, List
 
 import pandas as pd
-from sqlalchemy import MetaData, Table, create_engine
+from sqlalchemy import MetaData, Table, create_engine, select
 from sqlalchemy.orm import sessionmaker
 
+from evadb.expression.abstract_expression import AbstractExpression
+from evadb.expression.expression_utils import to_sqlalchemy_filter_clause
+
 
 @dataclass
 class DBHandlerResponse:
@@ -155,11 +158,20 @@ class DBHandler:
         """
         raise NotImplementedError()
 
-    def select(self, table_name: str) -> DBHandlerResponse:
+    def select(
+        self,
+        table_name: str,
+        columns: List[str] = None,
+        predicate: AbstractExpression = None,
+        limit: int = None,
+    ) -> DBHandlerResponse:
         """
         Returns a generator that yields the data from the given table, or the data.
         Args:
             table_name (str): name of the table whose data is to be retrieved.
+            columns (List[str]): names of the columns to retrieve, all the columns are retrieved if None.
+            predicate (AbstractExpression): sql compatible predicate to filter the rows in the data source.
+            limit (int): maximum number of rows to retrieve.
         Returns:
             DBHandlerResponse: An instance of DBHandlerResponse containing the data, data generator, or an error message. Data is in a pandas DataFrame.
 
@@ -176,8 +188,19 @@ class DBHandler:
             session = Session()
             # Retrieve the SQLAlchemy table object for the existing table
             table_to_read = Table(table_name, metadata, autoload_with=engine)
+            query = table_to_read.select()
+            if columns:
+                table_columns = {col.name.lower(): col for col in table_to_read.columns}
+                query = select(*[table_columns[col.lower()] for col in columns])
+            # push the filter and the limit into the data source
+            if predicate is not None:
+                query = query.where(
+                    to_sqlalchemy_filter_clause(predicate, table_to_read)
+                )
+            if limit is not None:
+                query = query.limit(limit)
             # TODO: there is a BUG in the SQLAlchemy session management, when there is a function expression in the plan tree, we will update the catalog for its cost, which leads to a SQLAlchemy deadlock if we return a generator here.
-            result = session.execute(table_to_read.select()).fetchall()
+            result = session.execute(query).fetchall()
             session.close()
             # A generator is better, however, the current implementation suffers from deadlock from different SQLAlchemy sessions.
             return DBHandlerResponse(data=result)
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from functools import partial
+
 from evadb.catalog.catalog_utils import get_metadata_entry_or_val
 from evadb.catalog.models.function_catalog import FunctionCatalogEntry
 from evadb.third_party.huggingface.create import MODEL_FOR_TASK
@@ -32,4 +34,4 @@ def assign_hf_function(function_obj: FunctionCatalogEntry):
     assert task is not None, "task not specified in Hugging Face Function"
     model_class = MODEL_FOR_TASK[task]
 
-    return lambda: model_class(function_obj)
+    return partial(model_class, function_obj)
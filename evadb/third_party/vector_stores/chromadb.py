@@ -57,6 +57,13 @@ class ChromaDBVectorStore(VectorStore):
             embeddings=embeddings,
         )
 
+    def remove_ids(self, ids):
+        if len(ids) == 0:
+            return
+        self._client.get_collection(self._collection_name).delete(
+            ids=[str(row_id) for row_id in ids]
+        )
+
     def delete(self) -> None:
         self._client.delete_collection(
             name=self._collection_name,
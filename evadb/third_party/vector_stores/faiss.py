@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import math
 import os
 from pathlib import Path
 from typing import List
@@ -27,60 +28,373 @@ from evadb.third_party.vector_stores.types import (
 from evadb.utils.generic_utils import try_to_import_faiss
 
 required_params = ["index_path"]
+# options of CREATE INDEX ... USING FAISS, e.g., INDEX_FACTORY 'IVF1024,PQ16'
+index_params = ["index_factory", "ef_construction", "ef_search", "nprobe", "train_size"]
+allowed_params = required_params + index_params
+
+DEFAULT_INDEX_FACTORY = "HNSW32,Flat"
+DEFAULT_TRAIN_SIZE = 100000
+# an index that cannot remove embeddings is rebuilt once this fraction of its
+# embeddings are removed, as the searches still visit the removed embeddings
+MAX_REMOVED_FRACTION = 0.1
+# filtered queries search the index skipping the embeddings that are not
+# selected only if more than MAX_EXACT_SEARCH_IDS ids are selected and they are
+# at least MIN_INDEX_SEARCH_SELECTIVITY of the index. Otherwise, the query is
+# compared with the selected embeddings exactly, MAX_EXACT_SEARCH_IDS at a time.
+MAX_EXACT_SEARCH_IDS = 10000
+MIN_INDEX_SEARCH_SELECTIVITY = 0.2
 
 
 class FaissVectorStore(VectorStore):
-    def __init__(self, index_name: str, index_path: str) -> None:
+    """Vector store backed by a FAISS index on disk
+
+    The queries with filter_ids search the selected embeddings exactly, or the
+    index restricted to the selected ids if they are many and a large fraction
+    of the index.
+
+    Arguments:
+        index_name (str): name of the index
+        index_path (str): path of the index file
+        index_factory (str): FAISS index factory string of the index, e.g.,
+            "HNSW32,Flat" or "IVF1024,PQ16"
+        ef_construction (int): HNSW graph construction depth
+        ef_search (int): HNSW search depth, saved with the index
+        nprobe (int): number of IVF lists visited by a search, saved with the index
+        train_size (int): number of embeddings used to train the index, for
+            index types that require training (e.g., IVF, PQ)
+    """
+
+    supports_filtering = True
+
+    def __init__(
+        self,
+        index_name: str,
+        index_path: str,
+        index_factory: str = DEFAULT_INDEX_FACTORY,
+        ef_construction: int = None,
+        ef_search: int = None,
+        nprobe: int = None,
+        train_size: int = DEFAULT_TRAIN_SIZE,
+    ) -> None:
         # Reference to Faiss documentation.
         # IDMap: https://github.com/facebookresearch/faiss/wiki/Pre--and-post-processing#faiss-id-mapping
         # Other index types: https://github.com/facebookresearch/faiss/wiki/The-index-factory
         try_to_import_faiss()
         self._index_name = index_name
         self._index_path = index_path
+        self._index_factory = index_factory
+        self._search_params = {
+            name: value
+            for name, value in [
+                ("efConstruction", ef_construction),
+                ("efSearch", ef_search),
+                ("nprobe", nprobe),
+            ]
+            if value is not None
+        }
+        self._train_size = train_size
+        # The index is loaded from disk on first use.
         self._index = None
+        self._is_mmapped = False
+        self._existing_ids = np.empty(0, dtype=np.int64)
+        # embeddings left in the index with their id unmapped by remove_ids
+        self._num_removed = 0
+        # sorted ids of the index, computed by the first filtered query after
+        # the index changes
+        self._sorted_ids = None
+        # (ids, embeddings) batches waiting for the index to be trained
+        self._untrained_batches = []
 
+    def _load(self, mmap: bool = False):
+        """Loads the index from disk if it exists
+
+        Queries memory-map the index file, so that only the pages touched by the
+        search are read instead of the whole index. The index is read fully
+        before it is modified, as mapped inverted lists are read-only.
+        """
+        if self._index is not None and (mmap or not self._is_mmapped):
+            return
+        if not os.path.exists(self._index_path):
+            return
         import faiss
 
-        # Load index from disk if it exists.
-        self._existing_id_set = set([])
-        if self._index is None and os.path.exists(self._index_path):
-            self._index = faiss.read_index(self._index_path)
-            # Get existing IDs.
-            for i in range(self._index.ntotal):
-                self._existing_id_set.add(self._index.id_map.at(i))
+        io_flags = faiss.IO_FLAG_MMAP if mmap else 0
+        self._index = faiss.read_index(self._index_path, io_flags)
+        self._is_mmapped = mmap
+        # Get existing IDs.
+        self._existing_ids = faiss.vector_to_array(self._index.id_map)
+        self._num_removed = int(np.count_nonzero(self._existing_ids == -1))
+        self._sorted_ids = None
 
     def create(self, vector_dim: int):
         import faiss
 
-        self._index = faiss.IndexIDMap2(faiss.IndexHNSWFlat(vector_dim, 32))
+        try:
+            self._index = faiss.index_factory(
+                vector_dim, f"IDMap2,{self._index_factory}"
+            )
+        except RuntimeError:
+            raise ValueError(f"Invalid FAISS index factory {self._index_factory}")
+        parameter_space = faiss.ParameterSpace()
+        for name, value in self._search_params.items():
+            try:
+                parameter_space.set_index_parameter(self._index, name, value)
+            except RuntimeError:
+                raise ValueError(
+                    f"FAISS index {self._index_factory} does not support {name}"
+                )
+        self._is_mmapped = False
+        # a stale index file on the path does not hold any of the new ids
+        self._existing_ids = np.empty(0, dtype=np.int64)
+        self._num_removed = 0
+        self._sorted_ids = None
+        self._untrained_batches = []
 
     def add(self, payload: List[FeaturePayload]):
+        if len(payload) == 0:
+            return
+        ids = np.array([row.id for row in payload], dtype=np.int64)
+        embeddings = np.concatenate(
+            [
+                np.asarray(row.embedding, dtype="float32").reshape(1, -1)
+                for row in payload
+            ]
+        )
+        self.add_batch(ids, embeddings)
+
+    def add_batch(self, ids: np.ndarray, embeddings: np.ndarray):
+        self._load()
         assert self._index is not None, "Please create an index before adding features."
-        for row in payload:
-            embedding = np.array(row.embedding, dtype="float32")
-            if len(embedding.shape) != 2:
-                embedding = embedding.reshape(1, -1)
-            if row.id not in self._existing_id_set:
-                self._index.add_with_ids(embedding, np.array([row.id]))
+        if len(ids) == 0:
+            return
+        ids = np.asarray(ids, dtype=np.int64)
+        embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+        # Skip the rows that were already in the index when it was loaded.
+        if len(self._existing_ids) > 0:
+            new_rows = ~np.isin(ids, self._existing_ids)
+            ids, embeddings = ids[new_rows], embeddings[new_rows]
+        if len(ids) == 0:
+            return
+        if not self._index.is_trained:
+            # Hold the embeddings back until there are enough to train the index.
+            self._untrained_batches.append((ids, embeddings))
+            num_untrained = sum(len(batch[0]) for batch in self._untrained_batches)
+            if num_untrained >= self._train_size:
+                self._train()
+            return
+        self._index.add_with_ids(embeddings, ids)
+        self._sorted_ids = None
+
+    def _train(self):
+        ids = np.concatenate([batch[0] for batch in self._untrained_batches])
+        embeddings = np.concatenate([batch[1] for batch in self._untrained_batches])
+        self._untrained_batches = []
+        sample = embeddings
+        if len(embeddings) > self._train_size:
+            rows = np.random.default_rng(0).choice(
+                len(embeddings), self._train_size, replace=False
+            )
+            sample = embeddings[rows]
+        self._index.train(sample)
+        self._index.add_with_ids(embeddings, ids)
+        self._sorted_ids = None
+
+    def remove_ids(self, ids: np.ndarray):
+        self._load()
+        assert self._index is not None, "Cannot remove as index does not exists."
+        import faiss
+
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids) == 0:
+            return
+        try:
+            self._index.remove_ids(ids)
+        except RuntimeError:
+            # HNSW graphs do not support removals. The embeddings stay in the
+            # graph, but their ids are unmapped so that queries skip them.
+            id_map = faiss.vector_to_array(self._index.id_map)
+            removed = np.isin(id_map, ids)
+            id_map[removed] = -1
+            faiss.copy_array_to_vector(id_map, self._index.id_map)
+            self._index.construct_rev_map()
+            self._num_removed += int(np.count_nonzero(removed))
+            if self._num_removed > MAX_REMOVED_FRACTION * self._index.ntotal:
+                self._compact()
+        self._existing_ids = faiss.vector_to_array(self._index.id_map)
+        self._sorted_ids = None
+
+    def _compact(self):
+        """Rebuilds the index without the removed embeddings"""
+        import faiss
+
+        id_map = faiss.vector_to_array(self._index.id_map)
+        kept = id_map != -1
+        embeddings = self._index.index.reconstruct_n(0, self._index.ntotal)
+        # the clone keeps the type and the search parameters of the index
+        index = faiss.clone_index(self._index)
+        index.reset()
+        if kept.any():
+            index.add_with_ids(embeddings[kept], id_map[kept])
+        self._index = index
+        self._num_removed = 0
 
     def persist(self):
+        self._load()
         assert self._index is not None, "Please create an index before calling persist."
         import faiss
 
+        # Train on all the embeddings if there are fewer than train_size.
+        if self._untrained_batches:
+            self._train()
         faiss.write_index(self._index, self._index_path)
 
     def query(self, query: VectorIndexQuery) -> VectorIndexQueryResult:
+        return self.query_batch([query])[0]
+
+    def query_batch(
+        self, queries: List[VectorIndexQuery]
+    ) -> List[VectorIndexQueryResult]:
+        self._load(mmap=True)
         assert self._index is not None, "Cannot query as index does not exists."
-        embedding = np.array(query.embedding, dtype="float32")
-        if len(embedding.shape) != 2:
-            embedding = embedding.reshape(1, -1)
-
-        dists, indices = self._index.search(embedding, query.top_k)
-        distances, ids = [], []
-        for dis, idx in zip(dists[0], indices[0]):
-            distances.append(dis)
-            ids.append(idx)
-        return VectorIndexQueryResult(distances, ids)
+        import faiss
+
+        results = [None] * len(queries)
+
+        # The queries without filter are searched together in a single call.
+        unfiltered = [
+            idx for idx, query in enumerate(queries) if query.filter_ids is None
+        ]
+        if unfiltered:
+            embeddings = np.concatenate(
+                [self._to_embedding(queries[idx].embedding) for idx in unfiltered]
+            )
+            top_k = max(queries[idx].top_k for idx in unfiltered)
+            if self._num_removed:
+                # The removed embeddings are still in the index, skip them.
+                removed = faiss.IDSelectorBatch(np.array([-1], dtype=np.int64))
+                dists, labels = self._search_with_selector(
+                    embeddings,
+                    top_k,
+                    faiss.IDSelectorNot(removed),
+                    1 - self._num_removed / self._index.ntotal,
+                )
+            else:
+                dists, labels = self._index.search(embeddings, top_k)
+            for row, idx in enumerate(unfiltered):
+                results[idx] = self._to_result(
+                    dists[row], labels[row], queries[idx].top_k
+                )
+
+        for idx, query in enumerate(queries):
+            if query.filter_ids is not None:
+                dists, labels = self._search_filtered(
+                    self._to_embedding(query.embedding), query.top_k, query.filter_ids
+                )
+                results[idx] = self._to_result(dists[0], labels[0], query.top_k)
+        return results
+
+    def _to_embedding(self, embedding) -> np.ndarray:
+        return np.asarray(embedding, dtype="float32").reshape(1, -1)
+
+    def _to_result(
+        self, dists: np.ndarray, labels: np.ndarray, top_k: int
+    ) -> VectorIndexQueryResult:
+        # -1 marks removed embeddings, or the missing neighbors of an index with
+        # fewer than top_k embeddings
+        found = labels != -1
+        return VectorIndexQueryResult(
+            list(dists[found][:top_k]), list(labels[found][:top_k])
+        )
+
+    def _contains(self, ids: np.ndarray) -> np.ndarray:
+        if self._sorted_ids is None:
+            import faiss
+
+            self._sorted_ids = np.sort(faiss.vector_to_array(self._index.id_map))
+        if len(self._sorted_ids) == 0:
+            return np.zeros(len(ids), dtype=bool)
+        positions = np.searchsorted(self._sorted_ids, ids)
+        positions = np.minimum(positions, len(self._sorted_ids) - 1)
+        return self._sorted_ids[positions] == ids
+
+    def _search_filtered(self, embedding: np.ndarray, top_k: int, filter_ids):
+        import faiss
+
+        ids = np.unique(np.asarray(filter_ids, dtype=np.int64))
+        ids = ids[self._contains(ids)]
+        if len(ids) == 0:
+            return np.empty((1, 0), dtype="float32"), np.empty((1, 0), dtype=np.int64)
+        selector = faiss.IDSelectorBatch(ids)
+        selectivity = len(ids) / self._index.ntotal
+        if (
+            len(ids) > MAX_EXACT_SEARCH_IDS
+            and selectivity >= MIN_INDEX_SEARCH_SELECTIVITY
+        ):
+            return self._search_with_selector(embedding, top_k, selector, selectivity)
+        try:
+            # Exact search over the embeddings of the selected ids, the graph of
+            # an HNSW index misses most neighbors when few ids are selected.
+            return self._exact_search(embedding, top_k, ids)
+        except RuntimeError:
+            # IVF indexes cannot reconstruct the embeddings without a direct
+            # map. Visit all the lists, only the selected ids are compared.
+            params = faiss.SearchParametersIVF(
+                sel=selector, nprobe=faiss.extract_index_ivf(self._index).nlist
+            )
+            return self._index.search(embedding, top_k, params=params)
+
+    def _search_with_selector(
+        self, embeddings: np.ndarray, top_k: int, selector, selectivity: float
+    ):
+        """Searches the index skipping the embeddings that are not selected
+
+        The HNSW search depth and the number of IVF lists visited are scaled by
+        the inverse of the selected fraction of the index, so that the search
+        meets as many selected embeddings as an unfiltered one.
+        """
+        import faiss
+
+        index = faiss.downcast_index(self._index.index)
+        if isinstance(index, faiss.IndexHNSW):
+            ef_search = max(index.hnsw.efSearch, top_k)
+            params = faiss.SearchParametersHNSW(
+                sel=selector, efSearch=math.ceil(ef_search / selectivity)
+            )
+        elif isinstance(index, faiss.IndexIVF):
+            params = faiss.SearchParametersIVF(
+                sel=selector,
+                nprobe=min(index.nlist, math.ceil(index.nprobe / selectivity)),
+            )
+        else:
+            params = faiss.SearchParameters(sel=selector)
+        return self._index.search(embeddings, top_k, params=params)
+
+    def _exact_search(self, embedding: np.ndarray, top_k: int, ids: np.ndarray):
+        """Compares the query with the embeddings of the ids, reconstructing
+        MAX_EXACT_SEARCH_IDS embeddings at a time"""
+        import faiss
+
+        top_k = min(top_k, len(ids))
+        chunk_dists, chunk_labels = [], []
+        for start in range(0, len(ids), MAX_EXACT_SEARCH_IDS):
+            chunk = ids[start : start + MAX_EXACT_SEARCH_IDS]
+            embeddings = self._index.reconstruct_batch(chunk)
+            dists, rows = faiss.knn(
+                embedding,
+                embeddings,
+                min(top_k, len(chunk)),
+                metric=self._index.metric_type,
+            )
+            chunk_dists.append(dists)
+            chunk_labels.append(np.where(rows >= 0, chunk[rows], -1))
+        dists = np.concatenate(chunk_dists, axis=1)
+        labels = np.concatenate(chunk_labels, axis=1)
+        # the larger inner products are the nearer neighbors
+        if self._index.metric_type == faiss.METRIC_INNER_PRODUCT:
+            order = np.argsort(-dists[0], kind="stable")[:top_k]
+        else:
+            order = np.argsort(dists[0], kind="stable")[:top_k]
+        return dists[:, order], labels[:, order]
 
     def delete(self):
         index_path = Path(self._index_path)
@@ -123,6 +123,13 @@ class MilvusVectorStore(VectorStore):
 
         self._client.insert(collection_name=self._collection_name, data=milvus_data)
 
+    def remove_ids(self, ids):
+        if len(ids) == 0:
+            return
+        self._client.delete(
+            collection_name=self._collection_name, pks=[int(row_id) for row_id in ids]
+        )
+
     def persist(self):
         self._client.flush(self._collection_name)
 
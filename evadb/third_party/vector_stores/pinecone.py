@@ -79,6 +79,15 @@ class PineconeVectorStore(VectorStore):
             ]
         )
 
+    def remove_ids(self, ids):
+        import pinecone
+
+        if len(ids) == 0:
+            return
+        if not self._client:
+            self._client = pinecone.Index(self._index_name)
+        self._client.delete(ids=[str(row_id) for row_id in ids])
+
     def delete(self) -> None:
         import pinecone
 
@@ -66,6 +66,16 @@ class QdrantVectorStore(VectorStore):
             ),
         )
 
+    def remove_ids(self, ids):
+        from qdrant_client.models import PointIdsList
+
+        if len(ids) == 0:
+            return
+        self._client.delete(
+            collection_name=self._collection_name,
+            points_selector=PointIdsList(points=[int(row_id) for row_id in ids]),
+        )
+
     def delete(self) -> None:
         self._client.delete_collection(
             collection_name=self._collection_name,
@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -26,6 +28,8 @@ class FeaturePayload:
 class VectorIndexQuery:
     embedding: List[float]
     top_k: int
+    # only the embeddings of these ids are searched (see supports_filtering)
+    filter_ids: Optional[np.ndarray] = None
 
 
 @dataclass
@@ -35,6 +39,9 @@ class VectorIndexQueryResult:
 
 
 class VectorStore:
+    # whether query restricts the search to the filter_ids of the query
+    supports_filtering = False
+
     def create(self, vector_dim: int):
         """Create an index"""
         ...
@@ -43,6 +50,30 @@ class VectorStore:
         """Add embeddings to the vector store"""
         ...
 
+    def add_batch(self, ids: np.ndarray, embeddings: np.ndarray) -> None:
+        """Add a batch of embeddings to the vector store
+
+        Args:
+            ids (np.ndarray): row ids of the embeddings, of shape (n,)
+            embeddings (np.ndarray): embeddings stacked in a matrix of shape (n, dim)
+        """
+        self.add(
+            [
+                FeaturePayload(row_id, embedding.reshape(1, -1))
+                for row_id, embedding in zip(ids, embeddings)
+            ]
+        )
+
+    def remove_ids(self, ids: np.ndarray) -> None:
+        """Remove the embeddings of the given row ids from the vector store
+
+        Args:
+            ids (np.ndarray): row ids of the embeddings to remove
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support removing embeddings"
+        )
+
     def persist(self) -> None:
         """Persist index to disk"""
         return None
@@ -51,6 +82,12 @@ class VectorStore:
         """Query index"""
         ...
 
+    def query_batch(
+        self, queries: List[VectorIndexQuery]
+    ) -> List[VectorIndexQueryResult]:
+        """Query index with several embeddings, one result per query"""
+        return [self.query(query) for query in queries]
+
     def delete(self):
         """delete an index"""
         ...
@@ -28,9 +28,12 @@ class VectorStoreFactory:
         vector_store_type: VectorStoreType, index_name: str, **kwargs
     ):
         if vector_store_type == VectorStoreType.FAISS:
-            from evadb.third_party.vector_stores.faiss import required_params
+            from evadb.third_party.vector_stores.faiss import (
+                allowed_params,
+                required_params,
+            )
 
-            validate_kwargs(kwargs, required_params, required_params)
+            validate_kwargs(kwargs, allowed_params, required_params)
             return FaissVectorStore(index_name, **kwargs)
 
         elif vector_store_type == VectorStoreType.QDRANT:
@@ -0,0 +1,144 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from diskcache import FanoutCache
+
+# decoded frame along with its timestamp in seconds
+FrameEntry = Tuple[np.ndarray, float]
+
+
+class FrameCache:
+    """Cache of decoded video frames
+
+    Frames are keyed by the video file and the frame id, and are stored on disk
+    with a least-recently-used eviction policy. Frequently read frames can also
+    be kept in an in-memory LRU tier in front of the disk cache. Frames are
+    always decoded at the native resolution of the video, so the resolution is
+    part of the file signature rather than the key.
+
+    Args:
+        `path` (str): the path on disk where the cache will be stored
+        `max_cache_size` (int, optional): maximum number of bytes of the disk cache.
+            The default value is 2**30.
+        `max_memory_size` (int, optional): maximum number of bytes of the in-memory
+            tier. The in-memory tier is disabled if it is 0 (default).
+        `shards` (int, optional): number of shards of the disk cache
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_cache_size: int = 2**30,
+        max_memory_size: int = 0,
+        shards: int = 3,
+    ):
+        # For details, see: http://www.grantjenks.com/docs/diskcache/tutorial.html#settings
+        default_settings = {
+            "size_limit": max_cache_size,
+            "eviction_policy": "least-recently-used",
+            "disk_pickle_protocol": pickle.HIGHEST_PROTOCOL,
+        }
+        self._path = path
+        self._cache = FanoutCache(path, shards=shards, **default_settings)
+        self._max_memory_size = max_memory_size
+        self._memory: OrderedDict = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def validate(self, file_url: str):
+        """
+        Drops the cached frames of the video if the file was modified since the
+        frames were cached. The signature of the file is its mtime and size.
+        """
+        file_url = str(file_url)
+        stat = os.stat(file_url)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        signature_key = ("signature", file_url)
+        if self._cache.get(signature_key) == signature:
+            return
+        self._cache.evict(file_url)
+        with self._lock:
+            for key in [key for key in self._memory if key[0] == file_url]:
+                self._memory_size -= self._memory.pop(key)[0].nbytes
+        self._cache.set(signature_key, signature)
+
+    def get_many(
+        self, file_url: str, frame_ids: Iterable[int]
+    ) -> List[Optional[FrameEntry]]:
+        """
+        Returns the cached (frame, seconds) of every frame id, or None for the
+        frames that are not in the cache
+        """
+        file_url = str(file_url)
+        entries = []
+        for frame_id in frame_ids:
+            key = (file_url, int(frame_id))
+            with self._lock:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    self._memory.move_to_end(key)
+            if entry is None:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    self._set_in_memory(key, entry)
+            entries.append(entry)
+        # the cache is shared by the decode threads of the parallel read
+        num_misses = sum(entry is None for entry in entries)
+        with self._lock:
+            self.hits += len(entries) - num_misses
+            self.misses += num_misses
+        return entries
+
+    def set_many(
+        self, file_url: str, frame_ids: Iterable[int], entries: Iterable[FrameEntry]
+    ):
+        file_url = str(file_url)
+        for frame_id, (frame, seconds) in zip(frame_ids, entries):
+            key = (file_url, int(frame_id))
+            # copy the frame so that it does not keep the decoded batch alive
+            entry = (np.array(frame), float(seconds))
+            self._cache.set(key, entry, tag=file_url)
+            self._set_in_memory(key, entry)
+
+    def _set_in_memory(self, key: Tuple[str, int], entry: FrameEntry):
+        nbytes = entry[0].nbytes
+        if nbytes > self._max_memory_size:
+            return
+        with self._lock:
+            if key in self._memory:
+                self._memory_size -= self._memory.pop(key)[0].nbytes
+            self._memory[key] = entry
+            self._memory_size += nbytes
+            while self._memory_size > self._max_memory_size:
+                _, (frame, _) = self._memory.popitem(last=False)
+                self._memory_size -= frame.nbytes
+
+    def clear(self):
+        self._cache.clear()
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
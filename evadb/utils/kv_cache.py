@@ -12,11 +12,61 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import hashlib
 import pickle
-from typing import Any
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Dict, Iterable, List, Tuple
 
+import numpy as np
+import pandas as pd
 from diskcache import FanoutCache
 
+# two hash keys of pandas hashing are combined into a 128-bit cache key
+_HASH_KEYS = ("0123456789123456", "6543219876543210")
+
+
+def _hash_value(value: Any) -> int:
+    # stable 64-bit hash of values pandas cannot hash, such as ndarrays
+    value = np.asarray(value)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(str((value.dtype.str, value.shape)).encode())
+    digest.update(np.ascontiguousarray(value).tobytes())
+    return int.from_bytes(digest.digest(), "little")
+
+
+def hash_keys(keys: pd.DataFrame) -> List[str]:
+    """Computes a stable 128-bit hash of every row of the key columns
+
+    Scalar columns are hashed vectorially with pandas. Columns of ndarrays (e.g.,
+    frame data) are hashed by content and then combined with the other columns.
+    """
+    keys = keys.reset_index(drop=True)
+    columns = {}
+    for idx, name in enumerate(keys.columns):
+        column = keys.iloc[:, idx]
+        # only object columns can hold values pandas cannot hash
+        if column.dtype == object and not all(
+            isinstance(value, Hashable) for value in column
+        ):
+            column = pd.Series(
+                np.fromiter(
+                    map(_hash_value, column), dtype=np.uint64, count=len(column)
+                )
+            )
+        columns[idx] = column
+    keys = pd.DataFrame(columns)
+    hashes = np.column_stack(
+        [
+            pd.util.hash_pandas_object(keys, index=False, hash_key=hash_key).to_numpy()
+            for hash_key in _HASH_KEYS
+        ]
+    )
+    return [f"{high:016x}{low:016x}" for high, low in hashes]
+
 
 class DiskKVCache:
     """Disk key value cache
@@ -41,9 +91,172 @@ class DiskKVCache:
         self._path = path
         self._cache = FanoutCache(path, shards=shards, **default_settings)
 
+    @property
+    def path(self) -> str:
+        return self._path
+
     def get(self, key: Any):
         value = self._cache.get(key, default=None)
         return value
 
     def set(self, key: Any, value: Any):
         self._cache.set(key, value)
+
+    def get_many(self, keys: Iterable[Any]) -> List[Any]:
+        """Returns the value of every key, or None for the missing keys"""
+        # a single transaction avoids locking the shards for every key
+        with self._cache.transact():
+            return [self._cache.get(key, default=None) for key in keys]
+
+    def set_many(self, keys: Iterable[Any], values: Iterable[Any]):
+        # a single transaction commits all the values at once
+        with self._cache.transact():
+            for key, value in zip(keys, values):
+                self._cache.set(key, value)
+
+
+def _nbytes(value: Any) -> int:
+    # cheaper than get_size for ndarrays, which it walks element by element
+    if isinstance(value, np.ndarray):
+        if value.dtype != object:
+            return value.nbytes
+        return value.nbytes + sum(_nbytes(item) for item in value.flat)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class MemoryKVCache:
+    """In-memory key value cache with byte-size accounting
+
+    The values are copied when they are stored and when they are returned, so
+    that a caller mutating its value does not corrupt the cached one.
+
+    Args:
+        `max_cache_size` (int): maximum number of bytes of the cached values
+        `eviction_policy` (str, optional): "least-recently-used" (default) or
+            "least-recently-stored", following the naming of diskcache
+    """
+
+    EVICTION_POLICIES = ("least-recently-used", "least-recently-stored")
+
+    def __init__(
+        self, max_cache_size: int, eviction_policy: str = "least-recently-used"
+    ):
+        if eviction_policy not in self.EVICTION_POLICIES:
+            raise ValueError(f"Unsupported eviction policy {eviction_policy}")
+        self._max_cache_size = max_cache_size
+        self._eviction_policy = eviction_policy
+        self._cache: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # a pickled cache (e.g., in a worker process) is the process-wide cache
+        # of the same configuration
+        return get_shared_memory_cache, (self._max_cache_size, self._eviction_policy)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: Any):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if self._eviction_policy == "least-recently-used":
+                self._cache.move_to_end(key)
+        return copy.deepcopy(entry[0])
+
+    def set(self, key: Any, value: Any) -> int:
+        """Stores the value and returns the number of evicted entries"""
+        nbytes = _nbytes(value)
+        if nbytes > self._max_cache_size:
+            return 0
+        value = copy.deepcopy(value)
+        evictions = 0
+        with self._lock:
+            if key in self._cache:
+                self._size -= self._cache.pop(key)[1]
+            self._cache[key] = (value, nbytes)
+            self._size += nbytes
+            while self._size > self._max_cache_size:
+                _, (_, evicted_nbytes) = self._cache.popitem(last=False)
+                self._size -= evicted_nbytes
+                evictions += 1
+        return evictions
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._size = 0
+
+
+_memory_caches: Dict[Tuple[int, str], MemoryKVCache] = {}
+_memory_caches_lock = threading.Lock()
+
+
+def get_shared_memory_cache(
+    max_cache_size: int, eviction_policy: str = "least-recently-used"
+) -> MemoryKVCache:
+    """Returns the process-wide in-memory cache for the given configuration so
+    that the hot entries survive across queries"""
+    key = (max_cache_size, eviction_policy)
+    with _memory_caches_lock:
+        if key not in _memory_caches:
+            _memory_caches[key] = MemoryKVCache(max_cache_size, eviction_policy)
+        return _memory_caches[key]
+
+
+class TieredKVCache:
+    """Key value cache with an in-memory tier in front of a disk tier
+
+    Entries are looked up in memory first and then on disk. Entries found on disk
+    are promoted to memory. The memory tier can be shared by several caches, so
+    the keys are namespaced with the path of the disk cache.
+
+    Args:
+        `disk` (DiskKVCache): the disk tier
+        `memory` (MemoryKVCache): the in-memory tier
+    """
+
+    def __init__(self, disk: DiskKVCache, memory: MemoryKVCache):
+        self._disk = disk
+        self._memory = memory
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _memory_key(self, key: Any) -> Tuple[str, Any]:
+        return (self._disk.path, key)
+
+    def get(self, key: Any):
+        return self.get_many([key])[0]
+
+    def set(self, key: Any, value: Any):
+        self.set_many([key], [value])
+
+    def get_many(self, keys: Iterable[Any]) -> List[Any]:
+        """Returns the value of every key, or None for the missing keys"""
+        keys = list(keys)
+        values = [self._memory.get(self._memory_key(key)) for key in keys]
+        disk_lookups = [idx for idx, value in enumerate(values) if value is None]
+        self.memory_hits += len(keys) - len(disk_lookups)
+        if disk_lookups:
+            disk_values = self._disk.get_many([keys[idx] for idx in disk_lookups])
+            for idx, value in zip(disk_lookups, disk_values):
+                if value is None:
+                    self.misses += 1
+                    continue
+                self.disk_hits += 1
+                self.evictions += self._memory.set(self._memory_key(keys[idx]), value)
+                values[idx] = value
+        return values
+
+    def set_many(self, keys: Iterable[Any], values: Iterable[Any]):
+        keys, values = list(keys), list(values)
+        self._disk.set_many(keys, values)
+        for key, value in zip(keys, values):
+            self.evictions += self._memory.set(self._memory_key(key), value)
@@ -52,4 +52,16 @@ class FunctionStats:
         self.num_calls: int = 0
         self.timer: Timer = Timer()
         self.prev_cost: float = 0.0
+        self.cache_hits: int = 0
         self.cache_misses: int = 0
+        # hits served by the in-memory tier, a subset of cache_hits
+        self.cache_memory_hits: int = 0
+        self.cache_evictions: int = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of the cache lookups that were hits, None without lookups"""
+        lookups = self.cache_hits + self.cache_misses
+        if lookups == 0:
+            return None
+        return self.cache_hits / lookups
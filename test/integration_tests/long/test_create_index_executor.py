@@ -12,20 +12,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import tempfile
 import unittest
 from pathlib import Path
 from test.markers import macos_skip_marker
 from test.util import get_evadb_for_testing, load_functions_for_testing
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from evadb.binder.binder_utils import BinderError
 from evadb.catalog.catalog_type import VectorStoreType
-from evadb.executor.executor_utils import ExecutorError
+from evadb.executor.executor_utils import (
+    ExecutorError,
+    add_rows_to_vector_indexes,
+    stack_features,
+)
 from evadb.models.storage.batch import Batch
 from evadb.server.command_handler import execute_query_fetch_all
 from evadb.storage.storage_engine import StorageEngine
+from evadb.third_party.vector_stores.faiss import FaissVectorStore
+from evadb.third_party.vector_stores.types import VectorIndexQuery
+from evadb.third_party.vector_stores.utils import VectorStoreFactory
 from evadb.utils.generic_utils import try_to_import_faiss
 
 
@@ -167,6 +177,199 @@ class CreateIndexTest(unittest.TestCase):
         self.assertEqual(distance[0][0], 0)
         self.assertEqual(row_id[0][0], 1)
 
+    @macos_skip_marker
+    def test_should_add_features_in_bulk(self):
+        try_to_import_faiss()
+        import faiss
+
+        for in_background in ["TRUE", "FALSE"]:
+            execute_query_fetch_all(
+                self.evadb, f"SET index_build_in_background = {in_background};"
+            )
+            query = "CREATE INDEX testCreateIndexName ON testCreateIndexFeatTable (feat) USING FAISS;"
+            execute_query_fetch_all(self.evadb, query)
+
+            # Updating the index does not add the existing rows again.
+            query = "CREATE INDEX IF NOT EXISTS testCreateIndexName ON testCreateIndexFeatTable (feat) USING FAISS;"
+            execute_query_fetch_all(self.evadb, query)
+
+            index = faiss.read_index(self._index_save_path())
+            self.assertEqual(index.ntotal, 3)
+            distance, row_id = index.search(
+                np.array([[100, 100, 100]]).astype(np.float32), 1
+            )
+            self.assertEqual(distance[0][0], 0)
+            self.assertEqual(row_id[0][0], 2)
+            execute_query_fetch_all(self.evadb, "DROP INDEX testCreateIndexName;")
+
+        execute_query_fetch_all(self.evadb, "SET index_build_in_background = TRUE;")
+        # recreated for tearDown
+        query = "CREATE INDEX testCreateIndexName ON testCreateIndexFeatTable (feat) USING FAISS;"
+        execute_query_fetch_all(self.evadb, query)
+
+    @macos_skip_marker
+    def test_should_maintain_index_on_new_and_deleted_rows(self):
+        execute_query_fetch_all(
+            self.evadb,
+            "CREATE TABLE testIndexMaintenanceTable (id INTEGER, feat NDARRAY FLOAT32(1,3));",
+        )
+        table_entry = self.evadb.catalog().get_table_catalog_entry(
+            "testIndexMaintenanceTable"
+        )
+        storage_engine = StorageEngine.factory(self.evadb, table_entry)
+        feats = [np.array([[idx * 100] * 3]).astype(np.float32) for idx in range(3)]
+        storage_engine.write(
+            table_entry, Batch(pd.DataFrame({"id": [0, 1], "feat": feats[:2]}))
+        )
+        query = "CREATE INDEX testCreateIndexName ON testIndexMaintenanceTable (feat) USING FAISS;"
+        execute_query_fetch_all(self.evadb, query)
+
+        # Only the new row is read and added to the index.
+        last_row_id = storage_engine.last_row_id(table_entry)
+        storage_engine.write(
+            table_entry, Batch(pd.DataFrame({"id": [2], "feat": feats[2:]}))
+        )
+        with patch(
+            "evadb.executor.executor_utils.stack_features", wraps=stack_features
+        ) as mock_stack_features:
+            add_rows_to_vector_indexes(self.evadb, table_entry, last_row_id)
+        self.assertEqual(len(mock_stack_features.call_args.args[0]), 1)
+
+        def query_index():
+            index = VectorStoreFactory.init_vector_store(
+                VectorStoreType.FAISS,
+                "testCreateIndexName",
+                index_path=self._index_save_path(),
+            )
+            return index.query(VectorIndexQuery(feats[0], 3)).ids
+
+        self.assertEqual(list(query_index()), [1, 2, 3])
+
+        # The deleted rows are no longer returned by the index.
+        execute_query_fetch_all(
+            self.evadb, "DELETE FROM testIndexMaintenanceTable WHERE id = 1;"
+        )
+        self.assertEqual(list(query_index()), [1, 3])
+
+        execute_query_fetch_all(self.evadb, "DROP INDEX testCreateIndexName;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE testIndexMaintenanceTable;")
+        # recreated for tearDown
+        query = "CREATE INDEX testCreateIndexName ON testCreateIndexFeatTable (feat) USING FAISS;"
+        execute_query_fetch_all(self.evadb, query)
+
+    @macos_skip_marker
+    def test_should_create_index_with_index_parameters(self):
+        try_to_import_faiss()
+        import faiss
+
+        execute_query_fetch_all(
+            self.evadb, "CREATE TABLE testIndexParamsTable (feat NDARRAY FLOAT32(1,3));"
+        )
+        table_entry = self.evadb.catalog().get_table_catalog_entry(
+            "testIndexParamsTable"
+        )
+        feats = [np.array([[idx] * 3]).astype(np.float32) for idx in range(64)]
+        StorageEngine.factory(self.evadb, table_entry).write(
+            table_entry, Batch(pd.DataFrame({"feat": feats}))
+        )
+
+        with self.assertRaises(BinderError):
+            query = "CREATE INDEX testCreateIndexName ON testIndexParamsTable (feat) USING FAISS NLIST 4;"
+            execute_query_fetch_all(self.evadb, query, do_not_print_exceptions=True)
+
+        # The IVF index is trained on a sample of the rows before they are added.
+        query = "CREATE INDEX testCreateIndexName ON testIndexParamsTable (feat) USING FAISS INDEX_FACTORY 'IVF4,Flat' NPROBE 4 TRAIN_SIZE 32;"
+        execute_query_fetch_all(self.evadb, query)
+        index = faiss.read_index(self._index_save_path())
+        self.assertEqual(index.ntotal, 64)
+        self.assertEqual(faiss.extract_index_ivf(index).nprobe, 4)
+
+        # Queries memory-map the index.
+        vector_store = VectorStoreFactory.init_vector_store(
+            VectorStoreType.FAISS,
+            "testCreateIndexName",
+            index_path=self._index_save_path(),
+        )
+        self.assertEqual(vector_store.query(VectorIndexQuery(feats[9], 1)).ids, [10])
+        self.assertTrue(vector_store._is_mmapped)
+
+        execute_query_fetch_all(self.evadb, "DROP INDEX testCreateIndexName;")
+        execute_query_fetch_all(self.evadb, "DROP TABLE testIndexParamsTable;")
+        # recreated for tearDown
+        query = "CREATE INDEX testCreateIndexName ON testCreateIndexFeatTable (feat) USING FAISS;"
+        execute_query_fetch_all(self.evadb, query)
+
+    @macos_skip_marker
+    def test_should_compact_index_after_many_removals(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vector_store = FaissVectorStore(
+                "testCompactIndex", str(Path(tmp_dir) / "FAISS_testCompactIndex.index")
+            )
+            vector_store.create(3)
+            feats = np.array([[idx] * 3 for idx in range(100)], dtype=np.float32)
+            vector_store.add_batch(np.arange(1, 101), feats)
+
+            # The HNSW graph keeps the removed embeddings until enough of them
+            # are removed to rebuild it.
+            vector_store.remove_ids(np.arange(1, 6))
+            self.assertEqual(vector_store._num_removed, 5)
+            self.assertEqual(vector_store._index.ntotal, 100)
+            # the queries skip the removed embeddings without over-fetching
+            self.assertEqual(
+                vector_store.query(VectorIndexQuery(feats[0], 2)).ids, [6, 7]
+            )
+            vector_store.remove_ids(np.arange(6, 12))
+            self.assertEqual(vector_store._num_removed, 0)
+            self.assertEqual(vector_store._index.ntotal, 89)
+            self.assertEqual(
+                vector_store.query(VectorIndexQuery(feats[0], 2)).ids, [12, 13]
+            )
+
+        # created for tearDown
+        query = "CREATE INDEX testCreateIndexName ON testCreateIndexFeatTable (feat) USING FAISS;"
+        execute_query_fetch_all(self.evadb, query)
+
+    @macos_skip_marker
+    def test_should_search_index_for_large_selections(self):
+        try_to_import_faiss()
+        import faiss
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            vector_store = FaissVectorStore(
+                "testFilteredIndex",
+                str(Path(tmp_dir) / "FAISS_testFilteredIndex.index"),
+            )
+            vector_store.create(3)
+            feats = np.array([[idx] * 3 for idx in range(100)], dtype=np.float32)
+            vector_store.add_batch(np.arange(1, 101), feats)
+            query = VectorIndexQuery(feats[10], 3, filter_ids=np.arange(1, 101, 2))
+
+            exact = vector_store.query(query).ids
+            with patch(
+                "evadb.third_party.vector_stores.faiss.MAX_EXACT_SEARCH_IDS", 10
+            ):
+                with patch("faiss.knn") as mock_knn:
+                    searched = vector_store.query(query).ids
+                mock_knn.assert_not_called()
+            self.assertEqual(exact[0], 11)
+            self.assertEqual(sorted(exact), [9, 11, 13])
+            self.assertEqual(sorted(searched), sorted(exact))
+
+            # few of the embeddings are selected, they are compared exactly
+            # MAX_EXACT_SEARCH_IDS at a time
+            query = VectorIndexQuery(feats[10], 3, filter_ids=np.arange(1, 101, 7))
+            with patch(
+                "evadb.third_party.vector_stores.faiss.MAX_EXACT_SEARCH_IDS", 10
+            ):
+                with patch("faiss.knn", wraps=faiss.knn) as mock_knn:
+                    searched = vector_store.query(query).ids
+                self.assertEqual(mock_knn.call_count, 2)
+            self.assertEqual(searched, [8, 15, 1])
+
+        # created for tearDown
+        query = "CREATE INDEX testCreateIndexName ON testCreateIndexFeatTable (feat) USING FAISS;"
+        execute_query_fetch_all(self.evadb, query)
+
     @macos_skip_marker
     def test_should_create_index_with_function(self):
         query = "CREATE INDEX testCreateIndexName ON testCreateIndexInputTable (DummyFeatureExtractor(input)) USING FAISS;"
@@ -85,6 +85,16 @@ class ExplainExecutorTest(unittest.TestCase):
             expected_output = """|__ ProjectPlan\n    |__ LateralJoinPlan\n        |__ SeqScanPlan\n            |__ StoragePlan\n        |__ FunctionScanPlan\n"""
             self.assertEqual(batch.frames[0][0], expected_output)
 
+    def test_explain_orderby_with_limit(self):
+        select_query = "EXPLAIN SELECT id FROM MyVideo ORDER BY id DESC LIMIT 3;"
+        batch = execute_query_fetch_all(self.evadb, select_query)
+        expected_output = """|__ ProjectPlan\n    |__ TopKPlan\n        |__ SeqScanPlan\n            |__ StoragePlan\n"""
+        self.assertEqual(batch.frames[0][0], expected_output)
+
+        select_query = "SELECT id FROM MyVideo ORDER BY id DESC LIMIT 3;"
+        batch = execute_query_fetch_all(self.evadb, select_query)
+        self.assertEqual(list(batch.frames["myvideo.id"]), [9, 8, 7])
+
 
 if __name__ == "__main__":
     unittest.main()
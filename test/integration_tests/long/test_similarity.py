@@ -28,11 +28,13 @@ from test.util import (
     load_functions_for_testing,
     shutdown_ray,
 )
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from evadb.executor.vector_index_scan_executor import MAX_OVERFETCH_ROUNDS
 from evadb.models.storage.batch import Batch
 from evadb.server.command_handler import execute_query_fetch_all
 from evadb.storage.storage_engine import StorageEngine
@@ -387,25 +389,36 @@ class SimilarityTests(unittest.TestCase):
         drop_query = "DROP INDEX testFaissIndexScanRewrite"
         execute_query_fetch_all(self.evadb, drop_query)
 
-    def test_should_not_do_vector_index_scan_with_predicate(self):
+    def test_should_do_vector_index_scan_with_predicate(self):
+        select_query = """SELECT dummy FROM testSimilarityTable WHERE dummy < 2
+                            ORDER BY Similarity(DummyFeatureExtractor(Open("{}")), DummyFeatureExtractor(data_col))
+                            LIMIT 2;""".format(
+            self.img_path
+        )
+        expected_batch = execute_query_fetch_all(self.evadb, select_query)
+
         # Execution with index scan.
         create_index_query = """CREATE INDEX testFaissIndexScanRewrite
                                     ON testSimilarityTable (DummyFeatureExtractor(data_col))
                                     USING FAISS;"""
         execute_query_fetch_all(self.evadb, create_index_query)
 
-        explain_query = """
-            EXPLAIN
-                SELECT data_col FROM testSimilarityTable WHERE dummy = 0
-                  ORDER BY Similarity(DummyFeatureExtractor(Open("{}")), DummyFeatureExtractor(data_col))
-                  LIMIT 3;
-        """.format(
-            "dummypath"
-        )
-        batch = execute_query_fetch_all(self.evadb, explain_query)
+        explain_batch = execute_query_fetch_all(self.evadb, f"EXPLAIN {select_query}")
+        self.assertTrue("VectorIndexScan" in explain_batch.frames[0][0])
 
-        # Index scan should not be used.
-        self.assertFalse("FaissIndexScan" in batch.frames[0][0])
+        # The nearest neighbors do not satisfy the predicate, they are skipped by
+        # querying more neighbors, or by searching only the rows satisfying it.
+        for max_rounds in [MAX_OVERFETCH_ROUNDS, 1]:
+            with patch(
+                "evadb.executor.vector_index_scan_executor.MAX_OVERFETCH_ROUNDS",
+                max_rounds,
+            ):
+                actual_batch = execute_query_fetch_all(self.evadb, select_query)
+            self.assertEqual(
+                list(actual_batch.frames["testsimilaritytable.dummy"]),
+                list(expected_batch.frames["testsimilaritytable.dummy"]),
+            )
+        self.assertEqual(list(actual_batch.frames["testsimilaritytable.dummy"]), [1, 0])
 
         # Cleanup
         drop_query = "DROP INDEX testFaissIndexScanRewrite"
@@ -21,8 +21,10 @@ import pytest
 
 from evadb.catalog.catalog_utils import get_video_table_column_definitions
 from evadb.executor.executor_utils import ExecutorError
+from evadb.functions.function_pool import get_function_pool
 from evadb.models.storage.batch import Batch
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.native_storage_engine import NativeStorageEngine
 from evadb.storage.storage_engine import StorageEngine
 
 
@@ -146,6 +148,40 @@ class DropObjectExecutorTest(unittest.TestCase):
         # clean up
         execute_query_fetch_all(self.evadb, drop_query)
 
+    def test_drop_function_should_remove_warm_instances(self):
+        get_function_pool().clear()
+        self.run_create_function_query()
+        execute_query_fetch_all(
+            self.evadb, f"LOAD VIDEO '{self.video_file_path}' INTO MyVideo;"
+        )
+        # different queries, so that the second one does not reuse the cached plan
+        select_query = "SELECT DummyObjectDetector(data) FROM MyVideo WHERE id < {};"
+        execute_query_fetch_all(self.evadb, select_query.format(2))
+        execute_query_fetch_all(self.evadb, select_query.format(3))
+        # only the stateless functions are kept in the pool
+        execute_query_fetch_all(
+            self.evadb,
+            """CREATE FUNCTION DummyMultiObjectDetector
+            INPUT  (Frame_Array NDARRAY UINT8(3, 256, 256))
+            OUTPUT (labels NDARRAY STR(10))
+            TYPE  Classification
+            IMPL  'test/util.py';""",
+        )
+        execute_query_fetch_all(
+            self.evadb, "SELECT DummyMultiObjectDetector(data) FROM MyVideo;"
+        )
+
+        pool = execute_query_fetch_all(self.evadb, "SHOW FUNCTION_POOL;")
+        self.assertEqual(list(pool.frames["name"]), ["DummyObjectDetector"])
+        self.assertEqual(list(pool.frames["warm_instances"]), [1])
+        self.assertEqual(list(pool.frames["loads"]), [1])
+        self.assertEqual(list(pool.frames["hits"]), [1])
+
+        execute_query_fetch_all(self.evadb, "DROP FUNCTION DummyObjectDetector;")
+        pool = execute_query_fetch_all(self.evadb, "SHOW FUNCTION_POOL;")
+        self.assertEqual(list(pool.frames["warm_instances"]), [0])
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyVideo;")
+
     def test_drop_wrong_function_name(self):
         self.run_create_function_query()
         right_function_name = "DummyObjectDetector"
@@ -214,15 +250,22 @@ class DropObjectExecutorTest(unittest.TestCase):
                     WITH ENGINE = "sqlite",
                     PARAMETERS = {params};"""
         execute_query_fetch_all(self.evadb, query)
-        self.assertIsNotNone(
-            self.evadb.catalog().get_database_catalog_entry(database_name)
+        db_catalog_entry = self.evadb.catalog().get_database_catalog_entry(
+            database_name
         )
+        self.assertIsNotNone(db_catalog_entry)
+        NativeStorageEngine(self.evadb)._get_sqlalchemy_engine(db_catalog_entry)
 
         # DROP DATABASE
         execute_query_fetch_all(self.evadb, f"DROP DATABASE {database_name}")
         self.assertIsNone(
             self.evadb.catalog().get_database_catalog_entry(database_name)
         )
+        # the pooled connections of the dropped database are closed
+        self.assertNotIn(
+            database_name,
+            [key[0] for key in NativeStorageEngine._sqlalchemy_engines],
+        )
 
         # DROP should pass with warning
         result = execute_query_fetch_all(
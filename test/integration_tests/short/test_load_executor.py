@@ -14,6 +14,7 @@
 # limitations under the License.
 import glob
 import os
+import tempfile
 import unittest
 from pathlib import Path
 from test.util import (
@@ -28,11 +29,14 @@ from test.util import (
 
 import pandas as pd
 import pytest
+from mock import patch
 
+from evadb.catalog.catalog_type import TableType
 from evadb.configuration.constants import EvaDB_ROOT_DIR
 from evadb.models.storage.batch import Batch
 from evadb.parser.types import FileFormatType
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.video_storage_engine import DecordStorageEngine
 
 
 @pytest.mark.notparallel
@@ -64,6 +68,86 @@ class LoadExecutorTests(unittest.TestCase):
         )
         self.assertEqual(result, expected)
 
+    def test_should_decode_videos_in_parallel(self):
+        path = f"{EvaDB_ROOT_DIR}/data/sample_videos/1/*.mp4"
+        execute_query_fetch_all(self.evadb, f"""LOAD VIDEO "{path}" INTO MyVideos;""")
+        select_query = "SELECT name, id, seconds FROM MyVideos;"
+        # the videos are split into frame ranges, which are sampled and
+        # filtered as the whole video
+        range_queries = [
+            "SELECT name, id FROM MyVideos SAMPLE 7;",
+            "SELECT name, id FROM MyVideos WHERE id > 40 AND id < 170;",
+        ]
+        expected = execute_query_fetch_all(self.evadb, select_query)
+        expected_ranges = [
+            execute_query_fetch_all(self.evadb, query) for query in range_queries
+        ]
+
+        split_frame_ranges = DecordStorageEngine._split_frame_ranges
+        frame_ranges = []
+
+        def record_frame_ranges(*args):
+            frame_ranges.append(split_frame_ranges(*args))
+            return frame_ranges[-1]
+
+        execute_query_fetch_all(self.evadb, "SET decode_parallelism = 4;")
+        with patch(
+            "evadb.storage.video_storage_engine.MIN_DECODE_RANGE_FRAMES", 50
+        ), patch.object(
+            DecordStorageEngine, "_split_frame_ranges", record_frame_ranges
+        ):
+            actual = execute_query_fetch_all(self.evadb, select_query)
+            actual_ranges = [
+                execute_query_fetch_all(self.evadb, query) for query in range_queries
+            ]
+        limited = execute_query_fetch_all(self.evadb, select_query[:-1] + " LIMIT 3;")
+        # a worker that exits without an Exception does not block the read
+        with patch.object(DecordStorageEngine, "_read_file", side_effect=GeneratorExit):
+            with self.assertRaises(GeneratorExit):
+                execute_query_fetch_all(self.evadb, select_query)
+        execute_query_fetch_all(self.evadb, "SET decode_parallelism = 1;")
+
+        # frames are returned in the same order as the sequential read
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual_ranges, expected_ranges)
+        self.assertEqual(limited, expected[:3])
+        # the videos of 151 and 252 frames are split into 3 and 4 ranges
+        self.assertEqual(sorted(len(ranges) for ranges in frame_ranges[:2]), [3, 4])
+
+    def test_should_read_videos_through_frame_cache(self):
+        path = f"{EvaDB_ROOT_DIR}/data/sample_videos/1/*.mp4"
+        execute_query_fetch_all(self.evadb, f"""LOAD VIDEO "{path}" INTO MyVideos;""")
+        select_query = "SELECT name, id, data, seconds FROM MyVideos WHERE id < 10;"
+        expected = execute_query_fetch_all(self.evadb, select_query)
+
+        cache_dir = self.evadb.catalog().get_configuration_catalog_value("cache_dir")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            execute_query_fetch_all(self.evadb, f"SET cache_dir = '{tmp_dir}';")
+            execute_query_fetch_all(self.evadb, f"SET frame_cache_size = {2**30};")
+            execute_query_fetch_all(
+                self.evadb, f"SET frame_cache_memory_size = {2**25};"
+            )
+            frame_cache = DecordStorageEngine(self.evadb)._get_frame_cache()
+            self.assertTrue(frame_cache.path.startswith(tmp_dir))
+            try:
+                # the first read populates the cache, the second one is served
+                # from it
+                cold = execute_query_fetch_all(self.evadb, select_query)
+                cold_misses = frame_cache.misses
+                self.assertEqual(frame_cache.hits, 0)
+                self.assertGreater(cold_misses, 0)
+
+                warm = execute_query_fetch_all(self.evadb, select_query)
+                self.assertEqual(frame_cache.misses, cold_misses)
+                self.assertGreater(frame_cache.hits, 0)
+            finally:
+                execute_query_fetch_all(self.evadb, "SET frame_cache_size = 0;")
+                execute_query_fetch_all(self.evadb, "SET frame_cache_memory_size = 0;")
+                execute_query_fetch_all(self.evadb, f"SET cache_dir = '{cache_dir}';")
+
+        self.assertEqual(cold, expected)
+        self.assertEqual(warm, expected)
+
     ###########################################
     # integration testcases for load image
     def test_should_load_images_in_table(self):
@@ -118,6 +202,45 @@ class LoadExecutorTests(unittest.TestCase):
         drop_query = "DROP TABLE IF EXISTS MyVideoCSV;"
         execute_query_fetch_all(self.evadb, drop_query)
 
+    def test_should_load_csv_in_columnar_table(self):
+        execute_query_fetch_all(self.evadb, "SET columnar_storage = TRUE;")
+        create_table_query = """
+
+            CREATE TABLE IF NOT EXISTS MyVideoCSV (
+                id INTEGER UNIQUE,
+                frame_id INTEGER,
+                video_id INTEGER,
+                dataset_name TEXT(30),
+                label TEXT(30),
+                bbox NDARRAY FLOAT32(4),
+                object_id INTEGER
+            );
+
+            """
+        execute_query_fetch_all(self.evadb, create_table_query)
+        execute_query_fetch_all(self.evadb, "SET columnar_storage = FALSE;")
+        table = self.evadb.catalog().get_table_catalog_entry("MyVideoCSV")
+        self.assertEqual(table.table_type, TableType.COLUMNAR_DATA)
+
+        load_query = f"LOAD CSV '{self.csv_file_path}' INTO MyVideoCSV;"
+        execute_query_fetch_all(self.evadb, load_query)
+
+        select_query = """SELECT id, frame_id, video_id,
+                          dataset_name, label, bbox,
+                          object_id
+                          FROM MyVideoCSV;"""
+
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+        actual_batch.sort()
+
+        expected_batch = next(create_dummy_csv_batches())
+        expected_batch.modify_column_alias("myvideocsv")
+        self.assertEqual(actual_batch, expected_batch)
+
+        drop_query = "DROP TABLE IF EXISTS MyVideoCSV;"
+        execute_query_fetch_all(self.evadb, drop_query)
+        self.assertFalse(Path(table.file_url).exists())
+
     ###################################
     # integration tests for csv files with spaces in column names
     def test_should_load_csv_in_table_with_spaces_in_column_name(self):
@@ -0,0 +1,89 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.util import get_evadb_for_testing
+
+import pytest
+from mock import patch
+
+from evadb.executor.executor_utils import ExecutorError
+from evadb.optimizer.plan_cache import get_plan_cache
+from evadb.server.command_handler import execute_query_fetch_all
+
+
+@pytest.mark.notparallel
+class PrepareExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        # reset the catalog manager before running each test
+        self.evadb.catalog().reset()
+        execute_query_fetch_all(
+            self.evadb, "CREATE TABLE MyTable (id INTEGER, label TEXT(10));"
+        )
+        for idx in range(5):
+            execute_query_fetch_all(
+                self.evadb, f"INSERT INTO MyTable (id, label) VALUES ({idx}, 'l{idx}');"
+            )
+        self.plan_cache = get_plan_cache(self.evadb.catalog_uri)
+        self.plan_cache.clear()
+
+    def tearDown(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS MyTable;")
+
+    def test_should_reuse_plan_of_repeated_query(self):
+        query = "SELECT id FROM MyTable WHERE id < 3;"
+        expected = execute_query_fetch_all(self.evadb, query)
+        with patch("evadb.server.command_handler.Parser") as mock_parser:
+            actual = execute_query_fetch_all(self.evadb, " ".join(query.split(" ")))
+        mock_parser.assert_not_called()
+        self.assertEqual(actual, expected)
+        self.assertEqual(self.plan_cache.hits, 1)
+
+        # the cached plan is invalidated by DDL on the referenced table
+        execute_query_fetch_all(self.evadb, "DROP TABLE MyTable;")
+        with self.assertRaises(Exception):
+            execute_query_fetch_all(self.evadb, query, do_not_print_exceptions=True)
+
+    def test_should_execute_prepared_statement_with_parameters(self):
+        execute_query_fetch_all(
+            self.evadb,
+            "PREPARE filter AS SELECT id, label FROM MyTable WHERE id < $1 AND label != $2;",
+        )
+        result = execute_query_fetch_all(self.evadb, "EXECUTE filter (3, 'l1');")
+        self.assertEqual(list(result.frames["mytable.id"]), [0, 2])
+        result = execute_query_fetch_all(self.evadb, "EXECUTE filter (5, 'l0');")
+        self.assertEqual(list(result.frames["mytable.id"]), [1, 2, 3, 4])
+
+        execute_query_fetch_all(
+            self.evadb,
+            "PREPARE add AS INSERT INTO MyTable (id, label) VALUES ($1, $2);",
+        )
+        execute_query_fetch_all(self.evadb, "EXECUTE add (7, 'l7');")
+        # the prepared plan is optimized again after the catalog changes
+        execute_query_fetch_all(self.evadb, "CREATE TABLE Other (id INTEGER);")
+        result = execute_query_fetch_all(self.evadb, "EXECUTE filter (10, 'l0');")
+        self.assertEqual(list(result.frames["mytable.id"]), [1, 2, 3, 4, 7])
+        execute_query_fetch_all(self.evadb, "DROP TABLE Other;")
+
+        with self.assertRaises(ExecutorError):
+            execute_query_fetch_all(self.evadb, "EXECUTE filter (3);")
+
+        execute_query_fetch_all(self.evadb, "DEALLOCATE filter;")
+        with self.assertRaises(ExecutorError):
+            execute_query_fetch_all(self.evadb, "EXECUTE filter (3, 'l1');")
+
+
+if __name__ == "__main__":
+    unittest.main()
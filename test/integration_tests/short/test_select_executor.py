@@ -28,6 +28,7 @@ from test.util import (  # file_remove,
 import numpy as np
 import pandas as pd
 import pytest
+from mock import patch
 
 from evadb.binder.binder_utils import BinderError
 from evadb.models.storage.batch import Batch
@@ -267,6 +268,63 @@ class SelectExecutorTest(unittest.TestCase):
             BinderError, execute_query_fetch_all, self.evadb, select_query
         )
 
+    def test_select_and_groupby_columns(self):
+        select_query = """SELECT a0, COUNT(*), SUM(a1), MAX(a2) FROM table2
+            GROUP BY a0 ORDER BY a0;"""
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+
+        expected = self.table2.groupby("table2.a0", as_index=False).agg(
+            count=("table2.a1", "count"),
+            sum=("table2.a1", "sum"),
+            max=("table2.a2", "max"),
+        )
+        self.assertEqual(
+            list(actual_batch.columns),
+            ["table2.a0", "COUNT._row_id", "SUM.a1", "MAX.a2"],
+        )
+        np.testing.assert_array_equal(
+            actual_batch.frames.to_numpy(), expected.to_numpy()
+        )
+
+        select_query = "SELECT a1, COUNT(*) FROM table2 GROUP BY a0;"
+        self.assertRaises(
+            BinderError, execute_query_fetch_all, self.evadb, select_query
+        )
+
+    def test_should_evaluate_functions_in_worker_processes(self):
+        select_queries = [
+            "SELECT id, DummyObjectDetector(data) FROM MyVideo ORDER BY id;",
+            """SELECT id, T.label FROM MyVideo JOIN LATERAL
+                DummyObjectDetector(data) AS T(label) ORDER BY id;""",
+        ]
+        expected = [
+            execute_query_fetch_all(self.evadb, query) for query in select_queries
+        ]
+
+        # the functions are estimated to cost a second per row on two CPUs
+        execute_query_fetch_all(self.evadb, "SET local_exchange = TRUE;")
+        with patch(
+            "evadb.optimizer.optimizer_utils.get_expression_execution_cost",
+            return_value=1,
+        ), patch("evadb.optimizer.optimizer_utils.os.cpu_count", return_value=2):
+            plans = [
+                execute_query_fetch_all(self.evadb, f"EXPLAIN {query}")
+                for query in select_queries
+            ]
+            with patch("evadb.executor.exchange_executor.logger") as mock_logger:
+                actual = [
+                    execute_query_fetch_all(self.evadb, query)
+                    for query in select_queries
+                ]
+        execute_query_fetch_all(self.evadb, "SET local_exchange = FALSE;")
+
+        # the functions are sent to the worker processes
+        mock_logger.warning.assert_not_called()
+
+        for plan in plans:
+            self.assertIn("ExchangePlan", plan.frames[0][0])
+        self.assertEqual(actual, expected)
+
     def test_select_and_groupby_with_sample(self):
         # TODO ACTION: groupby and orderby together not tested because groupby
         # only applies to video data which is already sorted
@@ -209,6 +209,10 @@ class StatementBinderTests(unittest.TestCase):
         mock_load_function_class_from_file.return_value.return_value = (
             "load_function_class_from_file"
         )
+        configs = {"gpu_ids": [0], "function_pool_memory_size": 0}
+        mock_catalog().get_configuration_catalog_value = MagicMock(
+            side_effect=lambda key, default=None: configs.get(key, default)
+        )
         # mock_get_file_checksum.return_value = function_obj.checksum
 
         # Case 1 set output
@@ -251,8 +255,12 @@ class StatementBinderTests(unittest.TestCase):
         )
         self.assertEqual(func_expr.function(), "load_function_class_from_file")
 
+        # the class is imported once per registered function
+        self.assertEqual(mock_load_function_class_from_file.call_count, 1)
+
         # Raise error if the class object cannot be created
         mock_load_function_class_from_file.reset_mock()
+        function_obj.checksum = "checksum of the function registered again"
         mock_error_msg = "mock_load_function_class_from_file_error"
         mock_load_function_class_from_file.side_effect = MagicMock(
             side_effect=RuntimeError(mock_error_msg)
@@ -329,6 +337,7 @@ class StatementBinderTests(unittest.TestCase):
             catalog = MagicMock()
             binder = StatementBinder(StatementBinderContext(catalog))
             create_index_statement = MagicMock()
+            create_index_statement.index_params = {}
 
             with self.assertRaises(AssertionError):
                 binder._bind_create_index_statement(create_index_statement)
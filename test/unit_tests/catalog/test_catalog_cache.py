@@ -0,0 +1,62 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from mock import MagicMock, patch
+
+from evadb.catalog.catalog_cache import CatalogCache
+from evadb.catalog.catalog_utils import (
+    get_catalog_instance,
+    release_catalog_instance,
+)
+
+
+class CatalogCacheTest(unittest.TestCase):
+    def test_should_load_entry_once(self):
+        cache = CatalogCache()
+        loader = MagicMock(return_value="entry")
+        self.assertEqual(cache.get("key", loader), "entry")
+        self.assertEqual(cache.get("key", loader), "entry")
+        loader.assert_called_once()
+
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+        cache.get("key", loader)
+        self.assertEqual(loader.call_count, 2)
+
+    def test_should_not_store_entry_read_before_invalidation(self):
+        cache = CatalogCache()
+
+        def stale_loader():
+            # a DDL commits while the entry is being read
+            cache.invalidate()
+            return "stale"
+
+        self.assertEqual(cache.get("key", stale_loader), "stale")
+        self.assertEqual(cache.get("key", lambda: "fresh"), "fresh")
+
+    @patch("evadb.catalog.catalog_manager.CatalogManager")
+    def test_should_share_catalog_instance_per_uri(self, catalog_mock):
+        catalog_mock.side_effect = lambda uri: MagicMock()
+        catalog = get_catalog_instance("uri1")
+        self.assertIs(get_catalog_instance("uri1"), catalog)
+        self.assertIsNot(get_catalog_instance("uri2"), catalog)
+
+        release_catalog_instance("uri1")
+        catalog.close.assert_called_once()
+        self.assertIsNot(get_catalog_instance("uri1"), catalog)
+
+        release_catalog_instance("uri1")
+        release_catalog_instance("uri2")
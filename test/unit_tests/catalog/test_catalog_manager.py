@@ -180,3 +180,58 @@ class CatalogManagerTests(unittest.TestCase):
         function_obj = MagicMock(spec=FunctionCatalogEntry)
         CatalogManager(MagicMock()).get_function_io_catalog_input_entries(function_obj)
         mock_func.assert_called_once_with(function_obj.row_id)
+
+    @mock.patch("evadb.catalog.catalog_manager.TableCatalogService")
+    def test_table_catalog_entry_should_be_cached_until_ddl(self, ds_mock):
+        catalog = CatalogManager(MagicMock())
+        get_entry = ds_mock.return_value.get_entry_by_name
+        get_entry.return_value = None
+
+        self.assertFalse(catalog.check_table_exists("name"))
+        self.assertIsNone(catalog.get_table_catalog_entry("name"))
+        get_entry.assert_called_once_with(None, "name")
+
+        # any DDL drops the cached entries, including the misses
+        catalog.insert_table_catalog_entry("name", "file1", [])
+        get_entry.return_value = MagicMock(row_id=1)
+        self.assertEqual(catalog.get_table_catalog_entry("name").row_id, 1)
+        self.assertEqual(get_entry.call_count, 2)
+
+    @mock.patch("evadb.catalog.catalog_manager.IndexCatalogService")
+    @mock.patch("evadb.catalog.catalog_manager.FunctionIOCatalogService")
+    def test_function_io_and_index_entries_should_be_cached(
+        self, function_io_mock, index_mock
+    ):
+        catalog = CatalogManager(MagicMock())
+        get_inputs = function_io_mock.return_value.get_input_entries_by_function_id
+        get_inputs.return_value = [MagicMock()]
+        function_obj = MagicMock(spec=FunctionCatalogEntry)
+
+        inputs = catalog.get_function_io_catalog_input_entries(function_obj)
+        # the cached list is not affected by the callers
+        inputs.append(MagicMock())
+        self.assertEqual(
+            catalog.get_function_io_catalog_input_entries(function_obj),
+            get_inputs.return_value,
+        )
+        get_inputs.assert_called_once_with(function_obj.row_id)
+
+        get_index = index_mock.return_value.get_entry_by_name
+        catalog.get_index_catalog_entry_by_name("index")
+        catalog.get_index_catalog_entry_by_name("index")
+        get_index.assert_called_once_with("index")
+
+        catalog.drop_index_catalog_entry("index")
+        catalog.get_index_catalog_entry_by_name("index")
+        self.assertEqual(get_index.call_count, 2)
+
+    @mock.patch("evadb.catalog.catalog_manager.DatabaseCatalogService")
+    def test_database_catalog_writes_should_bump_catalog_version(self, db_mock):
+        catalog = CatalogManager(MagicMock())
+        version = catalog.version
+        catalog.insert_database_catalog_entry("db", "sqlite", {})
+        self.assertGreater(catalog.version, version)
+
+        version = catalog.version
+        catalog.drop_database_catalog_entry(MagicMock())
+        self.assertGreater(catalog.version, version)
@@ -0,0 +1,121 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import threading
+import unittest
+from test.unit_tests.executor.utils import DummyExecutor, mock_db
+
+import numpy as np
+import pandas as pd
+
+from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.exchange_executor import ExchangeExecutor
+from evadb.executor.executor_utils import ExecutorError
+from evadb.executor.process_utils import read_shared_batch, write_shared_batch
+from evadb.models.storage.batch import Batch
+from evadb.plan_nodes.exchange_plan import ExchangePlan
+
+
+class DoubleExecutor(AbstractExecutor):
+    """Doubles the column A and records the process evaluating every batch"""
+
+    def __init__(self):
+        super().__init__(None, None)
+
+    def exec(self, *args, **kwargs):
+        for batch in self.children[0].exec(**kwargs):
+            if (batch.frames["A"] < 0).any():
+                raise ValueError("negative A")
+            frame = batch.frames.assign(A=batch.frames["A"] * 2, pid=os.getpid())
+            yield Batch(frame)
+
+
+class ExchangeExecutorTest(unittest.TestCase):
+    def _exchange(self, batches, parallelism):
+        plan = ExchangePlan(DoubleExecutor(), parallelism=parallelism, use_ray=False)
+        exchange_executor = ExchangeExecutor(mock_db(), plan)
+        exchange_executor.build_inner_executor(DoubleExecutor())
+        exchange_executor.append_child(DummyExecutor(batches))
+        return exchange_executor
+
+    def test_should_evaluate_batches_in_worker_processes_in_order(self):
+        batches = [
+            Batch(pd.DataFrame({"A": np.arange(idx, idx + 10)}))
+            for idx in range(0, 100, 10)
+        ]
+        outputs = list(self._exchange(batches, 3).exec())
+
+        frame = Batch.concat(outputs, copy=False).frames
+        self.assertEqual(list(frame["A"]), list(range(0, 200, 2)))
+        self.assertNotIn(os.getpid(), set(frame["pid"]))
+
+    def test_should_evaluate_batches_in_workers_while_other_threads_run(self):
+        batches = [Batch(pd.DataFrame({"A": [idx]})) for idx in range(4)]
+        # e.g., a server thread holding a lock while the query runs
+        lock = threading.Lock()
+        lock.acquire()
+        thread = threading.Thread(target=lock.acquire)
+        thread.start()
+        try:
+            outputs = list(self._exchange(batches, 2).exec())
+        finally:
+            lock.release()
+            thread.join()
+
+        frame = Batch.concat(outputs, copy=False).frames
+        self.assertEqual(list(frame["A"]), [0, 2, 4, 6])
+        self.assertNotIn(os.getpid(), set(frame["pid"]))
+
+    def test_should_evaluate_unpicklable_executors_in_process(self):
+        batches = [Batch(pd.DataFrame({"A": [idx]})) for idx in range(4)]
+        exchange_executor = self._exchange(batches, 2)
+        exchange_executor.inner_executor.lock = threading.Lock()
+        outputs = list(exchange_executor.exec())
+
+        frame = Batch.concat(outputs, copy=False).frames
+        self.assertEqual(list(frame["A"]), [0, 2, 4, 6])
+        self.assertEqual(set(frame["pid"]), {os.getpid()})
+
+    def test_should_reuse_worker_processes_across_queries(self):
+        batches = [Batch(pd.DataFrame({"A": [idx]})) for idx in range(8)]
+        first = Batch.concat(list(self._exchange(batches, 2).exec()), copy=False)
+        second = Batch.concat(list(self._exchange(batches, 2).exec()), copy=False)
+        self.assertEqual(list(second.frames["A"]), list(range(0, 16, 2)))
+        self.assertTrue(set(first.frames["pid"]) & set(second.frames["pid"]))
+
+    def test_should_stop_reading_batches_early(self):
+        batches = [Batch(pd.DataFrame({"A": [idx]})) for idx in range(20)]
+        outputs = self._exchange(batches, 2).exec()
+        self.assertEqual(next(outputs).frames["A"][0], 0)
+        self.assertEqual(next(outputs).frames["A"][0], 2)
+        outputs.close()
+
+    def test_should_raise_error_of_worker(self):
+        batches = [Batch(pd.DataFrame({"A": [idx]})) for idx in [1, -1, 2]]
+        with self.assertRaises(ExecutorError):
+            list(self._exchange(batches, 2).exec())
+
+    def test_should_pass_batches_through_shared_memory(self):
+        frames = np.empty(3, dtype=object)
+        for idx in range(3):
+            frames[idx] = np.full((4, 4, 3), idx, dtype=np.uint8)
+        batch = Batch(
+            pd.DataFrame({"id": [0, 1, 2], "data": frames, "label": ["a", "b", "c"]})
+        )
+
+        shared_batch = read_shared_batch(write_shared_batch(batch))
+        self.assertEqual(shared_batch, batch)
+        # the batch is copied out of the released block
+        shared_batch.frames["data"][0][0, 0, 0] = 255
@@ -0,0 +1,134 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+from test.unit_tests.executor.utils import DummyExecutor, mock_db
+
+import numpy as np
+import pandas as pd
+
+from evadb.executor.groupby_executor import GroupByExecutor
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.aggregation_expression import AggregationExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.plan_nodes.groupby_plan import GroupByPlan
+
+
+def _aggregate(etype, col_alias):
+    return AggregationExpression(etype, None, TupleValueExpression(col_alias=col_alias))
+
+
+class GroupByExecutorTest(unittest.TestCase):
+    def test_should_return_segments_of_rows(self):
+        df = pd.DataFrame({"id": np.arange(10)})
+        batches = [Batch(df.iloc[:2]), Batch(df.iloc[2:4]), Batch(df.iloc[4:10])]
+
+        groupby_executor = GroupByExecutor(
+            mock_db(), GroupByPlan(ConstantValueExpression("3 frames"))
+        )
+        groupby_executor.append_child(DummyExecutor(batches))
+
+        segments = [list(batch.frames["id"]) for batch in groupby_executor.exec()]
+        # the dangling rows are discarded
+        self.assertEqual(segments, [[0, 1, 2], [3, 4, 5], [6, 7, 8]])
+
+    def test_should_aggregate_groups_beyond_memory_size(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "t.key": rng.integers(0, 200, 2000),
+                "t.name": rng.choice(["a", "b"], 2000),
+                "t.value": rng.random(2000),
+            }
+        )
+        batches = [Batch(df.iloc[idx : idx + 100]) for idx in range(0, 2000, 100)]
+        plan = GroupByPlan(
+            None,
+            [
+                TupleValueExpression(col_alias="t.key"),
+                TupleValueExpression(col_alias="t.name"),
+            ],
+            [
+                (
+                    "COUNT.value",
+                    _aggregate(ExpressionType.AGGREGATION_COUNT, "t.value"),
+                ),
+                ("SUM.value", _aggregate(ExpressionType.AGGREGATION_SUM, "t.value")),
+                ("AVG.value", _aggregate(ExpressionType.AGGREGATION_AVG, "t.value")),
+                ("MIN.value", _aggregate(ExpressionType.AGGREGATION_MIN, "t.value")),
+                ("MAX.value", _aggregate(ExpressionType.AGGREGATION_MAX, "t.value")),
+            ],
+        )
+        expected = (
+            df.groupby(["t.key", "t.name"])["t.value"]
+            .agg(["count", "sum", "mean", "min", "max"])
+            .reset_index()
+        )
+        expected.columns = ["t.key", "t.name", *[name for name, _ in plan.aggregates]]
+
+        # the groups exceed a budget of 4 KB, and are spilled to partitions
+        for memory_size in [2**28, 2**12]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                db = mock_db({"groupby_memory_size": memory_size, "tmp_dir": tmp_dir})
+                groupby_executor = GroupByExecutor(db, plan)
+                groupby_executor.append_child(DummyExecutor(batches))
+                actual = Batch.concat(groupby_executor.exec()).frames
+                self.assertEqual(os.listdir(tmp_dir), [])
+
+            actual = actual.sort_values(["t.key", "t.name"], ignore_index=True)
+            pd.testing.assert_frame_equal(actual, expected)
+
+    def test_should_aggregate_all_rows_without_groupby_list(self):
+        df = pd.DataFrame({"t.value": np.arange(10)})
+        plan = GroupByPlan(
+            None,
+            [],
+            [
+                (
+                    "COUNT.value",
+                    _aggregate(ExpressionType.AGGREGATION_COUNT, "t.value"),
+                ),
+                ("AVG.value", _aggregate(ExpressionType.AGGREGATION_AVG, "t.value")),
+            ],
+        )
+        groupby_executor = GroupByExecutor(mock_db(), plan)
+        groupby_executor.append_child(
+            DummyExecutor([Batch(df.iloc[:4]), Batch(df.iloc[4:])])
+        )
+
+        actual = Batch.concat(groupby_executor.exec()).frames
+        pd.testing.assert_frame_equal(
+            actual, pd.DataFrame({"COUNT.value": [10], "AVG.value": [4.5]})
+        )
+
+    def test_should_return_distinct_keys_without_aggregates(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"t.key": rng.integers(0, 200, 2000)})
+        batches = [Batch(df.iloc[idx : idx + 100]) for idx in range(0, 2000, 100)]
+        plan = GroupByPlan(None, [TupleValueExpression(col_alias="t.key")], [])
+        expected = pd.DataFrame({"t.key": np.unique(df["t.key"])})
+
+        for memory_size in [2**28, 2**8]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                db = mock_db({"groupby_memory_size": memory_size, "tmp_dir": tmp_dir})
+                groupby_executor = GroupByExecutor(db, plan)
+                groupby_executor.append_child(DummyExecutor(batches))
+                actual = Batch.concat(groupby_executor.exec()).frames
+
+            actual = actual.sort_values(["t.key"], ignore_index=True)
+            pd.testing.assert_frame_equal(actual, expected)
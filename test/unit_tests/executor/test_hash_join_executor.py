@@ -0,0 +1,92 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+from test.unit_tests.executor.utils import (
+    CountingExecutor,
+    DummyExecutor,
+    mock_db,
+)
+
+import numpy as np
+import pandas as pd
+from mock import MagicMock
+
+from evadb.executor.hash_join_executor import HashJoinExecutor
+from evadb.executor.join_build_executor import BuildJoinExecutor
+from evadb.models.storage.batch import Batch
+from evadb.parser.types import JoinType
+from evadb.plan_nodes.hash_join_build_plan import HashJoinBuildPlan
+from evadb.plan_nodes.hash_join_probe_plan import HashJoinProbePlan
+
+
+class HashJoinExecutorTest(unittest.TestCase):
+    def _create_join(self, build_batches, probe_batches, memory_size, tmp_dir):
+        db = mock_db({"hash_join_memory_size": memory_size, "tmp_dir": tmp_dir})
+        build_plan = HashJoinBuildPlan(
+            JoinType.INNER_JOIN, [MagicMock(col_alias="a.key")]
+        )
+        probe_plan = HashJoinProbePlan(
+            JoinType.INNER_JOIN, [MagicMock(col_alias="b.key")], None, None
+        )
+        build_executor = BuildJoinExecutor(db, build_plan)
+        build_executor.append_child(DummyExecutor(build_batches))
+        probe_executor = CountingExecutor(probe_batches)
+        join_executor = HashJoinExecutor(db, probe_plan)
+        join_executor.append_child(build_executor)
+        join_executor.append_child(probe_executor)
+        return join_executor, probe_executor
+
+    def test_should_join_in_memory_and_with_spilled_partitions(self):
+        rng = np.random.default_rng(0)
+        build = pd.DataFrame(
+            {"a.key": rng.integers(0, 50, 300), "a.value": np.arange(300)}
+        )
+        # the float keys match the integer keys, the null keys do not match
+        probe_keys = rng.integers(0, 60, 400).astype("float64")
+        probe_keys[:10] = np.nan
+        probe = pd.DataFrame({"b.key": probe_keys, "b.value": np.arange(400)})
+        expected = probe.merge(build, left_on="b.key", right_on="a.key")
+        expected = expected.sort_values(["b.value", "a.value"], ignore_index=True)
+
+        build_batches = [Batch(build.iloc[idx : idx + 100]) for idx in (0, 100, 200)]
+        probe_batches = [
+            Batch(probe.iloc[idx : idx + 100]) for idx in range(0, 400, 100)
+        ]
+        # a budget of one byte partitions the rows down to a key per partition
+        for memory_size in [2**28, 1]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                join_executor, probe_executor = self._create_join(
+                    build_batches, probe_batches, memory_size, tmp_dir
+                )
+                actual = Batch.concat(join_executor.exec()).frames
+                actual = actual.sort_values(["b.value", "a.value"], ignore_index=True)
+
+                pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+                self.assertEqual(probe_executor.num_scans, 1)
+                spilled = join_executor.children[0].partitions is not None
+                self.assertEqual(spilled, memory_size == 1)
+                # the spill files are removed
+                self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_should_not_read_probe_side_of_empty_build_side(self):
+        probe = pd.DataFrame({"b.key": [1, 2], "b.value": [3, 4]})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            join_executor, probe_executor = self._create_join(
+                [Batch(pd.DataFrame())], [Batch(probe)], 2**28, tmp_dir
+            )
+            self.assertEqual(list(join_executor.exec()), [])
+            self.assertEqual(probe_executor.num_scans, 0)
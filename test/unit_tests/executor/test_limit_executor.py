@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import unittest
-from test.unit_tests.executor.utils import DummyExecutor
+from test.unit_tests.executor.utils import DummyExecutor, mock_db
 
 import numpy as np
 import pandas as pd
@@ -116,7 +116,7 @@ class LimitExecutorTest(unittest.TestCase):
             ]
         )
 
-        orderby_executor = OrderByExecutor(MagicMock(), plan)
+        orderby_executor = OrderByExecutor(mock_db(), plan)
         orderby_executor.append_child(DummyExecutor(batches))
 
         sorted_batches = list(orderby_executor.exec())
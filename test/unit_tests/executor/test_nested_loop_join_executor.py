@@ -0,0 +1,74 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+import unittest
+from test.unit_tests.executor.utils import CountingExecutor, mock_db
+
+import numpy as np
+import pandas as pd
+
+from evadb.executor.nested_loop_join_executor import NestedLoopJoinExecutor
+from evadb.models.storage.batch import Batch
+from evadb.parser.types import JoinType
+from evadb.plan_nodes.nested_loop_join_plan import NestedLoopJoinPlan
+
+
+class NestedLoopJoinExecutorTest(unittest.TestCase):
+    def test_should_read_both_sides_once(self):
+        rng = np.random.default_rng(0)
+        outer = pd.DataFrame(
+            {"a.key": rng.integers(0, 20, 50), "a.value": np.arange(50)}
+        )
+        inner = pd.DataFrame(
+            {"b.key": rng.integers(0, 20, 60), "b.value": np.arange(60)}
+        )
+        expected = outer.merge(inner, left_on="a.key", right_on="b.key")
+        expected = expected.sort_values(["a.value", "b.value"], ignore_index=True)
+
+        predicate = type(
+            "AbstractExpression",
+            (),
+            {
+                "evaluate": lambda batch: Batch(
+                    pd.DataFrame(batch.frames["a.key"] == batch.frames["b.key"])
+                ),
+                "find_all": lambda expr: [],
+            },
+        )
+        # a budget of one byte spills the inner side, and reads the outer side in
+        # blocks of one batch
+        for memory_size in [2**28, 1]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                db = mock_db(
+                    {"nested_loop_join_memory_size": memory_size, "tmp_dir": tmp_dir}
+                )
+                join_executor = NestedLoopJoinExecutor(
+                    db, NestedLoopJoinPlan(JoinType.INNER_JOIN, predicate)
+                )
+                outer_executor = CountingExecutor(
+                    [Batch(outer.iloc[idx : idx + 10]) for idx in range(0, 50, 10)]
+                )
+                inner_executor = CountingExecutor(
+                    [Batch(inner.iloc[idx : idx + 20]) for idx in range(0, 60, 20)]
+                )
+                join_executor.append_child(outer_executor)
+                join_executor.append_child(inner_executor)
+
+                actual = Batch.concat(join_executor.exec()).frames
+                actual = actual.sort_values(["a.value", "b.value"], ignore_index=True)
+
+                pd.testing.assert_frame_equal(actual, expected)
+                self.assertEqual(outer_executor.num_scans, 1)
+                self.assertEqual(inner_executor.num_scans, 1)
@@ -12,12 +12,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import tempfile
 import unittest
-from test.unit_tests.executor.utils import DummyExecutor
+from test.unit_tests.executor.utils import DummyExecutor, mock_db
 
 import numpy as np
 import pandas as pd
-from mock import MagicMock
+from mock import patch
 
 from evadb.executor.orderby_executor import OrderByExecutor
 from evadb.expression.tuple_value_expression import TupleValueExpression
@@ -58,7 +60,7 @@ class OrderByExecutorTest(unittest.TestCase):
             ]
         )
 
-        orderby_executor = OrderByExecutor(MagicMock(), plan)
+        orderby_executor = OrderByExecutor(mock_db(), plan)
         orderby_executor.append_child(DummyExecutor(batches))
 
         sorted_batches = list(orderby_executor.exec())
@@ -87,3 +89,57 @@ class OrderByExecutorTest(unittest.TestCase):
         self.assertEqual(expected_batches[0], sorted_batches[0])
         self.assertEqual(expected_batches[1], sorted_batches[1])
         self.assertEqual(expected_batches[2], sorted_batches[2])
+
+    def test_should_merge_sorted_runs_beyond_memory_size(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {"A": rng.integers(0, 10, 500), "B": rng.random(500), "C": np.arange(500)}
+        )
+        batches = [Batch(df.iloc[idx : idx + 50]) for idx in range(0, 500, 50)]
+        plan = OrderByPlan(
+            [
+                (TupleValueExpression(col_alias="A"), ParserOrderBySortType.DESC),
+                (TupleValueExpression(col_alias="B"), ParserOrderBySortType.ASC),
+            ]
+        )
+        expected = df.sort_values(
+            ["A", "B"], ascending=[False, True], ignore_index=True
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # a budget of one byte spills every batch as a sorted run
+            db = mock_db({"sort_memory_size": 1, "tmp_dir": tmp_dir})
+            orderby_executor = OrderByExecutor(db, plan)
+            orderby_executor.append_child(DummyExecutor(batches))
+            actual = Batch.concat(orderby_executor.exec()).frames
+            # the runs are removed once the rows are merged
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_should_merge_runs_in_several_passes(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"A": rng.random(500), "C": np.arange(500)})
+        batches = [Batch(df.iloc[idx : idx + 25]) for idx in range(0, 500, 25)]
+        plan = OrderByPlan(
+            [(TupleValueExpression(col_alias="A"), ParserOrderBySortType.ASC)]
+        )
+        expected = df.sort_values(["A"], ignore_index=True)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = mock_db({"sort_memory_size": 1, "tmp_dir": tmp_dir})
+            orderby_executor = OrderByExecutor(db, plan)
+            orderby_executor.append_child(DummyExecutor(batches))
+            # the 20 runs are merged 3 at a time
+            with patch("evadb.executor.orderby_executor.MERGE_FAN_IN", 3), patch.object(
+                orderby_executor,
+                "_merge_runs",
+                wraps=orderby_executor._merge_runs,
+            ) as merge_runs:
+                actual = Batch.concat(orderby_executor.exec()).frames
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+        pd.testing.assert_frame_equal(actual, expected)
+        num_runs = [len(call.args[0]) for call in merge_runs.call_args_list]
+        self.assertLessEqual(max(num_runs), 3)
+        self.assertEqual(num_runs[-1], 3)
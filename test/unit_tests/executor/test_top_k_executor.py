@@ -0,0 +1,63 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.unit_tests.executor.utils import DummyExecutor, mock_db
+
+import numpy as np
+import pandas as pd
+
+from evadb.executor.top_k_executor import TopKExecutor
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.parser.types import ParserOrderBySortType
+from evadb.plan_nodes.top_k_plan import TopKPlan
+
+
+class TopKExecutorTest(unittest.TestCase):
+    def _top_k(self, batches, limit):
+        plan = TopKPlan(
+            [
+                (TupleValueExpression(col_alias="A"), ParserOrderBySortType.ASC),
+                (TupleValueExpression(col_alias="B"), ParserOrderBySortType.DESC),
+            ],
+            ConstantValueExpression(limit),
+        )
+        top_k_executor = TopKExecutor(mock_db(), plan)
+        top_k_executor.append_child(DummyExecutor(batches))
+        return list(top_k_executor.exec())
+
+    def test_should_return_first_rows_of_the_order(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {"A": rng.integers(0, 10, 300), "B": rng.random(300), "C": np.arange(300)}
+        )
+        batches = [Batch(df.iloc[idx : idx + 40]) for idx in range(0, 300, 40)]
+        expected = df.sort_values(
+            ["A", "B"], ascending=[True, False], ignore_index=True
+        )
+
+        for limit in [1, 7, 300, 1000]:
+            top_batches = self._top_k(batches, limit)
+            self.assertEqual(len(top_batches), 1)
+            pd.testing.assert_frame_equal(
+                top_batches[0].frames.reset_index(drop=True), expected.iloc[:limit]
+            )
+
+    def test_should_return_nothing_for_zero_limit_or_empty_input(self):
+        df = pd.DataFrame({"A": [2, 1], "B": [0.5, 0.1]})
+        self.assertEqual(self._top_k([Batch(df)], 0), [])
+        self.assertEqual(self._top_k([], 5), [])
+        self.assertEqual(self._top_k([Batch(pd.DataFrame())], 5), [])
@@ -12,11 +12,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List
+from typing import Dict, List
+
+from mock import MagicMock
 
 from evadb.models.storage.batch import Batch
 
 
+def mock_db(config: Dict = None) -> MagicMock:
+    """MagicMock database returning the values of config as its configuration,
+    and the defaults otherwise"""
+    config = config or {}
+    db = MagicMock()
+    db.catalog().get_configuration_catalog_value.side_effect = (
+        lambda key, default=None: config.get(key, default)
+    )
+    return db
+
+
 class DummyExecutor:
     def __init__(self, batch_list: List[Batch]):
         self.batch_list = batch_list
@@ -24,3 +37,13 @@ class DummyExecutor:
     def exec(self):
         for batch in self.batch_list:
             yield batch
+
+
+class CountingExecutor(DummyExecutor):
+    """DummyExecutor counting the times its batches are read"""
+
+    num_scans = 0
+
+    def exec(self):
+        self.num_scans += 1
+        yield from super().exec()
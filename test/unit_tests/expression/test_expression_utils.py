@@ -15,6 +15,8 @@
 import unittest
 from unittest.mock import Mock
 
+from sqlalchemy import Column, Integer, MetaData, Table
+
 from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.arithmetic_expression import ArithmeticExpression
 from evadb.expression.comparison_expression import ComparisonExpression
@@ -25,6 +27,8 @@ from evadb.expression.expression_utils import (
     extract_range_list_from_comparison_expr,
     extract_range_list_from_predicate,
     is_simple_predicate,
+    is_sql_compatible_predicate,
+    to_sqlalchemy_filter_clause,
 )
 from evadb.expression.logical_expression import LogicalExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
@@ -179,6 +183,37 @@ class ExpressionUtilsTest(unittest.TestCase):
         )
         self.assertFalse(is_simple_predicate(expr))
 
+    def test_is_sql_compatible_predicate(self):
+        expr = LogicalExpression(
+            ExpressionType.LOGICAL_OR,
+            self.gen_cmp_expr(10, ExpressionType.COMPARE_GREATER, "x"),
+            self.gen_cmp_expr(10, ExpressionType.COMPARE_NEQ, "y"),
+        )
+        self.assertTrue(is_sql_compatible_predicate(expr))
+
+        expr = self.gen_cmp_expr(10, ExpressionType.COMPARE_CONTAINS)
+        self.assertFalse(is_sql_compatible_predicate(expr))
+
+        expr = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            ArithmeticExpression(ExpressionType.AGGREGATION_COUNT, Mock(), Mock()),
+            ConstantValueExpression(10),
+        )
+        self.assertFalse(is_sql_compatible_predicate(expr))
+
+    def test_to_sqlalchemy_filter_clause(self):
+        table = Table("T", MetaData(), Column("X", Integer), Column("y", Integer))
+        expr = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            self.gen_cmp_expr(10, ExpressionType.COMPARE_GREATER, "x"),
+            self.gen_cmp_expr(20, ExpressionType.COMPARE_LEQ, "y", const_first=True),
+        )
+        clause = to_sqlalchemy_filter_clause(expr, table)
+        self.assertEqual(
+            str(clause.compile(compile_kwargs={"literal_binds": True})),
+            '"T"."X" > 10 AND "T".y >= 20',
+        )
+
     def test_and_(self):
         expr1 = self.gen_cmp_expr(10)
         expr2 = self.gen_cmp_expr(20)
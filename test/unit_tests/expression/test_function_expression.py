@@ -12,16 +12,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import tempfile
 import unittest
 
+import numpy as np
 import pandas as pd
 from mock import MagicMock, Mock, patch
 
 from evadb.constants import NO_GPU
-from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.function_expression import (
+    FunctionExpression,
+    FunctionExpressionCache,
+)
 from evadb.functions.gpu_compatible import GPUCompatible
 from evadb.models.storage.batch import Batch
 from evadb.parser.alias import Alias
+from evadb.utils.kv_cache import DiskKVCache, hash_keys
 
 
 class FunctionExpressionTest(unittest.TestCase):
@@ -67,3 +73,51 @@ class FunctionExpressionTest(unittest.TestCase):
         input_batch = Batch(frames=pd.DataFrame())
         expression.evaluate(input_batch)
         mock_function.assert_called()
+
+    def test_should_only_call_function_for_cache_misses(self):
+        def square(frames):
+            return pd.DataFrame({"square": frames["id"] ** 2})
+
+        mock_function = MagicMock(side_effect=square)
+        child = MagicMock()
+        expression = FunctionExpression(
+            lambda: mock_function,
+            name="test",
+            alias=Alias("func_expr"),
+            children=[child],
+        )
+        expression.function_obj = MagicMock()
+        expression.function_obj.outputs = [MagicMock()]
+        expression.function_obj.outputs[0].name = "square"
+        expression.projection_columns = ["square"]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            expression.enable_cache(
+                FunctionExpressionCache(key=(), store=DiskKVCache(cache_dir))
+            )
+            child.evaluate.return_value = Batch(pd.DataFrame({"id": [1, 2, 3]}))
+            expression.evaluate(Batch(pd.DataFrame({"id": [1, 2, 3]})))
+
+            child.evaluate.return_value = Batch(pd.DataFrame({"id": [2, 3, 4]}))
+            result = expression.evaluate(Batch(pd.DataFrame({"id": [2, 3, 4]})))
+
+        self.assertEqual(list(mock_function.call_args[0][0]["id"]), [4])
+        self.assertEqual(list(result.frames["func_expr.square"]), [4, 9, 16])
+        self.assertEqual(expression._stats.cache_misses, 4)
+        self.assertEqual(expression._stats.cache_hits, 2)
+        self.assertEqual(expression._stats.cache_hit_rate, 2 / 6)
+
+    def test_hash_keys_should_be_stable_and_hash_arrays_by_content(self):
+        keys = pd.DataFrame(
+            {
+                "id": [1, 2, 1],
+                "data": [np.zeros((2, 2)), np.ones((2, 2)), np.zeros((2, 2))],
+            }
+        )
+        hashed = hash_keys(keys)
+        self.assertEqual(hashed[0], hashed[2])
+        self.assertNotEqual(hashed[0], hashed[1])
+        self.assertEqual(hashed, hash_keys(keys.copy()))
+        # same content with a different shape is a different key
+        keys["data"] = [np.zeros(4), np.ones((2, 2)), np.zeros((2, 2))]
+        self.assertNotEqual(hash_keys(keys)[0], hashed[0])
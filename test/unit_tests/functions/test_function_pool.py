@@ -0,0 +1,120 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import unittest
+
+from mock import MagicMock, patch
+
+from evadb.functions.function_pool import FunctionPool
+
+
+class FunctionPoolTest(unittest.TestCase):
+    def setUp(self):
+        # every instance grows the process memory by 100 bytes
+        memory = iter(range(0, 10000, 100))
+        patcher = patch(
+            "evadb.functions.function_pool._get_process_memory",
+            side_effect=lambda: next(memory),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_should_reuse_warm_instances(self):
+        pool = FunctionPool()
+        pool.resize(1000)
+        factory = MagicMock(side_effect=object)
+        first = pool.get(("f", "cpu"), "f", "cpu", factory)
+        second = pool.get(("f", "cpu"), "f", "cpu", factory)
+        self.assertIs(first, second)
+        factory.assert_called_once()
+
+        # a different device is a different instance
+        pool.get(("f", "gpu"), "f", "gpu", factory)
+        self.assertEqual(factory.call_count, 2)
+        self.assertEqual(
+            pool.display_format(),
+            [
+                {
+                    "name": "f",
+                    "warm_instances": 2,
+                    "memory_size": 200,
+                    "loads": 2,
+                    "hits": 1,
+                    "evictions": 0,
+                }
+            ],
+        )
+
+    def test_should_evict_least_recently_used_instances(self):
+        pool = FunctionPool()
+        pool.resize(200)
+        pool.get("a", "a", "cpu", object)
+        pool.get("b", "b", "cpu", object)
+        pool.get("a", "a", "cpu", object)
+        pool.get("c", "c", "cpu", object)
+        stats = {entry["name"]: entry for entry in pool.display_format()}
+        self.assertEqual(stats["a"]["warm_instances"], 1)
+        self.assertEqual(stats["b"]["warm_instances"], 0)
+        self.assertEqual(stats["b"]["evictions"], 1)
+        self.assertEqual(stats["c"]["warm_instances"], 1)
+
+        # disabling the pool drops every instance
+        pool.resize(0)
+        self.assertTrue(
+            all(entry["warm_instances"] == 0 for entry in pool.display_format())
+        )
+
+    def test_should_invalidate_instances_of_function(self):
+        pool = FunctionPool()
+        pool.resize(1000)
+        factory = MagicMock(side_effect=object)
+        pool.get(("f", "props"), "MyFunc", "cpu", factory)
+        pool.invalidate("myfunc")
+        pool.get(("f", "props"), "MyFunc", "cpu", factory)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_should_serve_warm_instances_while_loading_another_function(self):
+        pool = FunctionPool()
+        pool.resize(1000)
+        warm = pool.get("a", "a", "cpu", object)
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_factory():
+            loading.set()
+            release.wait(5)
+            return object()
+
+        loader = threading.Thread(target=pool.get, args=("b", "b", "cpu", slow_factory))
+        loader.start()
+        self.assertTrue(loading.wait(5))
+        # the pool is not locked while the other function is loading
+        self.assertIs(pool.get("a", "a", "cpu", object), warm)
+        release.set()
+        loader.join()
+
+    def test_should_load_an_instance_once_for_concurrent_queries(self):
+        pool = FunctionPool()
+        pool.resize(1000)
+        factory = MagicMock(side_effect=object)
+        threads = [
+            threading.Thread(target=pool.get, args=("a", "a", "cpu", factory))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        factory.assert_called_once()
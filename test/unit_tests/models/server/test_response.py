@@ -15,7 +15,11 @@
 import unittest
 from test.util import create_dataframe
 
+import numpy as np
+import pandas as pd
+
 from evadb.models.server.response import Response, ResponseStatus
+from evadb.models.server.wire_format import unpack
 from evadb.models.storage.batch import Batch
 
 
@@ -25,3 +29,79 @@ class ResponseTest(unittest.TestCase):
         response = Response(status=ResponseStatus.SUCCESS, batch=batch)
         response2 = Response.deserialize(response.serialize())
         self.assertEqual(response, response2)
+
+    def test_should_encode_columns_in_contiguous_buffers(self):
+        frames = pd.DataFrame(
+            {
+                "id": np.arange(4),
+                "label": ["person", "bicycle", "", "café"],
+                "data": [np.full((2, 3, 3), idx, dtype=np.uint8) for idx in range(4)],
+                "bboxes": [[1, 2], None, "x", 3.0],
+            }
+        )
+        response = Response(
+            status=ResponseStatus.SUCCESS,
+            batch=Batch(frames),
+            query_time=0.5,
+            has_more=True,
+        )
+        message = response.serialize()
+
+        header, buffers = unpack(message)
+        self.assertEqual(
+            [column["kind"] for column in header["batch"]["columns"]],
+            ["numpy", "string", "tensor", "pickle"],
+        )
+
+        response2 = Response.deserialize(message)
+        self.assertEqual(response2.query_time, 0.5)
+        self.assertTrue(response2.has_more)
+        decoded = response2.batch.frames
+        self.assertEqual(list(decoded.columns), list(frames.columns))
+        self.assertEqual(list(decoded["id"]), list(frames["id"]))
+        self.assertEqual(list(decoded["label"]), list(frames["label"]))
+        self.assertEqual(list(decoded["bboxes"]), list(frames["bboxes"]))
+        for cell, expected in zip(decoded["data"], frames["data"]):
+            np.testing.assert_array_equal(cell, expected)
+            # the cells are views into the message
+            self.assertTrue(np.shares_memory(cell, buffers[3]))
+
+    def test_should_decode_writable_frames_from_immutable_messages(self):
+        frames = pd.DataFrame(
+            {
+                "a": np.arange(3),
+                "label": ["a", "lone \udc80 surrogate", "b"],
+                "data": [np.zeros((2, 2), dtype=np.float32) for _ in range(3)],
+            }
+        )
+        response = Response(status=ResponseStatus.SUCCESS, batch=Batch(frames))
+        message = bytes(response.serialize())
+        self.assertEqual(
+            [column["kind"] for column in unpack(message)[0]["batch"]["columns"]],
+            ["numpy", "string", "tensor"],
+        )
+
+        decoded = Response.deserialize(message).batch.frames
+        self.assertEqual(list(decoded["label"]), list(frames["label"]))
+        decoded.loc[0, "a"] = 5
+        decoded["data"][0][0, 0] = 1.0
+        self.assertEqual(list(decoded["a"]), [5, 1, 2])
+        self.assertEqual(decoded["data"][0][0, 0], 1.0)
+
+    def test_should_keep_the_index_of_the_batch(self):
+        frames = create_dataframe(4)
+        frames = frames[frames["id"] % 2 == 0]
+        response = Response(status=ResponseStatus.SUCCESS, batch=Batch(frames))
+        response2 = Response.deserialize(response.serialize())
+        self.assertEqual(list(response2.batch.frames.index), [1, 3])
+        self.assertEqual(response, response2)
+
+    def test_should_serialize_responses_without_batch(self):
+        for response in [
+            Response(status=ResponseStatus.FAIL, error="error"),
+            Response(status=ResponseStatus.SUCCESS, batch=Batch()),
+        ]:
+            self.assertEqual(response, Response.deserialize(response.serialize()))
+
+        with self.assertRaises(ValueError):
+            Response.deserialize(b"not a response")
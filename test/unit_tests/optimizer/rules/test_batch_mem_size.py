@@ -55,4 +55,12 @@ class BatchMemSizeTest(unittest.TestCase):
         with patch.object(SQLStorageEngine, "read") as mock_read:
             mock_read.__iter__.return_value = []
             execute_query_fetch_all(self.evadb, select_table_query)
-            mock_read.assert_called_with(ANY, test_batch_mem_size)
+            mock_read.assert_called_with(
+                ANY,
+                test_batch_mem_size,
+                columns=ANY,
+                offset=ANY,
+                limit=ANY,
+                total_shards=ANY,
+                curr_shard=ANY,
+            )
@@ -20,19 +20,31 @@ from mock import MagicMock, patch
 
 from evadb.catalog.catalog_type import TableType
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
+    LogicalApplyAndMerge,
     LogicalFilter,
     LogicalGet,
     LogicalJoin,
+    LogicalLimit,
+    LogicalProject,
     LogicalSample,
 )
 from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInApply,
     CacheFunctionExpressionInFilter,
     CacheFunctionExpressionInProject,
+    CombineOrderByAndLimitToTopK,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedLimitIntoGet,
     EmbedSampleIntoGet,
+    LogicalApplyAndMergeToLocalPhysical,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
     LogicalCreateFromSelectToPhysical,
@@ -58,10 +70,12 @@ from evadb.optimizer.rules.rules import (
     LogicalLoadToPhysical,
     LogicalOrderByToPhysical,
     LogicalProjectNoTableToPhysical,
+    LogicalProjectToLocalPhysical,
     LogicalProjectToPhysical,
     LogicalProjectToRayPhysical,
     LogicalRenameToPhysical,
     LogicalShowToPhysical,
+    LogicalTopKToPhysical,
     LogicalUnionToPhysical,
     LogicalVectorIndexScanToPhysical,
     Promise,
@@ -75,6 +89,7 @@ from evadb.optimizer.rules.rules import (
 )
 from evadb.optimizer.rules.rules_manager import RulesManager, disable_rules
 from evadb.parser.types import JoinType
+from evadb.plan_nodes.types import PlanOprType
 from evadb.server.command_handler import execute_query_fetch_all
 from evadb.utils.generic_utils import is_ray_enabled_and_installed
 
@@ -100,10 +115,12 @@ class RulesTest(unittest.TestCase):
             Promise.LOGICAL_INNER_JOIN_COMMUTATIVITY,
             Promise.EMBED_FILTER_INTO_GET,
             Promise.EMBED_SAMPLE_INTO_GET,
+            Promise.EMBED_LIMIT_INTO_GET,
             Promise.XFORM_LATERAL_JOIN_TO_LINEAR_FLOW,
             Promise.PUSHDOWN_FILTER_THROUGH_JOIN,
             Promise.PUSHDOWN_FILTER_THROUGH_APPLY_AND_MERGE,
             Promise.COMBINE_SIMILARITY_ORDERBY_AND_LIMIT_TO_VECTOR_INDEX_SCAN,
+            Promise.COMBINE_ORDERBY_AND_LIMIT_TO_TOP_K,
             Promise.REORDER_PREDICATES,
             Promise.XFORM_EXTRACT_OBJECT_TO_LINEAR_FLOW,
         ]
@@ -118,6 +135,7 @@ class RulesTest(unittest.TestCase):
             Promise.LOGICAL_GROUPBY_TO_PHYSICAL,
             Promise.LOGICAL_ORDERBY_TO_PHYSICAL,
             Promise.LOGICAL_LIMIT_TO_PHYSICAL,
+            Promise.LOGICAL_TOP_K_TO_PHYSICAL,
             Promise.LOGICAL_INSERT_TO_PHYSICAL,
             Promise.LOGICAL_DELETE_TO_PHYSICAL,
             Promise.LOGICAL_RENAME_TO_PHYSICAL,
@@ -160,10 +178,12 @@ class RulesTest(unittest.TestCase):
             EmbedFilterIntoGet(),
             #    EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedLimitIntoGet(),
             XformLateralJoinToLinearFlow(),
             PushDownFilterThroughApplyAndMerge(),
             PushDownFilterThroughJoin(),
             CombineSimilarityOrderByAndLimitToVectorIndexScan(),
+            CombineOrderByAndLimitToTopK(),
             ReorderPredicates(),
             XformExtractObjectToLinearFlow(),
         ]
@@ -223,6 +243,7 @@ class RulesTest(unittest.TestCase):
             LogicalGroupByToPhysical(),
             LogicalOrderByToPhysical(),
             LogicalLimitToPhysical(),
+            LogicalTopKToPhysical(),
             LogicalJoinToPhysicalNestedLoopJoin(),
             LogicalLateralJoinToPhysical(),
             LogicalFunctionScanToPhysical(),
@@ -276,6 +297,93 @@ class RulesTest(unittest.TestCase):
 
         self.assertFalse(rule.check(logi_sample, MagicMock()))
 
+    def test_embed_limit_into_get(self):
+        rule = EmbedLimitIntoGet()
+
+        table_obj = TableCatalogEntry(
+            name="foo", table_type=TableType.STRUCTURED_DATA, file_url=MagicMock()
+        )
+
+        logi_get = LogicalGet(MagicMock(), table_obj, MagicMock(), MagicMock())
+        logi_limit = LogicalLimit(ConstantValueExpression(10), children=[logi_get])
+
+        self.assertTrue(rule.check(logi_limit, MagicMock()))
+        rewrite_opr = next(rule.apply(logi_limit, MagicMock()))
+        self.assertEqual(rewrite_opr.limit_count, logi_limit.limit_count)
+        self.assertEqual(rewrite_opr.children[0].limit, 10)
+        # the limit is embedded only once
+        self.assertFalse(rule.check(rewrite_opr, MagicMock()))
+
+    @patch("evadb.optimizer.rules.rules.is_sql_pushdown_supported")
+    def test_embed_filter_into_native_get(self, mock_pushdown_supported):
+        mock_pushdown_supported.return_value = True
+        rule = EmbedFilterIntoGet()
+
+        table_obj = TableCatalogEntry(
+            name="foo",
+            table_type=TableType.NATIVE_DATA,
+            file_url=MagicMock(),
+            database_name="bar",
+        )
+        sql_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression(name="id"),
+            ConstantValueExpression(1),
+        )
+        func_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            FunctionExpression(MagicMock(), name="foo"),
+            ConstantValueExpression(1),
+        )
+        predicate = LogicalExpression(ExpressionType.LOGICAL_AND, sql_pred, func_pred)
+        logi_get = LogicalGet(MagicMock(), table_obj, MagicMock())
+        logi_filter = LogicalFilter(predicate, [logi_get])
+
+        self.assertTrue(rule.check(logi_filter, MagicMock()))
+        rewrite_opr = next(rule.apply(logi_filter, MagicMock()))
+        self.assertEqual(rewrite_opr.predicate, func_pred)
+        self.assertEqual(rewrite_opr.children[0].predicate, sql_pred)
+
+    @patch("evadb.optimizer.rules.rules.get_exchange_parallelism")
+    def test_local_exchange_rules(self, mock_parallelism):
+        rules_manager = RulesManager({"local_exchange": True})
+        for rule in [
+            LogicalProjectToLocalPhysical(),
+            LogicalApplyAndMergeToLocalPhysical(),
+        ]:
+            self.assertTrue(
+                any(
+                    isinstance(rule, type(x))
+                    for x in rules_manager.implementation_rules
+                )
+            )
+
+        func_expr = FunctionExpression(MagicMock(), name="foo")
+        logi_project = LogicalProject([func_expr], children=[MagicMock()])
+        logi_apply = LogicalApplyAndMerge(
+            func_expr, MagicMock(), children=[MagicMock()]
+        )
+        for rule, logi_opr, opr_type in [
+            (LogicalProjectToLocalPhysical(), logi_project, PlanOprType.PROJECT),
+            (
+                LogicalApplyAndMergeToLocalPhysical(),
+                logi_apply,
+                PlanOprType.APPLY_AND_MERGE,
+            ),
+        ]:
+            # the cheap functions are evaluated in the process of the query
+            mock_parallelism.return_value = 1
+            plan = next(rule.apply(logi_opr, MagicMock()))
+            self.assertEqual(plan.opr_type, opr_type)
+
+            mock_parallelism.return_value = 4
+            plan = next(rule.apply(logi_opr, MagicMock()))
+            self.assertEqual(plan.opr_type, PlanOprType.EXCHANGE)
+            self.assertEqual(plan.parallelism, 4)
+            self.assertFalse(plan.use_ray)
+            self.assertEqual(plan.inner_plan.opr_type, opr_type)
+            self.assertEqual(plan.children, logi_opr.children)
+
     def test_disable_rules(self):
         rules_manager = RulesManager()
         with disable_rules(rules_manager, [PushDownFilterThroughApplyAndMerge()]):
@@ -14,8 +14,16 @@
 # limitations under the License.
 import unittest
 
+from mock import MagicMock, patch
+
 from evadb.catalog.catalog_type import ColumnType, NdArrayType
-from evadb.optimizer.optimizer_utils import column_definition_to_function_io
+from evadb.catalog.models.utils import FunctionCostCatalogEntry
+from evadb.expression.function_expression import FunctionExpression
+from evadb.optimizer.optimizer_utils import (
+    column_definition_to_function_io,
+    get_exchange_parallelism,
+    get_expression_execution_cost,
+)
 from evadb.parser.create_statement import ColumnDefinition
 
 
@@ -45,3 +53,37 @@ class OptimizerUtilsTest(unittest.TestCase):
             self.assertEqual(io.array_dimensions, (None, None, None))
             self.assertEqual(io.is_input, True)
             self.assertEqual(io.function_id, None)
+
+    def test_expression_cost_should_account_for_cache_hit_rate(self):
+        context = MagicMock()
+        context.db.catalog().get_function_cost_catalog_entry.return_value = (
+            FunctionCostCatalogEntry("test", cost=10.0, cache_hit_rate=0.75)
+        )
+        func_expr = FunctionExpression(MagicMock(), name="test")
+        self.assertEqual(get_expression_execution_cost(context, func_expr), 10.0)
+
+        func_expr.enable_cache(MagicMock())
+        self.assertEqual(get_expression_execution_cost(context, func_expr), 2.5)
+
+    def test_exchange_parallelism_should_follow_function_cost(self):
+        context = MagicMock()
+        func_expr = FunctionExpression(MagicMock(), name="test")
+        with patch("evadb.optimizer.optimizer_utils.os.cpu_count", return_value=8):
+            for cost, parallelism in [(0.0001, 1), (0.003, 3), (10.0, 8)]:
+                context.db.catalog().get_function_cost_catalog_entry.return_value = (
+                    FunctionCostCatalogEntry("test", cost=cost)
+                )
+                self.assertEqual(
+                    get_exchange_parallelism(context, [func_expr]), parallelism
+                )
+
+    def test_exchange_parallelism_should_use_default_without_function_cost(self):
+        context = MagicMock()
+        context.db.catalog().get_function_cost_catalog_entry.return_value = None
+        func_expr = FunctionExpression(MagicMock(), name="test")
+        with patch("evadb.optimizer.optimizer_utils.os.cpu_count", return_value=8):
+            self.assertEqual(get_exchange_parallelism(context, [func_expr]), 1)
+            self.assertEqual(
+                get_exchange_parallelism(context, [func_expr], default_parallelism=2),
+                2,
+            )
@@ -0,0 +1,89 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from mock import MagicMock
+
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.function_expression import (
+    FunctionExpression,
+    FunctionExpressionCache,
+)
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.optimizer.plan_cache import PlanCache, normalize_query
+from evadb.plan_nodes.project_plan import ProjectPlan
+
+
+class PlanCacheTest(unittest.TestCase):
+    def test_should_normalize_whitespace_outside_literals(self):
+        self.assertEqual(
+            normalize_query("SELECT  id,\n name FROM MyVideo\tWHERE label = 'a  b';"),
+            "SELECT id, name FROM MyVideo WHERE label = 'a  b'",
+        )
+        self.assertEqual(
+            normalize_query('  SELECT "x  y"  FROM `My  Table` ; '),
+            'SELECT "x  y" FROM `My  Table`',
+        )
+
+    def _plan(self):
+        store = MagicMock()
+        func_expr = FunctionExpression(
+            lambda: object(), "f", children=[ConstantValueExpression(1)]
+        ).enable_cache(FunctionExpressionCache((TupleValueExpression("id"),), store))
+        return ProjectPlan([func_expr])
+
+    def test_should_serve_plan_of_the_same_catalog_version(self):
+        cache = PlanCache(max_size=2)
+        plan = self._plan()
+        cache.put("query", 1, plan)
+        self.assertEqual(cache.get("query", 1).target_list, plan.target_list)
+        # the catalog changed since the plan was optimized
+        self.assertIsNone(cache.get("query", 2))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_should_execute_a_copy_of_the_cached_plan(self):
+        cache = PlanCache(max_size=2)
+        plan = self._plan()
+        func_expr = plan.target_list[0]
+        func_expr._gpu_enabled_function()
+        func_expr._stats.num_calls = 10
+        cache.put("query", 0, plan)
+
+        first, second = cache.get("query", 0), cache.get("query", 0)
+        self.assertIsNot(first, plan)
+        self.assertIsNot(first, second)
+        first_expr, second_expr = first.target_list[0], second.target_list[0]
+        # each copy loads its own function instance and collects its own stats
+        self.assertIsNone(first_expr._function_instance)
+        self.assertIsNot(first_expr._stats, second_expr._stats)
+        self.assertEqual(first_expr._stats.num_calls, 0)
+        self.assertIsNot(first_expr.children[0], second_expr.children[0])
+        # but shares the function and its cache store
+        self.assertIs(first_expr.function, func_expr.function)
+        self.assertIs(first_expr._cache.store, func_expr._cache.store)
+
+    def test_should_evict_least_recently_used_plans(self):
+        cache = PlanCache(max_size=2)
+        for query in ["q1", "q2"]:
+            cache.put(query, 0, MagicMock())
+        cache.get("q1", 0)
+        cache.put("q3", 0, MagicMock())
+        self.assertIsNone(cache.get("q2", 0))
+        self.assertIsNotNone(cache.get("q1", 0))
+
+        cache.resize(0)
+        self.assertEqual(len(cache), 0)
+        cache.put("q1", 0, MagicMock())
+        self.assertEqual(len(cache), 0)
@@ -43,6 +43,7 @@ from evadb.optimizer.operators import (
     LogicalRename,
     LogicalSample,
     LogicalShow,
+    LogicalTopK,
     LogicalUnion,
     LogicalVectorIndexScan,
     Operator,
@@ -72,6 +73,7 @@ class StatementToOprTest(unittest.TestCase):
             table_ref.table.table_obj,
             "alias",
             chunk_params=table_ref.chunk_params,
+            column_list=None,
         )
         self.assertEqual(mock_lget.return_value, converter._plan)
 
@@ -306,6 +308,7 @@ statement_to_opr_converter.metadata_definition_to_function_metadata"
         query_derived_plan = LogicalQueryDerivedGet(MagicMock())
         load_plan = LogicalLoadData(MagicMock(), MagicMock(), MagicMock(), MagicMock())
         limit_plan = LogicalLimit(MagicMock())
+        top_k_plan = LogicalTopK(MagicMock(), MagicMock())
         rename_plan = LogicalRename(MagicMock(), MagicMock())
 
         explain_plan = LogicalExplain([MagicMock()])
@@ -340,6 +343,7 @@ statement_to_opr_converter.metadata_definition_to_function_metadata"
         plans.append(query_derived_plan)
         plans.append(load_plan)
         plans.append(limit_plan)
+        plans.append(top_k_plan)
         plans.append(rename_plan)
         plans.append(drop_plan)
         plans.append(get_plan)
@@ -22,6 +22,7 @@ from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.parameter_expression import ParameterExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.alias import Alias
 from evadb.parser.create_function_statement import CreateFunctionStatement
@@ -170,6 +171,24 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(actual_stmt, expected_stmt)
         self.assertEqual(actual_stmt.index_def, create_index_query)
 
+        # create index with index parameters
+        create_index_query = "CREATE INDEX testindex ON MyVideo (featCol) USING FAISS INDEX_FACTORY 'IVF64,PQ8' NPROBE 8;"
+        evadb_stmt_list = parser.parse(create_index_query)
+        expected_stmt = CreateIndexStatement(
+            "testindex",
+            False,
+            TableRef(TableInfo("MyVideo")),
+            [
+                ColumnDefinition("featCol", None, None, None),
+            ],
+            VectorStoreType.FAISS,
+            [TupleValueExpression(name="featCol")],
+            {"index_factory": "IVF64,PQ8", "nprobe": 8},
+        )
+        actual_stmt = evadb_stmt_list[0]
+        self.assertEqual(actual_stmt, expected_stmt)
+        self.assertEqual(actual_stmt.index_def, create_index_query)
+
     @unittest.skip("Skip parser exception handling testcase, moved to binder")
     def test_create_index_exception_statement(self):
         parser = Parser()
@@ -201,6 +220,38 @@ class ParserTests(unittest.TestCase):
         self.assertIsInstance(inner_stmt.from_table, TableRef)
         self.assertEqual(inner_stmt.from_table.table.table_name, "TAIPAI")
 
+    def test_prepared_statements(self):
+        parser = Parser()
+
+        prepare_query = """PREPARE myquery AS SELECT id, $1 FROM MyVideo
+                        WHERE id < $2 AND label = $1;"""
+        prepare_stmt = parser.parse(prepare_query)[0]
+        self.assertEqual(prepare_stmt.stmt_type, StatementType.PREPARE)
+        self.assertEqual(prepare_stmt.name, "myquery")
+        self.assertEqual(prepare_stmt.statement.stmt_type, StatementType.SELECT)
+        self.assertEqual(prepare_stmt.parameters.num_parameters, 2)
+        self.assertEqual(str(prepare_stmt.statement.target_list[1]), "$1")
+
+        # all the parameters of the statement are bound together
+        parameter = prepare_stmt.statement.where_clause.children[0].children[1]
+        self.assertIsInstance(parameter, ParameterExpression)
+        prepare_stmt.parameters.set([5, 10])
+        self.assertEqual(parameter.value, 10)
+        self.assertEqual(prepare_stmt.statement.target_list[1].value, 5)
+        prepare_stmt.parameters.clear()
+        with self.assertRaises(ValueError):
+            parameter.value
+
+        execute_stmt = parser.parse("EXECUTE myquery (5, 'car');")[0]
+        self.assertEqual(execute_stmt.stmt_type, StatementType.EXECUTE)
+        self.assertEqual(execute_stmt.name, "myquery")
+        self.assertEqual(execute_stmt.values, [5, "car"])
+        self.assertEqual(parser.parse("EXECUTE myquery;")[0].values, [])
+
+        deallocate_stmt = parser.parse("DEALLOCATE myquery;")[0]
+        self.assertEqual(deallocate_stmt.stmt_type, StatementType.DEALLOCATE)
+        self.assertEqual(deallocate_stmt.name, "myquery")
+
     def test_explain_ddl_statement(self):
         parser = Parser()
 
@@ -635,6 +686,20 @@ class ParserTests(unittest.TestCase):
             ConstantValueExpression("8 frames", v_type=ColumnType.TEXT),
         )
 
+    def test_select_statement_groupby_list(self):
+        parser = Parser()
+
+        select_query = "SELECT CLASS, COUNT(*) FROM TAIPAI GROUP BY CLASS, REDNESS;"
+
+        select_stmt = parser.parse(select_query)[0]
+
+        self.assertIsNone(select_stmt.groupby_clause)
+        self.assertEqual(
+            select_stmt.groupby_list,
+            [TupleValueExpression(name="CLASS"), TupleValueExpression(name="REDNESS")],
+        )
+        self.assertTrue(str(select_stmt).endswith("GROUP BY CLASS, REDNESS"))
+
     def test_select_statement_orderby_class(self):
         """Testing order by clause in select statement
         Class: SelectStatement"""
@@ -20,6 +20,7 @@ from test.util import (
     create_sample_video,
     file_remove,
 )
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -62,6 +63,35 @@ class DecordLoaderTest(unittest.TestCase):
             new_batches.append(batch.project(["id", "data", "seconds", "_row_number"]))
         return new_batches
 
+    def test_should_decode_every_frame_once(self):
+        video_loader = DecordReader(
+            file_url=self.video_file_url, batch_mem_size=3 * self.frame_size
+        )
+        with patch.object(
+            video_loader,
+            "_decode_video_frames",
+            wraps=video_loader._decode_video_frames,
+        ) as decode:
+            batches = list(video_loader.read())
+
+        self.assertEqual(sum(len(batch) for batch in batches), NUM_FRAMES)
+        decoded = sum(len(call.args[0]) for call in decode.call_args_list)
+        self.assertEqual(decoded, NUM_FRAMES)
+
+    def test_should_read_frame_ranges_of_the_video(self):
+        frame_ranges = [(0, 2), (3, NUM_FRAMES // 2), (NUM_FRAMES // 2 + 1, NUM_FRAMES)]
+        for k in range(1, 4):
+            frame_ids = []
+            for frame_range in frame_ranges:
+                video_loader = DecordReader(
+                    file_url=self.video_file_url,
+                    sampling_rate=k,
+                    frame_range=frame_range,
+                )
+                for batch in video_loader.read():
+                    frame_ids.extend(batch.frames["id"])
+            self.assertEqual(frame_ids, list(range(0, NUM_FRAMES, k)))
+
     def test_should_sample_only_iframe(self):
         for k in range(1, 10):
             video_loader = DecordReader(
@@ -152,6 +182,18 @@ class DecordLoaderTest(unittest.TestCase):
         )
         self.assertEqual(batches, expected)
 
+    def test_should_stop_reading_at_limit(self):
+        video_loader = DecordReader(
+            file_url=self.video_file_url,
+            batch_mem_size=self.frame_size * 2,
+            limit=5,
+        )
+        batches = list(video_loader.read())
+        expected = self._batches_to_reader_convertor(
+            create_dummy_batches(filters=range(5), batch_size=2, is_from_storage=True)
+        )
+        self.assertEqual(batches, expected)
+
     def test_should_sample_every_k_frame(self):
         for k in range(1, 10):
             video_loader = DecordReader(
@@ -14,10 +14,13 @@
 # limitations under the License.
 import asyncio
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import mock
+import pandas as pd
 
+from evadb.models.server.response import Response, ResponseStatus
+from evadb.models.storage.batch import Batch
 from evadb.server.command_handler import handle_request
 
 
@@ -36,3 +39,68 @@ class CommandHandlerTests(unittest.TestCase):
         request_message = "SELECT id FROM foo;"
 
         asyncio.run(handle_request(None, transport, request_message))
+
+    def _read_responses(self, transport):
+        # every response is written as a length prefix followed by the message
+        messages = [call.args[0] for call in transport.write.call_args_list]
+        return [Response.deserialize(message) for message in messages[1::2]]
+
+    def test_command_handler_streams_batches(self):
+        batches = [Batch(pd.DataFrame({"id": [i]})) for i in range(3)]
+        transport = mock.Mock()
+        transport.drain = AsyncMock()
+
+        with mock.patch(
+            "evadb.server.command_handler.execute_query_stream",
+            return_value=(batch for batch in batches),
+        ):
+            asyncio.run(handle_request(None, transport, "SELECT id FROM foo;"))
+
+        responses = self._read_responses(transport)
+        self.assertEqual([response.batch for response in responses], batches)
+        self.assertEqual(
+            [response.has_more for response in responses], [True, True, False]
+        )
+        self.assertIsNotNone(responses[-1].query_time)
+        # every batch but the last one waits for the client to catch up
+        self.assertEqual(transport.drain.await_count, 2)
+
+    def test_command_handler_reports_error_after_streamed_batches(self):
+        def failing_stream():
+            yield Batch(pd.DataFrame({"id": [0]}))
+            yield Batch(pd.DataFrame({"id": [1]}))
+            raise Exception("test_error")
+
+        transport = mock.Mock()
+        transport.drain = AsyncMock()
+        with mock.patch(
+            "evadb.server.command_handler.execute_query_stream",
+            return_value=failing_stream(),
+        ):
+            asyncio.run(handle_request(None, transport, "SELECT id FROM foo;"))
+
+        responses = self._read_responses(transport)
+        self.assertEqual([response.has_more for response in responses], [True, False])
+        self.assertEqual(responses[-1].status, ResponseStatus.FAIL)
+        self.assertEqual(responses[-1].error, "test_error")
+
+    def test_command_handler_reports_error_serializing_last_batch(self):
+        serialize = Response.serialize
+
+        def failing_serialize(response):
+            if response.batch is not None:
+                raise ValueError("cannot serialize the batch")
+            return serialize(response)
+
+        transport = mock.Mock()
+        transport.drain = AsyncMock()
+        with mock.patch(
+            "evadb.server.command_handler.execute_query_stream",
+            return_value=(batch for batch in [Batch(pd.DataFrame({"id": [0]}))]),
+        ), mock.patch.object(Response, "serialize", failing_serialize):
+            asyncio.run(handle_request(None, transport, "SELECT id FROM foo;"))
+
+        responses = self._read_responses(transport)
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(responses[0].status, ResponseStatus.FAIL)
+        self.assertEqual(responses[0].error, "cannot serialize the batch")
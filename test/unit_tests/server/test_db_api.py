@@ -18,10 +18,12 @@ import sys
 import unittest
 from test.util import suffix_pytest_xdist_worker_id_to_dir
 
+import pandas as pd
 from mock import MagicMock, patch
 
 from evadb.interfaces.relational.db import EvaDBCursor, connect_remote
-from evadb.models.server.response import Response
+from evadb.models.server.response import Response, ResponseStatus
+from evadb.models.storage.batch import Batch
 
 # Check for Python 3.8+ for IsolatedAsyncioTestCase support
 if sys.version_info >= (3, 8):
@@ -55,8 +57,8 @@ if sys.version_info >= (3, 8):
         def test_evadb_cursor_fetch_all_async(self):
             connection = AsyncMock()
             evadb_cursor = EvaDBCursor(connection)
-            message = "test_response"
-            serialized_message = Response.serialize("test_response")
+            message = Response(status=ResponseStatus.SUCCESS, error="test_response")
+            serialized_message = Response.serialize(message)
             serialized_message_length = b"%d" % len(serialized_message)
             connection._reader.readline.side_effect = [serialized_message_length]
             connection._reader.readexactly.side_effect = [serialized_message]
@@ -71,8 +73,8 @@ if sys.version_info >= (3, 8):
             connection = AsyncMock()
             evadb_cursor = EvaDBCursor(connection)
 
-            message = "test_response"
-            serialized_message = Response.serialize("test_response")
+            message = Response(status=ResponseStatus.SUCCESS, error="test_response")
+            serialized_message = Response.serialize(message)
             serialized_message_length = b"%d" % len(serialized_message)
             connection._reader.readline.side_effect = [serialized_message_length]
             connection._reader.readexactly.side_effect = [serialized_message]
@@ -81,6 +83,76 @@ if sys.version_info >= (3, 8):
             self.assertEqual(evadb_cursor._pending_query, False)
             self.assertEqual(message, response)
 
+        def _mock_responses(self, connection, responses):
+            messages = [Response.serialize(response) for response in responses]
+            connection._reader.readline.side_effect = [
+                b"%d" % len(message) for message in messages
+            ]
+            connection._reader.readexactly.side_effect = messages
+
+        def test_evadb_cursor_fetch_streamed_results(self):
+            connection = AsyncMock()
+            evadb_cursor = EvaDBCursor(connection)
+            batches = [Batch(pd.DataFrame({"id": [i, i + 1]})) for i in range(0, 6, 2)]
+            responses = [
+                Response(status=ResponseStatus.SUCCESS, batch=batch, has_more=True)
+                for batch in batches[:-1]
+            ]
+            responses.append(
+                Response(
+                    status=ResponseStatus.SUCCESS, batch=batches[-1], query_time=1.0
+                )
+            )
+
+            # fetch_one returns the batches one by one
+            self._mock_responses(connection, responses)
+            asyncio.run(evadb_cursor.execute_async("test_query"))
+            response = asyncio.run(evadb_cursor.fetch_one_async())
+            self.assertEqual(response.batch, batches[0])
+            self.assertTrue(evadb_cursor._pending_query)
+
+            # fetch_all returns the remaining batches
+            response = asyncio.run(evadb_cursor.fetch_all_async())
+            self.assertEqual(response.batch, Batch.concat(batches[1:]))
+            self.assertEqual(response.query_time, 1.0)
+            self.assertFalse(response.has_more)
+            self.assertFalse(evadb_cursor._pending_query)
+
+            # the error of a failed query is returned by fetch_all
+            self._mock_responses(
+                connection,
+                [
+                    responses[0],
+                    Response(status=ResponseStatus.FAIL, error="test_error"),
+                ],
+            )
+            asyncio.run(evadb_cursor.execute_async("test_query"))
+            response = asyncio.run(evadb_cursor.fetch_all_async())
+            self.assertEqual(response.status, ResponseStatus.FAIL)
+            self.assertEqual(response.error, "test_error")
+
+        def test_evadb_cursor_skips_results_of_stopped_query(self):
+            connection = AsyncMock()
+            evadb_cursor = EvaDBCursor(connection)
+            batches = [Batch(pd.DataFrame({"id": [i]})) for i in range(3)]
+            self._mock_responses(
+                connection,
+                [
+                    Response(
+                        status=ResponseStatus.SUCCESS, batch=batches[0], has_more=True
+                    ),
+                    Response(status=ResponseStatus.SUCCESS, batch=batches[1]),
+                    Response(status=ResponseStatus.SUCCESS, batch=batches[2]),
+                ],
+            )
+            asyncio.run(evadb_cursor.execute_async("test_query"))
+            asyncio.run(evadb_cursor.fetch_one_async())
+            evadb_cursor.stop_query()
+
+            asyncio.run(evadb_cursor.execute_async("test_query"))
+            response = asyncio.run(evadb_cursor.fetch_all_async())
+            self.assertEqual(response.batch, batches[2])
+
         def test_evadb_connection(self):
             hostname = "localhost"
 
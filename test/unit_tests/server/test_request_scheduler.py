@@ -0,0 +1,214 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+
+from evadb.models.server.response import Response, ResponseStatus
+from evadb.models.storage.batch import Batch
+from evadb.server.command_handler import handle_request
+from evadb.server.request_scheduler import RequestScheduler
+
+
+def _mock_writer():
+    client_writer = MagicMock()
+    client_writer.drain = AsyncMock()
+    return client_writer
+
+
+def _read_responses(client_writer):
+    # every response is written as a length prefix followed by the message
+    messages = [call.args[0] for call in client_writer.write.call_args_list]
+    return [Response.deserialize(message) for message in messages[1::2]]
+
+
+def _mock_evadb(timeout=0):
+    evadb = MagicMock()
+    evadb.catalog().get_configuration_catalog_value.return_value = timeout
+    return evadb
+
+
+class RequestSchedulerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_should_run_requests_of_a_client_in_order(self):
+        executed = []
+
+        async def mock_handle_request(evadb, client_writer, message, worker, timeout):
+            await asyncio.sleep(0.01 if message == "first" else 0)
+            executed.append(message)
+
+        scheduler = RequestScheduler(_mock_evadb(), 4, 8)
+        client_writer = _mock_writer()
+        with patch(
+            "evadb.server.request_scheduler.handle_request", mock_handle_request
+        ):
+            scheduler.submit(client_writer, "first")
+            scheduler.submit(client_writer, "second")
+            await asyncio.sleep(0.1)
+        self.assertEqual(executed, ["first", "second"])
+        self.assertEqual(scheduler.num_queued_requests, 0)
+        await scheduler.stop()
+
+    async def test_should_keep_serving_client_after_failed_request(self):
+        executed = []
+
+        async def mock_handle_request(evadb, client_writer, message, worker, timeout):
+            if message == "failing":
+                raise ConnectionError("failed to write the response")
+            executed.append(message)
+
+        scheduler = RequestScheduler(_mock_evadb(), 1, 8)
+        client_writer = _mock_writer()
+        with patch(
+            "evadb.server.request_scheduler.handle_request", mock_handle_request
+        ):
+            scheduler.submit(client_writer, "failing")
+            scheduler.submit(client_writer, "next")
+            await asyncio.sleep(0.1)
+        self.assertEqual(executed, ["next"])
+
+        responses = _read_responses(client_writer)
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(responses[0].status, ResponseStatus.FAIL)
+        self.assertEqual(responses[0].error, "failed to write the response")
+        await scheduler.stop()
+
+    async def test_should_bound_concurrent_requests(self):
+        running = 0
+        max_running = 0
+
+        async def mock_handle_request(evadb, client_writer, message, worker, timeout):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        scheduler = RequestScheduler(_mock_evadb(), 2, 8)
+        with patch(
+            "evadb.server.request_scheduler.handle_request", mock_handle_request
+        ):
+            for _ in range(5):
+                scheduler.submit(_mock_writer(), "query")
+            await asyncio.sleep(0.2)
+        self.assertEqual(max_running, 2)
+        await scheduler.stop()
+
+    async def test_should_reject_requests_beyond_the_queue_limit(self):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def mock_handle_request(evadb, client_writer, message, worker, timeout):
+            started.set()
+            await release.wait()
+
+        scheduler = RequestScheduler(_mock_evadb(), 1, 1)
+        client_writer = _mock_writer()
+        with patch(
+            "evadb.server.request_scheduler.handle_request", mock_handle_request
+        ):
+            scheduler.submit(client_writer, "running")
+            await started.wait()
+            scheduler.submit(client_writer, "queued")
+            scheduler.submit(client_writer, "rejected")
+            self.assertEqual(scheduler.num_queued_requests, 1)
+
+            release.set()
+            await asyncio.sleep(0.05)
+
+        # the rejection is sent after the responses of the earlier requests
+        responses = _read_responses(client_writer)
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(responses[0].status, ResponseStatus.FAIL)
+        self.assertIn("Server is busy", responses[0].error)
+        await scheduler.stop()
+
+    async def test_should_cancel_requests_of_removed_client(self):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def mock_handle_request(evadb, client_writer, message, worker, timeout):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        scheduler = RequestScheduler(_mock_evadb(), 1, 8)
+        client_writer = _mock_writer()
+        with patch(
+            "evadb.server.request_scheduler.handle_request", mock_handle_request
+        ):
+            scheduler.submit(client_writer, "running")
+            scheduler.submit(client_writer, "queued")
+            await started.wait()
+            await scheduler.remove_client(client_writer)
+
+        self.assertTrue(cancelled.is_set())
+        self.assertEqual(scheduler.num_queued_requests, 0)
+        # the worker is available again
+        self.assertEqual(scheduler._idle_workers.qsize(), 1)
+        await scheduler.stop()
+
+    async def test_should_run_queries_on_the_workers(self):
+        threads = set()
+
+        def mock_stream(evadb, query):
+            for idx in range(3):
+                threads.add(threading.current_thread().name)
+                yield Batch(pd.DataFrame({"id": [idx]}))
+
+        scheduler = RequestScheduler(_mock_evadb(), 1, 8)
+        client_writer = _mock_writer()
+        with patch("evadb.server.command_handler.execute_query_stream", mock_stream):
+            scheduler.submit(client_writer, "query")
+            await asyncio.sleep(0.1)
+
+        # all the batches are produced on the same worker thread
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads.pop().startswith("evadb-worker"))
+        responses = _read_responses(client_writer)
+        self.assertEqual([len(response.batch) for response in responses], [1, 1, 1])
+        await scheduler.stop()
+
+
+class HandleRequestTimeoutTests(unittest.IsolatedAsyncioTestCase):
+    async def test_should_fail_query_exceeding_timeout(self):
+        closed = threading.Event()
+
+        def mock_stream(evadb, query):
+            try:
+                yield Batch(pd.DataFrame({"id": [0]}))
+                time.sleep(0.5)
+                yield Batch(pd.DataFrame({"id": [1]}))
+            finally:
+                closed.set()
+
+        scheduler = RequestScheduler(_mock_evadb(), 1, 8)
+        client_writer = _mock_writer()
+        with patch("evadb.server.command_handler.execute_query_stream", mock_stream):
+            response = await handle_request(
+                None, client_writer, "query", scheduler._workers[0], timeout=0.1
+            )
+
+        self.assertEqual(response.status, ResponseStatus.FAIL)
+        self.assertIn("timeout", response.error)
+        # the query is stopped once the worker completes the batch in flight
+        self.assertTrue(closed.is_set())
+        await scheduler.stop()
@@ -0,0 +1,154 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import shutil
+import unittest
+from pathlib import Path
+from test.util import get_evadb_for_testing, suffix_pytest_xdist_worker_id_to_dir
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
+from evadb.catalog.catalog_utils import is_fixed_shape_ndarray_col
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.models.storage.batch import Batch
+from evadb.storage.columnar_storage_engine import ColumnarStorageEngine
+
+
+@pytest.mark.notparallel
+class ColumnarStorageEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.evadb = get_evadb_for_testing()
+        self.table = self.create_sample_table()
+
+    def tearDown(self):
+        shutil.rmtree(self.table.file_url, ignore_errors=True)
+
+    def create_sample_table(self):
+        file_url = suffix_pytest_xdist_worker_id_to_dir("columnar_dataset")
+        table_info = TableCatalogEntry(
+            "columnar_dataset", str(file_url), table_type=TableType.COLUMNAR_DATA
+        )
+        column_pk = ColumnCatalogEntry(
+            IDENTIFIER_COLUMN, ColumnType.INTEGER, is_nullable=False
+        )
+        column_0 = ColumnCatalogEntry("name", ColumnType.TEXT, is_nullable=False)
+        column_1 = ColumnCatalogEntry(
+            "feat", ColumnType.NDARRAY, False, NdArrayType.FLOAT32, [1, 4]
+        )
+        column_2 = ColumnCatalogEntry(
+            "bbox", ColumnType.NDARRAY, False, NdArrayType.FLOAT32, [None, 4]
+        )
+        table_info.columns = [column_pk, column_0, column_1, column_2]
+        return table_info
+
+    def create_sample_batch(self, num_rows, start=0):
+        return Batch(
+            pd.DataFrame(
+                {
+                    "name": [f"row_{i}" for i in range(start, start + num_rows)],
+                    "feat": [
+                        np.full((1, 4), i, dtype=np.float32)
+                        for i in range(start, start + num_rows)
+                    ],
+                    "bbox": [
+                        np.ones((i % 3, 4), dtype=np.float32)
+                        for i in range(start, start + num_rows)
+                    ],
+                }
+            )
+        )
+
+    def test_fixed_shape_ndarray_col(self):
+        self.assertFalse(is_fixed_shape_ndarray_col(self.table.columns[0]))
+        self.assertFalse(is_fixed_shape_ndarray_col(self.table.columns[1]))
+        self.assertTrue(is_fixed_shape_ndarray_col(self.table.columns[2]))
+        self.assertFalse(is_fixed_shape_ndarray_col(self.table.columns[3]))
+
+    def test_should_write_and_read_rows(self):
+        engine = ColumnarStorageEngine(self.evadb)
+        engine.create(self.table)
+        engine.write(self.table, self.create_sample_batch(5))
+        engine.write(self.table, self.create_sample_batch(5, start=5))
+
+        # only the fixed-shape column is stored as a column file
+        self.assertEqual(
+            sorted(path.name for path in Path(self.table.file_url).iterdir()),
+            ["feat.col"],
+        )
+
+        # every batch holds at most 3 rows of the 16 byte fixed-shape column
+        batches = list(engine.read(self.table, batch_mem_size=3 * 16))
+        self.assertTrue(all(len(batch) <= 3 for batch in batches))
+        frames = Batch.concat(batches, copy=False).frames
+        self.assertEqual(
+            list(frames.columns),
+            [IDENTIFIER_COLUMN, "name", "feat", "bbox", ROW_NUM_COLUMN],
+        )
+        self.assertEqual(list(frames["name"]), [f"row_{i}" for i in range(10)])
+        for i in range(10):
+            np.testing.assert_array_equal(
+                frames["feat"][i], np.full((1, 4), i, dtype=np.float32)
+            )
+            self.assertEqual(frames["bbox"][i].shape, (i % 3, 4))
+        engine.drop(self.table)
+        self.assertFalse(Path(self.table.file_url).exists())
+
+    def test_should_skip_deleted_rows(self):
+        engine = ColumnarStorageEngine(self.evadb)
+        engine.create(self.table)
+        engine.write(self.table, self.create_sample_batch(6))
+
+        sql_table = engine._try_loading_table_via_reflection(self.table.name)
+        engine.delete(self.table, sql_table.columns["name"] == "row_2")
+
+        frames = Batch.concat(list(engine.read(self.table)), copy=False).frames
+        self.assertEqual(
+            list(frames["name"]), ["row_0", "row_1", "row_3", "row_4", "row_5"]
+        )
+        self.assertEqual([feat[0][0] for feat in frames["feat"]], [0, 1, 3, 4, 5])
+        engine.drop(self.table)
+
+    def test_should_gather_empty_slots(self):
+        engine = ColumnarStorageEngine(self.evadb)
+        column_file = np.zeros((4, 1, 4), dtype=np.float32)
+        data = engine._gather(column_file, np.array([], dtype=np.int64))
+        self.assertEqual(data.shape, (0, 1, 4))
+        data = engine._gather(column_file, np.array([2, 0], dtype=np.int64))
+        self.assertEqual(data.shape, (2, 1, 4))
+
+    def test_should_rollback_column_files_on_failed_write(self):
+        engine = ColumnarStorageEngine(self.evadb)
+        engine.create(self.table)
+        engine.write(self.table, self.create_sample_batch(2))
+
+        bad_batch = self.create_sample_batch(2)
+        bad_batch.frames["feat"] = [np.zeros(3), np.zeros(3)]
+        with self.assertRaises(Exception):
+            engine.write(self.table, bad_batch)
+
+        # missing sql column fails after the column file has been appended
+        missing_batch = Batch(self.create_sample_batch(2).frames.drop(columns="bbox"))
+        with self.assertRaises(Exception):
+            engine.write(self.table, missing_batch)
+
+        self.assertEqual(
+            (Path(self.table.file_url) / "feat.col").stat().st_size, 2 * 16
+        )
+        self.assertEqual(len(Batch.concat(list(engine.read(self.table)))), 2)
+        engine.drop(self.table)
@@ -17,10 +17,14 @@ import unittest
 from test.util import get_evadb_for_testing
 from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
-from evadb.catalog.models.utils import DatabaseCatalogEntry
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.utils import ColumnCatalogEntry, DatabaseCatalogEntry
+from evadb.models.storage.batch import Batch
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.native_storage_engine import _read_shard
 
 
 class NativeQueryResponse:
@@ -135,3 +139,26 @@ class SQLiteNativeStorageEngineTest(unittest.TestCase):
         self.execute_native_query_mock.assert_called_once()
         self.get_database_catalog_entry_mock.assert_called_once()
         self.disconnect_mock.assert_called_once()
+
+
+class NativeStorageShardTest(unittest.TestCase):
+    def test_shards_should_not_depend_on_the_order_of_the_rows(self):
+        columns = [
+            ColumnCatalogEntry("name", ColumnType.TEXT),
+            ColumnCatalogEntry("age", ColumnType.INTEGER),
+        ]
+        frame = pd.DataFrame({"name": [f"n{idx}" for idx in range(100)], "age": 7})
+
+        def read_shards(frame):
+            batches = [Batch(frame.iloc[idx : idx + 30]) for idx in range(0, 100, 30)]
+            return [
+                set(
+                    Batch.concat(_read_shard(batches, columns, 3, shard)).frames["name"]
+                )
+                for shard in range(3)
+            ]
+
+        shards = read_shards(frame)
+        self.assertEqual(shards, read_shards(frame.iloc[::-1]))
+        self.assertEqual(set.union(*shards), set(frame["name"]))
+        self.assertEqual(sum(len(shard) for shard in shards), 100)
@@ -20,12 +20,15 @@ from test.util import (
     suffix_pytest_xdist_worker_id_to_dir,
 )
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.models.storage.batch import Batch
 from evadb.storage.sqlite_storage_engine import SQLStorageEngine
 
 
@@ -88,6 +91,106 @@ class SQLStorageEngineTest(unittest.TestCase):
         # clean up
         sqlengine.drop(self.table)
 
+    def test_should_read_requested_columns_in_batches(self):
+        dummy_batches = list(create_dummy_batches())
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        num_rows = 0
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+            num_rows += len(batch)
+
+        # only the identifier column and the requested columns are read
+        columns = [self.table.columns[2]]
+        read_batches = list(
+            sqlengine.read(self.table, batch_mem_size=30, columns=columns)
+        )
+        self.assertGreater(len(read_batches), 1)
+        for batch in read_batches:
+            self.assertEqual(
+                list(batch.columns), [IDENTIFIER_COLUMN, "id", ROW_NUM_COLUMN]
+            )
+        row_ids = [
+            row_id
+            for batch in read_batches
+            for row_id in batch.column_as_numpy_array(IDENTIFIER_COLUMN)
+        ]
+        self.assertEqual(len(row_ids), num_rows)
+        self.assertEqual(row_ids, sorted(row_ids))
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_read_with_offset_limit_and_shards(self):
+        dummy_batches = list(create_dummy_batches())
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        def read_ids(**kwargs):
+            batches = sqlengine.read(self.table, batch_mem_size=30, **kwargs)
+            return [i for batch in batches for i in batch.column_as_numpy_array("id")]
+
+        all_ids = read_ids()
+        self.assertEqual(read_ids(offset=3, limit=4), all_ids[3:7])
+        self.assertEqual(read_ids(limit=0), [])
+
+        shards = [read_ids(total_shards=3, curr_shard=shard) for shard in range(3)]
+        self.assertEqual(sorted(sum(shards, [])), sorted(all_ids))
+        self.assertTrue(all(len(shard) > 0 for shard in shards))
+
+        # rows looked up by their row ids
+        batches = sqlengine.read(self.table, row_ids=[2, 5, 100])
+        row_ids = [
+            i for batch in batches for i in batch.column_as_numpy_array(ROW_NUM_COLUMN)
+        ]
+        self.assertEqual(row_ids, [2, 5])
+        # clean up
+        sqlengine.drop(self.table)
+
+    def test_should_round_trip_mixed_column_types(self):
+        table_info = TableCatalogEntry(
+            "mixed_types", "mixed_types", table_type=TableType.STRUCTURED_DATA
+        )
+        table_info.columns = [
+            ColumnCatalogEntry(IDENTIFIER_COLUMN, ColumnType.INTEGER, False),
+            ColumnCatalogEntry("name", ColumnType.TEXT),
+            ColumnCatalogEntry("count", ColumnType.INTEGER),
+            ColumnCatalogEntry("score", ColumnType.FLOAT),
+            ColumnCatalogEntry(
+                "data", ColumnType.NDARRAY, True, NdArrayType.FLOAT32, [2]
+            ),
+        ]
+        # the columns of the batch are not in the order of the table
+        frames = pd.DataFrame(
+            {
+                "data": [np.array([i, -i], dtype=np.float32) for i in range(3)],
+                "score": np.array([0.5, 1.5, 2.5]),
+                "count": np.array([1, 2, 3], dtype=np.int64),
+                "name": ["a", None, "ü"],
+            }
+        )
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(table_info)
+        sqlengine.write(table_info, Batch(frames))
+
+        actual = Batch.concat(list(sqlengine.read(table_info)), copy=False).frames
+        self.assertEqual(list(actual[IDENTIFIER_COLUMN]), [1, 2, 3])
+        self.assertEqual(list(actual["name"]), ["a", None, "ü"])
+        self.assertEqual(list(actual["count"]), [1, 2, 3])
+        self.assertEqual(list(actual["score"]), [0.5, 1.5, 2.5])
+        for i, data in enumerate(actual["data"]):
+            np.testing.assert_array_equal(data, np.array([i, -i], dtype=np.float32))
+        # clean up
+        sqlengine.drop(table_info)
+
     def test_rename(self):
         table_info = TableCatalogEntry(
             "new_name", "new_name", table_type=TableType.VIDEO_DATA
@@ -0,0 +1,118 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from test.util import create_sample_video
+from unittest.mock import patch
+
+import numpy as np
+
+from evadb.readers.decord_reader import DecordReader
+from evadb.utils.frame_cache import FrameCache
+
+
+class FrameCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.video_file = Path(self.cache_dir) / "video.bin"
+        self.video_file.write_bytes(b"video")
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _frame(self, value, shape=(4, 4, 3)):
+        return np.full(shape, value, dtype=np.uint8)
+
+    def test_should_return_cached_frames(self):
+        cache = FrameCache(str(Path(self.cache_dir) / "frames"))
+        cache.validate(self.video_file)
+        self.assertEqual(cache.get_many(self.video_file, [0, 1]), [None, None])
+
+        cache.set_many(self.video_file, [1], [(self._frame(1), 0.5)])
+        missing, (frame, seconds) = cache.get_many(self.video_file, [0, 1])
+        self.assertIsNone(missing)
+        self.assertTrue(np.array_equal(frame, self._frame(1)))
+        self.assertEqual(seconds, 0.5)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_should_count_hits_and_misses_of_concurrent_reads(self):
+        cache = FrameCache(
+            str(Path(self.cache_dir) / "frames"), max_memory_size=2**20
+        )
+        cache.set_many(self.video_file, [0], [(self._frame(0), 0.0)])
+
+        def read():
+            for _ in range(50):
+                cache.get_many(self.video_file, [0, 1])
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((cache.hits, cache.misses), (400, 400))
+
+    def test_should_invalidate_frames_of_modified_video(self):
+        cache = FrameCache(
+            str(Path(self.cache_dir) / "frames"), max_memory_size=2**20
+        )
+        cache.validate(self.video_file)
+        cache.set_many(self.video_file, [0], [(self._frame(0), 0.0)])
+
+        # unchanged video keeps its frames
+        cache.validate(self.video_file)
+        self.assertIsNotNone(cache.get_many(self.video_file, [0])[0])
+
+        self.video_file.write_bytes(b"modified video")
+        cache.validate(self.video_file)
+        self.assertEqual(cache.get_many(self.video_file, [0]), [None])
+
+    def test_should_evict_least_recently_used_frames_from_memory(self):
+        frame_nbytes = self._frame(0).nbytes
+        cache = FrameCache(
+            str(Path(self.cache_dir) / "frames"), max_memory_size=2 * frame_nbytes
+        )
+        frames = [(self._frame(i), float(i)) for i in range(3)]
+        cache.set_many(self.video_file, [0, 1], frames[:2])
+        # touch frame 0 so that frame 1 is the least recently used one
+        cache.get_many(self.video_file, [0])
+        cache.set_many(self.video_file, [2], frames[2:])
+
+        self.assertEqual(
+            [key[1] for key in cache._memory.keys()],
+            [0, 2],
+        )
+        self.assertEqual(cache._memory_size, 2 * frame_nbytes)
+        # evicted frames are still served from disk
+        self.assertIsNotNone(cache.get_many(self.video_file, [1])[0])
+
+    def test_decord_reader_should_not_decode_cached_frames(self):
+        video_file = create_sample_video()
+        try:
+            cache = FrameCache(str(Path(self.cache_dir) / "frames"))
+            cache.validate(video_file)
+            expected = list(DecordReader(video_file, frame_cache=cache).read())
+
+            reader = DecordReader(video_file, frame_cache=cache)
+            with patch.object(reader, "_decode_video_frames") as mock_decode:
+                batches = list(reader.read())
+            mock_decode.assert_not_called()
+            self.assertEqual(batches, expected)
+        finally:
+            os.remove(video_file)
@@ -0,0 +1,112 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from evadb.utils.kv_cache import (
+    DiskKVCache,
+    MemoryKVCache,
+    TieredKVCache,
+    get_shared_memory_cache,
+    hash_keys,
+)
+
+
+class KVCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def _value(self, fill):
+        return np.full(100, fill, dtype=np.uint8)
+
+    def test_memory_cache_should_evict_by_size(self):
+        nbytes = self._value(0).nbytes
+        for policy, expected_keys in [
+            ("least-recently-used", ["a", "c"]),
+            ("least-recently-stored", ["b", "c"]),
+        ]:
+            cache = MemoryKVCache(2 * nbytes, eviction_policy=policy)
+            self.assertEqual(cache.set("a", self._value(0)), 0)
+            self.assertEqual(cache.set("b", self._value(1)), 0)
+            cache.get("a")
+            self.assertEqual(cache.set("c", self._value(2)), 1)
+            self.assertEqual(
+                [key for key in "abc" if cache.get(key) is not None], expected_keys
+            )
+            self.assertEqual(cache.size, 2 * nbytes)
+
+        with self.assertRaises(ValueError):
+            MemoryKVCache(nbytes, eviction_policy="random")
+
+    def test_memory_cache_should_not_share_values_with_callers(self):
+        cache = MemoryKVCache(2**20)
+        value = [self._value(0), "label"]
+        cache.set("a", value)
+        value[0][0] = 1
+        cache.get("a")[0][0] = 2
+        np.testing.assert_array_equal(cache.get("a")[0], self._value(0))
+
+    def test_tiered_cache_should_promote_disk_hits_to_memory(self):
+        disk = DiskKVCache(self.cache_dir.name)
+        disk.set("a", self._value(0))
+        cache = TieredKVCache(disk, MemoryKVCache(2**20))
+
+        values = cache.get_many(["a", "b"])
+        self.assertTrue(np.array_equal(values[0], self._value(0)))
+        self.assertIsNone(values[1])
+        self.assertEqual((cache.disk_hits, cache.memory_hits, cache.misses), (1, 0, 1))
+
+        cache.set_many(["b"], [self._value(1)])
+        cache.get_many(["a", "b"])
+        self.assertEqual((cache.disk_hits, cache.memory_hits, cache.misses), (1, 2, 1))
+        # values are written through to disk
+        self.assertTrue(np.array_equal(disk.get("b"), self._value(1)))
+
+    def test_tiered_caches_should_not_share_keys(self):
+        with tempfile.TemporaryDirectory() as other_dir:
+            memory = MemoryKVCache(2**20)
+            cache = TieredKVCache(DiskKVCache(self.cache_dir.name), memory)
+            other_cache = TieredKVCache(DiskKVCache(other_dir), memory)
+            cache.set("a", self._value(0))
+            self.assertIsNone(other_cache.get("a"))
+
+    def test_tiered_cache_should_be_pickled_with_the_shared_memory_cache(self):
+        memory = get_shared_memory_cache(2**20)
+        cache = TieredKVCache(DiskKVCache(self.cache_dir.name), memory)
+        cache.set("a", self._value(0))
+
+        # e.g., sent to a worker process of the local Exchange
+        copied_cache = pickle.loads(pickle.dumps(cache))
+        self.assertIs(copied_cache._memory, memory)
+        self.assertTrue(np.array_equal(copied_cache.get("a"), self._value(0)))
+
+    def test_hash_keys_should_hash_ndarray_columns_by_content(self):
+        keys = pd.DataFrame(
+            {
+                "id": [0, 1, 0],
+                "data": [self._value(0), self._value(1), self._value(0)],
+            }
+        )
+        hashes = hash_keys(keys)
+        self.assertEqual(hashes[0], hashes[2])
+        self.assertNotEqual(hashes[0], hashes[1])
+        self.assertEqual(hashes, hash_keys(keys.copy()))
@@ -216,6 +216,22 @@ def get_mock_object(class_type, number_of_args):
             MagicMock(),
             MagicMock(),
         )
+    elif number_of_args == 14:
+        return class_type(
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+        )
     else:
         raise Exception("Too many args")
 
@@ -555,6 +571,8 @@ def load_functions_for_testing(db, mode="debug"):
 
 
 class DummyObjectDetector(AbstractClassifierFunction):
+    stateless = True
+
     def setup(self, *args, **kwargs):
         pass
 